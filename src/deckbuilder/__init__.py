@@ -5,10 +5,15 @@ Core presentation generation engine with template support and
 structured frontmatter processing.
 """
 
-from .core.engine import Deckbuilder, get_deckbuilder_client
+from .core.async_engine import AsyncDeckbuilder
+from .core.engine import Deckbuilder, create_engine, get_deckbuilder_client
+from .core.engine_pool import EnginePool
 
 __version__ = "1.4.1"
 __all__ = [
+    "AsyncDeckbuilder",
     "Deckbuilder",
+    "EnginePool",
+    "create_engine",
     "get_deckbuilder_client",
 ]
@@ -327,14 +327,14 @@ layout: Title Slide
             if not os.path.exists(template_path):
                 return {"status": "error", "error": f"Template file not found: {template_path}"}
 
-            # Try to load with python-pptx
-            from pptx import Presentation
+            # Load the shared analysis (opens the template with python-pptx only if it changed)
+            from ..templates.template_analysis import load_template_analysis
 
-            prs = Presentation(template_path)
+            analysis = load_template_analysis(template_path)
 
             return {
                 "status": "valid",
-                "layout_count": len(prs.slide_layouts),
+                "layout_count": analysis["layout_count"],
                 "file_size": os.path.getsize(template_path),
             }
 
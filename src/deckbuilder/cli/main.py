@@ -7,19 +7,20 @@ template management, and PlaceKitten image processing. Designed for
 local development and standalone usage without MCP server dependency.
 """
 
-import json
 import os
 import platform
 import subprocess  # nosec B404
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
 import click
 
-from ..core.engine import Deckbuilder
+from ..core.engine import Deckbuilder, create_engine
 from .commands import TemplateManager
 from ..content.formatting_support import FormattingSupport, print_supported_languages
+from ..utils.file_watcher import DEFAULT_DEBOUNCE, DEFAULT_INTERVAL, FileWatcher
 from ..utils.path import create_cli_path_manager, get_placekitten
 
 
@@ -62,7 +63,7 @@ class DeckbuilderCLI:
 
         return [template.stem for template in template_folder.glob("*.pptx")]
 
-    def create_presentation(self, input_file: str, output_name: Optional[str] = None, template: Optional[str] = None) -> str:
+    def create_presentation(self, input_file: str, output_name: Optional[str] = None, template: Optional[str] = None, show_profile: bool = False) -> str:
         """
         Create presentation from markdown or JSON file
 
@@ -70,6 +71,7 @@ class DeckbuilderCLI:
             input_file: Path to markdown (.md) or JSON (.json) input file
             output_name: Optional output filename (without extension)
             template: Optional template name to use
+            show_profile: Print stage timings and frontmatter cache counts after the build
 
         Returns:
             str: Path to generated presentation file
@@ -105,9 +107,8 @@ class DeckbuilderCLI:
             click.echo("Run 'deckbuilder init' to create template folder with default files", err=True)
             return
 
-        # Reset singleton and create fresh instance with CLI path manager
-        Deckbuilder.reset()
-        db = Deckbuilder(path_manager_instance=self.path_manager)
+        # Fresh engine with the CLI path manager (the process-wide singleton is left alone)
+        db = create_engine(self.path_manager)
 
         try:
             if input_path.suffix.lower() == ".md":
@@ -127,19 +128,19 @@ class DeckbuilderCLI:
                 # Handle structured result
                 if result.success:
                     click.echo(f"✓ Presentation created successfully: {result.filename}")
+                    if show_profile:
+                        self._print_build_profile(db)
                     return result.filename
                 else:
                     click.echo(f"✗ {result.error_message}", err=True)
                     return
 
             elif input_path.suffix.lower() == ".json":
-                # Process JSON file directly (keep existing approach for now)
-                with open(input_path, "r", encoding="utf-8") as f:
-                    presentation_data = json.load(f)
+                # Stream slides from the JSON file so large inputs are never loaded whole
                 click.echo(f"Processing JSON file: {input_path.name}")
 
-                result_message = db.create_presentation(
-                    presentation_data,
+                result_message = db.create_presentation_from_json_file(
+                    str(input_path),
                     fileName=output_name,
                     templateName=template_name,
                     language_code=self.language,
@@ -152,6 +153,8 @@ class DeckbuilderCLI:
                     return
 
                 click.echo(f"✓ {result_message}")
+                if show_profile:
+                    self._print_build_profile(db)
                 return result_message
 
             else:
@@ -162,6 +165,118 @@ class DeckbuilderCLI:
             click.echo(f"❌ Unexpected error creating presentation: {e}", err=True)
             # Don't re-raise since we want graceful CLI behavior
 
+    def watch_presentation(
+        self,
+        input_file: str,
+        output_name: Optional[str] = None,
+        template: Optional[str] = None,
+        interval: float = DEFAULT_INTERVAL,
+        debounce: float = DEFAULT_DEBOUNCE,
+        max_runs: Optional[int] = None,
+    ) -> int:
+        """
+        Build a presentation, then rebuild it whenever its inputs change
+
+        One engine stays loaded between builds, so the template, patterns and
+        image cache are only read once, and slides whose data did not change
+        are copied from the previous build instead of being built again.
+
+        Args:
+            input_file: Path to markdown (.md) or JSON (.json) input file
+            output_name: Optional output filename (without extension)
+            template: Optional template name to use
+            interval: Seconds between checks for changes
+            debounce: Seconds the inputs must be unchanged before rebuilding
+            max_runs: Stop after this many builds (default: until interrupted)
+
+        Returns:
+            int: Number of builds run
+        """
+        from ..core.output_naming import OutputNaming
+        from ..core.slide_reuse import SlideReuseCache
+
+        input_path = Path(input_file)
+        if not input_path.exists():
+            click.echo(f"❌ Input file not found: {input_file}", err=True)
+            raise click.Abort()
+        if input_path.suffix.lower() not in (".md", ".json"):
+            click.echo(f"✗ Unsupported file format: {input_path.suffix}. Supported formats: .md, .json", err=True)
+            raise click.Abort()
+        if not self._validate_templates_folder():
+            raise click.Abort()
+
+        output_name = output_name or input_path.stem
+        template_name = template or self.path_manager.get_template_name()
+        template_file = self.path_manager.get_template_file_path(template_name)
+        if not template_file.exists():
+            click.echo(f"✗ Template file not found: {template_file}", err=True)
+            raise click.Abort()
+
+        db = create_engine(self.path_manager)
+        db.slide_reuse = SlideReuseCache()
+        # Outputs are named by content, so saving an unchanged file rebuilds nothing
+        db.output_naming = OutputNaming(deterministic=True, keep=1)
+
+        inputs = [input_path, template_file, self.path_manager.get_template_folder() / "patterns"]
+        watcher = FileWatcher(inputs, interval=interval, debounce=debounce)
+        click.echo(f"👀 Watching {input_path.name} with template {template_name}.pptx (Ctrl+C to stop)")
+
+        runs = 0
+        try:
+            while True:
+                start = time.perf_counter()
+                outcome = self._rebuild(db, input_path, output_name, template_name)
+                if outcome is not None:
+                    click.echo(f"{outcome} in {(time.perf_counter() - start) * 1000:.0f} ms")
+                runs += 1
+                if max_runs is not None and runs >= max_runs:
+                    return runs
+
+                # Referenced images and record files can change with every build
+                watcher.watch(inputs + sorted(db.slide_reuse.files))
+                changed = watcher.wait()
+                click.echo(f"📝 Changed: {', '.join(sorted(Path(path).name for path in changed))}")
+        except KeyboardInterrupt:
+            click.echo("👋 Stopped watching")
+        return runs
+
+    def _rebuild(self, db: Deckbuilder, input_path: Path, output_name: str, template_name: str) -> Optional[str]:
+        """Run one watch mode build, returning its outcome (None if it failed)"""
+        try:
+            if input_path.suffix.lower() == ".md":
+                result = db.create_presentation_from_markdown(
+                    input_path.read_text(encoding="utf-8"),
+                    fileName=output_name,
+                    templateName=template_name,
+                    language_code=self.language,
+                    font_name=self.font,
+                )
+                if not result.success:
+                    click.echo(f"✗ {result.error_message}", err=True)
+                    return None
+                filename = result.filename
+            else:
+                message = db.create_presentation_from_json_file(str(input_path), fileName=output_name, templateName=template_name, language_code=self.language, font_name=self.font)
+                if "Error creating presentation" in message:
+                    click.echo(f"✗ {message}", err=True)
+                    return None
+                filename = message.rsplit(" ", 1)[-1]
+        except Exception as e:
+            click.echo(f"✗ {e}", err=True)
+            return None
+
+        if db.last_output_reused:
+            return f"✓ {filename} unchanged, checked"
+        return f"🔄 Rebuilt {filename} ({db.slide_reuse.built} slides built, {db.slide_reuse.reused} reused)"
+
+    def _print_build_profile(self, db: Deckbuilder):
+        """Print the stage timings of the last build"""
+        if db.last_build_profile is None:
+            return
+        click.echo("⏱️  Build profile:")
+        for line in db.last_build_profile.format_lines():
+            click.echo(f"   {line}")
+
     def analyze_template(self, template_name: str = "default", verbose: bool = False):
         """Analyze PowerPoint template structure"""
         if not self._validate_templates_folder():
@@ -268,6 +383,40 @@ class DeckbuilderCLI:
             click.echo(f"❌ Error processing image: {e}", err=True)
             raise
 
+    def warm_image_cache(self, template: Optional[str] = None, max_workers: Optional[int] = None):
+        """Pre-render PlaceKitten fallback images for every picture placeholder in a template"""
+        from ..image.fallback_warmer import FallbackWarmer
+        from ..image.image_handler import ImageHandler
+        from ..image.placekitten_integration import PlaceKittenIntegration
+
+        if not self._validate_templates_folder():
+            return False
+
+        template_name = template or self.path_manager.get_template_name()
+        template_file = self.path_manager.get_template_file_path(template_name)
+        if not template_file.exists():
+            click.echo(f"❌ Template file not found: {template_file}", err=True)
+            return False
+
+        # Same cache location PresentationBuilder uses for builds
+        cache_dir = self.path_manager.get_output_folder() / "temp" / "image_cache"
+        placekitten = PlaceKittenIntegration(ImageHandler(str(cache_dir)))
+        if not placekitten.is_available():
+            click.echo("❌ PlaceKitten library not available - nothing to warm", err=True)
+            return False
+
+        click.echo(f"🔥 Warming fallback image cache for template: {template_name}")
+        stats = FallbackWarmer(placekitten, max_workers=max_workers).warm(str(template_file))
+
+        click.echo(f"   Sizes: {', '.join(f'{w}x{h}' for w, h in stats['dimensions'])}")
+        click.echo(f"   Image variants per size: {len(stats['image_ids'])}")
+        click.echo(f"   Rendered: {stats['rendered']}  Already cached: {stats['cached']}  Failed: {stats['failed']}")
+        click.echo(f"📁 Cache: {stats['cache_dir']}")
+        for error in stats["errors"]:
+            click.echo(f"⚠️  {error}", err=True)
+
+        return stats["failed"] == 0
+
     def list_templates(self):
         """List available templates"""
         if not self._validate_templates_folder():
@@ -560,6 +709,8 @@ class DeckbuilderCLI:
         font_name: Optional[str] = None,
         output_file: Optional[str] = None,
         create_backup: bool = True,
+        engine: str = "xml",
+        atomic: bool = False,
     ):
         """
         Remap language and/or font settings in an existing PowerPoint presentation.
@@ -571,6 +722,8 @@ class DeckbuilderCLI:
             font_name: Optional font name to apply
             output_file: Optional output file path
             create_backup: Whether to create backup file
+            engine: Remap engine ("xml" bulk XML engine or "proxy" shape walk)
+            atomic: Write via temporary file and rename instead of creating a backup
         """
         input_path = Path(input_file)
 
@@ -608,7 +761,9 @@ class DeckbuilderCLI:
                 language_code=language_code,
                 font_name=font_name,
                 output_path=output_file,
-                create_backup=create_backup,
+                create_backup=create_backup and not atomic,
+                engine=engine,
+                atomic=atomic,
             )
 
             if result["success"]:
@@ -637,6 +792,116 @@ class DeckbuilderCLI:
             click.echo(f"❌ Error processing presentation: {e}", err=True)
             raise
 
+    def remap_directory(
+        self,
+        input_dir: str,
+        language_code: Optional[str] = None,
+        font_name: Optional[str] = None,
+        create_backup: bool = True,
+        engine: str = "xml",
+        atomic: bool = False,
+        workers: Optional[int] = None,
+        manifest: Optional[str] = None,
+        force: bool = False,
+    ):
+        """
+        Remap every PowerPoint file under a directory using a process pool.
+
+        Files whose hash, language mapping, font and language match the manifest
+        from a previous run are skipped.
+
+        Args:
+            input_dir: Directory to search recursively for .pptx files
+            language_code: Optional language code to apply
+            font_name: Optional font name to apply
+            create_backup: Whether to create backup files
+            engine: Remap engine ("xml" bulk XML engine or "proxy" shape walk)
+            atomic: Write via temporary file and rename instead of creating backups
+            workers: Number of worker processes
+            manifest: Optional manifest file path
+            force: Ignore the manifest and reprocess every file
+        """
+        from ..content.batch_remap import BatchRemapper
+
+        if not self.validate_language_and_font(language_code, font_name):
+            return False
+
+        if not language_code and not font_name:
+            click.echo("❌ No updates specified. Use --language or --font arguments.", err=True)
+            return False
+
+        remapper = BatchRemapper(
+            language_code=language_code,
+            font_name=font_name,
+            workers=workers,
+            create_backup=create_backup,
+            atomic=atomic,
+            engine=engine,
+            manifest_path=manifest,
+            force=force,
+        )
+
+        def report(relative_path, result):
+            if result["success"]:
+                click.echo(f"✅ {relative_path}")
+            else:
+                click.echo(f"❌ {relative_path}: {result['error']}", err=True)
+
+        click.echo(f"🔄 Remapping presentations under: {input_dir}")
+        summary = remapper.remap_directory(input_dir, on_result=report)
+
+        click.echo("📊 Batch Summary:")
+        click.echo(f"   Presentations found: {summary['total']}")
+        click.echo(f"   Remapped: {summary['processed']}")
+        click.echo(f"   Skipped (unchanged): {summary['skipped']}")
+        click.echo(f"   Failed: {summary['failed']}")
+        click.echo(f"📁 Manifest: {summary['manifest_path']}")
+
+        return summary["failed"] == 0
+
+    def diff_presentations(self, expected: str, actual: str, workers: Optional[int] = None, verbose: bool = False):
+        """
+        Structurally compare two decks, or two folders of decks.
+
+        Args:
+            expected: Golden .pptx file or folder
+            actual: .pptx file or folder to check
+            workers: Worker processes when comparing folders
+            verbose: Show the canonical XML diff of changed non-slide parts
+
+        Returns:
+            True if every deck matches
+        """
+        from ..utils.pptx_diff import diff_directories, diff_packages
+
+        expected_path, actual_path = Path(expected), Path(actual)
+        if expected_path.is_dir() != actual_path.is_dir():
+            click.echo("❌ Compare two .pptx files or two folders.", err=True)
+            return False
+
+        if expected_path.is_dir():
+            result = diff_directories(expected_path, actual_path, workers=workers)
+            diffs = result.diffs
+            for key in result.missing:
+                click.echo(f"❌ {key}: missing from {actual}", err=True)
+            for key in result.unexpected:
+                click.echo(f"❌ {key}: not in {expected}", err=True)
+        else:
+            diffs = {actual_path.name: diff_packages(expected_path, actual_path)}
+            result = None
+
+        for key, diff in diffs.items():
+            if diff.identical:
+                click.echo(f"✅ {key}")
+                continue
+            click.echo(f"❌ {key}", err=True)
+            for line in diff.format_lines(verbose=verbose):
+                click.echo(f"   {line}", err=True)
+
+        changed = sum(1 for diff in diffs.values() if not diff.identical)
+        click.echo(f"📊 {len(diffs)} compared, {changed} changed")
+        return changed == 0 and (result is None or result.identical)
+
     # Pattern Management Methods
 
     def list_patterns(self, source: str = "all", verbose: bool = False):
@@ -1001,6 +1266,11 @@ def _show_environment_info():
         ("DECKBUILDER_DEBUG", "Debug mode"),
         ("DECKBUILDER_QUIET", "Quiet mode"),
         ("DECKBUILDER_VALIDATION_DEBUG", "Validation debug"),
+        ("DECK_VALIDATION", "Post-generation validation"),
+        ("DECK_VALIDATION_SAMPLE", "Validate every Nth slide"),
+        ("DECK_SCHEMA_STRICT", "Unknown/missing slide fields are errors"),
+        ("DECK_DETERMINISTIC_OUTPUT", "Name outputs by input hash, skip unchanged builds"),
+        ("DECK_OUTPUT_KEEP", "Hashed outputs kept per deck"),
         ("DECKBUILDER_SLIDE_DEBUG", "Slide debug"),
         ("DECKBUILDER_CONTENT_DEBUG", "Content debug"),
     ]
@@ -1023,10 +1293,11 @@ def _show_environment_info():
 @click.argument("input_file", type=click.Path(exists=True, dir_okay=False))
 @click.option("--output", "-o", help="Output filename (without extension).")
 @click.option("--template", help="Template name to use (default: 'default').")
+@click.option("--profile", is_flag=True, help="Show stage timings for the build.")
 @click.pass_obj
-def create(cli, input_file, output, template):
+def create(cli, input_file, output, template, profile):
     """Generate presentations from markdown or JSON."""
-    cli.create_presentation(input_file, output, template)
+    cli.create_presentation(input_file, output, template, show_profile=profile)
 
 
 @main.group()
@@ -1158,6 +1429,17 @@ def crop(cli, input_file, width, height, save_steps, output):
     cli.smart_crop_image(input_file, width, height, save_steps, output)
 
 
+@image.command()
+@click.option("--template", help="Template name to warm (default: 'default').")
+@click.option("--workers", type=int, help="Number of parallel render workers.")
+@click.pass_obj
+def warm(cli, template, workers):
+    """Pre-render fallback images for a template's picture placeholders."""
+    success = cli.warm_image_cache(template, workers)
+    if not success:
+        sys.exit(1)
+
+
 @main.group(name="config")
 def config_group():
     """Configuration, setup, and system information."""
@@ -1185,19 +1467,58 @@ def completion(cli):
 
 
 @main.command()
-@click.argument("input_file", type=click.Path(exists=True, dir_okay=False))
+@click.argument("input_file", type=click.Path(exists=True, file_okay=True, dir_okay=True), metavar="INPUT_FILE")
 @click.option("--language", "-l", metavar="LANG", envvar="DECK_PROOFING_LANGUAGE", help="Language code to apply.")
 @click.option("--font", "-f", metavar="FONT", envvar="DECK_DEFAULT_FONT", help="Font family to apply.")
 @click.option("--output", "-o", metavar="FILE", help="Output file path.")
 @click.option("--no-backup", is_flag=True, help="Skip creating backup file.")
+@click.option("--engine", type=click.Choice(["xml", "proxy"]), default="xml", show_default=True, help="Remap engine: bulk XML or python-pptx shape walk.")
+@click.option("--atomic", is_flag=True, help="Write via temp file and rename instead of a backup copy.")
+@click.option("--recursive", "-r", is_flag=True, help="Remap every .pptx under INPUT_FILE as a directory.")
+@click.option("--workers", type=int, help="Worker processes for --recursive.")
+@click.option("--manifest", metavar="FILE", help="Manifest file for --recursive (default: in the directory).")
+@click.option("--force", is_flag=True, help="Ignore the manifest and reprocess every file.")
 @click.pass_obj
-def remap(cli, input_file, language, font, output, no_backup):
+def remap(cli, input_file, language, font, output, no_backup, engine, atomic, recursive, workers, manifest, force):
     """Update language and font settings in existing PowerPoint files."""
-    success = cli.remap_presentation(input_file, language, font, output, not no_backup)
+    if Path(input_file).is_dir():
+        if not recursive:
+            click.echo(f"❌ {input_file} is a directory. Use --recursive to remap all presentations in it.", err=True)
+            sys.exit(1)
+        if output:
+            click.echo("❌ --output cannot be used with --recursive.", err=True)
+            sys.exit(1)
+        success = cli.remap_directory(input_file, language, font, not no_backup, engine, atomic, workers, manifest, force)
+    else:
+        success = cli.remap_presentation(input_file, language, font, output, not no_backup, engine, atomic)
     if not success:
         sys.exit(1)
 
 
+@main.command()
+@click.argument("expected", type=click.Path(exists=True))
+@click.argument("actual", type=click.Path(exists=True))
+@click.option("--workers", type=int, help="Worker processes when comparing folders.")
+@click.option("--verbose", "-v", is_flag=True, help="Show the canonical XML diff of changed parts.")
+@click.pass_obj
+def diff(cli, expected, actual, workers, verbose):
+    """Compare presentations structurally (files or folders of golden decks)."""
+    if not cli.diff_presentations(expected, actual, workers, verbose):
+        sys.exit(1)
+
+
+@main.command()
+@click.argument("input_file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--output", "-o", help="Output filename (without extension).")
+@click.option("--template", help="Template name to use (default: 'default').")
+@click.option("--interval", type=float, default=DEFAULT_INTERVAL, show_default=True, help="Seconds between checks for changes.")
+@click.option("--debounce", type=float, default=DEFAULT_DEBOUNCE, show_default=True, help="Seconds of quiet before rebuilding.")
+@click.pass_obj
+def watch(cli, input_file, output, template, interval, debounce):
+    """Rebuild a presentation whenever its input, patterns or images change."""
+    cli.watch_presentation(input_file, output, template, interval=interval, debounce=debounce)
+
+
 @main.command()
 @click.argument("path", type=click.Path(), default="./templates")
 @click.pass_obj
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Deckbuilder Batch Remap
+
+Directory-scale language and font remapping. Presentations are remapped across
+a process pool, and a manifest records the (file hash, mapping-file hash, font,
+language) each file was last processed with so unchanged files are skipped on
+the next run - for example after a language mapping JSON file is edited only
+the decks that have not yet seen the new mapping are reprocessed.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .formatting_support import FormattingSupport
+
+MANIFEST_FILENAME = ".deckbuilder_remap_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Hash a file's contents without reading it into memory at once"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _remap_file(path: str, language_code: Optional[str], font_name: Optional[str], create_backup: bool, atomic: bool, engine: str) -> Dict:
+    """Remap one presentation in a worker process and hash the result"""
+    result = FormattingSupport().update_presentation(
+        presentation_path=path,
+        language_code=language_code,
+        font_name=font_name,
+        create_backup=create_backup,
+        engine=engine,
+        atomic=atomic,
+    )
+    if result["success"]:
+        result["file_hash"] = file_sha256(Path(path))
+    return result
+
+
+class BatchRemapper:
+    """Remaps every presentation under a directory, skipping files already processed"""
+
+    def __init__(
+        self,
+        language_code: Optional[str] = None,
+        font_name: Optional[str] = None,
+        workers: Optional[int] = None,
+        create_backup: bool = True,
+        atomic: bool = False,
+        engine: str = "xml",
+        manifest_path: Optional[str] = None,
+        force: bool = False,
+    ):
+        """
+        Initialize batch remapper.
+
+        Args:
+            language_code: Optional language code to apply
+            font_name: Optional font name to apply
+            workers: Process pool size (default: CPU count)
+            create_backup: Write a .bak.pptx copy before updating each file
+            atomic: Write each file via a temporary file and rename instead of a backup copy
+            engine: Remap engine passed to FormattingSupport.update_presentation
+            manifest_path: Manifest location (default: <root>/.deckbuilder_remap_manifest.json)
+            force: Reprocess files even if the manifest says they are up to date
+        """
+        self.language_code = language_code
+        self.font_name = font_name
+        self.workers = workers
+        self.create_backup = create_backup and not atomic
+        self.atomic = atomic
+        self.engine = engine
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.force = force
+
+    def mapping_hash(self) -> str:
+        """Hash of the language mapping file in effect, or empty if there is none"""
+        if not self.language_code:
+            return ""
+        mapping_file = FormattingSupport.get_language_mapping_path(self.language_code)
+        return file_sha256(mapping_file) if mapping_file.exists() else ""
+
+    @staticmethod
+    def find_presentations(root: Path) -> List[Path]:
+        """Find .pptx files under root, ignoring backups, Office lock files and temp files"""
+        return sorted(path for path in root.rglob("*.pptx") if path.is_file() and not path.name.endswith(".bak.pptx") and not path.name.startswith(("~$", ".")) and not path.name.endswith(".tmp.pptx"))
+
+    def load_manifest(self, manifest_path: Path) -> Dict[str, Dict]:
+        """Load manifest entries, starting fresh if it is missing, unreadable or from another version"""
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                return data.get("files", {})
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    @staticmethod
+    def save_manifest(manifest_path: Path, entries: Dict[str, Dict]) -> None:
+        """Write manifest atomically so an interrupted run never corrupts it"""
+        fd, temp_name = tempfile.mkstemp(prefix=".remap_manifest.", suffix=".tmp", dir=str(manifest_path.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "files": entries}, f, indent=2, sort_keys=True)
+            os.replace(temp_name, manifest_path)
+        finally:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+
+    def _fingerprint(self, file_hash: str, mapping_hash: str) -> Dict[str, str]:
+        """Manifest entry describing how a file was processed"""
+        return {
+            "file_hash": file_hash,
+            "mapping_hash": mapping_hash,
+            "language": self.language_code or "",
+            "font": self.font_name or "",
+        }
+
+    def remap_directory(self, root: str, on_result: Optional[Callable[[str, Dict], None]] = None) -> Dict:
+        """
+        Remap all presentations under a directory.
+
+        Args:
+            root: Directory to search recursively
+            on_result: Optional callback invoked with (relative path, result) per processed file
+
+        Returns:
+            Dictionary with processed/skipped/failed counts and per-file errors
+        """
+        root_path = Path(root).resolve()
+        manifest_path = self.manifest_path or root_path / MANIFEST_FILENAME
+        entries = {} if self.force else self.load_manifest(manifest_path)
+        mapping_hash = self.mapping_hash()
+
+        summary = {"total": 0, "processed": 0, "skipped": 0, "failed": 0, "errors": {}, "manifest_path": str(manifest_path)}
+
+        pending = []
+        for path in self.find_presentations(root_path):
+            summary["total"] += 1
+            key = path.relative_to(root_path).as_posix()
+            entry = entries.get(key)
+            if entry and entry == self._fingerprint(file_sha256(path), mapping_hash):
+                summary["skipped"] += 1
+                continue
+            pending.append((key, path))
+
+        if not pending:
+            return summary
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = {executor.submit(_remap_file, str(path), self.language_code, self.font_name, self.create_backup, self.atomic, self.engine): key for key, path in pending}
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {"success": False, "error": str(e), "stats": {}}
+
+                    if result["success"]:
+                        summary["processed"] += 1
+                        entries[key] = self._fingerprint(result["file_hash"], mapping_hash)
+                    else:
+                        summary["failed"] += 1
+                        summary["errors"][key] = result["error"]
+                        entries.pop(key, None)
+
+                    if on_result:
+                        on_result(key, result)
+        finally:
+            self.save_manifest(manifest_path, entries)
+
+        return summary
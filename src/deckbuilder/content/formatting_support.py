@@ -241,6 +241,19 @@ class FormattingSupport:
         except Exception:
             return False
 
+    @staticmethod
+    def get_language_mapping_path(language_code: str) -> Path:
+        """
+        Get the path of the language mapping file for a language code.
+
+        Args:
+            language_code: Target language code (e.g., 'en-AU')
+
+        Returns:
+            Path to the packaged language mapping JSON file (may not exist)
+        """
+        return Path(__file__).parent.parent / "language_mappings" / f"{language_code}.json"
+
     def load_language_mapping(self, language_code: str) -> Optional[Dict]:
         """
         Load language mapping configuration for text replacement.
@@ -255,8 +268,7 @@ class FormattingSupport:
             return self._language_mappings[language_code]
 
         # Find language mapping file
-        current_dir = Path(__file__).parent
-        mapping_file = current_dir / "language_mappings" / f"{language_code}.json"
+        mapping_file = self.get_language_mapping_path(language_code)
 
         if not mapping_file.exists():
             return None
@@ -529,6 +541,86 @@ class FormattingSupport:
             print(f"⚠️  Warning: Could not update theme fonts: {e}")
             return False
 
+    def _remap_with_proxies(self, prs, language_code: Optional[str] = None, font_name: Optional[str] = None) -> Dict[str, int]:
+        """
+        Remap a loaded presentation by walking python-pptx shape and run proxies.
+
+        Args:
+            prs: python-pptx Presentation object
+            language_code: Optional language code to apply
+            font_name: Optional font name to apply
+
+        Returns:
+            Dictionary with processing statistics
+        """
+        total_stats = {
+            "master_slides_processed": 0,
+            "content_slides_processed": 0,
+            "total_runs_processed": 0,
+            "total_language_applied": 0,
+            "total_font_applied": 0,
+            "total_text_replaced": 0,
+            "theme_fonts_updated": 0,
+        }
+
+        # Update theme fonts if font name is provided
+        if font_name:
+            if self.update_theme_fonts(prs, font_name):
+                total_stats["theme_fonts_updated"] = 1
+
+        # Process master slides
+        try:
+            for slide_master in prs.slide_masters:
+                total_stats["master_slides_processed"] += 1
+
+                # Process master slide shapes
+                for shape in slide_master.shapes:
+                    shape_stats = self.process_shape(shape, language_code, font_name)
+                    total_stats["total_runs_processed"] += shape_stats["runs_processed"]
+                    total_stats["total_language_applied"] += shape_stats["language_applied"]
+                    total_stats["total_font_applied"] += shape_stats["font_applied"]
+                    total_stats["total_text_replaced"] += shape_stats["text_replaced"]
+
+                # Process slide layouts
+                for slide_layout in slide_master.slide_layouts:
+                    for shape in slide_layout.shapes:
+                        shape_stats = self.process_shape(shape, language_code, font_name)
+                        total_stats["total_runs_processed"] += shape_stats["runs_processed"]
+                        total_stats["total_language_applied"] += shape_stats["language_applied"]
+                        total_stats["total_font_applied"] += shape_stats["font_applied"]
+                        total_stats["total_text_replaced"] += shape_stats["text_replaced"]
+
+        except Exception as e:
+            print(f"⚠️  Warning: Error processing master slides: {e}")
+
+        # Process content slides
+        for slide in prs.slides:
+            total_stats["content_slides_processed"] += 1
+
+            for shape in slide.shapes:
+                shape_stats = self.process_shape(shape, language_code, font_name)
+                total_stats["total_runs_processed"] += shape_stats["runs_processed"]
+                total_stats["total_language_applied"] += shape_stats["language_applied"]
+                total_stats["total_font_applied"] += shape_stats["font_applied"]
+                total_stats["total_text_replaced"] += shape_stats["text_replaced"]
+
+        return total_stats
+
+    @staticmethod
+    def _save_atomically(prs, save_path: str) -> None:
+        """Save presentation to a temporary file in the target folder, then rename it into place"""
+        import tempfile
+
+        target = Path(save_path)
+        fd, temp_name = tempfile.mkstemp(prefix=f".{target.stem}.", suffix=".tmp.pptx", dir=str(target.parent))
+        os.close(fd)
+        try:
+            prs.save(temp_name)
+            os.replace(temp_name, target)
+        finally:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+
     def update_presentation(
         self,
         presentation_path: str,
@@ -536,6 +628,8 @@ class FormattingSupport:
         font_name: Optional[str] = None,
         output_path: Optional[str] = None,
         create_backup: bool = True,
+        engine: str = "xml",
+        atomic: bool = False,
     ) -> Dict[str, any]:
         """
         Update both master slides and content slides in a PowerPoint presentation.
@@ -546,6 +640,9 @@ class FormattingSupport:
             font_name: Optional font name to apply
             output_path: Optional output path (default: update in place)
             create_backup: Whether to create a backup file
+            engine: "xml" for the bulk XML remap engine, "proxy" for the python-pptx shape walk
+            atomic: Write to a temporary file and rename it over the target, so an
+                interrupted save never leaves a truncated file (no backup needed)
 
         Returns:
             Dictionary with operation results and statistics
@@ -576,60 +673,19 @@ class FormattingSupport:
             # Load presentation
             prs = Presentation(str(pptx_path))
 
-            total_stats = {
-                "master_slides_processed": 0,
-                "content_slides_processed": 0,
-                "total_runs_processed": 0,
-                "total_language_applied": 0,
-                "total_font_applied": 0,
-                "total_text_replaced": 0,
-                "theme_fonts_updated": 0,
-            }
-
-            # Update theme fonts if font name is provided
-            if font_name:
-                if self.update_theme_fonts(prs, font_name):
-                    total_stats["theme_fonts_updated"] = 1
-
-            # Process master slides
-            try:
-                for slide_master in prs.slide_masters:
-                    total_stats["master_slides_processed"] += 1
-
-                    # Process master slide shapes
-                    for shape in slide_master.shapes:
-                        shape_stats = self.process_shape(shape, language_code, font_name)
-                        total_stats["total_runs_processed"] += shape_stats["runs_processed"]
-                        total_stats["total_language_applied"] += shape_stats["language_applied"]
-                        total_stats["total_font_applied"] += shape_stats["font_applied"]
-                        total_stats["total_text_replaced"] += shape_stats["text_replaced"]
-
-                    # Process slide layouts
-                    for slide_layout in slide_master.slide_layouts:
-                        for shape in slide_layout.shapes:
-                            shape_stats = self.process_shape(shape, language_code, font_name)
-                            total_stats["total_runs_processed"] += shape_stats["runs_processed"]
-                            total_stats["total_language_applied"] += shape_stats["language_applied"]
-                            total_stats["total_font_applied"] += shape_stats["font_applied"]
-                            total_stats["total_text_replaced"] += shape_stats["text_replaced"]
+            if engine == "xml":
+                from .remap_engine import XmlRemapEngine
 
-            except Exception as e:
-                print(f"⚠️  Warning: Error processing master slides: {e}")
-
-            # Process content slides
-            for slide in prs.slides:
-                total_stats["content_slides_processed"] += 1
-
-                for shape in slide.shapes:
-                    shape_stats = self.process_shape(shape, language_code, font_name)
-                    total_stats["total_runs_processed"] += shape_stats["runs_processed"]
-                    total_stats["total_language_applied"] += shape_stats["language_applied"]
-                    total_stats["total_font_applied"] += shape_stats["font_applied"]
-                    total_stats["total_text_replaced"] += shape_stats["text_replaced"]
+                total_stats = XmlRemapEngine(self).remap_parts(prs, language_code, font_name)
+            else:
+                total_stats = self._remap_with_proxies(prs, language_code, font_name)
 
             # Save presentation
             save_path = output_path if output_path else presentation_path
-            prs.save(save_path)
+            if atomic:
+                self._save_atomically(prs, save_path)
+            else:
+                prs.save(save_path)
 
             return {
                 "success": True,
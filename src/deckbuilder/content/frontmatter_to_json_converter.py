@@ -87,18 +87,19 @@ def _process_markdown_content(content: str):
     return processed
 
 
-def markdown_to_canonical_json(markdown_content: str) -> Dict[str, Any]:
+def markdown_to_canonical_json(markdown_content: str, processor=None) -> Dict[str, Any]:
     """
     Converts a Markdown string with frontmatter into the canonical JSON presentation model.
     This will be the single entry point for all .md files.
 
     Handles both pure structured frontmatter and frontmatter + content pairs.
+    Pass a ContentProcessor to read its parse profile after conversion.
     """
     # Import ContentProcessor to handle frontmatter + content parsing
     from .processor import ContentProcessor
 
     # Use ContentProcessor to properly parse frontmatter + content
-    processor = ContentProcessor()
+    processor = processor or ContentProcessor()
     slides = processor.parse_markdown_with_frontmatter(markdown_content)
 
     canonical_slides = []
@@ -213,6 +214,10 @@ def markdown_to_canonical_json(markdown_content: str) -> Dict[str, Any]:
         if "background_image" in slide_data:
             slide_obj["background_image"] = slide_data["background_image"]
 
+        # Add table_source to slide level if present (table loaded from a CSV/TSV file)
+        if "table_source" in slide_data:
+            slide_obj["table_source"] = slide_data["table_source"]
+
         # Add other placeholder fields from frontmatter (exclude internal fields and table properties)
         excluded_fields = [
             "type",
@@ -223,6 +228,7 @@ def markdown_to_canonical_json(markdown_content: str) -> Dict[str, Any]:
             "subtitle_formatted",
             "speaker_notes",  # Handle at slide level, not as placeholder
             "background_image",  # Handle at slide level for BackgroundHandler
+            "table_source",  # Handle at slide level for TableBuilder
         ]
 
         # Also exclude table properties from placeholders since they go in the table object
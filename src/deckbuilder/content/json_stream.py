@@ -0,0 +1,243 @@
+"""
+JSON Slide Stream Module
+
+Reads the ``slides`` array of a canonical JSON file one slide at a time, so
+very large generated inputs can be validated and built without holding the
+whole document (and its parsed form) in memory. The file is read in chunks
+and each slide object is decoded with the C-accelerated ``json`` scanner;
+only the current chunk and the slide being decoded are kept.
+
+Example:
+    stream = SlideStream("deck.json")
+    for slide in stream:
+        ...                     # one canonical slide dict at a time
+    stream.metadata             # other top-level keys read so far
+
+Accepted documents:
+    {"slides": [{...}, ...], ...}   canonical JSON; other keys go to metadata
+    [{...}, ...]                    a bare array of slides
+    {...}                           a single slide object, only with allow_bare_slide
+
+Syntax errors raise SlideStreamError (a json.JSONDecodeError) naming the
+slide they occurred in and their line and column in the file.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, TextIO, Union
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# A decode error further than this from the end of the buffer cannot be caused
+# by the buffer cutting a value short (the longest such case is a split \uXXXX escape)
+_TRUNCATION_MARGIN = 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+
+
+class SlideStreamError(json.JSONDecodeError):
+    """
+    Invalid JSON in a streamed file.
+
+    Attributes:
+        slide_index: 0-based index of the slide being read, or None outside the slides array
+        lineno, colno, pos: Position of the error in the file
+    """
+
+    def __init__(self, msg: str, slide_index: Optional[int], lineno: int, colno: int, pos: int):
+        where = f"Slide {slide_index + 1}: " if slide_index is not None else ""
+        ValueError.__init__(self, f"{where}{msg}: line {lineno} column {colno} (char {pos})")
+        self.msg = msg
+        self.doc = ""
+        self.pos = pos
+        self.lineno = lineno
+        self.colno = colno
+        self.slide_index = slide_index
+
+    def __reduce__(self):
+        return self.__class__, (self.msg, self.slide_index, self.lineno, self.colno, self.pos)
+
+
+class SlideStream:
+    """
+    Iterable over the slides of a canonical JSON file, decoded incrementally.
+
+    Args:
+        path: JSON file to read
+        chunk_size: Characters read from the file at a time
+        allow_bare_slide: Treat a top-level object without "slides" as a single slide
+        encoding: File encoding
+    """
+
+    def __init__(self, path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE, allow_bare_slide: bool = False, encoding: str = "utf-8"):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.allow_bare_slide = allow_bare_slide
+        self.encoding = encoding
+        self.metadata: Dict[str, Any] = {}
+
+        self._file: Optional[TextIO] = None
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._offset = 0  # file position of _buf[0]
+        self._lines = 0  # newlines before _buf[0]
+        self._line_start = 0  # file position after the last newline before _buf[0]
+        self._slide_index: Optional[int] = None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        self.metadata = {}
+        self._buf, self._pos, self._eof = "", 0, False
+        self._offset = self._lines = self._line_start = 0
+        self._slide_index = None
+
+        with open(self.path, "r", encoding=self.encoding) as f:
+            self._file = f
+            try:
+                yield from self._document()
+            finally:
+                self._file = None
+                self._buf = ""
+
+    def _document(self) -> Iterator[Dict[str, Any]]:
+        char = self._skip_whitespace()
+        if char == "[":
+            yield from self._slides()
+        elif char == "{":
+            self._pos += 1
+            found = False
+            if self._skip_whitespace() == "}":
+                self._pos += 1
+            else:
+                while True:
+                    key = self._value()
+                    if not isinstance(key, str):
+                        raise self._error("Expecting property name enclosed in double quotes", self._pos)
+                    self._expect(":")
+                    if key == "slides" and not found:
+                        if self._skip_whitespace() != "[":
+                            raise ValueError("'slides' must be an array of slide objects.")
+                        found = True
+                        yield from self._slides()
+                    else:
+                        self.metadata[key] = self._value()
+
+                    char = self._skip_whitespace()
+                    self._pos += 1
+                    if char == "}":
+                        break
+                    if char != ",":
+                        raise self._error("Expecting ',' delimiter", self._pos - 1)
+
+            if not found:
+                if not self.allow_bare_slide:
+                    raise ValueError("Canonical JSON data must contain a 'slides' array at root level.")
+                yield self.metadata
+                self.metadata = {}
+        else:
+            raise ValueError("Input must be a JSON object with a 'slides' array (or an array of slides).")
+
+        if self._skip_whitespace():
+            raise self._error("Extra data", self._pos)
+
+    def _slides(self) -> Iterator[Dict[str, Any]]:
+        """Yield the elements of the array starting at the current position."""
+        self._pos += 1
+        if self._skip_whitespace() == "]":
+            self._pos += 1
+            return
+
+        index = 0
+        while True:
+            self._slide_index = index
+            yield self._value()
+            index += 1
+
+            char = self._skip_whitespace()
+            self._pos += 1
+            if char == "]":
+                self._slide_index = None
+                return
+            if char != ",":
+                raise self._error("Expecting ',' delimiter", self._pos - 1)
+
+    def _fill(self) -> bool:
+        """Drop the consumed part of the buffer and read the next chunk; False at end of file."""
+        if self._eof:
+            return False
+        chunk = self._file.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+
+        consumed = self._buf[: self._pos]
+        newlines = consumed.count("\n")
+        if newlines:
+            self._lines += newlines
+            self._line_start = self._offset + consumed.rfind("\n") + 1
+        self._offset += self._pos
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _skip_whitespace(self) -> str:
+        """Advance past whitespace and return the next character ("" at end of file)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        if self._skip_whitespace() != char:
+            raise self._error(f"Expecting '{char}' delimiter", self._pos)
+        self._pos += 1
+
+    def _value(self) -> Any:
+        """Decode the JSON value at the current position, reading more of the file as needed."""
+        if not self._skip_whitespace():
+            raise self._error("Expecting value", self._pos)
+
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                cut_short = e.pos + _TRUNCATION_MARGIN >= len(self._buf) or e.msg.startswith("Unterminated string")
+                if cut_short and self._fill():
+                    continue
+                raise self._error(e.msg, e.pos) from None
+
+            # A number near the buffer end may continue in the next chunk: "12" or
+            # "12." decode as 12 with the rest ("5", ".5", "e3") still unread
+            is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if is_number and end + _TRUNCATION_MARGIN >= len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _error(self, msg: str, pos: int) -> SlideStreamError:
+        """Build an error for a position in the buffer, located in the file."""
+        newlines = self._buf.count("\n", 0, pos)
+        if newlines:
+            line_start = self._offset + self._buf.rfind("\n", 0, pos) + 1
+        else:
+            line_start = self._line_start
+        file_pos = self._offset + pos
+        return SlideStreamError(msg, self._slide_index, self._lines + newlines + 1, file_pos - line_start + 1, file_pos)
+
+
+def iter_json_slides(path: Union[str, Path], allow_bare_slide: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the slides of a canonical JSON file without loading it whole.
+
+    Args:
+        path: JSON file to read
+        allow_bare_slide: Treat a top-level object without "slides" as a single slide
+
+    Returns:
+        Iterator of slide dictionaries
+    """
+    return iter(SlideStream(path, allow_bare_slide=allow_bare_slide))
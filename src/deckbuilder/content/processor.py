@@ -1,13 +1,131 @@
+import copy
 import re
+import threading
+import time
+from collections import OrderedDict
+
 import yaml
 
+from ..utils.build_profile import BuildProfile
+
+# libyaml's C loader is much faster than the pure-Python SafeLoader; fall back when it is not compiled in
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+FRONTMATTER_CACHE_SIZE = 512
+
+TOKEN_HEADING = "heading"
+TOKEN_BULLET = "bullet"
+TOKEN_PARAGRAPH = "paragraph"
+
+MAX_HEADING_LEVEL = 6
+
+# Line kind by first non-blank character; anything else is paragraph text
+_FIRST_CHAR_KINDS = {"#": TOKEN_HEADING, "-": TOKEN_BULLET, "*": TOKEN_BULLET}
+
+
+def tokenize_markdown_lines(lines) -> list:
+    """
+    Classify markdown lines in a single pass.
+
+    Blank lines are skipped. Headings get their level from the number of
+    leading '#' characters (H1-H6). Bullets get a level from their
+    indentation, one level per two leading whitespace characters, with no
+    upper limit. Lines that only look like a heading or bullet (no space
+    after the marker, more than six '#') are paragraph text.
+
+    Args:
+        lines: Iterable of raw markdown lines
+
+    Returns:
+        List of (kind, text, level) tuples where kind is TOKEN_HEADING, TOKEN_BULLET or TOKEN_PARAGRAPH
+    """
+    tokens = []
+    append = tokens.append
+    kind_for = _FIRST_CHAR_KINDS.get
+
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        kind = kind_for(line[0], TOKEN_PARAGRAPH)
+        if kind == TOKEN_BULLET:
+            if line[1:2] == " ":
+                indent = len(raw_line) - len(raw_line.lstrip())
+                append((TOKEN_BULLET, line[2:].strip(), indent // 2 + 1))
+                continue
+        elif kind == TOKEN_HEADING:
+            level = len(line) - len(line.lstrip("#"))
+            if level <= MAX_HEADING_LEVEL and line[level : level + 1] == " ":
+                append((TOKEN_HEADING, line[level + 1 :].strip(), level))
+                continue
+
+        append((TOKEN_PARAGRAPH, line, 0))
+
+    return tokens
+
+
+class FrontmatterCache:
+    """
+    Bounded LRU memo of parsed YAML keyed by the raw frontmatter text.
+
+    Generated decks repeat the same frontmatter many times, so each distinct
+    block is parsed once. Callers always receive a deep copy, so mutating a
+    result never leaks into later slides.
+    """
+
+    def __init__(self, maxsize: int = FRONTMATTER_CACHE_SIZE):
+        """Initialize an empty cache holding at most maxsize entries."""
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, frontmatter_text: str):
+        """
+        Parse frontmatter YAML, reusing an earlier parse of identical text.
+
+        Returns:
+            Tuple of (parsed data copy, whether it was a cache hit)
+
+        Raises:
+            yaml.YAMLError: If the text is not valid YAML (errors are not cached)
+        """
+        with self._lock:
+            if frontmatter_text in self._entries:
+                self._entries.move_to_end(frontmatter_text)
+                self.hits += 1
+                return copy.deepcopy(self._entries[frontmatter_text]), True
+
+        parsed = yaml.load(frontmatter_text, Loader=YAML_SAFE_LOADER)  # nosec B506 - safe loader only
+
+        with self._lock:
+            self.misses += 1
+            self._entries[frontmatter_text] = parsed
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return copy.deepcopy(parsed), False
+
+    def clear(self) -> None:
+        """Drop all entries and reset hit statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Shared by every ContentProcessor in the process
+frontmatter_cache = FrontmatterCache()
+
 
 class ContentProcessor:
     """Handles markdown parsing, frontmatter processing, and content formatting."""
 
     def __init__(self):
         """Initialize the content processor."""
-        pass
+        self.profile = BuildProfile()
+        self._pattern_loader = None
 
     def parse_markdown_with_frontmatter(self, markdown_content: str) -> list:
         """
@@ -20,6 +138,9 @@ class ContentProcessor:
             List of slide dictionaries ready for _add_slide()
         """
         slides = []
+        self.profile = BuildProfile()
+        # Re-read pattern files once per document so edits are picked up between builds
+        self._pattern_loader = None
 
         # Split content by frontmatter boundaries
         slide_blocks = re.split(r"^---\s*$", markdown_content, flags=re.MULTILINE)
@@ -62,13 +183,15 @@ class ContentProcessor:
 
     def _parse_structured_frontmatter(self, frontmatter_content: str) -> dict:
         """Parse frontmatter using PatternLoader system only"""
-        from ..templates.pattern_loader import PatternLoader
-
+        start = time.perf_counter()
         try:
-            parsed = yaml.safe_load(frontmatter_content)
+            parsed, cache_hit = frontmatter_cache.load(frontmatter_content)
+            self.profile.count("frontmatter_cache_hits" if cache_hit else "frontmatter_cache_misses")
         except yaml.YAMLError:
             # Fallback to safe parsing for special characters
             return self._parse_frontmatter_safe(frontmatter_content)
+        finally:
+            self.profile.add_time("frontmatter_parse", time.perf_counter() - start)
 
         # Handle case where YAML parsing returns a string (malformed YAML)
         if not isinstance(parsed, dict):
@@ -79,8 +202,7 @@ class ContentProcessor:
             return parsed
 
         # Check if this layout has a pattern file
-        pattern_loader = PatternLoader()
-        pattern_data = pattern_loader.get_pattern_for_layout(layout_name)
+        pattern_data = self._get_pattern_loader().get_pattern_for_layout(layout_name)
 
         if pattern_data:
             # Validate required fields
@@ -112,6 +234,14 @@ class ContentProcessor:
 
         return result
 
+    def _get_pattern_loader(self):
+        """Create the PatternLoader on first use so pattern files are read once per document"""
+        if self._pattern_loader is None:
+            from ..templates.pattern_loader import PatternLoader
+
+            self._pattern_loader = PatternLoader()
+        return self._pattern_loader
+
     def _parse_frontmatter_safe(self, frontmatter_raw: str) -> dict:
         """
         Parse frontmatter safely by handling special characters that break YAML.
@@ -183,7 +313,7 @@ class ContentProcessor:
         # Parse mixed content based on slide type
         # Note: Tables are now parsed in converter.py and come as JSON objects in placeholders
         if slide_data["type"] != "title":  # Content slides get rich content
-            rich_content = self._parse_rich_content("\n".join(content_lines))
+            rich_content = self._parse_rich_lines(content_lines)
             if rich_content:
                 slide_data["rich_content"] = rich_content
 
@@ -191,70 +321,44 @@ class ContentProcessor:
 
     def _parse_rich_content(self, content: str) -> list:
         """Parse mixed markdown content into structured content blocks with better hierarchy"""
+        return self._parse_rich_lines(content.split("\n"))
+
+    def _parse_rich_lines(self, lines: list) -> list:
+        """Build heading, bullet and paragraph blocks from already split markdown lines"""
         blocks = []
-        lines = content.split("\n")
         current_block = None
+        bullet_items = None
+        paragraph_parts = None
+
+        for kind, text, level in tokenize_markdown_lines(lines):
+            # Extend the open block when the line continues it
+            if kind == TOKEN_PARAGRAPH:
+                if paragraph_parts is not None:
+                    paragraph_parts.append(text)
+                    continue
+            elif kind == TOKEN_BULLET:
+                if bullet_items is not None:
+                    bullet_items.append({"text": text, "level": level})
+                    continue
+
+            if current_block is not None:
+                if paragraph_parts is not None:
+                    current_block["text"] = " ".join(paragraph_parts)
+                blocks.append(current_block)
+            bullet_items = paragraph_parts = None
+
+            if kind == TOKEN_BULLET:
+                bullet_items = [{"text": text, "level": level}]
+                current_block = {"type": "bullets", "items": bullet_items}
+            elif kind == TOKEN_HEADING:
+                current_block = {"type": "heading", "text": text, "level": level}
+            else:
+                paragraph_parts = [text]
+                current_block = {"type": "paragraph", "text": text}
 
-        for line in lines:
-            original_line = line
-            line = line.strip()
-            if not line:
-                continue
-
-            # Handle nested bullet points by preserving indentation
-            if line.startswith("- ") or line.startswith("* "):
-                # Determine indentation level
-                indent_level = len(original_line) - len(original_line.lstrip())
-                bullet_text = line[2:].strip()
-
-                if not current_block or current_block.get("type") != "bullets":
-                    if current_block:
-                        blocks.append(current_block)
-                    current_block = {"type": "bullets", "items": []}
-
-                # Map indentation to bullet levels (0 indent = level 1, 2+ spaces = level 2, etc.)
-                level = 1 if indent_level < 2 else 2
-                current_block["items"].append({"text": bullet_text, "level": level})
-
-            elif line.startswith("###### "):  # H6 heading
-                if current_block:
-                    blocks.append(current_block)
-                current_block = {"type": "heading", "text": line[7:].strip(), "level": 6}
-
-            elif line.startswith("##### "):  # H5 heading
-                if current_block:
-                    blocks.append(current_block)
-                current_block = {"type": "heading", "text": line[6:].strip(), "level": 5}
-
-            elif line.startswith("#### "):  # H4 heading
-                if current_block:
-                    blocks.append(current_block)
-                current_block = {"type": "heading", "text": line[5:].strip(), "level": 4}
-
-            elif line.startswith("### "):  # H3 heading
-                if current_block:
-                    blocks.append(current_block)
-                current_block = {"type": "heading", "text": line[4:].strip(), "level": 3}
-
-            elif line.startswith("## "):  # H2 heading
-                if current_block:
-                    blocks.append(current_block)
-                current_block = {"type": "heading", "text": line[3:].strip(), "level": 2}
-
-            elif line.startswith("# "):  # H1 heading
-                if current_block:
-                    blocks.append(current_block)
-                current_block = {"type": "heading", "text": line[2:].strip(), "level": 1}
-
-            else:  # Regular paragraph
-                if not current_block or current_block.get("type") != "paragraph":
-                    if current_block:
-                        blocks.append(current_block)
-                    current_block = {"type": "paragraph", "text": line}
-                else:
-                    current_block["text"] += " " + line
-
-        if current_block:
+        if current_block is not None:
+            if paragraph_parts is not None:
+                current_block["text"] = " ".join(paragraph_parts)
             blocks.append(current_block)
 
         return blocks
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Deckbuilder XML Remap Engine
+
+Bulk language and font remapping that works directly on the XML of each slide,
+layout and master part instead of walking python-pptx shape and run proxies.
+All text runs in a part are selected with one compiled XPath query and updated
+in place, and text replacement is batched across the unique run texts.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from lxml import etree  # nosec B410 - querying trusted PowerPoint XML
+from pptx.enum.lang import MSO_LANGUAGE_ID
+from pptx.opc.constants import CONTENT_TYPE as CT
+
+from .formatting_support import FormattingSupport
+
+NAMESPACES = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+}
+
+# Every a:r reachable from a part's shape tree: text frames, table cells and group members
+RUN_XPATH = etree.XPath("./p:cSld/p:spTree//a:p/a:r", namespaces=NAMESPACES)
+
+
+class XmlRemapEngine:
+    """Applies language, font and text replacements to whole presentation parts at once"""
+
+    def __init__(self, formatter: Optional[FormattingSupport] = None):
+        """Initialize engine, reusing a FormattingSupport for mappings and theme fonts"""
+        self.formatter = formatter or FormattingSupport()
+
+    def _compile_replacement_filter(self, language_code: str) -> Optional[re.Pattern]:
+        """
+        Compile one pattern matching any source word of the language mapping.
+
+        Text that does not match this pattern cannot be changed by
+        apply_text_replacements, so it is skipped without running the
+        per-word replacement passes.
+        """
+        mapping = self.formatter.load_language_mapping(language_code)
+        if not mapping:
+            return None
+
+        words: List[str] = []
+        for section in ("spelling_patterns", "conditional_mappings", "vocabulary"):
+            words.extend(mapping.get(section, {}).keys())
+        if not words:
+            return None
+
+        # Longest first so phrases win over their leading words
+        alternation = "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+        return re.compile(r"\b(?:" + alternation + r")\b", re.IGNORECASE)
+
+    def _build_replacements(self, texts: List[str], language_code: str) -> Dict[str, str]:
+        """Compute replacements once per unique run text, returning only changed texts"""
+        replacement_filter = self._compile_replacement_filter(language_code)
+        if replacement_filter is None:
+            return {}
+
+        replacements = {}
+        for text in set(texts):
+            if not text or not replacement_filter.search(text):
+                continue
+            replaced = self.formatter.apply_text_replacements(text, language_code)
+            if replaced != text:
+                replacements[text] = replaced
+        return replacements
+
+    def remap_parts(self, prs, language_code: Optional[str] = None, font_name: Optional[str] = None) -> Dict[str, int]:
+        """
+        Remap every slide, layout and master part of a loaded presentation.
+
+        Args:
+            prs: python-pptx Presentation object
+            language_code: Optional language code to apply
+            font_name: Optional font name to apply
+
+        Returns:
+            Dictionary with the same statistics as FormattingSupport.update_presentation
+        """
+        stats = {
+            "master_slides_processed": 0,
+            "content_slides_processed": 0,
+            "total_runs_processed": 0,
+            "total_language_applied": 0,
+            "total_font_applied": 0,
+            "total_text_replaced": 0,
+            "theme_fonts_updated": 0,
+        }
+
+        if font_name and self.formatter.update_theme_fonts(prs, font_name):
+            stats["theme_fonts_updated"] = 1
+
+        # Resolve the language attribute value once instead of per run
+        lang_value = None
+        if language_code:
+            normalized = self.formatter.normalize_language_input(language_code)
+            if normalized:
+                lang_value = MSO_LANGUAGE_ID.to_xml(FormattingSupport.LANGUAGE_IDS[normalized])
+
+        # Select runs for all parts up front so replacements can be batched
+        part_runs = []
+        for part in prs.part.package.iter_parts():
+            if part.content_type == CT.PML_SLIDE_MASTER:
+                stats["master_slides_processed"] += 1
+            elif part.content_type == CT.PML_SLIDE:
+                stats["content_slides_processed"] += 1
+            elif part.content_type != CT.PML_SLIDE_LAYOUT:
+                continue
+            part_runs.append(RUN_XPATH(part._element))
+
+        replacements = {}
+        if language_code:
+            all_texts = [run.text for runs in part_runs for run in runs]
+            replacements = self._build_replacements(all_texts, language_code)
+
+        for runs in part_runs:
+            stats["total_runs_processed"] += len(runs)
+            for run in runs:
+                if replacements:
+                    replaced = replacements.get(run.text)
+                    if replaced is not None:
+                        run.text = replaced
+                        stats["total_text_replaced"] += 1
+
+                if lang_value is None and not font_name:
+                    continue
+
+                rPr = run.get_or_add_rPr()
+                if lang_value is not None:
+                    rPr.set("lang", lang_value)
+                    stats["total_language_applied"] += 1
+                if font_name:
+                    rPr.get_or_add_latin().set("typeface", font_name)
+                    stats["total_font_applied"] += 1
+
+        return stats
@@ -0,0 +1,169 @@
+"""
+Table Source Module
+
+Loads the data of a slide's ``table_source`` field from a local CSV or TSV
+file. Rows are streamed with the csv module and only the selected columns
+and row range are kept, so data tables skip the markdown round-trip and the
+per-cell inline-formatting parse: cells go to the table writer as plain text.
+
+Example slide:
+    {
+        "layout": "Title Only",
+        "placeholders": {"title": "Regional sales"},
+        "table_source": {
+            "path": "data/sales.csv",
+            "columns": ["Region", "Revenue"],
+            "rows": [0, 20],
+            "number_format": {"Revenue": ",.0f"},
+            "header_style": "dark_blue_white_text"
+        }
+    }
+
+Source options:
+    path: CSV/TSV file (required)
+    delimiter: Field separator (default: tab for .tsv/.tab files, otherwise comma)
+    encoding: File encoding (default: utf-8, with or without BOM)
+    header: Whether the first line holds column names (default: true); it becomes the table header
+    columns: Column names or 0-based indexes to include, in output order (default: all)
+    rows: [start, stop] range of data rows, 0-based with stop exclusive; stop may be null
+    number_format: Format spec for numeric cells (e.g. ",.2f"), or a mapping of column to spec
+
+Every other key (header_style, row_style, column_widths, ...) is passed to
+the table builder as a table styling option.
+"""
+
+import csv
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Union
+
+SOURCE_OPTIONS = ("path", "delimiter", "encoding", "header", "columns", "rows", "number_format")
+TSV_SUFFIXES = (".tsv", ".tab")
+
+ColumnRef = Union[str, int]
+
+
+def _column_index(column: ColumnRef, header: Optional[List[str]]) -> int:
+    """Resolve a column name or index to its position in the file."""
+    if isinstance(column, int) and not isinstance(column, bool):
+        return column
+    if isinstance(column, str):
+        if header is not None and column in header:
+            return header.index(column)
+        if column.isdigit():
+            return int(column)
+    raise ValueError(f"table_source: unknown column {column!r}")
+
+
+def format_number(value: str, spec: str) -> str:
+    """
+    Format a numeric cell with a format spec, leaving other text unchanged.
+
+    Args:
+        value: Cell text
+        spec: Python format spec (e.g. ",.2f", ".1%", ",d")
+
+    Returns:
+        Formatted number, or the original text if it is not a number or the spec does not apply
+    """
+    text = value.strip()
+    try:
+        number: Union[int, float] = int(text)
+    except ValueError:
+        try:
+            number = float(text)
+        except ValueError:
+            return value
+    try:
+        return format(number, spec)
+    except ValueError:
+        return value
+
+
+def _parse_range(rows: Any) -> tuple:
+    if rows is None:
+        return 0, None
+    if not isinstance(rows, (list, tuple)) or len(rows) != 2:
+        raise ValueError("table_source: 'rows' must be [start, stop]")
+    start, stop = rows
+    if not isinstance(start, int) or start < 0 or (stop is not None and (not isinstance(stop, int) or stop < start)):
+        raise ValueError(f"table_source: invalid row range {list(rows)}")
+    return start, stop
+
+
+def iter_table_rows(source: Mapping[str, Any]) -> Iterator[List[str]]:
+    """
+    Stream the rows of a table source: the header row (if any), then the selected data rows.
+
+    The file is read lazily and reading stops at the end of the row range.
+
+    Args:
+        source: table_source options (see module docstring)
+
+    Yields:
+        Rows of cell text for the selected columns
+
+    Raises:
+        ValueError: If the options are invalid or the file cannot be read
+    """
+    path = source.get("path")
+    if not path or not isinstance(path, str):
+        raise ValueError("table_source: 'path' to a CSV or TSV file is required")
+
+    delimiter = source.get("delimiter") or ("\t" if Path(path).suffix.lower() in TSV_SUFFIXES else ",")
+    start, stop = _parse_range(source.get("rows"))
+
+    try:
+        with open(path, newline="", encoding=source.get("encoding", "utf-8-sig")) as csv_file:
+            reader = csv.reader(csv_file, delimiter=delimiter)
+
+            header = None
+            if source.get("header", True):
+                header = next(reader, [])
+
+            columns = source.get("columns")
+            indexes = [_column_index(column, header) for column in columns] if columns else None
+
+            number_format = source.get("number_format")
+            formats: Dict[int, str] = {}
+            if isinstance(number_format, Mapping):
+                formats = {_column_index(column, header): spec for column, spec in number_format.items()}
+
+            def select(row: List[str]) -> List[str]:
+                return [row[index] if index < len(row) else "" for index in indexes] if indexes is not None else row
+
+            if header is not None:
+                yield select(header)
+
+            for row in islice(reader, start, stop):
+                if number_format:
+                    if formats:
+                        row = [format_number(cell, formats[index]) if index in formats else cell for index, cell in enumerate(row)]
+                    else:
+                        row = [format_number(cell, number_format) for cell in row]
+                yield select(row)
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        raise ValueError(f"table_source: cannot read '{path}': {e}") from e
+
+
+def load_table_source(source: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Load a table source into table data for TableBuilder.add_table_to_slide.
+
+    Args:
+        source: table_source options (see module docstring)
+
+    Returns:
+        Table dictionary with "data" rows and the source's styling options
+
+    Raises:
+        ValueError: If the options are invalid, the file cannot be read or it has no rows
+    """
+    if not isinstance(source, Mapping):
+        raise ValueError("table_source must be an object with a 'path'")
+
+    table_data = {key: value for key, value in source.items() if key not in SOURCE_OPTIONS}
+    table_data["data"] = list(iter_table_rows(source))
+    if not table_data["data"] or not any(table_data["data"]):
+        raise ValueError(f"table_source: no rows in '{source.get('path')}'")
+    return table_data
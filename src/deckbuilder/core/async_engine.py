@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Asyncio facade for Deckbuilder.
+
+AsyncDeckbuilder lets an asyncio application build presentations without
+blocking its event loop or wrapping a whole build in one thread. Each build
+runs in three stages:
+
+1. Input files are read in worker threads.
+2. Every image the deck needs (resized user images and PlaceKitten fallbacks,
+   at the size of the template placeholder they fill) is prepared
+   concurrently into the shared image cache.
+3. Slide assembly and the save run on a pooled engine in the build executor,
+   where the image lookups are now cache hits.
+
+Concurrency is bounded per resource: builds by the engine pool size, image
+preparation by its own executor and file reads by a semaphore, so many build
+requests can share one event loop.
+
+Example:
+    async with AsyncDeckbuilder(max_builds=4) as deck:
+        results = await asyncio.gather(*(deck.create_presentation_from_file(path) for path in paths))
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pptx.util import Emu
+
+from ..image.fallback_warmer import PIXELS_PER_INCH
+from ..image.image_handler import ImageHandler
+from ..image.placekitten_integration import PlaceKittenIntegration
+from ..templates.manager import TemplateManager
+from ..utils.path import PathManager, path_manager
+from ..utils.progress import ProgressCallback
+from .engine_pool import DEFAULT_MAX_ENGINES, EnginePool
+from .presentation_builder import image_cache_dir
+from .result import PresentationResult
+
+DEFAULT_MAX_IMAGE_JOBS = 4
+DEFAULT_MAX_FILE_IO = 8
+
+SUCCESS_MARKER = "Successfully created presentation: "
+
+# (image path or value from the slide, target pixel size, PlaceKitten fallback context)
+ImageJob = Tuple[Any, Tuple[int, int], Dict[str, Any]]
+
+
+def _to_pixels(emu: int) -> int:
+    """Convert EMU to pixels the same way the image handlers do."""
+    return int(Emu(emu).inches * PIXELS_PER_INCH)
+
+
+class AsyncDeckbuilder:
+    """
+    Awaitable presentation builds with concurrent image preparation.
+
+    Args:
+        path_manager_instance: PathManager for template and output folders (default: global)
+        max_builds: Maximum concurrent slide assembly/save jobs (engine pool size)
+        max_image_jobs: Maximum images prepared at the same time
+        max_file_io: Maximum concurrent input file reads
+    """
+
+    def __init__(
+        self,
+        path_manager_instance: Optional[PathManager] = None,
+        max_builds: int = DEFAULT_MAX_ENGINES,
+        max_image_jobs: int = DEFAULT_MAX_IMAGE_JOBS,
+        max_file_io: int = DEFAULT_MAX_FILE_IO,
+    ):
+        self.path_manager = path_manager_instance or path_manager
+        self.pool = EnginePool(self.path_manager, max_engines=max_builds)
+        self._build_executor = ThreadPoolExecutor(max_workers=max_builds, thread_name_prefix="deckbuilder-build")
+        self._image_executor = ThreadPoolExecutor(max_workers=max_image_jobs, thread_name_prefix="deckbuilder-image")
+        self._file_semaphore = asyncio.Semaphore(max_file_io)
+        self.template_manager = TemplateManager(self.path_manager)
+
+        # Same cache folder the engines' image placeholder handlers use
+        self.image_handler = ImageHandler(str(image_cache_dir(self.path_manager)))
+        self.placekitten = PlaceKittenIntegration(self.image_handler)
+
+    async def __aenter__(self) -> "AsyncDeckbuilder":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the build and image executors (running jobs finish first)."""
+        self._build_executor.shutdown(wait=True)
+        self._image_executor.shutdown(wait=True)
+
+    async def read_file(self, file_path: str) -> str:
+        """Read a UTF-8 input file in a worker thread."""
+        async with self._file_semaphore:
+            return await asyncio.to_thread(Path(file_path).read_text, encoding="utf-8")
+
+    def collect_image_jobs(self, presentation_data: Dict[str, Any], templateName: str = "default") -> List[ImageJob]:
+        """
+        List the images a build will place, with the placeholder size and fallback context it will use.
+
+        Picture fields are matched to the template's PICTURE placeholders by
+        name; background images use the full slide size. Images the build
+        resolves differently are simply prepared during the build instead.
+
+        Args:
+            presentation_data: Canonical JSON presentation data
+            templateName: Template the deck will be built with
+
+        Returns:
+            List of (image value, (width, height), fallback context) jobs
+        """
+        from ..templates.template_analysis import load_template_analysis
+
+        slides = presentation_data.get("slides") if isinstance(presentation_data, dict) else None
+        template_path = self.template_manager.get_template_path(templateName)
+        if not isinstance(slides, list) or not template_path:
+            return []
+
+        analysis = load_template_analysis(template_path)
+        slide_size = (_to_pixels(analysis["slide_width"]), _to_pixels(analysis["slide_height"]))
+
+        jobs: Dict[Tuple, ImageJob] = {}
+        for index, slide_data in enumerate(slides):
+            if not isinstance(slide_data, dict):
+                continue
+            layout = slide_data.get("layout", slide_data.get("type", "unknown"))
+            pictures = {
+                placeholder["name"]: placeholder
+                for placeholder in analysis["layouts"].get(layout, {}).get("placeholders", [])
+                if placeholder["type"] == "PICTURE" and placeholder["width"] and placeholder["height"]
+            }
+
+            placeholders = slide_data.get("placeholders", slide_data)
+            for field_name, value in placeholders.items() if isinstance(placeholders, dict) else ():
+                picture = pictures.get(field_name)
+                if picture is None:
+                    continue
+                dimensions = (_to_pixels(picture["width"]), _to_pixels(picture["height"]))
+                context = {"layout": layout, "slide_index": index, "field_name": field_name}
+                key = (value, dimensions) if isinstance(value, str) and value else (None, dimensions, index, field_name)
+                jobs.setdefault(key, (value, dimensions, context))
+
+            background = slide_data.get("background_image")
+            if background and isinstance(background, str):
+                context = {"layout": layout, "slide_index": index, "field_name": "background_image", "background": True}
+                jobs.setdefault((background.strip(), slide_size), (background.strip(), slide_size, context))
+
+        return list(jobs.values())
+
+    def _prepare_image(self, job: ImageJob) -> Optional[str]:
+        """Resize a user image into the cache, or render its PlaceKitten fallback (as the build would)."""
+        value, dimensions, context = job
+        if value and isinstance(value, str) and self.image_handler.validate_image(value):
+            processed = self.image_handler.process_image(value, dimensions, quality="high")
+            if processed:
+                return processed
+        return self.placekitten.generate_fallback(dimensions, context)
+
+    async def prepare_images(self, presentation_data: Dict[str, Any], templateName: str = "default") -> Dict[str, int]:
+        """
+        Prepare all images for a deck concurrently in the image executor.
+
+        Returns:
+            Counts of requested, prepared and failed images
+        """
+        loop = asyncio.get_running_loop()
+        jobs = await asyncio.to_thread(self.collect_image_jobs, presentation_data, templateName)
+        results = await asyncio.gather(*(loop.run_in_executor(self._image_executor, self._prepare_image, job) for job in jobs), return_exceptions=True)
+        prepared = sum(1 for result in results if isinstance(result, str))
+        return {"requested": len(jobs), "prepared": prepared, "failed": len(jobs) - prepared}
+
+    async def _run_on_engine(self, build: Callable):
+        """Run build(engine) on a pooled engine in the build executor."""
+
+        def run():
+            with self.pool.session() as engine:
+                return build(engine)
+
+        return await asyncio.get_running_loop().run_in_executor(self._build_executor, run)
+
+    async def create_presentation(
+        self,
+        presentation_data: Dict[str, Any],
+        fileName: str = "Sample_Presentation",
+        templateName: str = "default",
+        language_code: Optional[str] = None,
+        font_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> str:
+        """
+        Build a presentation from canonical JSON (see Deckbuilder.create_presentation).
+
+        Returns:
+            The engine's success message
+
+        Raises:
+            ValueError: If the presentation data is not valid canonical JSON
+        """
+        await self.prepare_images(presentation_data, templateName)
+        return await self._run_on_engine(lambda engine: engine.create_presentation(presentation_data, fileName, templateName, language_code, font_name, progress=progress))
+
+    async def _build_result(self, presentation_data: Dict[str, Any], **kwargs) -> PresentationResult:
+        """Build and report the outcome as a PresentationResult."""
+        try:
+            message = await self.create_presentation(presentation_data, **kwargs)
+        except ValueError as e:
+            return PresentationResult.validation_error_result(str(e), "Check presentation data structure and template compatibility")
+        except Exception as e:
+            return PresentationResult.error_result(f"Unexpected error during presentation creation: {str(e)}")
+
+        filename = message.split(SUCCESS_MARKER)[1].strip() if SUCCESS_MARKER in message else "presentation.pptx"
+        return PresentationResult.success_result(filename, len(presentation_data["slides"]))
+
+    async def create_presentation_from_markdown(self, markdown_content: str, fileName: str = "Sample_Presentation", templateName: str = "default", **kwargs) -> PresentationResult:
+        """
+        Build a presentation from markdown with frontmatter.
+
+        Conversion runs in the build executor. Accepts the same keyword
+        arguments as create_presentation.
+
+        Returns:
+            PresentationResult with success/error information
+        """
+        from ..content.frontmatter_to_json_converter import markdown_to_canonical_json
+
+        try:
+            presentation_data = await asyncio.get_running_loop().run_in_executor(self._build_executor, markdown_to_canonical_json, markdown_content)
+        except Exception as e:
+            return PresentationResult.content_error_result(f"Error converting markdown to presentation format: {str(e)}", "Check markdown frontmatter syntax and structure")
+
+        return await self._build_result(presentation_data, fileName=fileName, templateName=templateName, **kwargs)
+
+    async def create_presentation_from_file(self, file_path: str, fileName: str = "Sample_Presentation", templateName: str = "default", **kwargs) -> PresentationResult:
+        """
+        Build a presentation from a .json or .md file, reading it without blocking the loop.
+
+        Returns:
+            PresentationResult with success/error information
+        """
+        suffix = Path(file_path).suffix.lower()
+        if suffix not in (".json", ".md"):
+            return PresentationResult.validation_error_result(f"Unsupported file type '{suffix}'", "Supported types: .json, .md")
+
+        try:
+            content = await self.read_file(file_path)
+        except OSError as e:
+            return PresentationResult.error_result(f"Could not read {file_path}: {str(e)}")
+
+        if suffix == ".md":
+            return await self.create_presentation_from_markdown(content, fileName=fileName, templateName=templateName, **kwargs)
+
+        try:
+            presentation_data = json.loads(content)
+        except json.JSONDecodeError as e:
+            return PresentationResult.content_error_result(f"Invalid JSON: {str(e)}", "Check the file is canonical JSON with a 'slides' array")
+
+        return await self._build_result(presentation_data, fileName=fileName, templateName=templateName, **kwargs)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Compiled deck schema validation for Deckbuilder.
+
+Checks a whole deck against the canonical JSON structure and the structured
+frontmatter patterns (``yaml_pattern`` fields and
+``validation.required_fields``) in one pass before any slide is built, and
+collects every problem instead of stopping at the first, so a deck with ten
+broken slides fails once, with ten messages, before any image is fetched.
+
+Each layout's pattern is compiled once into a LayoutSchema (its field names,
+required fields and per-field type checks), and the compiled DeckSchema is
+cached per pattern set (keyed by PatternLoader.fingerprint), so checking a
+slide costs a few set and dict lookups.
+
+Problems that would fail the build (wrong structure, a layout with no
+pattern, a field of the wrong type) are errors. Fields the layout does not
+have (the build ignores them) and missing required fields are warnings, or
+errors when strict.
+
+Environment variables:
+    DECK_SCHEMA_STRICT: "1"/"true" to treat unknown and missing fields as errors
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from ..templates.pattern_loader import PatternLoader
+from ..utils.cache_stats import CacheCounter
+from ..utils.logging import error_print
+from .mail_merge import REPEAT_KEY, check_fields, load_records
+
+# Slide data fields that are never placeholder fields
+METADATA_FIELDS = frozenset({"layout", "style", "speaker_notes"})
+
+# Pattern field types ("str" fields also take rich text lists and table objects)
+FIELD_TYPES: Dict[str, Tuple[str, Callable[[Any], bool]]] = {
+    "str": ("text", lambda value: True),
+    "int": ("an integer", lambda value: isinstance(value, int) and not isinstance(value, bool)),
+    "bool": ("true or false", lambda value: isinstance(value, bool)),
+    "list": ("an array", lambda value: isinstance(value, list)),
+}
+
+# Compiled schemas kept per pattern set; old pattern sets are dropped beyond this
+MAX_CACHED_SCHEMAS = 8
+
+# Warnings printed after a check; the rest are counted
+MAX_REPORTED_WARNINGS = 10
+
+schema_cache_stats = CacheCounter()
+
+
+class LayoutSchema:
+    """
+    One layout's pattern compiled for fast slide checks.
+
+    Args:
+        layout: Layout name
+        pattern: Pattern data (yaml_pattern and validation)
+    """
+
+    def __init__(self, layout: str, pattern: Mapping[str, Any]):
+        self.layout = layout
+        yaml_pattern = pattern.get("yaml_pattern") or {}
+        self.fields = frozenset(yaml_pattern) - {"layout"}
+        self.required = tuple(pattern.get("validation", {}).get("required_fields", []))
+        self.typed = {field: FIELD_TYPES[kind] for field, kind in yaml_pattern.items() if kind in FIELD_TYPES and kind != "str"}
+
+    def check_fields(self, prefix: str, fields: Mapping[str, Any], placeholders: bool, check: "DeckCheck") -> None:
+        """Check a slide's field values (and, for a placeholders object, its field names)."""
+        for field in self.required:
+            if field not in fields:
+                check.warn(f"{prefix}: '{self.layout}' requires field '{field}'")
+
+        for field, value in fields.items():
+            if field in self.fields:
+                kind = self.typed.get(field)
+                if kind is not None and value is not None and not kind[1](value):
+                    check.error(f"{prefix}: field '{field}' must be {kind[0]}, got {type(value).__name__}")
+            elif placeholders and field not in METADATA_FIELDS:
+                check.warn(f"{prefix}: '{self.layout}' has no field '{field}' (it will be ignored); fields: {', '.join(sorted(self.fields))}")
+
+
+class DeckCheck:
+    """
+    Errors and warnings collected while checking a deck.
+
+    Args:
+        strict: Treat warnings (unknown and missing fields) as errors
+    """
+
+    def __init__(self, strict: bool = False):
+        self.strict = strict
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.slides = 0
+
+    @classmethod
+    def from_env(cls) -> "DeckCheck":
+        """Create a check configured from the DECK_SCHEMA_STRICT environment variable."""
+        return cls(strict=os.getenv("DECK_SCHEMA_STRICT", "").strip().lower() in ("1", "true", "yes", "on"))
+
+    def error(self, message: str) -> None:
+        self.errors.append(message)
+
+    def warn(self, message: str) -> None:
+        (self.errors if self.strict else self.warnings).append(message)
+
+    def raise_for_errors(self) -> None:
+        """
+        Raise one ValueError listing every error found.
+
+        Raises:
+            ValueError: If any error was found
+        """
+        if len(self.errors) == 1:
+            raise ValueError(self.errors[0])
+        if self.errors:
+            raise ValueError(f"{len(self.errors)} errors in slides:\n" + "\n".join(f"  - {error}" for error in self.errors))
+
+    def report(self) -> None:
+        """Print the warnings found (the first MAX_REPORTED_WARNINGS of them)."""
+        if not self.warnings:
+            return
+        error_print(f"[Schema] WARNING - {len(self.warnings)} slide field issues found:")
+        for warning in self.warnings[:MAX_REPORTED_WARNINGS]:
+            error_print(f"[Schema]   {warning}")
+        if len(self.warnings) > MAX_REPORTED_WARNINGS:
+            error_print(f"[Schema]   ... and {len(self.warnings) - MAX_REPORTED_WARNINGS} more")
+
+    def summary(self) -> Dict[str, Any]:
+        """Counts, errors and warnings of this check."""
+        return {"slides": self.slides, "errors": list(self.errors), "warnings": list(self.warnings)}
+
+
+class DeckSchema:
+    """
+    Canonical slide structure plus every layout's compiled pattern.
+
+    Args:
+        patterns: Pattern data keyed by layout name (PatternLoader.load_patterns)
+    """
+
+    def __init__(self, patterns: Mapping[str, Mapping[str, Any]]):
+        self.layouts = {layout: LayoutSchema(layout, pattern) for layout, pattern in patterns.items()}
+        self._available = ", ".join(sorted(self.layouts))
+        # Content hash of the pattern set, unlike the fingerprint stable across machines
+        self.digest = hashlib.sha256(json.dumps(patterns, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def check_slide(self, index: int, slide_data: Any, check: DeckCheck) -> None:
+        """
+        Check one slide, adding its problems to check.
+
+        Args:
+            index: 0-based slide index, used in messages
+            slide_data: Slide object from the canonical JSON (or a repeat spec)
+            check: Collects the errors and warnings
+        """
+        check.slides += 1
+        number = index + 1
+        if not isinstance(slide_data, dict):
+            check.error(f"Slide {number} must be a dictionary.")
+            return
+
+        if REPEAT_KEY in slide_data:
+            spec = slide_data[REPEAT_KEY]
+            if not isinstance(spec, dict) or "layout" not in spec or "records" not in spec:
+                check.error(f"Slide {number} 'repeat' must be an object with a 'layout' and 'records'.")
+                return
+            slide_data = spec
+
+        if "layout" not in slide_data:
+            check.error(f"Slide {number} must have a 'layout' field.")
+            return
+
+        placeholders = slide_data.get("placeholders")
+        if placeholders is not None and not isinstance(placeholders, dict):
+            check.error(f"Slide {number} 'placeholders' must be a dictionary.")
+            placeholders = None
+
+        if "content" in slide_data and not isinstance(slide_data["content"], list):
+            check.error(f"Slide {number} 'content' must be an array.")
+
+        if "table_source" in slide_data and not (isinstance(slide_data["table_source"], dict) and slide_data["table_source"].get("path")):
+            check.error(f"Slide {number} 'table_source' must be an object with a 'path' to a CSV or TSV file.")
+
+        layout = slide_data["layout"]
+        schema = self.layouts.get(layout) if isinstance(layout, str) else None
+        if schema is None:
+            check.error(f"Slide {number}: No pattern found for layout '{layout}'. Available layouts: {self._available}")
+            return
+
+        # The build reads fields from 'placeholders', or from the slide itself without one
+        fields = placeholders if placeholders is not None else slide_data
+        schema.check_fields(f"Slide {number} ({layout})", fields, placeholders is not None, check)
+
+    def load_slide(self, index: int, slide_data: Any, check: DeckCheck) -> Optional[list]:
+        """
+        Check one slide about to be built and load a repeat spec's records.
+
+        Args:
+            index: 0-based slide index, used in messages
+            slide_data: Slide object from the canonical JSON
+            check: Collects the slide's errors and warnings (including the records')
+
+        Returns:
+            The loaded records for a valid repeat (mail-merge) spec, otherwise None
+        """
+        errors = len(check.errors)
+        self.check_slide(index, slide_data, check)
+        if len(check.errors) > errors or REPEAT_KEY not in slide_data:
+            return None
+
+        spec = slide_data[REPEAT_KEY]
+        try:
+            records = load_records(spec)
+            check_fields(spec, records)
+        except ValueError as e:
+            check.error(f"Slide {index + 1} {e}")
+            return None
+        return records
+
+    def check_deck(self, slides: Iterable[Any], check: Optional[DeckCheck] = None) -> DeckCheck:
+        """
+        Check every slide of a deck in one pass.
+
+        Args:
+            slides: Slide objects (a list or any iterable, e.g. a SlideStream)
+            check: Collects the problems (default: DeckCheck.from_env())
+
+        Returns:
+            The DeckCheck holding every error and warning found
+        """
+        check = check or DeckCheck.from_env()
+        for index, slide_data in enumerate(slides):
+            self.check_slide(index, slide_data, check)
+        return check
+
+
+_schemas: Dict[str, DeckSchema] = {}
+_schemas_lock = threading.Lock()
+
+
+def compiled_schema(template_folder: Optional[Union[str, Path]] = None) -> DeckSchema:
+    """
+    Return the compiled schema for the patterns in effect for a template folder.
+
+    Built-in and user patterns are only read and compiled when their files
+    have changed since the last call (PatternLoader.fingerprint).
+    """
+    loader = PatternLoader(template_folder)
+    fingerprint = loader.fingerprint()
+    with _schemas_lock:
+        schema = _schemas.get(fingerprint)
+    if schema is not None:
+        schema_cache_stats.hit()
+        return schema
+    schema_cache_stats.miss()
+
+    schema = DeckSchema(loader.load_patterns())
+    with _schemas_lock:
+        while len(_schemas) >= MAX_CACHED_SCHEMAS:
+            del _schemas[next(iter(_schemas))]
+        _schemas[fingerprint] = schema
+    return schema
+
+
+def clear_schema_cache() -> None:
+    """Drop every compiled schema."""
+    with _schemas_lock:
+        _schemas.clear()
@@ -1,17 +1,23 @@
 # import json
-from datetime import datetime
+import io
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 import yaml
 
 from pptx import Presentation
 
 from ..utils.path import path_manager, PathManager
-from .presentation_builder import PresentationBuilder
+from .deck_schema import DeckCheck, compiled_schema
+from .output_naming import InputDigest, OutputNaming, output_digest, reused_output
+from .slide_reuse import SlideReuseCache
+from .post_validation import PostGenerationValidator
+from .presentation_builder import PresentationBuilder, build_slide
 from ..content.processor import ContentProcessor
-from ..templates.manager import TemplateManager
+from ..templates.manager import TemplateManager, template_file_cache
 from ..image.image_handler import ImageHandler
 from .result import PresentationResult, ValidationResult
+from ..utils.build_profile import BuildProfile
+from ..utils.progress import STAGE_COMPLETE, STAGE_MARKDOWN, STAGE_SAVE, STAGE_START, BuildProgress, ProgressCallback, ProgressEvent
 
 # PlaceKitten will be imported lazily when needed
 from ..utils.path import get_placekitten
@@ -31,6 +37,7 @@ def singleton(cls):
 
     # Allow external access to clear instances for testing
     get_instance._instances = instances
+    get_instance.__wrapped__ = cls
     get_instance.reset = reset
     cls._instances = instances
     cls.reset = reset
@@ -50,6 +57,13 @@ class Deckbuilder:
         # Initialize components
         self.template_manager = TemplateManager(self._path_manager)
         self.content_processor = ContentProcessor()
+        self.last_build_profile: Optional[BuildProfile] = None
+        self.last_validation: Optional[Dict[str, Any]] = None
+        self.last_schema_check: Optional[Dict[str, Any]] = None
+        self.last_output_reused = False
+        # Optional per-engine overrides (watch mode): output naming policy and slide reuse
+        self.output_naming: Optional[OutputNaming] = None
+        self.slide_reuse: Optional[SlideReuseCache] = None
         self.presentation_builder = PresentationBuilder(self._path_manager)
 
         # Initialize image-related components
@@ -76,9 +90,9 @@ class Deckbuilder:
         # Store template path for tests
         self.template_path = template_path
 
-        # Load template or create empty presentation
+        # Load template (file bytes shared across engines) or create empty presentation
         if template_path:
-            self.prs = Presentation(template_path)
+            self.prs = Presentation(io.BytesIO(template_file_cache.read(template_path)))
         else:
             self.prs = Presentation()
 
@@ -91,17 +105,25 @@ class Deckbuilder:
         templateName: str = "default",
         language_code: Optional[str] = None,
         font_name: Optional[str] = None,
+        profile: Optional[BuildProfile] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> str:
         """
         Creates a presentation from the canonical JSON data model.
         Only accepts canonical format: {"slides": [{"layout": "...", "placeholders": {...}, "content": [...]}]}
 
-        Includes built-in end-to-end validation to prevent layout regressions.
+        Every slide is first checked against the canonical structure and its
+        layout pattern (see deck_schema); all errors are raised together in one
+        ValueError before any slide is built. Slides are then validated in
+        memory as they are built to prevent layout regressions.
+        Stage timings are recorded into profile (or a new BuildProfile) and
+        kept in last_build_profile. If progress is given it is called with a
+        ProgressEvent at the start, after every slide, before saving and on
+        completion (with the stage timings).
         """
-        # Import validation here to avoid circular imports
-        # from .validation import PresentationValidator
-
-        self._initialize_presentation(templateName)
+        profile = profile or BuildProfile()
+        self.last_build_profile = profile
+        self.last_output_reused = False
 
         # Strict validation for canonical JSON format only
         if not isinstance(presentation_data, dict):
@@ -116,62 +138,207 @@ class Deckbuilder:
         if len(presentation_data["slides"]) == 0:
             raise ValueError("At least one slide is required.")
 
-        # Validate each slide has required canonical structure
-        for i, slide_data in enumerate(presentation_data["slides"]):
-            if not isinstance(slide_data, dict):
-                raise ValueError(f"Slide {i + 1} must be a dictionary.")
+        # Deterministic outputs are named by input hash; an existing one is reused
+        naming = self._output_naming()
+        digest = None
+        if naming.deterministic:
+            hasher = InputDigest()
+            for slide_data in presentation_data["slides"]:
+                hasher.add_slide(slide_data)
+            digest = self._output_digest(hasher, templateName, language_code, font_name)
+            existing = naming.find(self.output_folder, fileName, digest)
+            if existing:
+                self.last_output_reused = True
+                return reused_output(existing, profile, progress)
+
+        # STEP 1: Check every slide against the canonical structure and its layout
+        # pattern in one pass (repeat specs also load their records) and raise
+        # all the errors together, before any slide is built
+        schema = compiled_schema(self._path_manager.get_template_folder())
+        check = DeckCheck.from_env()
+        repeated: Dict[int, list] = {}
+        with profile.stage("schema_check"):
+            for i, slide_data in enumerate(presentation_data["slides"]):
+                records = schema.load_slide(i, slide_data, check)
+                if records is not None:
+                    repeated[i] = records
+        self._report_schema_check(check)
+
+        # STEP 1.5-2: Load the template, apply theme font and formatting parameters
+        self._prepare_build(templateName, language_code, font_name)
+
+        slide_count = len(presentation_data["slides"]) - len(repeated) + sum(len(records) for records in repeated.values())
+        tracker = BuildProgress(progress, slide_count) if progress is not None else None
+        if tracker is not None:
+            tracker.report(STAGE_START, 0, f"Building {slide_count} slides")
+            self.presentation_builder.set_progress(tracker)
+
+        # STEP 3: Process slides using canonical format with optional formatting,
+        # validating each slide in memory as it is built
+        validator = PostGenerationValidator.from_env()
+        try:
+            with profile.stage("slide_generation"):
+                for i, slide_data in enumerate(presentation_data["slides"]):
+                    build_slide(self.presentation_builder, self.prs, slide_data, repeated.get(i), validator, self.slide_reuse)
+        finally:
+            if tracker is not None:
+                self.presentation_builder.set_progress(None)
+
+        return self._finish_build(fileName, slide_count, profile, tracker, validator, digest)
+
+    def create_presentation_from_slides(
+        self,
+        slides: Iterable[Dict[str, Any]],
+        fileName: str = "Sample_Presentation",
+        templateName: str = "default",
+        language_code: Optional[str] = None,
+        font_name: Optional[str] = None,
+        profile: Optional[BuildProfile] = None,
+        progress: Optional[ProgressCallback] = None,
+        input_digest: Optional[str] = None,
+    ) -> str:
+        """
+        Creates a presentation from an iterable of canonical slide objects.
 
-            if "layout" not in slide_data:
-                raise ValueError(f"Slide {i + 1} must have a 'layout' field.")
+        Unlike create_presentation, each slide is validated and built as it is
+        taken from the iterable, so a SlideStream over a very large JSON file is
+        never held in memory whole. Errors name the failing slide; nothing is
+        saved if any slide fails. The slide total is unknown until the end, so
+        progress events report a total of 0 until completion.
 
-            # Ensure canonical structure exists (placeholders and content are optional but must be correct types)
-            if "placeholders" in slide_data and not isinstance(slide_data["placeholders"], dict):
-                raise ValueError(f"Slide {i + 1} 'placeholders' must be a dictionary.")
+        With deterministic output naming the slides are hashed as they are
+        built; a caller that hashed them beforehand passes input_digest, which
+        lets an unchanged deck be reused without building it.
+        """
+        profile = profile or BuildProfile()
+        self.last_build_profile = profile
+        self.last_output_reused = False
+
+        naming = self._output_naming()
+        hasher = None
+        if naming.deterministic and input_digest is not None:
+            existing = naming.find(self.output_folder, fileName, input_digest)
+            if existing:
+                self.last_output_reused = True
+                return reused_output(existing, profile, progress)
+        elif naming.deterministic:
+            hasher = InputDigest()
+            slides = hasher.feed(slides)
+
+        self._prepare_build(templateName, language_code, font_name)
+
+        tracker = BuildProgress(progress, 0) if progress is not None else None
+        if tracker is not None:
+            tracker.report(STAGE_START, 0, "Building slides")
+            self.presentation_builder.set_progress(tracker)
+
+        slide_count = 0
+        schema = compiled_schema(self._path_manager.get_template_folder())
+        check = DeckCheck.from_env()
+        validator = PostGenerationValidator.from_env()
+        try:
+            with profile.stage("slide_generation"):
+                for i, slide_data in enumerate(slides):
+                    records = schema.load_slide(i, slide_data, check)
+                    check.raise_for_errors()
+                    slide_count += build_slide(self.presentation_builder, self.prs, slide_data, records, validator, self.slide_reuse)
+        finally:
+            if tracker is not None:
+                self.presentation_builder.set_progress(None)
+
+        if slide_count == 0:
+            raise ValueError("At least one slide is required.")
+        self._report_schema_check(check)
 
-            if "content" in slide_data and not isinstance(slide_data["content"], list):
-                raise ValueError(f"Slide {i + 1} 'content' must be an array.")
+        if hasher is not None:
+            input_digest = self._output_digest(hasher, templateName, language_code, font_name)
+        if tracker is not None:
+            tracker.total_slides = slide_count
+        return self._finish_build(fileName, slide_count, profile, tracker, validator, input_digest if naming.deterministic else None)
 
-        # STEP 1: Pre-generation validation (JSON ↔ Template alignment)
-        # TEMPORARILY DISABLED: Old validation system uses index-based mappings
-        # template_folder = str(self._path_manager.get_template_folder())
-        # validator = PresentationValidator(presentation_data, templateName, template_folder)
-        # validator.validate_pre_generation()
+    def create_presentation_from_json_file(self, file_path: str, fileName: str = "Sample_Presentation", templateName: str = "default", **kwargs) -> str:
+        """
+        Creates a presentation from a canonical JSON file, streaming its slides.
+
+        The file is decoded one slide at a time (see content.json_stream), so
+        peak memory is bounded by the largest slide rather than the file size.
+        The file is read twice: a first pass checks (and, with deterministic
+        output naming, hashes) every slide so all slide errors are raised
+        together before anything is built. Keyword arguments are passed to
+        create_presentation_from_slides.
+
+        Raises:
+            SlideStreamError: If the file is not valid JSON (names the slide, line and column)
+            ValueError: If any slide is invalid (names every invalid slide)
+        """
+        from ..content.json_stream import SlideStream
+
+        # Check the whole file in a first streamed pass so every slide error is
+        # reported at once, before any slide is built (and, for deterministic
+        # output naming, hash it so an unchanged deck is not rebuilt)
+        hasher = InputDigest() if self._output_naming().deterministic else None
+        slides = SlideStream(file_path)
+        check = compiled_schema(self._path_manager.get_template_folder()).check_deck(hasher.feed(slides) if hasher else slides)
+        check.raise_for_errors()
+        if hasher is not None:
+            kwargs["input_digest"] = self._output_digest(hasher, templateName, kwargs.get("language_code"), kwargs.get("font_name"))
+
+        return self.create_presentation_from_slides(SlideStream(file_path), fileName, templateName, **kwargs)
+
+    def _report_schema_check(self, check: DeckCheck) -> None:
+        """Keep the schema check's results, raise its errors and print its warnings."""
+        self.last_schema_check = check.summary()
+        check.raise_for_errors()
+        check.report()
+
+    def _output_naming(self) -> OutputNaming:
+        """The engine's output naming policy, or the one configured by the environment."""
+        return self.output_naming or OutputNaming.from_env()
+
+    def _output_digest(self, hasher: InputDigest, templateName: str, language_code: Optional[str], font_name: Optional[str]) -> str:
+        """Hash naming a deterministic build's output (see output_naming.output_digest)."""
+        self.template_manager.check_template_exists(templateName)
+        template_path = self.template_manager.get_template_path(templateName)
+        return output_digest(hasher, template_path, self._path_manager.get_template_folder(), language_code, font_name)
+
+    def _prepare_build(self, templateName: str, language_code: Optional[str], font_name: Optional[str]) -> None:
+        """Load the template, apply formatting and start the build's slide reuse (if enabled)."""
+        self._initialize_presentation(templateName)
+        self._apply_formatting(language_code, font_name)
+        if self.slide_reuse is not None:
+            self.slide_reuse.begin(self.template_path, self._path_manager.get_template_folder(), language_code, font_name)
 
-        # STEP 1.5: Apply theme font formatting if specified
+    def _apply_formatting(self, language_code: Optional[str], font_name: Optional[str]) -> None:
+        """Apply the theme font (if any) and pass formatting options to the presentation builder."""
         if font_name is not None:
             from ..content.formatting_support import FormattingSupport
 
             formatter = FormattingSupport()
             formatter.update_theme_fonts(self.prs, font_name)
 
-        # STEP 2: Update presentation builder with formatting parameters
         self.presentation_builder.set_formatting_options(language_code, font_name)
 
-        # STEP 3: Process slides using canonical format with optional formatting
-        for slide_data in presentation_data["slides"]:
-            # Use template-based layouts for tables instead of dynamic shape creation
-            self.presentation_builder.add_slide(self.prs, slide_data)
-
-        # STEP 4: Save the presentation to disk
-        write_result = self.write_presentation(fileName)
+    def _finish_build(self, fileName: str, slide_count: int, profile: BuildProfile, tracker: Optional[BuildProgress], validator: PostGenerationValidator, digest: Optional[str] = None) -> str:
+        """Report post-generation validation, save the built presentation and report completion."""
+        if self.slide_reuse is not None:
+            self.slide_reuse.end(profile)
 
-        # Extract the file path from write_result for post-generation validation
-        # write_result format: "Successfully created presentation: filename.pptx"
-        if "Successfully created presentation:" in write_result:
-            # file_path = write_result.split("Successfully created presentation: ")[1].strip()  # Future: use for validation
-            # full_path = str(self._path_manager.get_output_folder() / file_path)  # Future: use for validation
-            pass
+        # STEP 4: Post-generation validation results (slides were checked in memory as they were built)
+        self.last_validation = validator.finish(len(self.prs.slides), slide_count, profile)
 
-            # STEP 5: Post-generation validation (PPTX ↔ JSON verification)
-            # TEMPORARILY DISABLED: Old validation system uses index-based mappings
-            # validator.validate_post_generation(full_path)
+        # STEP 5: Save the presentation to disk
+        if tracker is not None:
+            tracker.report(STAGE_SAVE, slide_count, "Saving presentation")
+        with profile.stage("save"):
+            write_result = self.write_presentation(fileName, digest)
 
         # Show completion summary
         from ..utils.logging import success_print
 
-        slide_count = len(presentation_data["slides"])
         file_name = write_result.split("Successfully created presentation: ")[1].strip() if "Successfully created presentation:" in write_result else "presentation.pptx"
         success_print(f"✅ Presentation complete: {file_name} ({slide_count} slides)")
+        if tracker is not None:
+            tracker.report(STAGE_COMPLETE, slide_count, f"Presentation complete: {file_name}", profile.timings)
 
         return f"Successfully created presentation with {slide_count} slides. {write_result}"
 
@@ -182,6 +349,7 @@ class Deckbuilder:
         templateName: str = "default",
         language_code: Optional[str] = None,
         font_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> PresentationResult:
         """
         Creates a presentation from markdown content with frontmatter.
@@ -195,13 +363,21 @@ class Deckbuilder:
             templateName: Template to use
             language_code: Language for formatting
             font_name: Font to use
+            progress: Optional callback receiving ProgressEvents (see create_presentation)
 
         Returns:
-            PresentationResult with success/error information
+            PresentationResult with success/error information. Stage timings,
+            including frontmatter parse time, are kept in last_build_profile.
         """
+        profile = BuildProfile()
+        self.last_build_profile = profile
         try:
             # Parse markdown to canonical JSON with internal error handling
-            conversion_result = self._convert_markdown_to_json_safe(markdown_content)
+            with profile.stage("markdown_conversion"):
+                conversion_result = self._convert_markdown_to_json_safe(markdown_content)
+            profile.merge(self.content_processor.profile)
+            if progress is not None:
+                progress(ProgressEvent(STAGE_MARKDOWN, 0, 0, "Converted markdown to slide data", dict(profile.timings)))
             if not conversion_result.valid:
                 # Convert validation errors to presentation error
                 error_messages = "\n".join(conversion_result.errors)
@@ -220,6 +396,8 @@ class Deckbuilder:
                     templateName=templateName,
                     language_code=language_code,
                     font_name=font_name,
+                    profile=profile,
+                    progress=progress,
                 )
 
                 # Parse success message to extract details
@@ -246,7 +424,7 @@ class Deckbuilder:
             from ..content.frontmatter_to_json_converter import markdown_to_canonical_json
 
             # Try conversion - this may internally handle some YAML errors
-            presentation_data = markdown_to_canonical_json(markdown_content)
+            presentation_data = markdown_to_canonical_json(markdown_content, self.content_processor)
 
             # Basic validation of the result
             if not isinstance(presentation_data, dict):
@@ -280,25 +458,32 @@ class Deckbuilder:
 
     # Removed _process_mixed_content_for_json - table handling now uses dedicated layouts
 
-    def write_presentation(self, fileName: str = "Sample_Presentation") -> str:
-        """Writes the generated presentation to disk with ISO timestamp."""
-        import os
+    def write_presentation(self, fileName: str = "Sample_Presentation", digest: Optional[str] = None) -> str:
+        """
+        Writes the generated presentation to disk with ISO timestamp.
+
+        Given the input digest of a deterministic build, the file is named by
+        the digest instead (see OutputNaming.save).
+        """
+        output_name = self._output_naming().save(self.prs, self.output_folder or ".", fileName, digest)
+        return f"Successfully created presentation: {output_name}"
 
-        # Get output folder from environment or use default
-        output_folder = self.output_folder or "."
 
-        # Ensure output folder exists
-        os.makedirs(output_folder, exist_ok=True)
+def create_engine(path_manager_instance: Optional[PathManager] = None):
+    """
+    Create an independent Deckbuilder engine, bypassing the process-wide singleton.
 
-        # Create filename with ISO timestamp and .g.pptx extension for generated files
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H%M")
-        generated_filename = f"{fileName}.{timestamp}.g.pptx"
-        output_file = os.path.join(output_folder, generated_filename)
+    Each engine owns its presentation, template manager and builders, so
+    separate engines can build concurrently in different threads. Use
+    EnginePool to reuse engines across builds.
 
-        # Save the presentation (overwrites if same timestamp exists)
-        self.prs.save(output_file)
+    Args:
+        path_manager_instance: PathManager for template and output folders (default: global)
 
-        return f"Successfully created presentation: {os.path.basename(output_file)}"
+    Returns:
+        New Deckbuilder engine
+    """
+    return Deckbuilder.__wrapped__(path_manager_instance=path_manager_instance)
 
 
 def get_deckbuilder_client():
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Engine pool for concurrent presentation builds.
+
+Deckbuilder() returns a process-wide singleton holding one presentation, so
+two builds in the same process must not run at the same time. EnginePool
+hands out isolated engines instead: each session has exclusive use of one
+engine (its presentation, template manager and slide builders), and engines
+are returned to the pool afterwards so their loaded patterns and layout data
+are reused by later builds. Read-only data is shared by all engines through
+the process-wide caches (template files, template metadata, frontmatter).
+
+Example:
+    pool = EnginePool(max_engines=4)
+    with pool.session() as engine:
+        engine.create_presentation(data, fileName="Report")
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..utils.path import PathManager
+from .engine import Deckbuilder, create_engine
+
+DEFAULT_MAX_ENGINES = 4
+
+
+class EnginePool:
+    """
+    Bounded pool of independent Deckbuilder engines.
+
+    Args:
+        path_manager_instance: PathManager used by every engine (default: global)
+        max_engines: Maximum number of engines, i.e. concurrent builds
+    """
+
+    def __init__(self, path_manager_instance: Optional[PathManager] = None, max_engines: int = DEFAULT_MAX_ENGINES):
+        if max_engines < 1:
+            raise ValueError("max_engines must be at least 1")
+        self.path_manager = path_manager_instance
+        self.max_engines = max_engines
+        self._idle: List[Deckbuilder] = []
+        self._created = 0
+        self._in_use = 0
+        self._condition = threading.Condition()
+        # Engine construction may copy the default template into the template folder
+        self._create_lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self._waiting = 0
+
+    def _acquire(self, timeout: Optional[float]):
+        """Take an idle engine, create one if below max_engines, or wait for a release."""
+        with self._condition:
+            if not self._idle and self._created >= self.max_engines:
+                self.waits += 1
+                self._waiting += 1
+                try:
+                    available = self._condition.wait_for(lambda: self._idle or self._created < self.max_engines, timeout)
+                finally:
+                    self._waiting -= 1
+                if not available:
+                    raise TimeoutError(f"No engine available after {timeout} seconds ({self.max_engines} in use)")
+            self.checkouts += 1
+            self._in_use += 1
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+
+        try:
+            with self._create_lock:
+                return create_engine(self.path_manager)
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, engine) -> None:
+        """Return an engine to the pool."""
+        with self._condition:
+            self._in_use -= 1
+            self._idle.append(engine)
+            self._condition.notify()
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[Deckbuilder]:
+        """
+        Check out an engine for exclusive use.
+
+        Args:
+            timeout: Seconds to wait for a free engine (None waits indefinitely)
+
+        Yields:
+            Deckbuilder engine owned by this session until the block exits
+
+        Raises:
+            TimeoutError: If no engine became available within timeout
+        """
+        engine = self._acquire(timeout)
+        try:
+            yield engine
+        finally:
+            self._release(engine)
+
+    def create_presentation(self, presentation_data: Dict[str, Any], **kwargs) -> str:
+        """Build a presentation from canonical JSON on a pooled engine (see Deckbuilder.create_presentation)."""
+        with self.session() as engine:
+            return engine.create_presentation(presentation_data, **kwargs)
+
+    def create_presentation_from_markdown(self, markdown_content: str, **kwargs):
+        """Build a presentation from markdown on a pooled engine (see Deckbuilder.create_presentation_from_markdown)."""
+        with self.session() as engine:
+            return engine.create_presentation_from_markdown(markdown_content, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool size, engine usage, sessions currently waiting and checkout/wait counters."""
+        with self._condition:
+            return {
+                "max_engines": self.max_engines,
+                "engines": self._created,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "waiting": self._waiting,
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+            }
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Mail-Merge Slide Generation
+
+Expands a ``repeat`` slide spec into one slide per record. The slide is
+built once through the normal pipeline (layout resolution, field mapping,
+inline formatting) with its ``{field}`` tokens left in the text; every
+further slide is stamped from a copy of that slide's XML with the tokens
+replaced by the record's values, without parsing, formatting or mapping
+the slide data again.
+
+Example slide:
+    {
+        "repeat": {
+            "layout": "Title and Content",
+            "placeholders": {"title_top": "{region} results", "content": "Revenue: **{revenue}**"},
+            "speaker_notes": "Owner: {owner}",
+            "records": "data/regions.csv"
+        }
+    }
+
+Records source (``records``):
+    A list of objects, a path to a CSV/TSV (first line holds the field names)
+    or JSON lines (.jsonl/.ndjson) file, or an object with "path" and optional
+    "format" ("csv", "tsv" or "jsonl"), "encoding" and "delimiter".
+
+Tokens are ``{field}``; ``{{`` and ``}}`` produce literal braces. Fields a
+record does not have are replaced with an empty string. A token must not
+span a formatting change (``**{re}gion**`` is not substituted). Only text
+is substituted: images, tables and other fields are the same on every slide.
+"""
+
+import csv
+import json
+import re
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from pptx.parts.slide import SlidePart
+
+REPEAT_KEY = "repeat"
+TSV_SUFFIXES = (".tsv", ".tab")
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+# Slide data fields applied per stamped slide instead of copied from the skeleton
+PER_RECORD_FIELDS = ("records", "speaker_notes")
+
+_TOKEN = re.compile(r"\{\{|\}\}|\{([^{}]+)\}")
+
+# Relationships every new slide part already gets from its layout or adds itself
+_SKIPPED_RELTYPES = (RT.SLIDE_LAYOUT, RT.NOTES_SLIDE)
+
+# Attributes holding relationship ids in slide XML (pictures, media, hyperlinks)
+_RID_ATTRIBUTES = (qn("r:embed"), qn("r:link"), qn("r:id"))
+
+
+def substitute(text: str, record: Mapping[str, Any]) -> str:
+    """
+    Replace the {field} tokens of a text with a record's values.
+
+    Args:
+        text: Text with {field} tokens ({{ and }} for literal braces)
+        record: Field values; missing fields and None become an empty string
+
+    Returns:
+        The substituted text
+    """
+
+    def replace(match):
+        field = match.group(1)
+        if field is None:
+            return match.group(0)[0]
+        value = record.get(field.strip())
+        return "" if value is None else str(value)
+
+    return _TOKEN.sub(replace, text)
+
+
+def token_fields(text: str) -> Set[str]:
+    """Return the field names of the tokens in a text."""
+    return {match.group(1).strip() for match in _TOKEN.finditer(text) if match.group(1) is not None}
+
+
+def _has_tokens(text: Optional[str]) -> bool:
+    return bool(text) and ("{" in text or "}" in text) and _TOKEN.search(text) is not None
+
+
+def _records_format(path: str, declared: Optional[str]) -> str:
+    if declared:
+        declared = declared.lower()
+        if declared not in ("csv", "tsv", "jsonl"):
+            raise ValueError(f"repeat: unknown records format {declared!r} (expected csv, tsv or jsonl)")
+        return declared
+    suffix = Path(path).suffix.lower()
+    if suffix in JSONL_SUFFIXES:
+        return "jsonl"
+    return "tsv" if suffix in TSV_SUFFIXES else "csv"
+
+
+def iter_records(source: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the records of a repeat spec's records source.
+
+    Args:
+        source: List of objects, path to a CSV/TSV/JSON lines file, or an object
+            with "path" and optional "format", "encoding" and "delimiter"
+
+    Yields:
+        One dictionary of field values per record
+
+    Raises:
+        ValueError: If the source is invalid, cannot be read, or holds a record that is not an object
+    """
+    if isinstance(source, list):
+        for index, record in enumerate(source):
+            if not isinstance(record, Mapping):
+                raise ValueError(f"repeat: record {index + 1} must be an object")
+            yield dict(record)
+        return
+
+    options: Mapping[str, Any] = {"path": source} if isinstance(source, str) else source
+    if not isinstance(options, Mapping) or not options.get("path") or not isinstance(options["path"], str):
+        raise ValueError("repeat: 'records' must be a list of objects, a file path or an object with a 'path'")
+
+    path = options["path"]
+    records_format = _records_format(path, options.get("format"))
+
+    try:
+        with open(path, newline="", encoding=options.get("encoding", "utf-8-sig")) as records_file:
+            if records_format == "jsonl":
+                for line_number, line in enumerate(records_file, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise ValueError(f"repeat: invalid JSON on line {line_number} of '{path}': {e}") from e
+                    if not isinstance(record, dict):
+                        raise ValueError(f"repeat: line {line_number} of '{path}' is not a JSON object")
+                    yield record
+            else:
+                delimiter = options.get("delimiter") or ("\t" if records_format == "tsv" else ",")
+                yield from csv.DictReader(records_file, delimiter=delimiter)
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        raise ValueError(f"repeat: cannot read records from '{path}': {e}") from e
+
+
+def load_records(spec: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Load all records of a repeat spec.
+
+    Raises:
+        ValueError: If the records cannot be loaded or there are none
+    """
+    records = list(iter_records(spec.get("records")))
+    if not records:
+        raise ValueError("repeat: 'records' holds no records")
+    return records
+
+
+def template_slide_data(spec: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return the slide data of a repeat spec used to build the skeleton slide."""
+    return {key: value for key, value in spec.items() if key not in PER_RECORD_FIELDS}
+
+
+def check_fields(spec: Mapping[str, Any], records: List[Mapping[str, Any]]) -> None:
+    """
+    Check that every token of a repeat spec names a field of the records.
+
+    A record may leave a field out, but a field no record has is a typo.
+
+    Raises:
+        ValueError: If a token names a field none of the records has
+    """
+    fields: Set[str] = set()
+
+    def collect(value):
+        if isinstance(value, str):
+            fields.update(token_fields(value))
+        elif isinstance(value, Mapping):
+            for item in value.values():
+                collect(item)
+        elif isinstance(value, list):
+            for item in value:
+                collect(item)
+
+    collect({key: value for key, value in spec.items() if key != "records"})
+    available: Set[str] = set()
+    for record in records:
+        available.update(record)
+    unknown = sorted(fields - available)
+    if unknown:
+        raise ValueError(f"repeat: unknown record field(s) {', '.join(unknown)}; available: {', '.join(sorted(available))}")
+
+
+class SlideStamper:
+    """
+    Stamps copies of a built skeleton slide with records substituted into its text.
+
+    The skeleton's text elements holding tokens are located once; each stamped
+    slide is a new slide part on the skeleton's layout whose shape tree is a
+    copy of the skeleton's, sharing its images and hyperlinks.
+
+    Args:
+        prs: Presentation holding the skeleton slide
+        skeleton: Slide built from the repeat spec, with its tokens unsubstituted
+    """
+
+    def __init__(self, prs, skeleton):
+        self.prs = prs
+        self.skeleton = skeleton
+        self._cSld = deepcopy(skeleton._element.cSld)
+        self._token_indexes = [index for index, text in enumerate(self._cSld.iter(qn("a:t"))) if _has_tokens(text.text)]
+        self._rels = [rel for rel in skeleton.part.rels.values() if rel.reltype not in _SKIPPED_RELTYPES]
+        self._layout_part = skeleton.slide_layout.part
+        self._sldIdLst = prs.slides._sldIdLst
+        self._next_slide_id = self._sldIdLst._next_id
+
+    def _substitute_text(self, cSld, record: Mapping[str, Any]) -> None:
+        text_elements = list(cSld.iter(qn("a:t")))
+        for index in self._token_indexes:
+            text_element = text_elements[index]
+            text_element.text = substitute(text_element.text, record)
+
+    def fill_skeleton(self, record: Mapping[str, Any]):
+        """Substitute a record into the skeleton slide itself and return it."""
+        self._substitute_text(self.skeleton._element.cSld, record)
+        return self.skeleton
+
+    def stamp(self, record: Mapping[str, Any]):
+        """Append a copy of the skeleton slide with a record substituted and return it."""
+        # As PresentationPart.add_slide and Slides.add_slide, without their scans of
+        # all existing relationships and slide ids, which make bulk appends quadratic
+        presentation_part = self.prs.part
+        slide_part = SlidePart.new(presentation_part._next_slide_partname, presentation_part.package, self._layout_part)
+        rId = presentation_part.rels._add_relationship(RT.SLIDE, slide_part)
+        slide = slide_part.slide
+
+        rId_map = {}
+        for rel in self._rels:
+            target = rel.target_ref if rel.is_external else rel.target_part
+            new_rId = slide.part.relate_to(target, rel.reltype, rel.is_external)
+            if new_rId != rel.rId:
+                rId_map[rel.rId] = new_rId
+
+        cSld = deepcopy(self._cSld)
+        self._substitute_text(cSld, record)
+        if rId_map:
+            for element in cSld.iter():
+                for attribute in _RID_ATTRIBUTES:
+                    value = element.get(attribute)
+                    if value in rId_map:
+                        element.set(attribute, rId_map[value])
+
+        slide._element.replace(slide._element.cSld, cSld)
+        self._sldIdLst._add_sldId(id=self._next_slide_id, rId=rId)
+        self._next_slide_id += 1
+        return slide
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Deterministic output naming for Deckbuilder.
+
+By default generated decks are named ``{fileName}.{YYYY-MM-DD_HHMM}.g.pptx``
+(numbered ``-2``, ``-3``, ... for further builds in the same minute), so
+outputs pile up. In deterministic mode the timestamp is replaced with a hash
+of everything the output depends on, ``{fileName}.{hash}.g.pptx``:
+
+- the slides, as canonical JSON (sorted keys, so formatting does not matter)
+- the contents of local files the slides reference (images, CSV records, ...)
+- the template file and the pattern set (by content)
+- the language and font applied, and the Deckbuilder version
+
+A build whose output already exists is skipped, and older outputs of the same
+deck are pruned, keeping the most recently built DECK_OUTPUT_KEEP of them.
+
+Environment variables:
+    DECK_DETERMINISTIC_OUTPUT: "1"/"true" to name outputs by content hash (default: timestamp)
+    DECK_OUTPUT_KEEP: Hashed outputs kept per deck name, including the current one (default: 3)
+"""
+
+import glob
+import hashlib
+import itertools
+import json
+import os
+import re
+import tempfile
+import threading
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..utils.build_profile import BuildProfile
+from ..utils.logging import success_print
+from ..utils.progress import STAGE_COMPLETE, ProgressCallback, ProgressEvent
+from .deck_schema import compiled_schema
+
+DEFAULT_KEEP = 3
+
+# Length of the hash in output names
+DIGEST_LENGTH = 16
+
+# Slide strings longer than this, or spanning lines, are never file paths
+MAX_PATH_LENGTH = 1024
+
+SLIDE_FILE_PATTERN = re.compile(r"ppt/slides/slide\d+\.xml")
+
+_file_digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
+_file_digests_lock = threading.Lock()
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """SHA-256 of a file, read in chunks and memoised by (mtime, size)."""
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _file_digests_lock:
+        cached = _file_digests.get(str(path))
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    with _file_digests_lock:
+        _file_digests[str(path)] = (signature, digest.hexdigest())
+    return digest.hexdigest()
+
+
+def _strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+
+
+def referenced_files(slide_data: Any, files: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    Find the local files a slide's strings name (images, CSV records, ...).
+
+    Args:
+        slide_data: Slide object (any JSON value)
+        files: Path to digest mapping to add to; paths already in it are not hashed again
+
+    Returns:
+        files (or a new mapping), with each file's content digest
+    """
+    files = {} if files is None else files
+    for value in _strings(slide_data):
+        if value not in files and len(value) < MAX_PATH_LENGTH and "\n" not in value and os.path.isfile(value):
+            files[value] = file_digest(value)
+    return files
+
+
+class InputDigest:
+    """
+    Incremental hash of a deck's slides and the local files they reference.
+
+    Slides are added one at a time, so a streamed deck is hashed without
+    being held in memory.
+    """
+
+    def __init__(self):
+        self._slides = hashlib.sha256()
+        self.files: Dict[str, str] = {}
+
+    def add_slide(self, slide_data: Any) -> None:
+        """Add one slide (and the files its strings name) to the hash."""
+        self._slides.update(json.dumps(slide_data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8"))
+        self._slides.update(b"\n")
+        referenced_files(slide_data, self.files)
+
+    def feed(self, slides: Iterable[Any]) -> Iterator[Any]:
+        """Yield slides unchanged, adding each to the hash as it passes."""
+        for slide_data in slides:
+            self.add_slide(slide_data)
+            yield slide_data
+
+    def hexdigest(self, template_path: Optional[str], patterns_digest: str, language_code: Optional[str], font_name: Optional[str]) -> str:
+        """
+        Hash identifying the output of a build.
+
+        Args:
+            template_path: Template .pptx the deck is built from (None for a blank presentation)
+            patterns_digest: Content hash of the pattern set (DeckSchema.digest)
+            language_code: Language applied to text, if any
+            font_name: Font applied to text, if any
+
+        Returns:
+            The first DIGEST_LENGTH hex digits of the hash
+        """
+        from .. import __version__
+
+        digest = hashlib.sha256()
+        template_hash = file_digest(template_path) if template_path and os.path.exists(template_path) else ""
+        for part in (__version__, template_hash, patterns_digest, language_code or "", font_name or "", self._slides.hexdigest()):
+            digest.update(part.encode("utf-8") + b"\0")
+        for path, path_digest in sorted(self.files.items()):
+            digest.update(f"{path}\0{path_digest}\0".encode("utf-8"))
+        return digest.hexdigest()[:DIGEST_LENGTH]
+
+
+def output_digest(hasher: InputDigest, template_path: Optional[str], template_folder: Optional[Union[str, Path]], language_code: Optional[str], font_name: Optional[str]) -> str:
+    """Hash naming a deterministic build's output: the hashed slides, template, patterns (of template_folder), language and font."""
+    return hasher.hexdigest(template_path, compiled_schema(template_folder).digest, language_code, font_name)
+
+
+def reused_output(output_path: Path, profile: BuildProfile, progress: Optional[ProgressCallback]) -> str:
+    """Report an unchanged deck's existing output as the build's result, returning the build message."""
+    slide_count = count_slides(output_path)
+    profile.count("reused_outputs", 1)
+    success_print(f"✅ Presentation unchanged: {output_path.name} ({slide_count} slides, build skipped)")
+    if progress is not None:
+        progress(ProgressEvent(STAGE_COMPLETE, slide_count, slide_count, f"Presentation unchanged: {output_path.name}", profile.timings))
+    return f"Successfully created presentation with {slide_count} slides (unchanged, build skipped). Successfully created presentation: {output_path.name}"
+
+
+def count_slides(path: Union[str, Path]) -> int:
+    """Number of slides in a .pptx, read from its part names without parsing it."""
+    with zipfile.ZipFile(path) as package:
+        return sum(1 for name in package.namelist() if SLIDE_FILE_PATTERN.fullmatch(name))
+
+
+class OutputNaming:
+    """
+    How generated decks are named, reused and pruned.
+
+    Args:
+        deterministic: Name outputs by content hash instead of build time
+        keep: Hashed outputs kept per deck name, including the current one
+    """
+
+    def __init__(self, deterministic: bool = False, keep: int = DEFAULT_KEEP):
+        self.deterministic = deterministic
+        self.keep = max(1, keep)
+
+    @classmethod
+    def from_env(cls) -> "OutputNaming":
+        """Create a naming policy configured from DECK_DETERMINISTIC_OUTPUT and DECK_OUTPUT_KEEP."""
+        deterministic = os.getenv("DECK_DETERMINISTIC_OUTPUT", "").strip().lower() in ("1", "true", "yes", "on")
+        try:
+            keep = int(os.getenv("DECK_OUTPUT_KEEP", DEFAULT_KEEP))
+        except ValueError:
+            keep = DEFAULT_KEEP
+        return cls(deterministic=deterministic, keep=keep)
+
+    @staticmethod
+    def output_name(file_name: str, digest: str) -> str:
+        """File name of a deck's hashed output."""
+        return f"{file_name}.{digest}.g.pptx"
+
+    def find(self, folder: Union[str, Path], file_name: str, digest: str) -> Optional[Path]:
+        """
+        Return a deck's existing output for this hash, marking it as the most recent.
+
+        Returns:
+            The output path, or None if it has not been built
+        """
+        path = Path(folder) / self.output_name(file_name, digest)
+        if not path.is_file():
+            return None
+        os.utime(path)
+        return path
+
+    def prune(self, folder: Union[str, Path], file_name: str) -> List[Path]:
+        """
+        Delete a deck's older hashed outputs beyond the retention limit.
+
+        Returns:
+            The deleted paths
+        """
+        stamp = re.compile(re.escape(file_name) + r"\.[0-9a-f]{%d}\.g\.pptx" % DIGEST_LENGTH)
+        outputs = [path for path in Path(folder).glob(f"{glob.escape(file_name)}.*.g.pptx") if stamp.fullmatch(path.name)]
+        outputs.sort(key=lambda path: path.stat().st_mtime_ns, reverse=True)
+        removed = []
+        for path in outputs[self.keep :]:
+            try:
+                path.unlink()
+                removed.append(path)
+            except OSError:  # nosec B112 - e.g. open in PowerPoint; pruned next time
+                continue
+        return removed
+
+    def save(self, prs, folder: Union[str, Path], file_name: str, digest: Optional[str] = None) -> str:
+        """
+        Save a built deck under its generated name.
+
+        Without a digest the deck is named by build time. The file is created
+        exclusively, so builds of the same name in the same minute (e.g.
+        concurrent pooled builds) get numbered names instead of overwriting
+        each other's output.
+
+        Given the input digest of a deterministic build, the deck is named by
+        the digest instead, written atomically (so a half-written file is never
+        reused) and the deck's older hashed outputs are pruned.
+
+        Returns:
+            The output file name
+        """
+        os.makedirs(folder, exist_ok=True)
+        if digest is None:
+            return self._save_timestamped(prs, folder, file_name)
+
+        output_file = os.path.join(folder, self.output_name(file_name, digest))
+        # Each build saves to its own temp file, so concurrent builds of the same
+        # deck never write to one file and a reader never sees a partial output
+        handle, temp_file = tempfile.mkstemp(dir=folder, prefix=f".{os.path.basename(file_name)}.", suffix=".tmp")
+        os.close(handle)
+        try:
+            prs.save(temp_file)
+            os.replace(temp_file, output_file)
+        except OSError:
+            # Another build of the same content may hold the output (e.g. on Windows)
+            if not os.path.isfile(output_file):
+                raise
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+        self.prune(folder, file_name)
+        return os.path.basename(output_file)
+
+    @staticmethod
+    def _save_timestamped(prs, folder: Union[str, Path], file_name: str) -> str:
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H%M")
+        for attempt in itertools.count(1):
+            suffix = "" if attempt == 1 else f"-{attempt}"
+            output_file = os.path.join(folder, f"{file_name}.{timestamp}{suffix}.g.pptx")
+            try:
+                output = open(output_file, "xb")
+            except FileExistsError:
+                continue
+            try:
+                with output:
+                    prs.save(output)
+            except BaseException:
+                os.remove(output_file)
+                raise
+            return os.path.basename(output_file)
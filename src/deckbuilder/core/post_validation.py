@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+In-memory post-generation validation for Deckbuilder.
+
+Checks each slide against its slide data as soon as the slide is built, on
+the live python-pptx objects the engine already holds, instead of saving the
+deck and re-loading it from disk. A slide's text, tables and pictures are
+read straight from its XML, so a check costs a few percent of building the
+slide. Huge decks can be sampled (every Nth slide).
+
+Issues are warnings: they are reported after the build and kept on the
+engine, but never fail it.
+
+Environment variables:
+    DECK_VALIDATION: "0"/"false"/"off" to disable (default: enabled)
+    DECK_VALIDATION_SAMPLE: Validate every Nth slide (default: 1, every slide)
+"""
+
+import os
+import re
+import time
+from typing import Any, Dict, List, Mapping
+
+from ..utils.build_profile import BuildProfile
+from ..utils.logging import error_print, validation_print
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+TEXT_TAG = f"{{{A_NS}}}t"
+TABLE_TAG = f"{{{A_NS}}}tbl"
+BLIP_TAG = f"{{{A_NS}}}blip"
+
+# Placeholder fields that carry styling or notes rather than slide text
+NON_CONTENT_FIELDS = frozenset({"speaker_notes", "media"})
+STYLE_FIELD = re.compile(r"style|font|width|height|colou?r", re.IGNORECASE)
+IMAGE_FIELD = re.compile(r"image|picture", re.IGNORECASE)
+TABLE_FIELD = re.compile(r"^table_data", re.IGNORECASE)
+
+# Words of expected text; link targets and markdown markers are not slide text
+WORD = re.compile(r"\w+")
+LINK_TARGET = re.compile(r"\]\([^)]*\)")
+
+# Text may be reworded by language remapping, so half of its words must be found
+MIN_WORDS_FOUND = 0.5
+
+
+def _is_table_markdown(text: str) -> bool:
+    lines = [line for line in text.splitlines() if line.strip()]
+    return len(lines) >= 2 and sum(1 for line in lines if "|" in line) >= len(lines) * 0.8
+
+
+class PostGenerationValidator:
+    """
+    Validates slides in memory as the engine builds them.
+
+    Args:
+        enabled: Whether slides are checked at all
+        sample_every: Check every Nth slide (the first slide is always checked)
+    """
+
+    def __init__(self, enabled: bool = True, sample_every: int = 1):
+        self.enabled = enabled
+        self.sample_every = max(1, sample_every)
+        self.issues: List[str] = []
+        self.checked = 0
+        self.skipped = 0
+        self.seconds = 0.0
+
+    @classmethod
+    def from_env(cls) -> "PostGenerationValidator":
+        """Create a validator configured from DECK_VALIDATION* environment variables."""
+        enabled = os.getenv("DECK_VALIDATION", "1").strip().lower() not in ("0", "false", "no", "off")
+        try:
+            sample_every = int(os.getenv("DECK_VALIDATION_SAMPLE", "1"))
+        except ValueError:
+            sample_every = 1
+        return cls(enabled=enabled, sample_every=sample_every)
+
+    def check_slide(self, slide_number: int, slide, slide_data: Mapping[str, Any]) -> bool:
+        """
+        Check one built slide against its slide data (if it falls in the sample).
+
+        Args:
+            slide_number: 1-based position of the slide in the deck
+            slide: The python-pptx slide just built
+            slide_data: The canonical slide data it was built from
+
+        Returns:
+            True if the slide was checked and no issues were found
+        """
+        if not self.enabled:
+            return False
+        if (slide_number - 1) % self.sample_every:
+            self.skipped += 1
+            return False
+
+        start = time.perf_counter()
+        try:
+            problems = self._slide_problems(slide, slide_data)
+        except Exception as e:  # validation must never fail a build
+            problems = [f"could not be validated ({e})"]
+        self.seconds += time.perf_counter() - start
+        self.checked += 1
+
+        layout = slide_data.get("layout", "unknown")
+        for problem in problems:
+            self.issues.append(f"Slide {slide_number} ({layout}): {problem}")
+        return not problems
+
+    def check_count(self, actual: int, expected: int) -> None:
+        """Check the deck holds the number of slides the input asked for."""
+        if self.enabled and actual != expected:
+            self.issues.append(f"Slide count mismatch: expected {expected}, got {actual}")
+
+    def _slide_problems(self, slide, slide_data: Mapping[str, Any]) -> List[str]:
+        problems = []
+        expected_layout = slide_data.get("layout")
+        actual_layout = slide.slide_layout.name
+        if expected_layout and actual_layout != expected_layout:
+            problems.append(f"layout is '{actual_layout}', expected '{expected_layout}'")
+
+        element = slide._element
+        words = None
+        has_table = element.find(f".//{TABLE_TAG}") is not None
+
+        if ("table" in slide_data or "table_source" in slide_data) and not has_table:
+            problems.append("table is missing")
+
+        placeholders = slide_data.get("placeholders") or {}
+        for field_name, value in placeholders.items():
+            if field_name in NON_CONTENT_FIELDS or STYLE_FIELD.search(field_name) or not isinstance(value, str) or not value.strip():
+                continue
+
+            if IMAGE_FIELD.search(field_name):
+                if element.find(f".//{BLIP_TAG}") is None:
+                    problems.append(f"'{field_name}' has no picture")
+            elif TABLE_FIELD.match(field_name) or _is_table_markdown(value):
+                if not has_table:
+                    problems.append(f"'{field_name}' table is missing")
+            else:
+                expected = {word.lower() for word in WORD.findall(LINK_TARGET.sub("]", value))}
+                if not expected:
+                    continue
+                if words is None:
+                    words = {word.lower() for text in element.iter(TEXT_TAG) if text.text for word in WORD.findall(text.text)}
+                if len(expected & words) < len(expected) * MIN_WORDS_FOUND:
+                    snippet = " ".join(value.split())[:30]
+                    problems.append(f"'{field_name}' content is missing (expected: '{snippet}')")
+        return problems
+
+    def summary(self) -> Dict[str, Any]:
+        """Counts, time spent and issues of this build's validation."""
+        return {"checked": self.checked, "skipped": self.skipped, "seconds": self.seconds, "issues": list(self.issues)}
+
+    def report(self) -> None:
+        """Print the issues found (validation details only with DECKBUILDER_VALIDATION_DEBUG)."""
+        if not self.enabled:
+            return
+        validation_print(f"[Post Validation] Checked {self.checked} slides, skipped {self.skipped} ({self.seconds * 1000:.1f} ms)")
+        if not self.issues:
+            return
+        error_print(f"[Post Validation] WARNING - {len(self.issues)} validation issues found:")
+        for number, issue in enumerate(self.issues, 1):
+            error_print(f"[Post Validation]   {number}. {issue}")
+
+    def finish(self, actual: int, expected: int, profile: BuildProfile) -> Dict[str, Any]:
+        """
+        Check the slide count, report the issues and add the validation time and counts to profile.
+
+        Returns:
+            The validation summary
+        """
+        self.check_count(actual, expected)
+        self.report()
+        if self.enabled:
+            profile.add_time("post_validation", self.seconds)
+            profile.count("validated_slides", self.checked)
+            profile.count("validation_issues", len(self.issues))
+        return self.summary()
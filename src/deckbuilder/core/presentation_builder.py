@@ -1,11 +1,53 @@
 from ..content.formatter import ContentFormatter
+from ..content.table_source import load_table_source
 from ..image.image_handler import ImageHandler
 from ..image.placeholder import ImagePlaceholderHandler
 from ..image.placekitten_integration import PlaceKittenIntegration
+from .mail_merge import REPEAT_KEY, SlideStamper, substitute, template_slide_data
 from .slide_builder import SlideBuilder
 from .table_builder import TableBuilder
 
 
+def image_cache_dir(path_manager):
+    """Folder where processed and fallback images are cached for builds."""
+    return path_manager.get_output_folder() / "temp" / "image_cache"
+
+
+def build_slide(builder, prs, slide_data: dict, records, validator, slide_reuse=None) -> int:
+    """
+    Build one validated slide (or the slides of a repeat spec) and check them in memory.
+
+    Stamped repeat slides are checked by their first slide's layout only,
+    since their text is substituted per record.
+
+    Args:
+        builder: PresentationBuilder adding the slides
+        prs: PowerPoint presentation object
+        slide_data: Dictionary containing slide information
+        records: Records loaded for a repeat spec (see DeckSchema.load_slide), otherwise None
+        validator: PostGenerationValidator checking the built slides
+        slide_reuse: SlideReuseCache restoring unchanged slides, if enabled
+
+    Returns:
+        Number of slides added
+    """
+    if records is not None:
+        spec = slide_data[REPEAT_KEY]
+        if slide_reuse is not None:
+            slide_reuse.add_files(spec)
+        added = builder.add_repeated_slides(prs, spec, records)
+        validator.check_slide(len(prs.slides) - len(added) + 1, added[0], {"layout": spec["layout"]})
+        return len(added)
+
+    # Use template-based layouts for tables instead of dynamic shape creation
+    if slide_reuse is not None:
+        slide = slide_reuse.add_slide(prs, builder, slide_data)
+    else:
+        slide = builder.add_slide(prs, slide_data)
+    validator.check_slide(len(prs.slides), slide, slide_data)
+    return 1
+
+
 class PresentationBuilder:
     """Orchestrates slide creation, content placement, and formatting for PowerPoint presentations."""
 
@@ -26,9 +68,10 @@ class PresentationBuilder:
         # Formatting options (set later via set_formatting_options)
         self.language_code = None
         self.font_name = None
+        self.progress = None
 
         # Initialize image handling components with cache in output directory
-        cache_dir = str(self.path_manager.get_output_folder() / "temp" / "image_cache")
+        cache_dir = str(image_cache_dir(self.path_manager))
         self.image_handler = ImageHandler(cache_dir)
         self.placekitten = PlaceKittenIntegration(self.image_handler)
         self.image_placeholder_handler = ImagePlaceholderHandler(self.image_handler, self.placekitten)
@@ -44,6 +87,11 @@ class PresentationBuilder:
             # Update table builder with new formatter
             self.table_builder = TableBuilder(self.content_formatter)
 
+    def set_progress(self, progress):
+        """Set the BuildProgress notified after each slide (None to disable)."""
+        self.progress = progress
+        self.slide_builder.set_progress(progress)
+
     # TODO: Refactor and remove this pass through method
     def clear_slides(self, prs):
         """Clear all slides from the presentation."""
@@ -70,8 +118,56 @@ class PresentationBuilder:
         if "table" in slide_data:
             self.table_builder.add_table_to_slide(slide, slide_data["table"])
 
+        # Add table loaded from a CSV/TSV file if provided
+        if "table_source" in slide_data:
+            self.table_builder.add_table_to_slide(slide, load_table_source(slide_data["table_source"]))
+
         return slide
 
+    @property
+    def slide_index(self) -> int:
+        """Index the next slide is built with (fallback images are chosen by it)."""
+        return self.slide_builder.slide_index
+
+    def slide_restored(self, prs, slide_data: dict):
+        """Track a slide restored from a previous build instead of built from slide_data."""
+        self.slide_builder.slide_restored(prs, slide_data.get("layout", "Unknown Layout"))
+
+    def add_repeated_slides(self, prs, spec: dict, records: list):
+        """
+        Add one slide per record from a repeat (mail-merge) slide spec.
+
+        The spec is built once as a normal slide; the other slides are stamped
+        from its XML with each record's values substituted for the {field}
+        tokens (see mail_merge).
+
+        Args:
+            prs: PowerPoint presentation object
+            spec: The repeat spec (slide data plus "records")
+            records: Records loaded from the spec, at least one
+
+        Returns:
+            List of the added slides
+        """
+        from ..utils.logging import progress_print
+
+        progress_print(f"Slides {len(prs.slides) + 1}-{len(prs.slides) + len(records)}: {spec.get('layout', 'Unknown Layout')} x {len(records)}")
+
+        # The skeleton reports its own progress; notes are added per record
+        skeleton = self.add_slide(prs, template_slide_data(spec))
+        stamper = SlideStamper(prs, skeleton)
+        speaker_notes = spec.get("speaker_notes")
+
+        slides = []
+        for index, record in enumerate(records):
+            slide = stamper.fill_skeleton(record) if index == 0 else stamper.stamp(record)
+            if speaker_notes:
+                self.slide_builder.add_speaker_notes(slide, substitute(speaker_notes, record), self.content_formatter)
+            if index > 0 and self.progress is not None:
+                self.progress.slide_created(len(prs.slides), spec.get("layout", "Unknown Layout"))
+            slides.append(slide)
+        return slides
+
     # TODO: Refactor and remove this pass through method
     def add_slide_with_direct_mapping(self, prs, slide_data: dict):
         """
@@ -63,6 +63,38 @@ class SlideBuilder:
         """
         return self._coordinator.create_slide(prs, slide_data, content_formatter, image_placeholder_handler)
 
+    def slide_restored(self, prs, layout_name: str):
+        """
+        Track a slide restored from a previous build (see slide_reuse).
+
+        DELEGATES to: SlideCoordinator.slide_restored()
+
+        Args:
+            prs: PowerPoint presentation object
+            layout_name: Layout of the restored slide
+        """
+        self._coordinator.slide_restored(prs, layout_name)
+
+    @property
+    def slide_index(self) -> int:
+        """
+        Index the next slide is created with.
+
+        DELEGATES to: SlideCoordinator.slide_index
+        """
+        return self._coordinator.slide_index
+
+    def set_progress(self, progress):
+        """
+        Set the BuildProgress notified after each slide is created.
+
+        DELEGATES to: SlideCoordinator.progress
+
+        Args:
+            progress: BuildProgress instance, or None to stop reporting
+        """
+        self._coordinator.progress = progress
+
     def add_speaker_notes(self, slide, notes_content, content_formatter):
         """
         Add speaker notes to the slide.
@@ -58,6 +58,9 @@ class SlideCoordinator:
         # Initialize slide tracking
         self._current_slide_index = 0
 
+        # Optional BuildProgress notified after each slide (set for the duration of a build)
+        self.progress = None
+
     @property
     def layout_resolver(self):
         """Lazy-loaded LayoutResolver."""
@@ -140,7 +143,7 @@ class SlideCoordinator:
             slide = self._create_slide_with_layout(prs, layout_name)
 
             # Step 3: Apply background image if specified (before content so it appears behind)
-            self._apply_background_image_if_present(slide, slide_data)
+            self._apply_background_image_if_present(slide, slide_data, image_placeholder_handler)
 
             # Step 4: Normalize placeholder names using hybrid approach
             self._normalize_placeholder_names(slide, layout_name)
@@ -153,7 +156,8 @@ class SlideCoordinator:
 
             # Step 7: Track slide completion
             self._current_slide_index += 1
-            # Slide creation completed successfully
+            if self.progress is not None:
+                self.progress.slide_created(len(prs.slides), layout_name)
 
             return slide
 
@@ -161,6 +165,26 @@ class SlideCoordinator:
             error_print(f"Failed to create slide: {e}")
             raise RuntimeError(f"Slide creation failed: {e}") from e
 
+    @property
+    def slide_index(self) -> int:
+        """Index the next slide is created with (it picks PlaceKitten fallback images)."""
+        return self._current_slide_index
+
+    def slide_restored(self, prs, layout_name: str):
+        """
+        Track a slide added as a copy of a previous build's slide (see slide_reuse).
+
+        The slide index still advances, so slides built after it get the same
+        fallback images as in a full build.
+
+        Args:
+            prs: PowerPoint presentation object
+            layout_name: Layout of the restored slide, for progress reporting
+        """
+        self._current_slide_index += 1
+        if self.progress is not None:
+            self.progress.slide_created(len(prs.slides), layout_name)
+
     def clear_slides(self, prs):
         """
         Clear all slides from presentation.
@@ -341,9 +365,15 @@ class SlideCoordinator:
         if speaker_notes:
             self.add_speaker_notes(slide, speaker_notes, content_formatter)
 
-    def _apply_background_image_if_present(self, slide, slide_data: Dict[str, Any]):
+    def _apply_background_image_if_present(self, slide, slide_data: Dict[str, Any], image_placeholder_handler=None):
         """Apply background image if background_image field is present in slide data."""
         try:
+            # Share the build's image cache so background fallbacks hit pre-warmed entries
+            if self._background_handler is None and image_placeholder_handler is not None:
+                from .background_handler import BackgroundImageHandler
+
+                self._background_handler = BackgroundImageHandler(image_placeholder_handler.image_handler, image_placeholder_handler.placekitten)
+
             if self.background_handler.should_apply_background(slide_data):
                 background_image_path = self.background_handler.get_background_image_path(slide_data)
                 if background_image_path:
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Slide reuse across rebuilds of the same deck.
+
+An engine given a SlideReuseCache keeps a snapshot of every slide it builds:
+its shape tree, layout, pictures, hyperlinks and speaker notes. When the deck
+is rebuilt, a slide whose data (and referenced files) did not change is
+restored from its snapshot instead of going through layout resolution, field
+mapping, formatting and image processing again; only edited slides are built.
+
+Snapshots are only valid for the template, patterns, language and font they
+were built with, so a change to any of them (the build context) drops them
+all. Snapshots of slides that were not part of the latest build are dropped
+too. Slides with parts other than pictures (charts, media) and repeat
+(mail-merge) slides are always built.
+
+PlaceKitten fallback images are chosen by slide index, so a snapshot of a
+slide with pictures (or a background image) is keyed by its position as well:
+inserting or removing a slide before it rebuilds it, while slides of text
+are still restored wherever they move.
+"""
+
+import hashlib
+import json
+from copy import deepcopy
+from typing import Any, Dict, Optional, Set, Tuple
+
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.parts.image import Image, ImagePart
+from pptx.oxml.ns import qn
+from pptx.parts.slide import NotesSlidePart, SlidePart
+
+from ..utils.build_profile import BuildProfile
+from .output_naming import InputDigest, output_digest, referenced_files
+
+# Attributes holding relationship ids in slide XML (pictures, media, hyperlinks)
+RID_ATTRIBUTES = (qn("r:embed"), qn("r:link"), qn("r:id"))
+
+# Relationships every new slide part already gets from its layout or adds itself
+OWN_RELTYPES = (RT.SLIDE_LAYOUT, RT.NOTES_SLIDE)
+
+
+class SlideSnapshot:
+    """Everything needed to add a copy of a built slide to another presentation"""
+
+    __slots__ = ("layout", "cSld", "images", "external", "notes")
+
+    def __init__(self, layout: Tuple[int, int], cSld, images: Dict[str, Tuple[bytes, str]], external: Dict[str, Tuple[str, str]], notes):
+        self.layout = layout
+        self.cSld = cSld
+        self.images = images
+        self.external = external
+        self.notes = notes
+
+
+def _layout_position(prs, slide) -> Optional[Tuple[int, int]]:
+    layout_part = slide.slide_layout.part
+    for master_index, master in enumerate(prs.slide_masters):
+        for layout_index, layout in enumerate(master.slide_layouts):
+            if layout.part is layout_part:
+                return master_index, layout_index
+    return None
+
+
+class SlideReuseCache:
+    """
+    Snapshots of built slides, keyed by their slide data and build context.
+
+    An engine calls begin() before each build, add_slide() for each slide and
+    end() after it; counts of the slides restored and built in the latest
+    build are kept in reused and built.
+    """
+
+    def __init__(self):
+        self.context: Optional[str] = None
+        self.files: Set[str] = set()
+        self.reused = 0
+        self.built = 0
+        self._snapshots: Dict[str, SlideSnapshot] = {}
+        self._used: Set[str] = set()
+
+    def begin(self, template_path: Optional[str], template_folder, language_code: Optional[str], font_name: Optional[str]) -> None:
+        """
+        Start a build, dropping every snapshot if the build context changed.
+
+        Args:
+            template_path: Template .pptx the deck is built from
+            template_folder: Folder holding the user patterns
+            language_code: Language applied to text, if any
+            font_name: Font applied to text, if any
+        """
+        # The output digest of no slides identifies the build context alone
+        context = output_digest(InputDigest(), template_path, template_folder, language_code, font_name)
+        if context != self.context:
+            self._snapshots.clear()
+            self.context = context
+        self._used = set()
+        self.files = set()
+        self.reused = self.built = 0
+
+    def end(self, profile: BuildProfile) -> None:
+        """Finish a build, dropping the snapshots of slides it did not have and counting reused slides into profile."""
+        self._snapshots = {key: snapshot for key, snapshot in self._snapshots.items() if key in self._used}
+        profile.count("reused_slides", self.reused)
+
+    def add_slide(self, prs, builder, slide_data: Dict[str, Any]):
+        """
+        Add one slide to prs, restored from the previous build if it is unchanged.
+
+        Args:
+            prs: Presentation being built
+            builder: PresentationBuilder that builds changed slides
+            slide_data: Slide object from the canonical JSON
+
+        Returns:
+            The added slide
+        """
+        key = self.key(slide_data)
+        positional_key = f"{key}@{builder.slide_index}"
+        slide = self.restore(prs, key) or self.restore(prs, positional_key)
+        if slide is None:
+            slide = builder.add_slide(prs, slide_data)
+            self.store(prs, key, slide, positional_key)
+        else:
+            builder.slide_restored(prs, slide_data)
+        return slide
+
+    def add_files(self, slide_data: Any) -> None:
+        """Record the files a slide that is always built references (see files)."""
+        self.files.update(referenced_files(slide_data))
+
+    def key(self, slide_data: Any) -> str:
+        """Hash of a slide's data and the contents of the files it references."""
+        files = referenced_files(slide_data)
+        self.files.update(files)
+        digest = hashlib.sha256(json.dumps(slide_data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8"))
+        for path, path_digest in sorted(files.items()):
+            digest.update(f"\0{path}\0{path_digest}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def restore(self, prs, key: str):
+        """
+        Add a copy of a snapshot slide to prs.
+
+        Returns:
+            The added slide, or None if there is no snapshot for key
+        """
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            return None
+        self._used.add(key)
+        self.reused += 1
+
+        # As Slides.add_slide, without cloning the layout's placeholders (the
+        # shape tree is replaced) or scanning all parts for a free part name
+        master_index, layout_index = snapshot.layout
+        layout = prs.slide_masters[master_index].slide_layouts[layout_index]
+        presentation_part = prs.part
+        slide_part = SlidePart.new(presentation_part._next_slide_partname, presentation_part.package, layout.part)
+        sldIdLst = prs.slides._sldIdLst
+        sldIdLst._add_sldId(id=sldIdLst._next_id, rId=presentation_part.rels._add_relationship(RT.SLIDE, slide_part))
+        slide = slide_part.slide
+
+        rId_map = {}
+        for rId, (blob, filename) in snapshot.images.items():
+            rId_map[rId] = slide_part.relate_to(self._image_part(presentation_part.package, blob, filename), RT.IMAGE)
+        for rId, (reltype, target) in snapshot.external.items():
+            rId_map[rId] = slide_part.relate_to(target, reltype, is_external=True)
+
+        cSld = deepcopy(snapshot.cSld)
+        for element in cSld.iter():
+            for attribute in RID_ATTRIBUTES:
+                value = element.get(attribute)
+                if value in rId_map:
+                    element.set(attribute, rId_map[value])
+        slide._element.replace(slide._element.cSld, cSld)
+
+        if snapshot.notes is not None:
+            self._restore_notes(slide_part, snapshot.notes)
+        return slide
+
+    @staticmethod
+    def _image_part(package, blob: bytes, filename: str):
+        # As package.get_or_add_image_part, but keeping the image's file name:
+        # pictures inserted later with the same image share the part and take
+        # their description (alt text) from it
+        image = Image.from_blob(blob, filename)
+        return package._image_parts._find_by_sha1(image.sha1) or ImagePart.new(package, image)
+
+    @staticmethod
+    def _restore_notes(slide_part, notes) -> None:
+        # Notes parts are numbered like their slide. Slides are added in order
+        # and python-pptx gives a built slide's notes the lowest free number,
+        # which is never above its slide's, so restored and built notes never
+        # share a part name.
+        package = slide_part.package
+        partname = PackURI(f"/ppt/notesSlides/notesSlide{slide_part.partname.idx}.xml")
+        notes_part = NotesSlidePart(partname, CT.PML_NOTES_SLIDE, package, deepcopy(notes))
+        notes_part.relate_to(package.presentation_part.notes_master_part, RT.NOTES_MASTER)
+        notes_part.relate_to(slide_part, RT.SLIDE)
+        slide_part.relate_to(notes_part, RT.NOTES_SLIDE)
+
+    def store(self, prs, key: str, slide, positional_key: Optional[str] = None) -> bool:
+        """
+        Snapshot a slide just built from the slide data hashed as key.
+
+        Args:
+            prs: Presentation the slide was added to
+            key: Hash of the slide data (see key)
+            slide: The built slide
+            positional_key: Key including the slide's position, used instead of key if the slide has pictures
+
+        Returns:
+            True if the slide can be reused (it has no charts, media or other parts)
+        """
+        self._used.add(key)
+        self.built += 1
+        layout = _layout_position(prs, slide)
+        if layout is None:
+            return False
+
+        images, external = {}, {}
+        for rel in slide.part.rels.values():
+            if rel.reltype in OWN_RELTYPES:
+                continue
+            if rel.is_external:
+                external[rel.rId] = (rel.reltype, rel.target_ref)
+            elif rel.reltype == RT.IMAGE:
+                images[rel.rId] = (rel.target_part.blob, rel.target_part.desc)
+            else:
+                return False
+
+        notes = deepcopy(slide.notes_slide._element) if slide.has_notes_slide else None
+
+        if images and positional_key is not None:
+            key = positional_key
+            self._used.add(key)
+        self._snapshots[key] = SlideSnapshot(layout, deepcopy(slide._element.cSld), images, external, notes)
+        return True
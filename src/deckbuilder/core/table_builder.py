@@ -1,31 +1,22 @@
 from pptx.util import Cm, Pt
-from pptx.dml.color import RGBColor
-
-try:
-    from .table_styles import TABLE_BORDER_STYLES, TABLE_HEADER_STYLES, TABLE_ROW_STYLES
-except ImportError:
-    # Fallback values if modules don't exist
-    TABLE_HEADER_STYLES = {"dark_blue_white_text": {"bg": RGBColor(46, 89, 132), "text": RGBColor(255, 255, 255)}}
-    TABLE_ROW_STYLES = {
-        "alternating_light_gray": {
-            "primary": RGBColor(255, 255, 255),
-            "alt": RGBColor(240, 240, 240),
-        }
-    }
-    TABLE_BORDER_STYLES = {"thin_gray": {"width": Pt(1), "color": RGBColor(128, 128, 128), "style": "all"}}
+
+from .table_palette import TABLE_BORDER_STYLES, TABLE_HEADER_STYLES, TABLE_ROW_STYLES, TablePalette, resolve_color
+from .table_writer import TableXmlWriter
 
 
 class TableBuilder:
     """Handles table creation, styling, and formatting for PowerPoint presentations."""
 
-    def __init__(self, content_formatter=None):
+    def __init__(self, content_formatter=None, palette=None):
         """
         Initialize the table builder.
 
         Args:
             content_formatter: ContentFormatter instance for text formatting
+            palette: TablePalette shared by the tables this builder writes (default: a new palette)
         """
         self.content_formatter = content_formatter
+        self.palette = palette or TablePalette()
 
     def add_table_to_slide(self, slide, table_data):
         """
@@ -43,7 +34,6 @@ class TableBuilder:
         # Get styling options with enhanced configuration support
         header_style = table_data.get("header_style", "dark_blue_white_text")
         row_style = table_data.get("row_style", "alternating_light_gray")
-        border_style = table_data.get("border_style", "thin_gray")
         custom_colors = table_data.get("custom_colors", {})
 
         # Font sizing configuration
@@ -78,7 +68,6 @@ class TableBuilder:
             height = dimensions["table_height"] or self._calculate_smart_table_height(data, header_font_size, data_font_size)
 
         # Create the table
-        rows = len(data)
         if data:
             # Handle both old (list of strings) and new (list of dicts) formats
             first_row = data[0]
@@ -89,37 +78,42 @@ class TableBuilder:
         else:
             cols = 1
 
-        table = slide.shapes.add_table(rows, cols, left, top, width, height).table
+        # Text, dimensions, styling and per-cell colours are written in one pass
+        cell_color_mode = table_data.get("cell_color_mode", "auto")
+        writer = self._create_table_writer(header_style, row_style, custom_colors, header_font_size, data_font_size, cell_color_mode)
+        writer.add_table(slide, data, cols, left, top, width, height, column_widths=dimensions["column_widths"], row_height=dimensions["row_height"])
 
-        # Apply table data with formatting support
-        for row_idx, row_data in enumerate(data):
-            for col_idx, cell_data in enumerate(row_data):
-                cell = table.cell(row_idx, col_idx)
+    def _create_table_writer(self, header_style, row_style, custom_colors, header_font_size=12, data_font_size=10, cell_color_mode="auto"):
+        """
+        Resolve table styling options into the style classes of a TableXmlWriter.
 
-                # Handle both old (string) and new (formatted) cell data
-                if isinstance(cell_data, dict) and "formatted" in cell_data:
-                    # New formatted cell data
-                    if self.content_formatter:
-                        self.content_formatter.apply_formatted_segments_to_cell(cell, cell_data["formatted"])
-                    else:
-                        cell.text = cell_data.get("text", str(cell_data))
-                else:
-                    # Old string cell data
-                    cell.text = str(cell_data)
+        Styles and colors come from the builder's palette, so they are resolved
+        once per build rather than per table. Border styles are not part of the
+        classes: python-pptx cells expose no border API, so _apply_table_borders
+        has never written border XML.
 
-        # Apply dimension controls
-        if dimensions["column_widths"]:
-            self._apply_column_widths(table, dimensions["column_widths"])
-        if dimensions["row_height"]:
-            self._apply_row_heights(table, dimensions["row_height"])
+        Args:
+            header_style: Header style name
+            row_style: Row style name
+            custom_colors: Dictionary of custom color overrides
+            header_font_size: Font size for the header row
+            data_font_size: Font size for data rows
+            cell_color_mode: Per-cell color detection mode ("auto", "enabled" or "disabled")
 
-        # Apply styling with font size control
-        self._apply_table_styling(table, header_style, row_style, border_style, custom_colors, table_data, header_font_size, data_font_size)
+        Returns:
+            TableXmlWriter with precomputed header, primary and alternate row styles
+        """
+        header = self.palette.header_style(header_style, custom_colors, self._get_font_size(0, header_font_size, data_font_size))
+        primary_row, alt_row = self.palette.row_styles(row_style, custom_colors, self._get_font_size(1, header_font_size, data_font_size))
 
-        # Apply per-cell color overrides based on configuration
-        cell_color_mode = table_data.get("cell_color_mode", "auto")
-        if cell_color_mode in ["auto", "enabled"]:
-            self._apply_per_cell_colors(table, data, cell_color_mode)
+        return TableXmlWriter(
+            header=header,
+            primary_row=primary_row,
+            alt_row=alt_row,
+            cell_color=resolve_color if cell_color_mode in ["auto", "enabled"] else None,
+            run_formatter=self.content_formatter._apply_language_font_formatting if self.content_formatter else None,
+            palette=self.palette,
+        )
 
     def _apply_table_styling(self, table, header_style, row_style, border_style, custom_colors, table_data=None, header_font_size=12, data_font_size=10):
         """
@@ -275,26 +269,7 @@ class TableBuilder:
         Returns:
             RGBColor object or None for transparent/invalid
         """
-        if not color_value or not isinstance(color_value, str):
-            return None
-
-        try:
-            import webcolors
-
-            # Normalize the color name
-            color_name = color_value.strip().lower()
-
-            # Handle transparent specially
-            if color_name == "transparent":
-                return None
-
-            # Convert HTML color name to RGB using webcolors
-            rgb_tuple = webcolors.name_to_rgb(color_name)
-            return RGBColor(rgb_tuple.red, rgb_tuple.green, rgb_tuple.blue)
-
-        except (ValueError, TypeError, AttributeError):
-            # webcolors raises ValueError for unknown color names
-            return None
+        return resolve_color(color_value)
 
     def _apply_per_cell_colors(self, table, data, mode="auto"):
         """
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Compiled Table Style Palette
+
+Resolves the named header and row styles and HTML colour names into
+immutable values once, instead of per table and per cell. A palette also owns the a:tcPr and a:rPr XML fragments built for each
+style class, so every table written with it (all tables of a build) clones
+the same fragments.
+
+Colour names are resolved through a bounded, process-wide memo shared by all
+palettes.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
+
+import webcolors
+from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.table import _Cell
+from pptx.text.text import _Run
+from pptx.util import Pt
+
+# Styles tables are built with. TableBuilder has always used these: the fuller
+# set in templates/table_styles.py (other colours for the same names) is not
+# wired in, so switching to it is a separate, visible change.
+TABLE_HEADER_STYLES = {"dark_blue_white_text": {"bg": RGBColor(46, 89, 132), "text": RGBColor(255, 255, 255)}}
+TABLE_ROW_STYLES = {
+    "alternating_light_gray": {
+        "primary": RGBColor(255, 255, 255),
+        "alt": RGBColor(240, 240, 240),
+    }
+}
+TABLE_BORDER_STYLES = {"thin_gray": {"width": Pt(1), "color": RGBColor(128, 128, 128), "style": "all"}}
+
+# Distinct colour names remembered (status tables reuse a handful of names)
+COLOR_CACHE_SIZE = 256
+
+# Text colour for transparent cells: dark gray reads on most backgrounds
+TRANSPARENT_CELL_TEXT_COLOR = RGBColor(64, 64, 64)
+
+# Fill value for cells that are explicitly transparent
+NO_FILL = "none"
+
+# (bold, italic, underline) of a formatted text segment
+SegmentFormat = Tuple[bool, bool, bool]
+PLAIN: SegmentFormat = (False, False, False)
+
+_TC_XML = f'<a:tc {nsdecls("a")}><a:txBody><a:bodyPr/><a:lstStyle/></a:txBody></a:tc>'
+_R_XML = f'<a:r {nsdecls("a")}><a:t/></a:r>'
+
+
+class CellStyle(NamedTuple):
+    """Properties shared by all cells of one style class."""
+
+    fill: Any = None  # RGBColor, NO_FILL, or None to leave the fill unset
+    text_color: Optional[RGBColor] = None
+    bold: bool = False
+    size: Optional[int] = None  # Font size in points
+
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def _color_for_name(color_name: str) -> Optional[RGBColor]:
+    if color_name == "transparent":
+        return None
+    try:
+        rgb = webcolors.name_to_rgb(color_name)
+    except (ValueError, TypeError, AttributeError):
+        # webcolors raises ValueError for unknown color names
+        return None
+    return RGBColor(rgb.red, rgb.green, rgb.blue)
+
+
+def resolve_color(color_value: Any) -> Optional[RGBColor]:
+    """
+    Resolve an HTML color name (e.g. "red", "navy", "lightgray") to an RGBColor.
+
+    Args:
+        color_value: Color name; case and surrounding whitespace are ignored
+
+    Returns:
+        RGBColor, or None for "transparent", unknown names and non-strings
+    """
+    if not color_value or not isinstance(color_value, str):
+        return None
+    color_name = color_value.strip().lower()
+    # Color names are letters only; numbers and other data never reach the memo
+    if not color_name.isalpha():
+        return None
+    return _color_for_name(color_name)
+
+
+def color_cache_stats() -> Dict[str, Any]:
+    """Return hits, misses and size of the color name memo."""
+    info = _color_for_name.cache_info()
+    lookups = info.hits + info.misses
+    return {"hits": info.hits, "misses": info.misses, "hit_rate": info.hits / lookups if lookups else 0.0, "size": info.currsize, "max_size": info.maxsize}
+
+
+class TablePalette:
+    """
+    Named table styles and their XML fragments, compiled once and shared by many tables.
+
+    Args:
+        header_styles: Header style definitions (name -> {"bg", "text"})
+        row_styles: Row style definitions (name -> {"primary", "alt"})
+        transparent_text_color: Text color for cells whose text is "transparent"
+    """
+
+    def __init__(
+        self,
+        header_styles: Mapping[str, Mapping[str, Any]] = TABLE_HEADER_STYLES,
+        row_styles: Mapping[str, Mapping[str, Any]] = TABLE_ROW_STYLES,
+        transparent_text_color: RGBColor = TRANSPARENT_CELL_TEXT_COLOR,
+    ):
+        self.header_colors = {name: (style["bg"], style["text"]) for name, style in header_styles.items()}
+        self.row_colors = {name: (style["primary"], style["alt"]) for name, style in row_styles.items()}
+        self.transparent_text_color = transparent_text_color
+
+        self._headers: Dict[Tuple, CellStyle] = {}
+        self._rows: Dict[Tuple, Tuple[CellStyle, CellStyle]] = {}
+        self._tcPr: Dict[Any, Any] = {}
+        self._rPr: Dict[Tuple, Any] = {}
+
+    def header_style(self, style_name: str, custom_colors: Mapping[str, Any], font_size: int) -> CellStyle:
+        """
+        Return the header row style class.
+
+        Custom "header_bg"/"header_text" colors override the named style; an
+        unknown style name leaves header cells unstyled.
+        """
+        custom_bg, custom_text = resolve_color(custom_colors.get("header_bg")), resolve_color(custom_colors.get("header_text"))
+        key = (style_name, custom_bg, custom_text, font_size)
+        if key not in self._headers:
+            style = CellStyle()
+            if style_name in self.header_colors:
+                bg, text = self.header_colors[style_name]
+                style = CellStyle(
+                    fill=custom_bg or bg,
+                    text_color=custom_text or text,
+                    bold=True,
+                    size=font_size,
+                )
+            self._headers[key] = style
+        return self._headers[key]
+
+    def row_styles(self, style_name: str, custom_colors: Mapping[str, Any], font_size: int) -> Tuple[CellStyle, CellStyle]:
+        """
+        Return the (primary, alternate) data row style classes.
+
+        Custom "primary_row"/"alt_row" colors override the named style; rows
+        without a fill color (or of an unknown style) are left unstyled.
+        """
+        custom_primary, custom_alt = resolve_color(custom_colors.get("primary_row")), resolve_color(custom_colors.get("alt_row"))
+        key = (style_name, custom_primary, custom_alt, font_size)
+        if key not in self._rows:
+            primary_row = alt_row = CellStyle()
+            if style_name in self.row_colors:
+                primary, alt = self.row_colors[style_name]
+                primary = custom_primary or primary
+                alt = custom_alt or alt
+                if primary is not None:
+                    primary_row = CellStyle(fill=primary, size=font_size)
+                if alt is not None:
+                    alt_row = CellStyle(fill=alt, size=font_size)
+            self._rows[key] = (primary_row, alt_row)
+        return self._rows[key]
+
+    def cell_properties(self, fill):
+        """
+        Return the a:tcPr fragment for a fill, building it on first use.
+
+        The fragment is shared: callers insert a copy.
+        """
+        if fill not in self._tcPr:
+            tc = parse_xml(_TC_XML)
+            tcPr = tc.get_or_add_tcPr()
+            if fill == NO_FILL:
+                _Cell(tc, None).fill.background()
+            elif fill is not None:
+                cell_fill = _Cell(tc, None).fill
+                cell_fill.solid()
+                cell_fill.fore_color.rgb = fill
+            self._tcPr[fill] = tcPr
+        return self._tcPr[fill]
+
+    def run_properties(self, style: CellStyle, segment: SegmentFormat = PLAIN, run_formatter: Optional[Callable[[_Run], None]] = None):
+        """
+        Return the a:rPr fragment for runs of a style class, building it on first use.
+
+        Properties are set in the order the per-cell styling passes applied
+        them: segment formatting and language/font (run_formatter) first, then
+        the class's color, weight and size. The fragment is shared: callers
+        insert a copy.
+
+        Returns:
+            a:rPr element, or None when runs of the class have no properties
+        """
+        # Runs of classes differing only by fill share a fragment
+        key = (style.text_color, style.bold, style.size, segment, run_formatter)
+        if key not in self._rPr:
+            r = parse_xml(_R_XML)
+            run = _Run(r, None)
+            bold, italic, underline = segment
+            if bold:
+                run.font.bold = True
+            if italic:
+                run.font.italic = True
+            if underline:
+                run.font.underline = True
+            if run_formatter is not None:
+                run_formatter(run)
+            if style.text_color is not None:
+                run.font.color.rgb = style.text_color
+            if style.bold:
+                run.font.bold = True
+            if style.size is not None:
+                run.font.size = Pt(style.size)
+            self._rPr[key] = r.rPr
+        return self._rPr[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of compiled style classes and XML fragments."""
+        return {
+            "header_styles": len(self._headers),
+            "row_styles": len(self._rows),
+            "cell_fragments": len(self._tcPr),
+            "run_fragments": len(self._rPr),
+        }
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Direct-XML Table Writer
+
+Builds a styled ``a:tbl`` element in a single pass over the table data
+instead of creating an empty table and revisiting every cell through
+``table.cell()`` proxies to set text, fills, fonts and per-cell colours.
+
+Every cell belongs to a style class: the header row, primary or alternate
+data rows, or a colour override when the cell text names a colour. The
+``a:tcPr`` and ``a:rPr`` fragments for each class are built once through
+python-pptx's own fill and font setters, then deep-copied into each cell,
+so the resulting XML is the same as styling the cells one by one. The
+fragments come from a TablePalette, which can be shared by many tables.
+"""
+
+import re
+from copy import deepcopy
+from typing import Any, Callable, List, Optional, Sequence
+
+from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.text.text import _Run
+from pptx.util import Emu
+
+from .table_palette import NO_FILL, CellStyle, TablePalette
+
+# Table style GUID python-pptx assigns to new tables
+DEFAULT_TABLE_STYLE_ID = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
+
+TRANSPARENT_TEXT = "TRANSPARENT"
+
+_TBL_XML = f'<a:tbl {nsdecls("a")}><a:tblPr firstRow="1" bandRow="1"><a:tableStyleId>%s</a:tableStyleId></a:tblPr><a:tblGrid/></a:tbl>'
+_TC_XML = f'<a:tc {nsdecls("a")}><a:txBody><a:bodyPr/><a:lstStyle/></a:txBody></a:tc>'
+
+# Same split python-pptx uses for paragraph text: runs separated by line breaks
+_LINE_BREAK = re.compile("\n|\v")
+
+
+class TableXmlWriter:
+    """
+    Writes complete tables as XML from precomputed cell property fragments.
+
+    Args:
+        header: Style of the first row
+        primary_row: Style of the first, third, ... data row
+        alt_row: Style of the second, fourth, ... data row
+        cell_color: Optional lookup turning cell text into an override colour (None for no override)
+        run_formatter: Callable applied to each run of formatted cells (language and font);
+            without one, formatted cells are written as their plain text
+        palette: TablePalette providing the XML fragments (default: a new palette)
+    """
+
+    def __init__(
+        self,
+        header: CellStyle = CellStyle(),
+        primary_row: CellStyle = CellStyle(),
+        alt_row: CellStyle = CellStyle(),
+        cell_color: Optional[Callable[[str], Optional[RGBColor]]] = None,
+        run_formatter: Optional[Callable[[_Run], None]] = None,
+        palette: Optional[TablePalette] = None,
+    ):
+        self.header = header
+        self.primary_row = primary_row
+        self.alt_row = alt_row
+        self.cell_color = cell_color
+        self.run_formatter = run_formatter
+        self.palette = palette or TablePalette()
+
+        self._tc_template = parse_xml(_TC_XML)
+
+    def _row_style(self, row_idx: int) -> CellStyle:
+        if row_idx == 0:
+            return self.header
+        return self.alt_row if (row_idx - 1) % 2 == 1 else self.primary_row
+
+    def _cell_style(self, base: CellStyle, text: str) -> CellStyle:
+        """Apply the colour override for a cell's text, if any."""
+        if self.cell_color is None:
+            return base
+
+        color = self.cell_color(text)
+        if color is not None:
+            return base._replace(fill=color, text_color=color)
+        if text.upper() == TRANSPARENT_TEXT:
+            return base._replace(fill=NO_FILL, text_color=self.palette.transparent_text_color or base.text_color)
+        return base
+
+    def _write_cell(self, cell_data, style: CellStyle):
+        """Build one a:tc element holding the cell's text and its style class properties."""
+        tc = deepcopy(self._tc_template)
+        txBody = tc.txBody
+
+        if isinstance(cell_data, dict) and "formatted" in cell_data and self.run_formatter is not None:
+            p = txBody.add_p()
+            for segment in cell_data["formatted"]:
+                r = p.add_r(segment["text"])
+                format_dict = segment["format"]
+                segment_format = (bool(format_dict.get("bold")), bool(format_dict.get("italic")), bool(format_dict.get("underline")))
+                rPr = self.palette.run_properties(style, segment_format, self.run_formatter)
+                if rPr is not None:
+                    r.insert(0, deepcopy(rPr))
+        else:
+            if isinstance(cell_data, dict) and "formatted" in cell_data:
+                text = cell_data.get("text", str(cell_data))
+            else:
+                text = str(cell_data)
+            rPr = self.palette.run_properties(style)
+            for p_text in text.split("\n"):
+                p = txBody.add_p()
+                for idx, r_text in enumerate(_LINE_BREAK.split(p_text)):
+                    if idx > 0:
+                        p.add_br()
+                    if r_text:
+                        r = p.add_r(r_text)
+                        if rPr is not None:
+                            r.insert(0, deepcopy(rPr))
+
+        tc.append(deepcopy(self.palette.cell_properties(style.fill)))
+        return tc
+
+    def build_table(
+        self,
+        data: Sequence[Sequence[Any]],
+        cols: int,
+        width: int,
+        height: int,
+        column_widths: Optional[List[int]] = None,
+        row_height: Optional[int] = None,
+    ):
+        """
+        Build a styled a:tbl element.
+
+        Columns and rows share width and height evenly (the last absorbing
+        rounding), as python-pptx lays out new tables, unless explicit
+        column widths or a uniform row height are given.
+
+        Args:
+            data: Rows of cell values (strings or formatted cell dictionaries)
+            cols: Number of columns; extra values in a row are ignored, missing ones left empty
+            width: Table width in EMU
+            height: Table height in EMU
+            column_widths: Optional per-column widths in EMU
+            row_height: Optional uniform row height in EMU
+
+        Returns:
+            The a:tbl element
+        """
+        rows = len(data)
+        tbl = parse_xml(_TBL_XML % DEFAULT_TABLE_STYLE_ID)
+
+        col_width = width // cols
+        for col_idx in range(cols):
+            if column_widths and col_idx < len(column_widths):
+                tbl.tblGrid.add_gridCol(width=Emu(column_widths[col_idx]))
+            else:
+                tbl.tblGrid.add_gridCol(width=Emu(width - (cols - 1) * col_width if col_idx == cols - 1 else col_width))
+
+        default_height = height // rows
+        for row_idx, row_data in enumerate(data):
+            if row_height:
+                h = row_height
+            else:
+                h = height - (rows - 1) * default_height if row_idx == rows - 1 else default_height
+            tr = tbl.add_tr(height=Emu(h))
+
+            base = self._row_style(row_idx)
+            values = list(row_data)[:cols]
+            for col_idx in range(cols):
+                if col_idx >= len(values):
+                    tr.append(self._write_cell("", base))
+                    continue
+                cell_data = values[col_idx]
+                text = str(cell_data["text"] if isinstance(cell_data, dict) and "text" in cell_data else cell_data).strip()
+                tr.append(self._write_cell(cell_data, self._cell_style(base, text)))
+
+        return tbl
+
+    def add_table(self, slide, data: Sequence[Sequence[Any]], cols: int, left: int, top: int, width: int, height: int, column_widths=None, row_height=None):
+        """
+        Add a table shape holding a table written by build_table to a slide.
+
+        The shape is sized to the written grid, so explicit column widths and
+        row heights resize it as they do when set on a python-pptx table.
+
+        Returns:
+            The new GraphicFrame shape
+        """
+        tbl = self.build_table(data, cols, width, height, column_widths, row_height)
+        grid_width = sum(gridCol.w for gridCol in tbl.tblGrid.gridCol_lst)
+        grid_height = sum(tr.h for tr in tbl.tr_lst)
+
+        graphic_frame = slide.shapes.add_table(1, 1, left, top, grid_width, grid_height)
+        placeholder_tbl = graphic_frame.table._tbl
+        placeholder_tbl.getparent().replace(placeholder_tbl, tbl)
+        return graphic_frame
@@ -57,7 +57,7 @@ _deckbuilder_completion() {
         image)
             # Image subcommands
             if [[ ${COMP_CWORD} == 2 ]]; then
-                image_commands="generate crop"
+                image_commands="generate crop warm"
                 COMPREPLY=($(compgen -W "${image_commands}" -- ${cur}))
                 return 0
             fi
@@ -159,7 +159,7 @@ _deckbuilder_completion() {
                         return 0
                         ;;
                     image)
-                        image_commands="generate crop"
+                        image_commands="generate crop warm"
                         COMPREPLY=($(compgen -W "${image_commands}" -- ${cur}))
                         return 0
                         ;;
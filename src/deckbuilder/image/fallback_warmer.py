@@ -0,0 +1,91 @@
+"""
+FallbackWarmer - Pre-render PlaceKitten fallback images for a template.
+
+This module provides the FallbackWarmer class that reads the placeholder
+geometry of a PowerPoint template and renders every fallback image a build
+against that template could request, so production builds hit the image cache
+instead of running smart crops and filters on the critical path.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.util import Emu
+
+from ..templates.template_analysis import load_template_analysis
+from .placekitten_integration import PlaceKittenIntegration
+
+# Pixel conversion used by ImagePlaceholderHandler and BackgroundImageHandler
+PIXELS_PER_INCH = 96
+
+
+class FallbackWarmer:
+    """
+    Pre-renders PlaceKitten fallback images for a template's layouts.
+
+    Enumerates every PICTURE placeholder across the template's slide layouts
+    plus the full slide size used for background images, and renders each
+    size for every image ID the fallback selector can choose.
+    """
+
+    def __init__(self, placekitten: PlaceKittenIntegration, max_workers: Optional[int] = None):
+        """
+        Initialize FallbackWarmer.
+
+        Args:
+            placekitten: PlaceKittenIntegration whose image cache will be warmed
+            max_workers: Optional thread pool size for rendering
+        """
+        self.placekitten = placekitten
+        self.max_workers = max_workers
+
+    @staticmethod
+    def _to_pixels(length) -> int:
+        """Convert a python-pptx Length to pixels the same way the build does."""
+        return int(length.inches * PIXELS_PER_INCH)
+
+    def collect_dimensions(self, template_path: str) -> List[Tuple[int, int]]:
+        """
+        Collect fallback image dimensions from a template.
+
+        Args:
+            template_path: Path to the .pptx template
+
+        Returns:
+            list: Unique (width, height) pairs in pixels, sorted
+        """
+        analysis = load_template_analysis(template_path)
+
+        # Background images always cover the whole slide
+        dimensions = {(self._to_pixels(Emu(analysis["slide_width"])), self._to_pixels(Emu(analysis["slide_height"])))}
+
+        for layout in analysis["layouts"].values():
+            for placeholder in layout["placeholders"]:
+                if placeholder["type"] != PP_PLACEHOLDER.PICTURE.name:
+                    continue
+                if placeholder["width"] is None or placeholder["height"] is None:
+                    continue
+                dimensions.add((self._to_pixels(Emu(placeholder["width"])), self._to_pixels(Emu(placeholder["height"]))))
+
+        return sorted(dimensions)
+
+    def warm(self, template_path: str) -> Dict:
+        """
+        Render all fallback images for a template into the image cache.
+
+        Args:
+            template_path: Path to the .pptx template
+
+        Returns:
+            dict: Warm-up statistics including dimensions and render counts
+        """
+        if not Path(template_path).exists():
+            raise FileNotFoundError(f"Template file not found: {template_path}")
+
+        dimensions = self.collect_dimensions(template_path)
+        stats = self.placekitten.warm_cache(dimensions, max_workers=self.max_workers)
+        stats["dimensions"] = dimensions
+        stats["image_ids"] = self.placekitten.get_variety_image_ids()
+        stats["cache_dir"] = str(self.placekitten.image_handler.cache_dir)
+        return stats
@@ -7,11 +7,17 @@ processing them for PowerPoint placeholders, and managing cached fallback images
 
 import hashlib
 import os
+import threading
 from pathlib import Path
 from typing import Optional, Tuple
 
 from PIL import Image
 
+from ..utils.cache_stats import CacheCounter
+
+# Lookups in the processed image cache across all handlers in the process
+image_cache_stats = CacheCounter()
+
 
 class ImageHandler:
     """
@@ -215,8 +221,10 @@ class ImageHandler:
         cached_path = self.cache_dir / f"{cache_key}.jpg"
 
         if cached_path.exists():
+            image_cache_stats.hit()
             return str(cached_path)
 
+        image_cache_stats.miss()
         return None
 
     def _save_processed_image(self, img: Image.Image, cache_key: str, quality: str) -> Path:
@@ -237,8 +245,11 @@ class ImageHandler:
         # Get quality setting
         jpeg_quality = self.quality_settings.get(quality, 95)
 
-        # Save as JPEG with specified quality
-        img.save(output_path, "JPEG", quality=jpeg_quality, optimize=True)
+        # Save as JPEG with specified quality, then move into place so concurrent
+        # builds never see a partially written cache file
+        temp_path = output_path.with_name(f"{output_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        img.save(temp_path, "JPEG", quality=jpeg_quality, optimize=True)
+        os.replace(temp_path, output_path)
 
         return output_path
 
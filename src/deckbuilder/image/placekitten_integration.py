@@ -5,7 +5,10 @@ This module provides the PlaceKittenIntegration class that generates professiona
 fallback images using PlaceKitten when user-provided images are missing or invalid.
 """
 
-from typing import Dict, Optional, Tuple
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 
 from .image_handler import ImageHandler
 
@@ -104,22 +107,47 @@ class PlaceKittenIntegration:
             # Select consistent image based on context
             image_id = self._select_image_id(context)
 
-            # Generate base image
-            processor = self.pk.generate(image_id=image_id)
-
-            # Apply professional styling pipeline
-            styled_processor = self._apply_professional_styling(processor, width, height)
-
-            # Save to cache with high quality
-            output_path = self.image_handler.cache_dir / f"{cache_key}.jpg"
-            final_path = styled_processor.save(str(output_path))
-
-            return final_path
+            return self._render_fallback_image(width, height, image_id, cache_key)
 
         except Exception as e:
             print(f"Warning: Failed to create fallback image: {e}")
             return None
 
+    def _render_fallback_image(self, width: int, height: int, image_id: int, cache_key: str) -> str:
+        """
+        Render a styled fallback image into the cache.
+
+        The image is written under a temporary name and moved into place, so
+        concurrent builds never pick up a partially written cache entry.
+
+        Args:
+            width: Target width
+            height: Target height
+            image_id: PlaceKitten image ID (1-based)
+            cache_key: Cache key for storing result
+
+        Returns:
+            str: Path to the cached image
+        """
+        # Generate base image
+        processor = self.pk.generate(image_id=image_id)
+
+        # Apply professional styling pipeline
+        styled_processor = self._apply_professional_styling(processor, width, height)
+
+        # Save to cache with high quality
+        self.image_handler._ensure_cache_dir()
+        output_path = self.image_handler.cache_dir / f"{cache_key}.jpg"
+        temp_path = self.image_handler.cache_dir / f".{cache_key}.{uuid.uuid4().hex}.jpg"
+        try:
+            styled_processor.save(str(temp_path))
+            os.replace(temp_path, output_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+        return str(output_path)
+
     def _apply_professional_styling(self, processor, width: int, height: int):
         """
         Apply professional styling pipeline to PlaceKitten image.
@@ -198,6 +226,11 @@ class PlaceKittenIntegration:
         """
         Generate cache key for fallback image including image variety.
 
+        The rendered image depends only on its dimensions, the selected image ID
+        and the styling, so the key is built from those alone. This keeps keys
+        stable across processes and lets placeholders that resolve to the same
+        image share one cache entry.
+
         Args:
             dimensions: Target dimensions
             context: Optional context information
@@ -205,12 +238,24 @@ class PlaceKittenIntegration:
         Returns:
             str: Cache key for consistent fallback generation with variety
         """
-        width, height = dimensions
-
         # Get the selected image ID to ensure different images get different cache keys
         image_id = self._select_image_id(context)
 
-        # Base key with dimensions and styling
+        return self._build_cache_key(dimensions, image_id)
+
+    def _build_cache_key(self, dimensions: Tuple[int, int], image_id: int) -> str:
+        """
+        Build the cache key for a rendered fallback image.
+
+        Args:
+            dimensions: Target dimensions
+            image_id: PlaceKitten image ID (1-based)
+
+        Returns:
+            str: Cache key
+        """
+        width, height = dimensions
+
         key_parts = [
             "placekitten_fallback",
             f"{width}x{height}",
@@ -220,21 +265,62 @@ class PlaceKittenIntegration:
             f'brightness{self.professional_config["brightness_adjustment"]}',
         ]
 
-        # Add context-based components for consistency
-        if context:
-            if "slide_index" in context and context["slide_index"] > 0:
-                key_parts.append(f'slide{context["slide_index"]}')
-            if "layout" in context:
-                # Use a shorter hash to keep cache keys manageable
-                layout_hash = abs(hash(context["layout"])) % 10000
-                key_parts.append(f"layout{layout_hash}")
-            if "field_name" in context:
-                # Add field name for unique images per placeholder
-                field_hash = abs(hash(context["field_name"])) % 1000
-                key_parts.append(f"field{field_hash}")
-
         return "_".join(str(part) for part in key_parts)
 
+    def get_variety_image_ids(self) -> List[int]:
+        """
+        Get every image ID that _select_image_id can produce.
+
+        Returns:
+            list: Image IDs (1-based), empty if PlaceKitten is unavailable
+        """
+        if not self.is_available():
+            return []
+        return list(range(1, self.pk.get_image_count() + 1))
+
+    def warm_cache(self, dimensions_list: List[Tuple[int, int]], max_workers: Optional[int] = None) -> Dict:
+        """
+        Pre-render fallback images for every dimension and image ID combination.
+
+        Rendering happens in a thread pool; OpenCV and Pillow release the GIL
+        for the heavy lifting, so crops and filters run in parallel.
+
+        Args:
+            dimensions_list: Target (width, height) pairs to render
+            max_workers: Optional thread pool size
+
+        Returns:
+            dict: Counts of rendered, already cached and failed images
+        """
+        stats = {"requested": 0, "rendered": 0, "cached": 0, "failed": 0, "errors": []}
+        if not self.is_available():
+            return stats
+
+        jobs = []
+        for dimensions in sorted(set(dimensions_list)):
+            for image_id in self.get_variety_image_ids():
+                cache_key = self._build_cache_key(dimensions, image_id)
+                stats["requested"] += 1
+                if self.image_handler._get_cached_image(cache_key):
+                    stats["cached"] += 1
+                else:
+                    jobs.append((dimensions, image_id, cache_key))
+
+        if not jobs:
+            return stats
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._render_fallback_image, dims[0], dims[1], image_id, cache_key): cache_key for dims, image_id, cache_key in jobs}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    stats["rendered"] += 1
+                except Exception as e:
+                    stats["failed"] += 1
+                    stats["errors"].append(f"{futures[future]}: {e}")
+
+        return stats
+
     def _get_professional_styling(self) -> Dict:
         """
         Get professional styling configuration for business presentations.
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Batch layout scoring for LayoutIntelligence.recommend_layouts_batch.
+
+Each slide is analyzed into a feature row (structure indicators, keyword
+hits, intent, image hints, content blocks) and the whole feature matrix is
+scored against every layout with NumPy:
+
+- the structure match is (S @ optimal_for) > 0
+- keyword factors are T @ confidence_factors
+- intent is one-hot @ intent_layouts
+- the four-column, three-column and picture rules are boolean masks
+
+Scores match LayoutIntelligence.recommend_layouts for each slide; reasoning
+and hints are only built for the recommendations returned.
+"""
+
+from typing import TYPE_CHECKING, List
+
+import numpy as np
+
+from .layout_intelligence import LayoutRecommendation
+
+if TYPE_CHECKING:
+    from .layout_intelligence import LayoutIntelligence
+
+
+class BatchLayoutScorer:
+    """
+    Layout rules of one LayoutIntelligence compiled into scoring matrices.
+
+    Args:
+        intelligence: Engine whose layout_compatibility, intent and weight data are compiled
+    """
+
+    def __init__(self, intelligence: "LayoutIntelligence"):
+        self.intelligence = intelligence
+        data = intelligence.intelligence_data
+        layout_compatibility = data.get("layout_compatibility", {})
+        intent_patterns = data.get("content_patterns", {}).get("intent_recognition", {})
+        self.weights = data.get("recommendation_engine", {}).get("scoring_weights", {})
+        self.layout_names = list(layout_compatibility)
+
+        # Every structure indicator or keyword that any layout rule refers to
+        tokens = []
+        for layout_info in layout_compatibility.values():
+            tokens.extend(layout_info.get("optimal_for", []))
+            tokens.extend(layout_info.get("confidence_factors", {}))
+        self.token_index = {token: i for i, token in enumerate(dict.fromkeys(tokens))}
+        self.intent_index = {intent: i for i, intent in enumerate(intent_patterns)}
+
+        self.optimal_for = np.zeros((len(self.token_index), len(self.layout_names)))
+        self.confidence_factors = np.zeros((len(self.token_index), len(self.layout_names)))
+        self.intent_layouts = np.zeros((len(self.intent_index), len(self.layout_names)))
+
+        for column, layout_name in enumerate(self.layout_names):
+            layout_info = layout_compatibility[layout_name]
+            for indicator in layout_info.get("optimal_for", []):
+                self.optimal_for[self.token_index[indicator], column] = 1
+            for factor, weight in layout_info.get("confidence_factors", {}).items():
+                self.confidence_factors[self.token_index[factor], column] = self.weights.get("keyword_matching", 0.3) * weight
+            for intent, pattern_info in intent_patterns.items():
+                if layout_name in pattern_info.get("layouts", []):
+                    self.intent_layouts[self.intent_index[intent], column] = 1
+
+        self.four_columns = np.array(["Four Columns" in name for name in self.layout_names])
+        self.three_columns = np.array(["Three Columns" in name for name in self.layout_names])
+        self.picture = np.array(["Picture" in name for name in self.layout_names])
+
+    def recommend(self, contents: List[str], max_recommendations: int = 3) -> List[List[LayoutRecommendation]]:
+        """
+        Recommend layouts for every slide.
+
+        Args:
+            contents: Content of each slide, in deck order
+            max_recommendations: Maximum number of recommendations per slide
+
+        Returns:
+            One list of LayoutRecommendation objects (sorted by confidence) per slide
+        """
+        intelligence = self.intelligence
+        analyses = [intelligence.analyze_content(content) for content in contents]
+
+        slide_count = len(analyses)
+        structure_features = np.zeros((slide_count, len(self.token_index)))
+        token_features = np.zeros((slide_count, len(self.token_index)))
+        intent_features = np.zeros((slide_count, len(self.intent_index)))
+        four_blocks = np.zeros(slide_count, dtype=bool)
+        three_blocks = np.zeros(slide_count, dtype=bool)
+        has_images = np.zeros(slide_count, dtype=bool)
+
+        for row, analysis in enumerate(analyses):
+            for indicator in analysis.structure_indicators:
+                if indicator in self.token_index:
+                    structure_features[row, self.token_index[indicator]] = 1
+                    token_features[row, self.token_index[indicator]] = 1
+            for keyword in analysis.keywords_found:
+                if keyword in self.token_index:
+                    token_features[row, self.token_index[keyword]] = 1
+            if analysis.intent in self.intent_index:
+                intent_features[row, self.intent_index[analysis.intent]] = 1
+            four_blocks[row] = analysis.content_blocks == 4
+            three_blocks[row] = analysis.content_blocks == 3
+            has_images[row] = analysis.has_images
+
+        weights = self.weights
+
+        # Same rules as LayoutIntelligence._score_layout, for all slides x layouts at once
+        scores = weights.get("content_structure", 0.4) * ((structure_features @ self.optimal_for) > 0)
+        scores = scores + token_features @ self.confidence_factors
+        scores = scores + weights.get("intent_recognition", 0.2) * (intent_features @ self.intent_layouts)
+
+        four_match = np.outer(four_blocks, self.four_columns)
+        three_match = ~four_match & np.outer(three_blocks, self.three_columns)
+        picture_match = ~four_match & ~three_match & np.outer(has_images, self.picture)
+        scores = scores + weights.get("layout_compatibility", 0.1) * (four_match | three_match | picture_match)
+        scores = np.minimum(scores, 1.0)
+
+        minimum_confidence = intelligence.intelligence_data.get("recommendation_engine", {}).get("minimum_confidence", 0.6)
+        layout_compatibility = intelligence.intelligence_data.get("layout_compatibility", {})
+        content_patterns = intelligence.intelligence_data.get("content_patterns", {})
+
+        # Stable sort keeps layout file order for equal confidences, like list.sort in recommend_layouts
+        ranking = np.argsort(-scores, axis=1, kind="stable")
+
+        results = []
+        for row, analysis in enumerate(analyses):
+            recommendations = []
+            for column in ranking[row]:
+                confidence = float(scores[row, column])
+                if len(recommendations) >= max_recommendations or confidence < minimum_confidence:
+                    break
+
+                layout_name = self.layout_names[column]
+                layout_info = layout_compatibility[layout_name]
+                _score, reasoning = intelligence._score_layout(analysis, layout_name, layout_info, content_patterns, weights)
+                recommendations.append(
+                    LayoutRecommendation(
+                        layout_name=layout_name,
+                        confidence=confidence,
+                        reasoning=reasoning,
+                        placeholder_mapping=intelligence._generate_placeholder_mapping(analysis, layout_info),
+                        optimization_hints=intelligence._get_optimization_hints(layout_name, analysis),
+                    )
+                )
+            results.append(recommendations)
+
+        return results
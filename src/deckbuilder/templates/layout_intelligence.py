@@ -7,11 +7,29 @@ semantic metadata and convention-based placeholder names.
 """
 
 import json
+import os
 import re
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from ..utils.keyword_index import KeywordIndex
+
+# Hardcoded content-type vocabularies, checked in this order by _detect_content_type
+CONTENT_KEYWORDS = KeywordIndex(
+    {
+        "image_content": ["image", "picture", "photo", "diagram"],
+        "comparison_content": ["vs", "versus", "compare", "option"],
+        "agenda_content": ["step", "agenda", "process"],
+        "image_indicators": ["image", "picture", "photo", "diagram", "visual", "media"],
+    }
+)
+
+# Parsed layout_intelligence.json files keyed by path: (mtime_ns, data). Treated as read-only.
+_INTELLIGENCE_DATA_CACHE: Dict[str, Tuple[int, Dict]] = {}
+_intelligence_data_lock = threading.Lock()
+
 
 @dataclass
 class LayoutRecommendation:
@@ -57,17 +75,39 @@ class LayoutIntelligence:
 
         self.intelligence_file = intelligence_file
         self.intelligence_data = self._load_intelligence_data()
+        self._batch_scorer = None
+
+        intent_patterns = self.intelligence_data.get("content_patterns", {}).get("intent_recognition", {})
+        self.intent_keywords = KeywordIndex({intent: pattern_info.get("keywords", []) for intent, pattern_info in intent_patterns.items()})
 
     def _load_intelligence_data(self) -> Dict:
-        """Load layout intelligence metadata"""
+        """Load layout intelligence metadata, shared between instances until the file changes"""
+        try:
+            mtime_ns = os.stat(self.intelligence_file).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Layout intelligence file not found: {self.intelligence_file}")
+
+        with _intelligence_data_lock:
+            cached = _INTELLIGENCE_DATA_CACHE.get(self.intelligence_file)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
         try:
             with open(self.intelligence_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+                data = json.load(f)
         except FileNotFoundError:
             raise FileNotFoundError(f"Layout intelligence file not found: {self.intelligence_file}")
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in intelligence file: {e}")
 
+        with _intelligence_data_lock:
+            # Threads that parsed the file concurrently all share the first result
+            cached = _INTELLIGENCE_DATA_CACHE.get(self.intelligence_file)
+            if cached and cached[0] == mtime_ns:
+                return cached[1]
+            _INTELLIGENCE_DATA_CACHE[self.intelligence_file] = (mtime_ns, data)
+        return data
+
     def analyze_content(self, content: str) -> ContentAnalysis:
         """
         Analyze content to extract semantic information for layout recommendations.
@@ -148,24 +188,39 @@ class LayoutIntelligence:
         recommendations.sort(key=lambda x: x.confidence, reverse=True)
         return recommendations[:max_recommendations]
 
+    def recommend_layouts_batch(self, contents: List[str], max_recommendations: int = 3) -> List[List[LayoutRecommendation]]:
+        """
+        Recommend layouts for many slides at once, scored with matrix operations (see layout_batch).
+
+        Args:
+            contents: Content of each slide, in deck order
+            max_recommendations: Maximum number of recommendations per slide
+
+        Returns:
+            One list of LayoutRecommendation objects (sorted by confidence) per slide
+        """
+        if not contents:
+            return []
+        return self._get_batch_scorer().recommend(contents, max_recommendations)
+
+    def _get_batch_scorer(self):
+        """Batch scorer compiled from the intelligence data (built once per instance)"""
+        if self._batch_scorer is None:
+            from .layout_batch import BatchLayoutScorer
+
+            self._batch_scorer = BatchLayoutScorer(self)
+        return self._batch_scorer
+
     def _detect_intent(self, content_lower: str) -> str:
         """Detect primary intent from content"""
-        intent_patterns = self.intelligence_data.get("content_patterns", {}).get("intent_recognition", {})
+        hits = self.intent_keywords.scan(content_lower)
 
         best_intent = "overview"
         best_score = 0
 
-        for intent, pattern_info in intent_patterns.items():
-            score = 0
-            keywords = pattern_info.get("keywords", [])
-
-            for keyword in keywords:
-                if keyword in content_lower:
-                    score += 1
-
+        for intent, keywords in self.intent_keywords.groups.items():
             # Normalize score by number of keywords
-            if keywords:
-                score = score / len(keywords)
+            score = hits.count(intent) / len(keywords) if keywords else 0
 
             if score > best_score:
                 best_score = score
@@ -176,13 +231,14 @@ class LayoutIntelligence:
     def _detect_content_type(self, content_lower: str) -> str:
         """Detect primary content type"""
         # Simple heuristics for content type detection
-        if any(word in content_lower for word in ["image", "picture", "photo", "diagram"]):
+        hits = CONTENT_KEYWORDS.scan(content_lower)
+        if hits.has("image_content"):
             return "image_content"
-        elif any(word in content_lower for word in ["vs", "versus", "compare", "option"]):
+        elif hits.has("comparison_content"):
             return "comparison_content"
         elif re.search(r"\d+[%]|\d+\.\d+", content_lower):
             return "statistics"
-        elif any(word in content_lower for word in ["step", "agenda", "process"]):
+        elif hits.has("agenda_content"):
             return "agenda_content"
         elif len(re.findall(r"^#{1,3}\s", content_lower, re.MULTILINE)) >= 3:
             return "column_content"
@@ -218,16 +274,7 @@ class LayoutIntelligence:
 
     def _find_keywords(self, content_lower: str) -> List[str]:
         """Find relevant keywords in content"""
-        found_keywords = []
-        intent_patterns = self.intelligence_data.get("content_patterns", {}).get("intent_recognition", {})
-
-        for _intent, pattern_info in intent_patterns.items():
-            keywords = pattern_info.get("keywords", [])
-            for keyword in keywords:
-                if keyword in content_lower:
-                    found_keywords.append(keyword)
-
-        return list(set(found_keywords))  # Remove duplicates
+        return list(self.intent_keywords.find(content_lower))
 
     def _count_content_blocks(self, content: str) -> int:
         """Count distinct content blocks"""
@@ -238,8 +285,7 @@ class LayoutIntelligence:
 
     def _has_image_content(self, content_lower: str) -> bool:
         """Check if content references images"""
-        image_indicators = ["image", "picture", "photo", "diagram", "visual", "media"]
-        return any(indicator in content_lower for indicator in image_indicators)
+        return CONTENT_KEYWORDS.scan(content_lower).has("image_indicators")
 
     def _has_numeric_content(self, content_lower: str) -> bool:
         """Check if content has significant numeric data"""
@@ -1,6 +1,61 @@
 import json
 import os
 import shutil
+import threading
+from typing import Any, Dict, Tuple
+
+
+class TemplateFileCache:
+    """
+    Process-wide cache of template .pptx bytes shared by all engines.
+
+    Entries are keyed by path and tagged with the file's (mtime, size), so an
+    edited template is re-read on its next use. Each build still parses the
+    bytes into its own Presentation; only the file contents are shared.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def read(self, template_path: str) -> bytes:
+        """Return the template's bytes, reading the file only if it changed."""
+        stat = os.stat(template_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(template_path)
+            if entry and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        with open(template_path, "rb") as f:
+            data = f.read()
+        with self._lock:
+            self._entries[template_path] = (signature, data)
+        return data
+
+    def clear(self) -> None:
+        """Drop all cached templates."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry count, cached bytes and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": sum(len(data) for _, data in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Shared by every engine in the process
+template_file_cache = TemplateFileCache()
 
 
 class TemplateManager:
@@ -9,8 +9,9 @@ This module implements the foundation for TDD Template Discovery (GitHub Issue #
 """
 
 import logging
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 
 from deckbuilder.utils.path import path_manager
@@ -47,6 +48,76 @@ class TemplateMetadata:
     complexity_breakdown: Dict[str, int] = field(default_factory=dict)
 
 
+class TemplateMetadataStore:
+    """
+    Process-wide store of built TemplateMetadata shared by all loaders.
+
+    Entries are keyed by (template folder, template name) and tagged with a
+    fingerprint of the template file and the pattern files. A lookup whose
+    fingerprint no longer matches is a miss, so edits to the template or to
+    built-in/user patterns are picked up without restarting the process.
+    Stored metadata is shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._entries: Dict[Tuple[str, str], Tuple[Tuple, TemplateMetadata]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: Tuple[str, str], fingerprint: Tuple) -> Optional[TemplateMetadata]:
+        """Return stored metadata if its fingerprint still matches, counting hits and misses."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == fingerprint:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            if entry:
+                # Template or patterns changed since the entry was built
+                self.invalidations += 1
+                del self._entries[key]
+            return None
+
+    def put(self, key: Tuple[str, str], fingerprint: Tuple, metadata: TemplateMetadata) -> None:
+        """Store metadata built for the given fingerprint."""
+        with self._lock:
+            self._entries[key] = (fingerprint, metadata)
+
+    def invalidate(self, template_folder: Optional[Path] = None) -> None:
+        """Drop entries for one template folder, or all entries."""
+        with self._lock:
+            if template_folder is None:
+                self._entries.clear()
+                return
+            folder = str(Path(template_folder).resolve())
+            for key in [key for key in self._entries if key[0] == folder]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry count, hit/miss/invalidation counters and hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset counters without dropping entries."""
+        with self._lock:
+            self.hits = self.misses = self.invalidations = 0
+
+
+# Shared by every TemplateMetadataLoader in the process
+template_metadata_store = TemplateMetadataStore()
+
+
 class TemplateMetadataLoader:
     """
     Enhanced template metadata loader with semantic intelligence.
@@ -59,10 +130,10 @@ class TemplateMetadataLoader:
         """Initialize with template folder path."""
         self.template_folder = template_folder or self._get_default_template_folder()
         self.logger = logging.getLogger(__name__)
-        self._metadata_cache: Dict[str, TemplateMetadata] = {}
 
         # Initialize PatternLoader for structured frontmatter patterns
         self.pattern_loader = PatternLoader(self.template_folder)
+        self._loaded_patterns_fingerprint: Optional[str] = None
 
     def _get_default_template_folder(self) -> Path:
         """Get default template folder from package assets."""
@@ -82,14 +153,26 @@ class TemplateMetadataLoader:
             FileNotFoundError: If template JSON file doesn't exist
             ValueError: If template JSON is invalid or corrupted
         """
-        if template_name in self._metadata_cache:
-            return self._metadata_cache[template_name]
-
         # Check if PowerPoint template exists
         pptx_file = self.template_folder / f"{template_name}.pptx"
-        if not pptx_file.exists():
+        try:
+            pptx_stat = pptx_file.stat()
+        except OSError:
             raise FileNotFoundError(f"Template '{template_name}' not found at {pptx_file}")
 
+        # Shared store lookup: valid while the template and pattern files are unchanged
+        patterns_fingerprint = self.pattern_loader.fingerprint()
+        fingerprint = (pptx_stat.st_mtime_ns, pptx_stat.st_size, patterns_fingerprint)
+        store_key = (str(Path(self.template_folder).resolve()), template_name)
+        metadata = template_metadata_store.get(store_key, fingerprint)
+        if metadata is not None:
+            return metadata
+
+        # Re-read pattern files if they changed since this loader last read them
+        if self._loaded_patterns_fingerprint != patterns_fingerprint:
+            self.pattern_loader.clear_cache()
+            self._loaded_patterns_fingerprint = patterns_fingerprint
+
         # Create metadata from patterns (new primary approach)
         try:
             metadata = self.create_template_metadata_from_patterns(template_name)
@@ -98,8 +181,8 @@ class TemplateMetadataLoader:
             # JSON mapping files were removed - no fallback needed
             raise ValueError(f"Failed to create metadata for template '{template_name}': {e}. Template patterns required.")
 
-        # Cache for performance
-        self._metadata_cache[template_name] = metadata
+        # Share with every loader in the process
+        template_metadata_store.put(store_key, fingerprint, metadata)
 
         return metadata
 
@@ -444,8 +527,10 @@ class TemplateMetadataLoader:
 
         templates = {}
 
-        # Find all JSON files in template folder
-        for template_file in self.template_folder.glob("*.json"):
+        # Find all PowerPoint templates (legacy JSON mappings are gone; skip hidden files and Office lock files)
+        for template_file in sorted(self.template_folder.glob("*.pptx")):
+            if template_file.name.startswith((".", "~$")):
+                continue
             template_name = template_file.stem
 
             try:
@@ -485,9 +570,14 @@ class TemplateMetadataLoader:
         return list(all_templates_data.get("templates", {}).keys())
 
     def clear_cache(self) -> None:
-        """Clear the metadata cache (useful for testing or reloading)."""
-        self._metadata_cache.clear()
+        """Clear cached metadata for this template folder (useful for testing or reloading)."""
+        template_metadata_store.invalidate(self.template_folder)
         self.pattern_loader.clear_cache()
+        self._loaded_patterns_fingerprint = None
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get hit-rate statistics of the shared metadata store."""
+        return template_metadata_store.stats()
 
     def get_enhanced_layout_metadata(self, layout_name: str) -> Optional[LayoutMetadata]:
         """
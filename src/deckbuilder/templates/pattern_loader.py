@@ -11,14 +11,19 @@ Implements pattern discovery, validation, and override behavior.
 GitHub Issue: https://github.com/teknologika/Deckbuilder/issues/39
 """
 
+import hashlib
 import json
 import logging
 import os
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 
+from ..utils.cache_stats import CacheCounter
 from .pattern_schema import PatternSchemaValidator
 
+# Lookups in the per-loader pattern caches across the process
+pattern_cache_stats = CacheCounter()
+
 
 class PatternLoader:
     """
@@ -72,7 +77,9 @@ class PatternLoader:
             Dictionary mapping layout names to pattern data
         """
         if self._pattern_cache:
+            pattern_cache_stats.hit()
             return self._pattern_cache
+        pattern_cache_stats.miss()
 
         patterns = {}
 
@@ -220,6 +227,22 @@ class PatternLoader:
         """
         return {"builtin": self._load_builtin_patterns(), "user": self._load_user_patterns()}
 
+    def fingerprint(self) -> str:
+        """
+        Cheap fingerprint of the pattern files in effect.
+
+        Changes whenever a built-in or user pattern file is added, removed or
+        modified (by name, size and mtime), without reading file contents.
+        """
+        digest = hashlib.sha256()
+        for directory in (self.builtin_patterns_dir, self.user_patterns_dir):
+            if not directory.exists():
+                continue
+            for pattern_file in sorted(directory.glob("*.json")):
+                stat = pattern_file.stat()
+                digest.update(f"{pattern_file}|{stat.st_size}|{stat.st_mtime_ns}\n".encode("utf-8"))
+        return digest.hexdigest()
+
     def clear_cache(self) -> None:
         """Clear pattern cache to force reloading."""
         self._pattern_cache.clear()
@@ -19,6 +19,71 @@ from typing import Any, Dict, List, Optional
 from .metadata import TemplateMetadataLoader
 from ..content.matcher import ContentTemplateMatcher
 from .layout_analyzer import LayoutCapabilityAnalyzer
+from ..utils.keyword_index import KeywordIndex
+
+# Description vocabularies, one index so all detectors share a single scan of the description.
+# Within each detector, groups are checked in the order listed here.
+DESCRIPTION_KEYWORDS = KeywordIndex(
+    {
+        # Content type
+        "executive_presentation": ["executive", "board", "c-level", "leadership"],
+        "training": ["training", "workshop", "tutorial", "learn"],
+        "sales_presentation": ["sales", "pitch", "proposal", "demo"],
+        "research_presentation": ["research", "analysis", "findings", "study"],
+        "project_update": ["project", "status", "update", "progress"],
+        # Audience
+        "audience:executive": ["executive", "board", "director", "c-level", "leadership"],
+        "audience:technical": ["technical", "engineer", "developer", "implementation"],
+        "audience:external": ["client", "customer", "external", "stakeholder"],
+        "audience:internal": ["team", "internal", "employee", "staff"],
+        "audience:learners": ["student", "trainee", "learner", "new"],
+        # Formality
+        "formality:very_high": ["board", "formal", "official", "corporate"],
+        "formality:high": ["business", "professional", "presentation"],
+        "formality:medium": ["team", "meeting", "update", "review"],
+        # Time constraint
+        "time:short": ["quick", "brief", "short", "summary"],
+        "time:long": ["detailed", "comprehensive", "thorough", "complete"],
+        "data_heavy": [
+            "metrics",
+            "data",
+            "analytics",
+            "numbers",
+            "statistics",
+            "performance",
+            "kpi",
+            "dashboard",
+            "financial",
+            "revenue",
+            "quarterly",
+            "analysis",
+            "report",
+            "findings",
+        ],
+        "decision_focused": [
+            "decision",
+            "choose",
+            "recommend",
+            "approval",
+            "vote",
+            "select",
+            "approve",
+            "strategy",
+            "direction",
+            "plan",
+            "strategic",
+            "initiative",
+            "board",
+            "review",
+            "proposal",
+        ],
+    }
+)
+
+CONTENT_TYPE_GROUPS = ["executive_presentation", "training", "sales_presentation", "research_presentation", "project_update"]
+AUDIENCE_GROUPS = ["audience:executive", "audience:technical", "audience:external", "audience:internal", "audience:learners"]
+FORMALITY_GROUPS = ["formality:very_high", "formality:high", "formality:medium"]
+TIME_GROUPS = ["time:short", "time:long"]
 
 
 @dataclass
@@ -317,94 +382,30 @@ class SmartTemplateRecommendationSystem:
 
     def _detect_content_type(self, description_lower: str) -> str:
         """Detect the type of content from description."""
-        if any(word in description_lower for word in ["executive", "board", "c-level", "leadership"]):
-            return "executive_presentation"
-        elif any(word in description_lower for word in ["training", "workshop", "tutorial", "learn"]):
-            return "training"
-        elif any(word in description_lower for word in ["sales", "pitch", "proposal", "demo"]):
-            return "sales_presentation"
-        elif any(word in description_lower for word in ["research", "analysis", "findings", "study"]):
-            return "research_presentation"
-        elif any(word in description_lower for word in ["project", "status", "update", "progress"]):
-            return "project_update"
-        else:
-            return "general_presentation"
+        return DESCRIPTION_KEYWORDS.scan(description_lower).first(CONTENT_TYPE_GROUPS, default="general_presentation")
 
     def _detect_audience(self, description_lower: str) -> str:
         """Detect target audience from description."""
-        if any(word in description_lower for word in ["executive", "board", "director", "c-level", "leadership"]):
-            return "executive"
-        elif any(word in description_lower for word in ["technical", "engineer", "developer", "implementation"]):
-            return "technical"
-        elif any(word in description_lower for word in ["client", "customer", "external", "stakeholder"]):
-            return "external"
-        elif any(word in description_lower for word in ["team", "internal", "employee", "staff"]):
-            return "internal"
-        elif any(word in description_lower for word in ["student", "trainee", "learner", "new"]):
-            return "learners"
-        else:
-            return "general"
+        group = DESCRIPTION_KEYWORDS.scan(description_lower).first(AUDIENCE_GROUPS, default="audience:general")
+        return group.split(":", 1)[1]
 
     def _detect_formality(self, description_lower: str) -> str:
         """Detect formality level from description."""
-        if any(word in description_lower for word in ["board", "formal", "official", "corporate"]):
-            return "very_high"
-        elif any(word in description_lower for word in ["business", "professional", "presentation"]):
-            return "high"
-        elif any(word in description_lower for word in ["team", "meeting", "update", "review"]):
-            return "medium"
-        else:
-            return "low"
+        group = DESCRIPTION_KEYWORDS.scan(description_lower).first(FORMALITY_GROUPS, default="formality:low")
+        return group.split(":", 1)[1]
 
     def _detect_data_heavy(self, description_lower: str) -> bool:
         """Detect if presentation is data-heavy."""
-        data_indicators = [
-            "metrics",
-            "data",
-            "analytics",
-            "numbers",
-            "statistics",
-            "performance",
-            "kpi",
-            "dashboard",
-            "financial",
-            "revenue",
-            "quarterly",
-            "analysis",
-            "report",
-            "findings",
-        ]
-        return any(word in description_lower for word in data_indicators)
+        return DESCRIPTION_KEYWORDS.scan(description_lower).has("data_heavy")
 
     def _detect_time_constraint(self, description_lower: str) -> str:
         """Detect time constraints from description."""
-        if any(word in description_lower for word in ["quick", "brief", "short", "summary"]):
-            return "short"
-        elif any(word in description_lower for word in ["detailed", "comprehensive", "thorough", "complete"]):
-            return "long"
-        else:
-            return "medium"
+        group = DESCRIPTION_KEYWORDS.scan(description_lower).first(TIME_GROUPS, default="time:medium")
+        return group.split(":", 1)[1]
 
     def _detect_decision_focused(self, description_lower: str) -> bool:
         """Detect if presentation is decision-focused."""
-        decision_indicators = [
-            "decision",
-            "choose",
-            "recommend",
-            "approval",
-            "vote",
-            "select",
-            "approve",
-            "strategy",
-            "direction",
-            "plan",
-            "strategic",
-            "initiative",
-            "board",
-            "review",
-            "proposal",
-        ]
-        return any(word in description_lower for word in decision_indicators)
+        return DESCRIPTION_KEYWORDS.scan(description_lower).has("decision_focused")
 
     def _get_template_capabilities(self, template_name: str) -> Dict[str, Any]:
         """Get template capabilities with caching."""
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Template Analysis Cache
+
+Shared, persistent analysis of a PowerPoint template: layout names,
+placeholder idx/type/name/geometry and structured frontmatter pattern
+compatibility. The analysis is computed once per template file content and
+stored next to the template as a sidecar JSON file
+(``.<template>.analysis.json``) keyed by the SHA-256 of the .pptx, so the
+CLI, the MCP server and the image tools can load it in milliseconds instead
+of opening the template with python-pptx. Editing the template changes its
+hash and the sidecar is rebuilt automatically; editing pattern files only
+refreshes the pattern compatibility section.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .pattern_loader import PatternLoader
+
+ANALYSIS_VERSION = 1
+SIDECAR_SUFFIX = ".analysis.json"
+
+
+def _sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Hash a file's contents in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_sidecar_path(template_path: Union[str, Path]) -> Path:
+    """Location of the analysis sidecar for a template file"""
+    template_path = Path(template_path)
+    return template_path.with_name(f".{template_path.stem}{SIDECAR_SUFFIX}")
+
+
+def compute_layout_analysis(template_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Open a template with python-pptx and describe its layouts and placeholders.
+
+    Args:
+        template_path: Path to the .pptx template
+
+    Returns:
+        Dictionary with slide size (EMU), layout count and layouts keyed by layout name, each
+        holding its index and placeholder idx/type/name/geometry (EMU)
+    """
+    from pptx import Presentation
+
+    prs = Presentation(str(template_path))
+    layouts = {}
+
+    for index, layout in enumerate(prs.slide_layouts):
+        placeholders = []
+        for shape in layout.placeholders:
+            try:
+                placeholder_type = shape.placeholder_format.type
+                type_name = placeholder_type.name if placeholder_type is not None else None
+            except Exception:  # nosec B110 - unknown placeholder types are recorded as None
+                type_name = None
+            placeholders.append(
+                {
+                    "idx": shape.placeholder_format.idx,
+                    "type": type_name,
+                    "name": shape.name,
+                    "left": shape.left,
+                    "top": shape.top,
+                    "width": shape.width,
+                    "height": shape.height,
+                }
+            )
+
+        layout_name = layout.name or f"layout_{index}"
+        layouts[layout_name] = {"index": index, "placeholders": placeholders}
+
+    return {"slide_width": prs.slide_width, "slide_height": prs.slide_height, "layout_count": len(prs.slide_layouts), "layouts": layouts}
+
+
+def compute_pattern_compatibility(layouts: Dict[str, Any], pattern_loader: PatternLoader) -> Dict[str, Any]:
+    """
+    Check which structured frontmatter patterns the template's layouts can fill.
+
+    A layout is compatible when a pattern exists for its name and every
+    pattern field (other than 'layout') names one of its placeholders.
+
+    Returns:
+        Dictionary with per-layout results and patterns whose layout is missing from the template
+    """
+    patterns = pattern_loader.load_patterns()
+    compatibility = {}
+
+    for layout_name, layout_info in layouts.items():
+        pattern = patterns.get(layout_name)
+        if not pattern:
+            compatibility[layout_name] = {"has_pattern": False, "compatible": False, "missing_fields": []}
+            continue
+
+        placeholder_names = {placeholder["name"] for placeholder in layout_info["placeholders"]}
+        fields = [field for field in pattern.get("yaml_pattern", {}) if field != "layout"]
+        missing = [field for field in fields if field not in placeholder_names]
+        compatibility[layout_name] = {"has_pattern": True, "compatible": not missing, "missing_fields": missing}
+
+    return {
+        "layouts": compatibility,
+        "patterns_without_layout": sorted(name for name in patterns if name not in layouts),
+    }
+
+
+class TemplateAnalysisCache:
+    """
+    Loads template analyses from sidecar files, rebuilding them when the template changes.
+
+    Within a process, results are also memoised by (path, mtime, size) so
+    repeated lookups do not even re-hash the template.
+    """
+
+    def __init__(self):
+        """Initialize an empty in-process memo."""
+        self._memo: Dict[str, Tuple[Tuple[int, int, str], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _read_sidecar(sidecar_path: Path) -> Optional[Dict[str, Any]]:
+        """Read a sidecar, returning None if it is missing, unreadable or from another version"""
+        try:
+            with open(sidecar_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) and data.get("version") == ANALYSIS_VERSION else None
+
+    @staticmethod
+    def _write_sidecar(sidecar_path: Path, analysis: Dict[str, Any]) -> None:
+        """Write a sidecar atomically; read-only template folders just skip persistence"""
+        try:
+            fd, temp_name = tempfile.mkstemp(prefix=f"{sidecar_path.name}.", suffix=".tmp", dir=str(sidecar_path.parent))
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(analysis, f, indent=2)
+            os.replace(temp_name, sidecar_path)
+        except OSError:
+            pass  # nosec B110 - sidecar is an optimisation only
+        finally:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+
+    def load(self, template_path: Union[str, Path], template_folder: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+        """
+        Get the analysis for a template, computing and persisting it if needed.
+
+        Args:
+            template_path: Path to the .pptx template
+            template_folder: Folder whose patterns/ subfolder holds user patterns (default: the template's folder)
+
+        Returns:
+            Analysis dictionary with version, content_hash, template_name, slide size,
+            layouts and pattern_compatibility. The dictionary is shared between
+            callers and must be treated as read-only.
+
+        Raises:
+            FileNotFoundError: If the template does not exist
+        """
+        template_path = Path(template_path).resolve()
+        stat = template_path.stat()
+        pattern_loader = PatternLoader(template_folder or template_path.parent)
+        patterns_fingerprint = pattern_loader.fingerprint()
+        memo_key = (stat.st_mtime_ns, stat.st_size, patterns_fingerprint)
+
+        with self._lock:
+            memo = self._memo.get(str(template_path))
+        if memo and memo[0] == memo_key:
+            return memo[1]
+
+        content_hash = _sha256_file(template_path)
+        sidecar_path = get_sidecar_path(template_path)
+        analysis = self._read_sidecar(sidecar_path)
+
+        changed = False
+        if not analysis or analysis.get("content_hash") != content_hash:
+            analysis = {
+                "version": ANALYSIS_VERSION,
+                "content_hash": content_hash,
+                "template_name": template_path.stem,
+                **compute_layout_analysis(template_path),
+            }
+            changed = True
+
+        if changed or analysis.get("patterns_fingerprint") != patterns_fingerprint:
+            analysis["patterns_fingerprint"] = patterns_fingerprint
+            analysis["pattern_compatibility"] = compute_pattern_compatibility(analysis["layouts"], pattern_loader)
+            changed = True
+
+        if changed:
+            self._write_sidecar(sidecar_path, analysis)
+
+        with self._lock:
+            self._memo[str(template_path)] = (memo_key, analysis)
+        return analysis
+
+    def clear(self) -> None:
+        """Forget in-process results (sidecar files are left in place)."""
+        with self._lock:
+            self._memo.clear()
+
+
+# Shared by the CLI, MCP tools and image tools in the process
+template_analysis_cache = TemplateAnalysisCache()
+
+
+def load_template_analysis(template_path: Union[str, Path], template_folder: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """Convenience wrapper around the shared TemplateAnalysisCache"""
+    return template_analysis_cache.load(template_path, template_folder)
+
+
+def get_layout_names(analysis: Dict[str, Any]) -> List[str]:
+    """Layout names in template order"""
+    return sorted(analysis["layouts"], key=lambda name: analysis["layouts"][name]["index"])
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Build profiling for Deckbuilder.
+
+Collects wall-clock timings and counters for the stages of a single
+presentation build (markdown conversion, frontmatter parsing, slide
+generation, save) so they can be reported after the build.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+
+class BuildProfile:
+    """Stage timings and counters for one presentation build"""
+
+    def __init__(self):
+        """Initialize an empty profile."""
+        self.timings: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block and add it to the named stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Accumulate seconds for a stage."""
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increment a counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def merge(self, other: "BuildProfile") -> None:
+        """Add another profile's timings and counters to this one."""
+        for name, seconds in other.timings.items():
+            self.add_time(name, seconds)
+        for name, amount in other.counters.items():
+            self.count(name, amount)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return timings (in seconds) and counters as plain dictionaries."""
+        return {"timings": dict(self.timings), "counters": dict(self.counters)}
+
+    def format_lines(self) -> List[str]:
+        """Format the profile as human-readable lines, timings first."""
+        lines = [f"{name}: {seconds * 1000:.1f} ms" for name, seconds in self.timings.items()]
+        lines.extend(f"{name}: {amount}" for name, amount in self.counters.items())
+        return lines
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Process-wide hit/miss counters for caches whose entries live in many instances.
+
+Caches such as the per-engine pattern cache or the image cache are owned by
+individual objects, but their effectiveness is only meaningful per process
+(e.g. for the MCP server's diagnostics), so each keeps one shared counter.
+"""
+
+import threading
+from typing import Any, Dict
+
+
+class CacheCounter:
+    """Thread-safe hit/miss counter"""
+
+    def __init__(self):
+        """Initialize counters at zero."""
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def hit(self) -> None:
+        """Record a cache hit."""
+        with self._lock:
+            self.hits += 1
+
+    def miss(self) -> None:
+        """Record a cache miss."""
+        with self._lock:
+            self.misses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hits, misses and hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def reset(self) -> None:
+        """Reset both counters."""
+        with self._lock:
+            self.hits = self.misses = 0
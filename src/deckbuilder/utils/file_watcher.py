@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Polling file watcher for Deckbuilder's watch mode.
+
+Watches files and directories (recursively) by their modification time and
+size, so it needs no platform file-event support. Editors often save in
+several writes (or write a temp file and rename it), so a change is only
+reported once the watched paths have been quiet for the debounce interval,
+with every path that changed in that burst.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple, Union
+
+DEFAULT_INTERVAL = 0.5
+DEFAULT_DEBOUNCE = 0.3
+
+# (mtime_ns, size) of a file, or None if it does not exist
+Signature = Optional[Tuple[int, int]]
+
+
+def _signature(path: str) -> Signature:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileWatcher:
+    """
+    Reports changes to a set of files and directories.
+
+    Args:
+        paths: Files and directories to watch (they need not exist yet)
+        interval: Seconds between polls
+        debounce: Seconds the paths must be unchanged before a change is reported
+    """
+
+    def __init__(self, paths: Iterable[Union[str, Path]] = (), interval: float = DEFAULT_INTERVAL, debounce: float = DEFAULT_DEBOUNCE):
+        self.interval = interval
+        self.debounce = debounce
+        self.paths: Set[str] = set()
+        self._signatures: Dict[str, Signature] = {}
+        self.watch(paths)
+
+    def watch(self, paths: Iterable[Union[str, Path]]) -> None:
+        """
+        Replace the watched paths.
+
+        Files already watched keep their last seen state, so a change made
+        while the caller was busy is still reported; new files are taken as
+        unchanged.
+        """
+        self.paths = {str(path) for path in paths}
+        self._signatures = {path: self._signatures.get(path, signature) for path, signature in self._scan().items()}
+
+    def _scan(self) -> Dict[str, Signature]:
+        signatures = {}
+        for path in self.paths:
+            if os.path.isdir(path):
+                for folder, _, names in os.walk(path):
+                    for name in names:
+                        file_path = os.path.join(folder, name)
+                        signatures[file_path] = _signature(file_path)
+            else:
+                signatures[path] = _signature(path)
+        return signatures
+
+    def changes(self) -> Set[str]:
+        """Files added, removed or modified since the last call (or watch)."""
+        signatures = self._scan()
+        changed = {path for path in signatures.keys() | self._signatures.keys() if signatures.get(path) != self._signatures.get(path)}
+        self._signatures = signatures
+        return changed
+
+    def wait(self, timeout: Optional[float] = None, sleep: Callable[[float], None] = time.sleep) -> Set[str]:
+        """
+        Block until the watched paths change and then settle.
+
+        Args:
+            timeout: Give up after this many seconds without a change (default: wait forever)
+            sleep: Sleep function (for tests)
+
+        Returns:
+            Every file that changed, or an empty set on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed: Set[str] = set()
+        while not changed:
+            if deadline is not None and time.monotonic() >= deadline:
+                return changed
+            sleep(self.interval)
+            changed = self.changes()
+
+        quiet_since = time.monotonic()
+        while time.monotonic() - quiet_since < self.debounce:
+            sleep(min(self.interval, self.debounce))
+            burst = self.changes()
+            if burst:
+                changed |= burst
+                quiet_since = time.monotonic()
+        return changed
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Keyword Index
+
+Shared, precompiled keyword vocabularies for the content heuristics in
+LayoutIntelligence, SmartTemplateRecommendationSystem and the MCP content
+analyzer. Each vocabulary is a mapping of group name to keywords (for example
+intent -> keywords). The index de-duplicates keywords across groups and scans
+a text once, after which every group question ("does this text mention any
+executive keyword?", "which intent keywords occur?") is answered from the
+single set of hits.
+
+Two matching modes are supported, mirroring the existing heuristics:
+
+- substring (default): ``keyword in text``, so "vs" matches inside "devs"
+- whole words: equivalent to ``re.search(r"\\bkeyword\\b", text)``; single-word
+  keywords are matched by tokenising the text once
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence
+
+_WORD_RE = re.compile(r"\w+")
+
+# Recently scanned texts per index; detectors called in sequence on the same text share one scan
+SCAN_CACHE_SIZE = 64
+
+
+class KeywordHits:
+    """Keywords of one index found in one text, answered per group"""
+
+    __slots__ = ("_index", "keywords")
+
+    def __init__(self, index: "KeywordIndex", keywords: FrozenSet[str]):
+        self._index = index
+        self.keywords = keywords
+
+    def has(self, group: str) -> bool:
+        """True if any keyword of the group occurs in the text."""
+        return not self._index._group_sets[group].isdisjoint(self.keywords)
+
+    def matched(self, group: str) -> List[str]:
+        """Keywords of the group found in the text, in vocabulary order (duplicates kept)."""
+        return [keyword for keyword in self._index.groups[group] if keyword in self.keywords]
+
+    def count(self, group: str) -> int:
+        """Number of the group's keyword entries found in the text."""
+        return len(self.matched(group))
+
+    def first(self, groups: Optional[Sequence[str]] = None, default: Optional[str] = None) -> Optional[str]:
+        """
+        First group (in the given order, or vocabulary order) with a hit.
+
+        Replaces ``if any(...) elif any(...)`` chains that test one keyword list per branch.
+        """
+        for group in groups if groups is not None else self._index.groups:
+            if self.has(group):
+                return group
+        return default
+
+
+class KeywordIndex:
+    """
+    Precompiled keyword vocabulary scanned once per text.
+
+    Args:
+        groups: Mapping of group name to keywords. Keywords are matched as given,
+            so callers lower-case both the vocabulary and the text.
+        whole_words: Match keywords as whole words instead of substrings
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]], whole_words: bool = False):
+        self.groups: Dict[str, List[str]] = {name: list(keywords) for name, keywords in groups.items()}
+        self.whole_words = whole_words
+        self._group_sets = {name: frozenset(keywords) for name, keywords in self.groups.items()}
+
+        # Each distinct keyword is checked once per text however many groups share it
+        unique = list(dict.fromkeys(keyword for keywords in self.groups.values() for keyword in keywords))
+        if whole_words:
+            self._word_keywords = frozenset(keyword for keyword in unique if _WORD_RE.fullmatch(keyword))
+            self._pattern_keywords = [(keyword, re.compile(r"\b" + re.escape(keyword) + r"\b")) for keyword in unique if keyword not in self._word_keywords]
+        else:
+            self._keywords = tuple(unique)
+
+        self._scan_cached = lru_cache(maxsize=SCAN_CACHE_SIZE)(self._scan)
+
+    def _scan(self, text: str) -> FrozenSet[str]:
+        """Find every keyword of the index in the text"""
+        if not self.whole_words:
+            return frozenset(keyword for keyword in self._keywords if keyword in text)
+
+        hits = set(self._word_keywords.intersection(_WORD_RE.findall(text)))
+        hits.update(keyword for keyword, pattern in self._pattern_keywords if pattern.search(text))
+        return frozenset(hits)
+
+    def scan(self, text: str) -> KeywordHits:
+        """
+        Scan a text for all keywords of the index.
+
+        Args:
+            text: Text to search (already lower-cased if the vocabulary is)
+
+        Returns:
+            KeywordHits answering per-group questions without rescanning
+        """
+        return KeywordHits(self, self._scan_cached(text))
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """Distinct keywords of the index found in the text."""
+        return self._scan_cached(text)
@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Structural PPTX Diff
+
+Compares two .pptx packages part by part without python-pptx. Each XML part
+is canonicalised into one line per element (stable attribute order, fixed
+namespace prefixes, whitespace-only text dropped) with volatile values such
+as core property timestamps masked and relationship ids renumbered in order
+of first use, so two builds of the same deck compare equal even if
+relationships were created in a different order. Binary parts (media,
+fonts) are compared by content. Parts whose bytes are identical are never
+parsed.
+
+Slides are matched by their position in presentation.xml and reported per
+shape (added, removed, or changed geometry/text/formatting); other parts are
+reported with a unified diff of their canonical form. diff_directories
+compares whole folders of golden decks across a process pool.
+"""
+
+import copy
+import difflib
+import hashlib
+import json
+import posixpath
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from lxml import etree  # nosec B410 - parsing PowerPoint packages without entity resolution or network access
+
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+PREFIXES = {
+    A_NS: "a",
+    P_NS: "p",
+    R_NS: "r",
+    REL_NS: "rel",
+    "http://schemas.openxmlformats.org/package/2006/content-types": "ct",
+    "http://schemas.openxmlformats.org/package/2006/metadata/core-properties": "cp",
+    "http://purl.org/dc/elements/1.1/": "dc",
+    "http://purl.org/dc/terms/": "dcterms",
+    "http://schemas.openxmlformats.org/officeDocument/2006/extended-properties": "ep",
+    "http://schemas.openxmlformats.org/markup-compatibility/2006": "mc",
+    "http://schemas.microsoft.com/office/powerpoint/2010/main": "p14",
+    "http://www.w3.org/2001/XMLSchema-instance": "xsi",
+}
+
+# Values that change on every save: element text, or one attribute of the element
+VOLATILE = {
+    "{http://purl.org/dc/terms/}created": None,
+    "{http://purl.org/dc/terms/}modified": None,
+    "{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}lastModifiedBy": None,
+    "{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}lastPrinted": None,
+    "{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}revision": None,
+    "{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}TotalTime": None,
+    "{http://schemas.microsoft.com/office/powerpoint/2010/main}creationId": "val",
+}
+MASK = "*"
+
+SHAPE_TAGS = {f"{{{P_NS}}}{name}" for name in ("sp", "pic", "graphicFrame", "grpSp", "cxnSp")}
+XFRM_TAGS = {f"{{{A_NS}}}xfrm", f"{{{P_NS}}}xfrm"}
+TEXT_TAG = f"{{{A_NS}}}t"
+
+# Generated decks carry a build timestamp (name.YYYY-MM-DD_HHMM.g.pptx, numbered
+# name.YYYY-MM-DD_HHMM-2.g.pptx when the name was taken) or,
+# with deterministic output naming, an input hash (name.<16 hex>.g.pptx)
+GENERATED_STAMP = re.compile(r"\.(?:\d{4}-\d{2}-\d{2}_\d{4}(?:-\d+)?|[0-9a-f]{16})(?=\.g\.pptx$)")
+
+_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False, no_network=True)
+
+
+def _name(qualified: str) -> str:
+    """Qualified name with a fixed prefix for known namespaces."""
+    if qualified[0] != "{":
+        return qualified
+    uri, local = qualified[1:].split("}", 1)
+    prefix = PREFIXES.get(uri)
+    return f"{prefix}:{local}" if prefix else qualified
+
+
+def canonical_lines(root, rid_map: Optional[Dict[str, str]] = None) -> List[str]:
+    """
+    Canonical one-line-per-element form of an XML tree.
+
+    Args:
+        root: lxml element
+        rid_map: Relationship id renumbering applied to r:* attributes and rels Id attributes
+
+    Returns:
+        Lines, indented by depth, with attributes sorted and volatile values masked
+    """
+    rid_map = rid_map or {}
+    lines: List[str] = []
+
+    def walk(element, depth: int) -> None:
+        volatile = VOLATILE.get(element.tag, False)
+        attributes = []
+        for key, value in element.attrib.items():
+            if key.startswith(f"{{{R_NS}}}") or (key == "Id" and element.tag == f"{{{REL_NS}}}Relationship"):
+                value = rid_map.get(value, value)
+            elif volatile == key:
+                value = MASK
+            attributes.append(f' {_name(key)}="{value}"')
+        attributes.sort()
+
+        line = "  " * depth + "<" + _name(element.tag) + "".join(attributes) + ">"
+        text = element.text
+        if volatile is None:
+            text = MASK
+        if text and text.strip():
+            line += " " + json.dumps(text, ensure_ascii=False)
+        lines.append(line)
+
+        children = [child for child in element if isinstance(child.tag, str)]
+        if element.tag == f"{{{REL_NS}}}Relationships":
+            children.sort(key=lambda rel: _rid_order(rid_map.get(rel.get("Id"), rel.get("Id") or "")))
+        for child in children:
+            walk(child, depth + 1)
+            if child.tail and child.tail.strip():
+                lines.append("  " * (depth + 1) + json.dumps(child.tail, ensure_ascii=False))
+
+    walk(root, 0)
+    return lines
+
+
+def _rid_order(rid: str) -> Tuple[int, str]:
+    digits = rid[3:] if rid.startswith("rId") else ""
+    return (int(digits), rid) if digits.isdigit() else (1 << 30, rid)
+
+
+def relationship_map(source, rels) -> Dict[str, str]:
+    """
+    Renumber a part's relationship ids by order of first reference in the part.
+
+    Relationships the part does not reference (e.g. a slide's layout) follow,
+    ordered by type and target.
+
+    Args:
+        source: Root element of the part, or None for package relationships
+        rels: Root element of the part's .rels
+
+    Returns:
+        Mapping of original id to canonical id
+    """
+    known = {rel.get("Id") for rel in rels if isinstance(rel.tag, str)}
+    mapping: Dict[str, str] = {}
+    if source is not None:
+        prefix = f"{{{R_NS}}}"
+        for element in source.iter():
+            for key, value in element.attrib.items():
+                if key.startswith(prefix) and value in known and value not in mapping:
+                    mapping[value] = f"rId{len(mapping) + 1}"
+
+    rest = sorted((rel for rel in rels if isinstance(rel.tag, str) and rel.get("Id") not in mapping), key=lambda rel: (rel.get("Type", ""), rel.get("Target", "")))
+    for rel in rest:
+        mapping[rel.get("Id")] = f"rId{len(mapping) + 1}"
+    return mapping
+
+
+def rels_name(part: str) -> str:
+    """Name of the .rels part holding a part's relationships."""
+    directory, base = posixpath.split(part)
+    return posixpath.join(directory, "_rels", base + ".rels")
+
+
+def source_name(rels: str) -> str:
+    """Name of the part a .rels part belongs to ("" for the package relationships)."""
+    directory, base = posixpath.split(rels)
+    return posixpath.join(posixpath.dirname(directory), base[: -len(".rels")])
+
+
+class PackageReader:
+    """Lazily parsed, canonicalised view of the parts of one .pptx package"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        with zipfile.ZipFile(self.path) as package:
+            self.raw: Dict[str, bytes] = {info.filename: package.read(info) for info in package.infolist() if not info.is_dir()}
+        self._trees: Dict[str, object] = {}
+        self._rid_maps: Dict[str, Dict[str, str]] = {}
+        self._canonical: Dict[str, List[str]] = {}
+
+    def tree(self, part: str):
+        """Parsed root of an XML part (None if missing)."""
+        if part not in self._trees:
+            data = self.raw.get(part)
+            self._trees[part] = etree.fromstring(data, _parser) if data is not None else None  # nosec B320
+        return self._trees[part]
+
+    def rid_map(self, part: str) -> Dict[str, str]:
+        """Canonical relationship ids of a part ({} if it has no relationships)."""
+        if part not in self._rid_maps:
+            rels = self.tree(rels_name(part)) if rels_name(part) in self.raw else None
+            self._rid_maps[part] = relationship_map(self.tree(part) if part else None, rels) if rels is not None else {}
+        return self._rid_maps[part]
+
+    def canonical(self, part: str) -> List[str]:
+        """Canonical lines of an XML part, or a content digest line for binary parts."""
+        if part not in self._canonical:
+            if not is_xml(part):
+                self._canonical[part] = [f"<binary sha256={hashlib.sha256(self.raw[part]).hexdigest()} bytes={len(self.raw[part])}>"]
+            elif part.endswith(".rels"):
+                self._canonical[part] = canonical_lines(self.tree(part), self.rid_map(source_name(part)))
+            else:
+                self._canonical[part] = canonical_lines(self.tree(part), self.rid_map(part))
+        return self._canonical[part]
+
+    def slide_parts(self) -> List[str]:
+        """Slide part names in presentation order."""
+        presentation = "ppt/presentation.xml"
+        rels = self.tree(rels_name(presentation)) if rels_name(presentation) in self.raw else None
+        if presentation not in self.raw or rels is None:
+            return []
+        targets = {rel.get("Id"): rel.get("Target") for rel in rels if isinstance(rel.tag, str)}
+        slides = []
+        for slide_id in self.tree(presentation).iterfind(f"{{{P_NS}}}sldIdLst/{{{P_NS}}}sldId"):
+            target = targets.get(slide_id.get(f"{{{R_NS}}}id"))
+            if target:
+                slides.append(posixpath.normpath(posixpath.join("ppt", target)) if not target.startswith("/") else target[1:])
+        return slides
+
+
+def is_xml(part: str) -> bool:
+    return part.endswith((".xml", ".rels"))
+
+
+@dataclass
+class SlideDiff:
+    """Structural changes to one slide (1-based position in the deck)"""
+
+    number: int
+    added_shapes: List[str] = field(default_factory=list)
+    removed_shapes: List[str] = field(default_factory=list)
+    changed_shapes: Dict[str, List[str]] = field(default_factory=dict)
+    other_changes: List[str] = field(default_factory=list)
+
+    def format_lines(self) -> List[str]:
+        lines = [f"Slide {self.number}:"]
+        lines.extend(f"  + shape '{name}'" for name in self.added_shapes)
+        lines.extend(f"  - shape '{name}'" for name in self.removed_shapes)
+        lines.extend(f"  ~ shape '{name}': {', '.join(kinds)}" for name, kinds in self.changed_shapes.items())
+        lines.extend(f"  ~ {change}" for change in self.other_changes)
+        return lines
+
+
+@dataclass
+class PackageDiff:
+    """Differences between an expected and an actual .pptx package"""
+
+    expected: str
+    actual: str
+    added_slides: List[int] = field(default_factory=list)
+    removed_slides: List[int] = field(default_factory=list)
+    slides: List[SlideDiff] = field(default_factory=list)
+    added_parts: List[str] = field(default_factory=list)
+    removed_parts: List[str] = field(default_factory=list)
+    changed_parts: Dict[str, List[str]] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def identical(self) -> bool:
+        return not (self.error or self.added_slides or self.removed_slides or self.slides or self.added_parts or self.removed_parts or self.changed_parts)
+
+    def format_lines(self, verbose: bool = False) -> List[str]:
+        """Human-readable report; verbose adds the canonical diff of changed non-slide parts."""
+        if self.error:
+            return [f"error: {self.error}"]
+        lines = [f"+ slide {number}" for number in self.added_slides]
+        lines.extend(f"- slide {number}" for number in self.removed_slides)
+        for slide in self.slides:
+            lines.extend(slide.format_lines())
+        lines.extend(f"+ part {part}" for part in self.added_parts)
+        lines.extend(f"- part {part}" for part in self.removed_parts)
+        for part, diff in self.changed_parts.items():
+            lines.append(f"~ part {part}")
+            if verbose:
+                lines.extend(f"    {line}" for line in diff)
+        return lines
+
+
+def _unified(expected: List[str], actual: List[str], max_lines: int) -> List[str]:
+    diff = list(difflib.unified_diff(expected, actual, lineterm="", n=1))[2:]
+    return diff[:max_lines] + ([f"... {len(diff) - max_lines} more lines"] if len(diff) > max_lines else [])
+
+
+def _shapes(tree) -> Dict[str, object]:
+    """Top-level shapes of a slide keyed by name (numbered when names repeat)."""
+    shapes: Dict[str, object] = {}
+    tree_root = tree.find(f"{{{P_NS}}}cSld/{{{P_NS}}}spTree")
+    if tree_root is None:
+        return shapes
+    for shape in tree_root:
+        if shape.tag not in SHAPE_TAGS:
+            continue
+        c_nv_pr = next(shape.iter(f"{{{P_NS}}}cNvPr"), None)
+        name = c_nv_pr.get("name", "") if c_nv_pr is not None else ""
+        key, count = name, 2
+        while key in shapes:
+            key, count = f"{name} #{count}", count + 1
+        shapes[key] = shape
+    return shapes
+
+
+def _shape_changes(expected, actual, expected_rids: Dict[str, str], actual_rids: Dict[str, str]) -> List[str]:
+    """Kinds of change between two versions of a shape: geometry, text, formatting."""
+
+    def geometry(shape):
+        xfrm = next((element for element in shape.iter() if element.tag in XFRM_TAGS), None)
+        return canonical_lines(xfrm) if xfrm is not None else []
+
+    def text(shape):
+        return [element.text or "" for element in shape.iter(TEXT_TAG)]
+
+    def rest(shape, rids):
+        shape = copy.deepcopy(shape)
+        for xfrm in [element for element in shape.iter() if element.tag in XFRM_TAGS]:
+            xfrm.getparent().remove(xfrm)
+        for element in shape.iter(TEXT_TAG):
+            element.text = None
+        return canonical_lines(shape, rids)
+
+    kinds = []
+    if geometry(expected) != geometry(actual):
+        kinds.append("geometry")
+    if text(expected) != text(actual):
+        kinds.append("text")
+    if rest(expected, expected_rids) != rest(actual, actual_rids) or not kinds:
+        kinds.append("formatting")
+    return kinds
+
+
+def _diff_slide(number: int, expected: PackageReader, expected_part: str, actual: PackageReader, actual_part: str) -> Optional[SlideDiff]:
+    same_xml = expected.raw.get(expected_part) == actual.raw.get(actual_part)
+    same_rels = expected.raw.get(rels_name(expected_part)) == actual.raw.get(rels_name(actual_part))
+    if same_xml and same_rels:
+        return None
+    if expected.canonical(expected_part) == actual.canonical(actual_part) and _canonical_rels(expected, expected_part) == _canonical_rels(actual, actual_part):
+        return None
+
+    slide = SlideDiff(number)
+    expected_rids, actual_rids = expected.rid_map(expected_part), actual.rid_map(actual_part)
+    expected_shapes = _shapes(expected.tree(expected_part))
+    actual_shapes = _shapes(actual.tree(actual_part))
+    slide.added_shapes = [name for name in actual_shapes if name not in expected_shapes]
+    slide.removed_shapes = [name for name in expected_shapes if name not in actual_shapes]
+    for name in expected_shapes.keys() & actual_shapes.keys():
+        if canonical_lines(expected_shapes[name], expected_rids) != canonical_lines(actual_shapes[name], actual_rids):
+            slide.changed_shapes[name] = _shape_changes(expected_shapes[name], actual_shapes[name], expected_rids, actual_rids)
+    slide.changed_shapes = dict(sorted(slide.changed_shapes.items()))
+
+    if [name for name in expected_shapes if name in actual_shapes] != [name for name in actual_shapes if name in expected_shapes]:
+        slide.other_changes.append("shape order")
+    if not (slide.added_shapes or slide.removed_shapes or slide.changed_shapes or slide.other_changes) and expected.canonical(expected_part) != actual.canonical(actual_part):
+        slide.other_changes.append("slide properties")
+    if _canonical_rels(expected, expected_part) != _canonical_rels(actual, actual_part):
+        slide.other_changes.append("relationships (layout, images or links)")
+    return slide
+
+
+def _canonical_rels(package: PackageReader, part: str) -> List[str]:
+    rels = rels_name(part)
+    return package.canonical(rels) if rels in package.raw else []
+
+
+def diff_packages(expected: Union[str, Path], actual: Union[str, Path], max_diff_lines: int = 40) -> PackageDiff:
+    """
+    Structurally compare two .pptx packages.
+
+    Args:
+        expected: Golden .pptx
+        actual: .pptx under test
+        max_diff_lines: Canonical diff lines kept per changed non-slide part
+
+    Returns:
+        PackageDiff (identical when only volatile values or relationship numbering differ)
+    """
+    result = PackageDiff(str(expected), str(actual))
+    try:
+        expected_package, actual_package = PackageReader(expected), PackageReader(actual)
+    except (OSError, zipfile.BadZipFile) as e:
+        result.error = str(e)
+        return result
+
+    expected_slides, actual_slides = expected_package.slide_parts(), actual_package.slide_parts()
+    for index, (expected_part, actual_part) in enumerate(zip(expected_slides, actual_slides)):
+        slide = _diff_slide(index + 1, expected_package, expected_part, actual_package, actual_part)
+        if slide is not None:
+            result.slides.append(slide)
+    result.removed_slides = list(range(len(actual_slides) + 1, len(expected_slides) + 1))
+    result.added_slides = list(range(len(expected_slides) + 1, len(actual_slides) + 1))
+
+    # Slides and their relationships are compared by position above
+    skip = set()
+    for part in expected_slides + actual_slides:
+        skip.update((part, rels_name(part)))
+
+    expected_parts = {part for part in expected_package.raw if part not in skip}
+    actual_parts = {part for part in actual_package.raw if part not in skip}
+    result.removed_parts = sorted(expected_parts - actual_parts)
+    result.added_parts = sorted(actual_parts - expected_parts)
+    for part in sorted(expected_parts & actual_parts):
+        if expected_package.raw[part] == actual_package.raw[part]:
+            continue
+        expected_lines, actual_lines = expected_package.canonical(part), actual_package.canonical(part)
+        if expected_lines != actual_lines:
+            result.changed_parts[part] = _unified(expected_lines, actual_lines, max_diff_lines)
+    return result
+
+
+def deck_key(path: Path) -> str:
+    """Key matching golden and generated decks: relative path without the build timestamp or hash."""
+    return GENERATED_STAMP.sub("", path.as_posix())
+
+
+@dataclass
+class DirectoryDiff:
+    """Result of comparing two folders of decks"""
+
+    diffs: Dict[str, PackageDiff] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
+    unexpected: List[str] = field(default_factory=list)
+
+    @property
+    def identical(self) -> bool:
+        return not self.missing and not self.unexpected and all(diff.identical for diff in self.diffs.values())
+
+
+def _find_decks(root: Path) -> Dict[str, Path]:
+    return {deck_key(path.relative_to(root)): path for path in sorted(root.rglob("*.pptx")) if not path.name.startswith(("~$", ".")) and not path.name.endswith(".bak.pptx")}
+
+
+def diff_directories(expected_dir: Union[str, Path], actual_dir: Union[str, Path], workers: Optional[int] = None, max_diff_lines: int = 40) -> DirectoryDiff:
+    """
+    Compare every deck under expected_dir with its counterpart under actual_dir.
+
+    Decks are matched by relative path, ignoring the build timestamp in
+    generated names, and compared across a process pool.
+
+    Args:
+        expected_dir: Folder of golden decks
+        actual_dir: Folder of decks under test
+        workers: Process pool size (default: CPU count)
+        max_diff_lines: Canonical diff lines kept per changed non-slide part
+
+    Returns:
+        DirectoryDiff keyed by deck
+    """
+    expected, actual = _find_decks(Path(expected_dir)), _find_decks(Path(actual_dir))
+    result = DirectoryDiff(missing=sorted(expected.keys() - actual.keys()), unexpected=sorted(actual.keys() - expected.keys()))
+    pairs = sorted(expected.keys() & actual.keys())
+    if not pairs:
+        return result
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {key: executor.submit(diff_packages, str(expected[key]), str(actual[key]), max_diff_lines) for key in pairs}
+        for key in pairs:
+            try:
+                result.diffs[key] = futures[key].result()
+            except Exception as e:
+                result.diffs[key] = PackageDiff(str(expected[key]), str(actual[key]), error=str(e))
+    return result
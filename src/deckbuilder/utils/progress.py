@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Build progress reporting for Deckbuilder.
+
+Deckbuilder.create_presentation accepts an optional progress callback that
+receives a ProgressEvent at the start of a build, after each slide is
+created, before saving and when the build completes (with stage timings).
+When no callback is given nothing is allocated or called per slide.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+STAGE_START = "start"
+STAGE_MARKDOWN = "markdown_conversion"
+STAGE_SLIDE = "slide"
+STAGE_SAVE = "save"
+STAGE_COMPLETE = "complete"
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """One progress notification from a presentation build"""
+
+    stage: str
+    current: int
+    total: int
+    message: str
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+class BuildProgress:
+    """
+    Progress reporter for one build, passed down to the slide coordinator.
+
+    Args:
+        callback: Receives every ProgressEvent
+        total_slides: Number of slides in the build (0 while unknown, e.g. when streaming)
+    """
+
+    __slots__ = ("callback", "total_slides")
+
+    def __init__(self, callback: ProgressCallback, total_slides: int):
+        self.callback = callback
+        self.total_slides = total_slides
+
+    def report(self, stage: str, current: int, message: str, timings: Optional[Dict[str, float]] = None) -> None:
+        """Send an event for the given stage."""
+        self.callback(ProgressEvent(stage, current, self.total_slides, message, dict(timings or {})))
+
+    def slide_created(self, slide_number: int, layout_name: str) -> None:
+        """Report that a slide has been added to the presentation."""
+        position = f"{slide_number}/{self.total_slides}" if self.total_slides else str(slide_number)
+        self.report(STAGE_SLIDE, slide_number, f"Slide {position}: {layout_name}")
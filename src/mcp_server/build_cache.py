@@ -0,0 +1,229 @@
+"""
+Build Result Cache for Deck Builder MCP
+
+LLM clients frequently retry a build with exactly the same input. When enabled
+(DECK_BUILD_CACHE=1), the MCP build tools look up a key derived from the input
+content, output name, template file hash, pattern set fingerprint, language,
+font and output folder. On a hit the previously generated presentation is
+returned immediately instead of being rebuilt.
+
+The generated .pptx bytes are kept in memory, so a hit can restore the output
+file if it was moved or edited since the build. The cache is bounded by entry
+count and total bytes with least-recently-used eviction.
+
+Environment variables:
+    DECK_BUILD_CACHE: "1"/"true" to enable (default: disabled)
+    DECK_BUILD_CACHE_MAX_ENTRIES: Maximum cached builds (default: 32)
+    DECK_BUILD_CACHE_MAX_MB: Maximum total size of cached outputs in MB (default: 256)
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_MB = 256
+
+
+@dataclass
+class BuildCacheEntry:
+    """One cached build: where it was written, its bytes and the tool's result message"""
+
+    output_path: str
+    data: bytes
+    message: str
+    mtime_ns: int
+
+
+class BuildCache:
+    """
+    Bounded LRU cache of generated presentations keyed by build inputs.
+
+    Args:
+        max_entries: Maximum number of cached builds
+        max_bytes: Maximum total size of cached presentation bytes
+        enabled: Whether lookups and stores are performed
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024, enabled: bool = False):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, BuildCacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._file_hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "BuildCache":
+        """Create a cache configured from DECK_BUILD_CACHE* environment variables."""
+        enabled = os.getenv("DECK_BUILD_CACHE", "").strip().lower() in ("1", "true", "yes", "on")
+        max_entries = int(os.getenv("DECK_BUILD_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+        max_mb = float(os.getenv("DECK_BUILD_CACHE_MAX_MB", DEFAULT_MAX_MB))
+        return cls(max_entries=max_entries, max_bytes=int(max_mb * 1024 * 1024), enabled=enabled)
+
+    def _file_hash(self, path: Union[str, Path]) -> str:
+        """SHA-256 of a file, memoised by (mtime, size)"""
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._file_hashes.get(str(path))
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        self._file_hashes[str(path)] = (signature, digest.hexdigest())
+        return digest.hexdigest()
+
+    def file_digest(self, path: Union[str, Path]) -> str:
+        """SHA-256 of an input file, read in chunks and memoised by (mtime, size); usable as make_key content."""
+        return self._file_hash(path)
+
+    def make_key(
+        self,
+        source: str,
+        content: Union[str, bytes],
+        file_name: str,
+        template_path: Optional[str],
+        output_folder: str,
+        language_code: Optional[str] = None,
+        font_name: Optional[str] = None,
+    ) -> str:
+        """
+        Build the cache key for a build request.
+
+        Args:
+            source: Kind of input ("markdown", "json", ...)
+            content: Input content exactly as received
+            file_name: Requested output file name
+            template_path: Resolved template .pptx path (None if not found)
+            output_folder: Folder the output is written to
+            language_code: Language applied to text, if any
+            font_name: Font applied to text, if any
+
+        Returns:
+            Hex digest identifying the build
+        """
+        from deckbuilder.templates.pattern_loader import PatternLoader
+
+        template_hash = ""
+        patterns_fingerprint = ""
+        if template_path and os.path.exists(template_path):
+            template_hash = self._file_hash(template_path)
+            patterns_fingerprint = PatternLoader(Path(template_path).parent).fingerprint()
+
+        digest = hashlib.sha256()
+        for part in (source, file_name, template_hash, patterns_fingerprint, language_code or "", font_name or "", output_folder):
+            digest.update(part.encode("utf-8") + b"\0")
+        digest.update(content.encode("utf-8") if isinstance(content, str) else content)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[BuildCacheEntry]:
+        """
+        Look up a build, restoring its output file if it no longer matches the cached bytes.
+
+        Returns:
+            The cached entry, or None on a miss (or when the cache is disabled)
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            try:
+                stat = os.stat(entry.output_path)
+                intact = stat.st_size == len(entry.data) and stat.st_mtime_ns == entry.mtime_ns
+            except OSError:
+                intact = False
+
+            if not intact:
+                try:
+                    os.makedirs(os.path.dirname(entry.output_path) or ".", exist_ok=True)
+                    with open(entry.output_path, "wb") as f:
+                        f.write(entry.data)
+                    entry.mtime_ns = os.stat(entry.output_path).st_mtime_ns
+                except OSError:
+                    self._remove(key)
+                    self.misses += 1
+                    return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, output_path: str, message: str) -> bool:
+        """
+        Cache a successful build.
+
+        Args:
+            key: Key from make_key
+            output_path: Path of the generated presentation
+            message: Result message returned to the client for this build
+
+        Returns:
+            True if the build was cached (False if disabled, unreadable or larger than the byte budget)
+        """
+        if not self.enabled:
+            return False
+
+        try:
+            with open(output_path, "rb") as f:
+                data = f.read()
+            mtime_ns = os.stat(output_path).st_mtime_ns
+        except OSError:
+            return False
+
+        if len(data) > self.max_bytes:
+            return False
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = BuildCacheEntry(output_path=output_path, data=data, message=message, mtime_ns=mtime_ns)
+            self._bytes += len(data)
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+        return True
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry (caller holds the lock)"""
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.data)
+
+    def clear(self) -> None:
+        """Drop all entries (generated files are left in place)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return configuration, size and hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -11,6 +11,66 @@ not "what layouts exist?"
 import re
 from typing import Any, Dict, List
 
+from deckbuilder.utils.keyword_index import KeywordIndex
+
+# Narrative vocabularies are matched as whole words to avoid false positives
+NARRATIVE_KEYWORDS = KeywordIndex(
+    {
+        "success": [
+            "growth",
+            "success",
+            "increase",
+            "expand",
+            "win",
+            "achievement",
+            "improvement",
+            "grew",
+            "expanded",
+            "gains",
+            "positive",
+        ],
+        "challenge": [
+            "but",
+            "however",
+            "problem",
+            "issue",
+            "churn",
+            "decrease",
+            "challenge",
+            "concern",
+            "difficulty",
+            "bottleneck",
+            "drops",
+            "causing",
+        ],
+        "solution": [
+            "strategy",
+            "plan",
+            "solution",
+            "address",
+            "fix",
+            "propose",
+            "recommend",
+            "implement",
+            "adding",
+            "need",
+        ],
+        "compare-contrast": ["compare", "vs", "versus", "option", "alternative"],
+        "persuasive": ["convince", "persuade", "recommend", "should"],
+    },
+    whole_words=True,
+)
+
+SIGNAL_KEYWORDS = KeywordIndex(
+    {
+        "metrics-heavy": ["data", "metrics", "numbers", "statistics"],
+        "story-driven": ["story", "example", "case", "experience"],
+        "urgent": ["urgent", "critical", "immediate", "crisis"],
+        "cautious": ["concern", "worry", "issue", "problem", "challenge"],
+        "positive": ["success", "growth", "achievement", "win"],
+    }
+)
+
 
 class ContentAnalyzer:
     """
@@ -132,73 +192,20 @@ class ContentAnalyzer:
 
     def _determine_narrative_arc(self, user_input: str, _key_messages: List[str]) -> str:
         """Determine the narrative structure from content."""
-        import re
-
         input_lower = user_input.lower()
-
-        # Use word boundary matching to avoid false positives
-        def has_word_pattern(patterns, text):
-            """Check if any pattern exists as whole words in text."""
-            for pattern in patterns:
-                if re.search(r"\b" + re.escape(pattern) + r"\b", text):
-                    return True
-            return False
+        hits = NARRATIVE_KEYWORDS.scan(input_lower)
 
         # Check for success-challenge-solution pattern with word boundaries
-        success_patterns = [
-            "growth",
-            "success",
-            "increase",
-            "expand",
-            "win",
-            "achievement",
-            "improvement",
-            "grew",
-            "expanded",
-            "gains",
-            "positive",
-        ]
-        challenge_patterns = [
-            "but",
-            "however",
-            "problem",
-            "issue",
-            "churn",
-            "decrease",
-            "challenge",
-            "concern",
-            "difficulty",
-            "bottleneck",
-            "drops",
-            "causing",
-        ]
-        solution_patterns = [
-            "strategy",
-            "plan",
-            "solution",
-            "address",
-            "fix",
-            "propose",
-            "recommend",
-            "implement",
-            "adding",
-            "need",
-        ]
-
-        has_success = has_word_pattern(success_patterns, input_lower) or re.search(r"\d+%", input_lower)
-        has_challenge = has_word_pattern(challenge_patterns, input_lower)
-        has_solution = has_word_pattern(solution_patterns, input_lower)
+        has_success = hits.has("success") or re.search(r"\d+%", input_lower)
+        has_challenge = hits.has("challenge")
+        has_solution = hits.has("solution")
 
         if has_success and has_challenge and has_solution:
             return "success-challenge-solution"
         elif has_challenge and has_solution:
             return "problem-solution"
-        elif has_word_pattern(["compare", "vs", "versus", "option", "alternative"], input_lower):
-            return "compare-contrast"
-        elif has_word_pattern(["convince", "persuade", "recommend", "should"], input_lower):
-            return "persuasive"
         else:
-            return "informational"
+            return hits.first(["compare-contrast", "persuasive"], default="informational")
 
     def _assess_complexity_level(self, user_input: str, audience: str) -> str:
         """Assess the complexity level needed."""
@@ -216,25 +223,17 @@ class ContentAnalyzer:
         # Count numeric mentions
         numeric_mentions = len(re.findall(r"\d+", user_input))
 
-        if numeric_mentions >= 5 or any(word in user_input.lower() for word in ["data", "metrics", "numbers", "statistics"]):
+        hits = SIGNAL_KEYWORDS.scan(user_input.lower())
+
+        if numeric_mentions >= 5 or hits.has("metrics-heavy"):
             return "metrics-heavy"
-        elif any(word in user_input.lower() for word in ["story", "example", "case", "experience"]):
-            return "story-driven"
-        else:
-            return "balanced"
+        return hits.first(["story-driven"], default="balanced")
 
     def _detect_emotional_tone(self, user_input: str, _key_messages: List[str]) -> str:
         """Detect the emotional tone of the content."""
         input_lower = user_input.lower()
 
-        if any(word in input_lower for word in ["urgent", "critical", "immediate", "crisis"]):
-            return "urgent"
-        elif any(word in input_lower for word in ["concern", "worry", "issue", "problem", "challenge"]):
-            return "cautious"
-        elif any(word in input_lower for word in ["success", "growth", "achievement", "win"]):
-            return "positive"
-        else:
-            return "neutral"
+        return SIGNAL_KEYWORDS.scan(input_lower).first(["urgent", "cautious", "positive"], default="neutral")
 
     def _analyze_audience(self, audience: str, constraints: str) -> Dict[str, str]:
         """Analyze audience characteristics and constraints."""
@@ -18,7 +18,7 @@ import json
 # Import content-first tools (will be implemented later)
 try:
     from .content_analysis import analyze_presentation_needs
-    from .content_optimization import optimize_content_for_layout
+    from .content_optimization import optimize_content_for_layout, optimize_deck
     from .layout_recommendations import recommend_slide_approach
 except ImportError:
     # Placeholder functions for when these modules don't exist yet
@@ -31,6 +31,9 @@ except ImportError:
     def optimize_content_for_layout(*args, **kwargs):
         return "Content optimization tool not implemented yet"
 
+    def optimize_deck(*args, **kwargs):
+        return "Content optimization tool not implemented yet"
+
 
 async def analyze_presentation_needs_tool(
     user_input: str,
@@ -185,3 +188,43 @@ async def optimize_content_for_layout_tool(content: str, chosen_layout: str, sli
 
     except Exception as e:
         return f"Error optimizing content for layout: {str(e)}"
+
+
+async def optimize_deck_content_tool(slides: str, slide_context: str = None) -> str:
+    """
+    Optimize a whole deck in one call and return all YAML blocks with a deck-level gap analysis.
+
+    Batch form of optimize_content_for_layout_tool: avoids one tool round trip per slide.
+
+    Args:
+        slides: JSON array of slides, each {"content": "...", "layout": "Four Columns"}
+                or ["content", "layout"]
+        slide_context: Optional JSON string with context shared by all slides
+
+    Returns:
+        JSON string with:
+        - yaml_blocks: Ready-to-use structured frontmatter per slide, in deck order
+        - slides: Full per-slide results (optimized_content, gap_analysis, presentation_tips)
+        - gap_analysis: content_fit_counts, average_layout_utilization,
+          slides_needing_attention (1-based slide numbers) and missing_elements counts
+    """
+    try:
+        context_dict = None
+        if slide_context:
+            try:
+                context_dict = json.loads(slide_context)
+            except json.JSONDecodeError:
+                # If parsing fails, continue without context
+                pass
+
+        pairs = []
+        for slide in json.loads(slides):
+            if isinstance(slide, dict):
+                pairs.append((slide.get("content", ""), slide.get("layout", "Title and Content")))
+            else:
+                pairs.append((slide[0], slide[1]))
+
+        return json.dumps(optimize_deck(pairs, context_dict), indent=2)
+
+    except Exception as e:
+        return f"Error optimizing deck content: {str(e)}"
@@ -9,9 +9,73 @@ Design Philosophy: Transform raw content into presentation-ready structure that
 maximizes communication effectiveness within the chosen layout constraints.
 """
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Patterns shared by every engine instance (and every slide of a deck)
+BLANK_LINES_RE = re.compile(r"\n\s*\n")
+DOUBLE_QUOTE_RE = re.compile(r'["""]')
+SINGLE_QUOTE_RE = re.compile(r"[''']")
+TITLE_WORD_RE = re.compile(r"\b[A-Za-z]{4,}\b")
+BULLET_ITEM_RE = re.compile(r"[-*•]\s*([^\n]+)")
+BULLET_LINE_RE = re.compile(r"^\s*[-*•]", re.MULTILINE)
+NUMBERED_ITEM_RE = re.compile(r"\d+[.\)\-\s]+([^\n]+)")
+NUMBERED_PAREN_ITEM_RE = re.compile(r"\d+\)\s*([^\n]+)")
+COLON_ITEM_RE = re.compile(r"([^:]+):\s*([^,\n]+)")
+SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+VERSUS_RE = re.compile(r"(.+?)\s+(?:vs|versus|compared to)\s+(.+)", re.IGNORECASE)
+CONTRAST_RES = (
+    re.compile(r"(.+?)\s+(?:but|however|while)\s+(.+)", re.IGNORECASE),
+    re.compile(r"(.+?)\s+(?:whereas|although)\s+(.+)", re.IGNORECASE),
+)
+PERCENT_RE = re.compile(r"(\d+%)")
+CURRENCY_RE = re.compile(r"(\$[\d,]+)")
+METRIC_RE = re.compile(r"\d+%|\$[\d,]+")
+STRONG_WORD_RE = re.compile(r"\b(best|fastest|highest|lowest|most|least|critical|important|key)\b", re.IGNORECASE)
+SWOT_STRENGTH_RE = re.compile(r"strength[s]?[:\-\s]*([^\n]+)", re.IGNORECASE)
+SWOT_WEAKNESS_RE = re.compile(r"weakness[es]*[:\-\s]*([^\n]+)", re.IGNORECASE)
+SWOT_OPPORTUNITY_RE = re.compile(r"opportunit[y|ies]*[:\-\s]*([^\n]+)", re.IGNORECASE)
+SWOT_THREAT_RE = re.compile(r"threat[s]*[:\-\s]*([^\n]+)", re.IGNORECASE)
+
+# Layout templates and formatting rules (read-only, shared by all engines)
+LAYOUT_TEMPLATES: Dict[str, Dict] = {
+    "Four Columns": {
+        "required_fields": ["title", "columns"],
+        "optimal_content_length": "20-40 words per column",
+    },
+    "Comparison": {
+        "required_fields": ["title", "left", "right"],
+        "optimal_content_length": "30-60 words per side",
+    },
+}
+
+FORMATTING_RULES: Dict[str, List[str]] = {
+    "numbers": ["**{number}**"],
+    "percentages": ["**{percentage}**"],
+    "currency": ["**{amount}**"],
+    "emphasis": ["**{word}**"],
+}
+
+# Decks smaller than this are optimized in-process; worker start-up costs more than it saves
+PARALLEL_MIN_SLIDES = 1000
+
+# Layout name -> optimization handler method
+LAYOUT_HANDLERS = {
+    "Four Columns": "_optimize_for_four_columns",
+    "Four Columns With Titles": "_optimize_for_four_columns_with_titles",
+    "Three Columns": "_optimize_for_three_columns",
+    "Three Columns With Titles": "_optimize_for_three_columns_with_titles",
+    "Comparison": "_optimize_for_comparison",
+    "Two Content": "_optimize_for_two_content",
+    "Title and Content": "_optimize_for_title_and_content",
+    "Section Header": "_optimize_for_section_header",
+    "Title Slide": "_optimize_for_title_slide",
+    "SWOT Analysis": "_optimize_for_swot_analysis",
+    "Agenda, 6 Textboxes": "_optimize_for_agenda_6_textboxes",
+}
 
 
 @dataclass
@@ -44,8 +108,8 @@ class ContentOptimizationEngine:
 
     def __init__(self):
         """Initialize with layout templates and optimization rules"""
-        self.layout_templates = self._build_layout_templates()
-        self.formatting_rules = self._build_formatting_rules()
+        self.layout_templates = LAYOUT_TEMPLATES
+        self.formatting_rules = FORMATTING_RULES
 
     def optimize_content_for_layout(self, content: str, chosen_layout: str, slide_context: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -87,6 +151,65 @@ class ContentOptimizationEngine:
             "presentation_tips": presentation_tips,
         }
 
+    def optimize_deck(self, slides: Sequence[Tuple[str, str]], slide_context: Optional[Dict] = None, workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Optimize every slide of a deck in one call.
+
+        Args:
+            slides: (content, layout) pairs in deck order
+            slide_context: Optional context shared by all slides
+            workers: Process pool size. None uses all CPUs for decks of at least
+                PARALLEL_MIN_SLIDES slides and runs smaller decks in-process; 1 never
+                starts a pool.
+
+        Returns:
+            Dictionary with per-slide results, all YAML blocks in deck order and a
+            deck-level gap analysis
+        """
+        jobs = [(content, layout, slide_context) for content, layout in slides]
+
+        if workers is None:
+            workers = (os.cpu_count() or 1) if len(jobs) >= PARALLEL_MIN_SLIDES else 1
+
+        if workers > 1 and len(jobs) > 1:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_optimize_slide, jobs, chunksize=chunksize))
+        else:
+            results = [self.optimize_content_for_layout(*job) for job in jobs]
+
+        slide_results = [{"slide": number, "layout": layout, **result} for number, ((_content, layout, _context), result) in enumerate(zip(jobs, results), 1)]
+
+        return {
+            "slide_count": len(slide_results),
+            "yaml_blocks": [result["optimized_content"]["yaml_structure"] for result in slide_results],
+            "slides": slide_results,
+            "gap_analysis": self._summarize_deck_gaps(slide_results),
+        }
+
+    def _summarize_deck_gaps(self, slide_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Aggregate per-slide gap analyses into a deck-level summary."""
+        fit_counts = {"excellent": 0, "good": 0, "fair": 0, "poor": 0}
+        missing_elements: Dict[str, int] = {}
+        needs_attention = []
+        utilization = 0.0
+
+        for result in slide_results:
+            gap = result["gap_analysis"]
+            fit_counts[gap["content_fit"]] += 1
+            utilization += gap["layout_utilization"]
+            for element in gap["missing_elements"]:
+                missing_elements[element] = missing_elements.get(element, 0) + 1
+            if gap["content_fit"] in ["fair", "poor"]:
+                needs_attention.append(result["slide"])
+
+        return {
+            "content_fit_counts": fit_counts,
+            "average_layout_utilization": round(utilization / len(slide_results), 3) if slide_results else 0.0,
+            "slides_needing_attention": needs_attention,
+            "missing_elements": missing_elements,
+        }
+
     def _clean_content(self, content: str) -> str:
         """Clean and normalize the input content.
         The _clean_content method is intended to standardize and clean raw input content.
@@ -103,14 +226,14 @@ class ContentOptimizationEngine:
 
         """
         # Remove excessive whitespace
-        cleaned = re.sub(r"\n\s*\n", "\n\n", content.strip())
+        cleaned = BLANK_LINES_RE.sub("\n\n", content.strip())
 
         # Normalize quotes
-        cleaned = re.sub(r'["""]', '"', cleaned)
-        cleaned = re.sub(r"[''']", "'", cleaned)
+        cleaned = DOUBLE_QUOTE_RE.sub('"', cleaned)
+        cleaned = SINGLE_QUOTE_RE.sub("'", cleaned)
 
         # Normalize em dashes to hyphens
-        cleaned = re.sub(r"—", "-", cleaned)
+        cleaned = cleaned.replace("—", "-")
 
         return cleaned
 
@@ -126,20 +249,8 @@ class ContentOptimizationEngine:
 
     def _get_layout_handler(self, layout: str):
         """Get the appropriate optimization handler for the layout."""
-        handlers = {
-            "Four Columns": self._optimize_for_four_columns,
-            "Four Columns With Titles": self._optimize_for_four_columns_with_titles,
-            "Three Columns": self._optimize_for_three_columns,
-            "Three Columns With Titles": self._optimize_for_three_columns_with_titles,
-            "Comparison": self._optimize_for_comparison,
-            "Two Content": self._optimize_for_two_content,
-            "Title and Content": self._optimize_for_title_and_content,
-            "Section Header": self._optimize_for_section_header,
-            "Title Slide": self._optimize_for_title_slide,
-            "SWOT Analysis": self._optimize_for_swot_analysis,
-            "Agenda, 6 Textboxes": self._optimize_for_agenda_6_textboxes,
-        }
-        return handlers.get(layout)
+        handler_name = LAYOUT_HANDLERS.get(layout)
+        return getattr(self, handler_name) if handler_name else None
 
     def _optimize_for_four_columns(self, content: str, slide_context: Optional[Dict]) -> ContentOptimizationResult:
         """Optimize content for Four Columns layout."""
@@ -498,7 +609,7 @@ class ContentOptimizationEngine:
                 return " ".join(word.capitalize() for word in key_words)
 
         # Extract key terms from content
-        content_words = re.findall(r"\b[A-Za-z]{4,}\b", content)
+        content_words = TITLE_WORD_RE.findall(content)
         if content_words:
             # Take first few significant words
             title_words = content_words[:3]
@@ -509,12 +620,12 @@ class ContentOptimizationEngine:
     def _parse_content_into_columns(self, content: str, num_columns: int) -> List[str]:
         """Parse content into specified number of columns."""
         # Look for explicit list items first
-        bullet_items = re.findall(r"[-*•]\s*([^\n]+)", content)
+        bullet_items = BULLET_ITEM_RE.findall(content)
         if len(bullet_items) >= num_columns:
             return bullet_items[:num_columns]
 
         # Look for numbered list items
-        numbered_items = re.findall(r"\d+\)\s*([^\n]+)", content)
+        numbered_items = NUMBERED_PAREN_ITEM_RE.findall(content)
         if len(numbered_items) >= num_columns:
             return numbered_items[:num_columns]
 
@@ -524,12 +635,12 @@ class ContentOptimizationEngine:
             return comma_parts[:num_columns]
 
         # Try colon-separated items
-        colon_items = re.findall(r"([^:]+):\s*([^,\n]+)", content)
+        colon_items = COLON_ITEM_RE.findall(content)
         if len(colon_items) >= num_columns:
             return [f"{item[0]}: {item[1]}" for item in colon_items[:num_columns]]
 
         # Split by sentences/phrases
-        sentences = re.split(r"[.!?]+", content)
+        sentences = SENTENCE_SPLIT_RE.split(content)
         clean_sentences = [s.strip() for s in sentences if s.strip()]
 
         if len(clean_sentences) >= num_columns:
@@ -557,7 +668,7 @@ class ContentOptimizationEngine:
     def _parse_content_into_comparison(self, content: str) -> Tuple[Dict[str, str], Dict[str, str]]:
         """Parse content into left/right comparison structure."""
         # Look for explicit vs/versus patterns
-        vs_match = re.search(r"(.+?)\s+(?:vs|versus|compared to)\s+(.+)", content, re.IGNORECASE)
+        vs_match = VERSUS_RE.search(content)
         if vs_match:
             left_content = vs_match.group(1).strip()
             right_content = vs_match.group(2).strip()
@@ -568,13 +679,8 @@ class ContentOptimizationEngine:
             )
 
         # Look for contrasting words
-        contrast_patterns = [
-            r"(.+?)\s+(?:but|however|while)\s+(.+)",
-            r"(.+?)\s+(?:whereas|although)\s+(.+)",
-        ]
-
-        for pattern in contrast_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in CONTRAST_RES:
+            match = pattern.search(content)
             if match:
                 left_content = match.group(1).strip()
                 right_content = match.group(2).strip()
@@ -585,7 +691,7 @@ class ContentOptimizationEngine:
                 )
 
         # Split content in half
-        sentences = re.split(r"[.!?]+", content)
+        sentences = SENTENCE_SPLIT_RE.split(content)
         clean_sentences = [s.strip() for s in sentences if s.strip()]
 
         mid_point = len(clean_sentences) // 2
@@ -620,7 +726,7 @@ class ContentOptimizationEngine:
                 return second_line
 
         # Create a summary from content
-        sentences = re.split(r"[.!?]+", content)
+        sentences = SENTENCE_SPLIT_RE.split(content)
         clean_sentences = [s.strip() for s in sentences if s.strip()]
 
         if clean_sentences:
@@ -638,34 +744,22 @@ class ContentOptimizationEngine:
             return content
 
         # Emphasize key numbers and percentages
-        content = re.sub(r"(\d+%)", r"**\1**", content)
-        content = re.sub(r"(\$[\d,]+)", r"**\1**", content)
+        content = PERCENT_RE.sub(r"**\1**", content)
+        content = CURRENCY_RE.sub(r"**\1**", content)
 
         # Emphasize superlatives and strong words
-        strong_words = [
-            "best",
-            "fastest",
-            "highest",
-            "lowest",
-            "most",
-            "least",
-            "critical",
-            "important",
-            "key",
-        ]
-        for word in strong_words:
-            content = re.sub(rf"\b({word})\b", r"**\1**", content, flags=re.IGNORECASE)
+        content = STRONG_WORD_RE.sub(r"**\1**", content)
 
         return content
 
     def _structure_as_bullets(self, content: str) -> str:
         """Structure content as bullet points if appropriate."""
         # If already has bullets, keep as is
-        if re.search(r"^\s*[-*•]", content, re.MULTILINE):
+        if BULLET_LINE_RE.search(content):
             return content
 
         # Split sentences and convert to bullets
-        sentences = re.split(r"[.!?]+", content)
+        sentences = SENTENCE_SPLIT_RE.split(content)
         clean_sentences = [s.strip() for s in sentences if s.strip() and len(s) > 10]
 
         if len(clean_sentences) >= 2:
@@ -687,22 +781,22 @@ class ContentOptimizationEngine:
         swot_content = {}
 
         if "strength" in content_lower:
-            strength_match = re.search(r"strength[s]?[:\-\s]*([^\n]+)", content, re.IGNORECASE)
+            strength_match = SWOT_STRENGTH_RE.search(content)
             if strength_match:
                 swot_content["content_top_left"] = f"**Strengths**: {strength_match.group(1).strip()}"
 
         if "weakness" in content_lower:
-            weakness_match = re.search(r"weakness[es]*[:\-\s]*([^\n]+)", content, re.IGNORECASE)
+            weakness_match = SWOT_WEAKNESS_RE.search(content)
             if weakness_match:
                 swot_content["content_top_right"] = f"**Weaknesses**: {weakness_match.group(1).strip()}"
 
         if "opportunit" in content_lower:
-            opportunity_match = re.search(r"opportunit[y|ies]*[:\-\s]*([^\n]+)", content, re.IGNORECASE)
+            opportunity_match = SWOT_OPPORTUNITY_RE.search(content)
             if opportunity_match:
                 swot_content["content_bottom_left"] = f"**Opportunities**: {opportunity_match.group(1).strip()}"
 
         if "threat" in content_lower:
-            threat_match = re.search(r"threat[s]*[:\-\s]*([^\n]+)", content, re.IGNORECASE)
+            threat_match = SWOT_THREAT_RE.search(content)
             if threat_match:
                 swot_content["content_bottom_right"] = f"**Threats**: {threat_match.group(1).strip()}"
 
@@ -716,16 +810,16 @@ class ContentOptimizationEngine:
     def _parse_content_into_agenda_items(self, content: str, num_items: int) -> List[str]:
         """Parse content into agenda items."""
         # Look for numbered or bulleted items
-        numbered_items = re.findall(r"\d+[.\)\-\s]+([^\n]+)", content)
+        numbered_items = NUMBERED_ITEM_RE.findall(content)
         if len(numbered_items) >= num_items:
             return numbered_items[:num_items]
 
-        bullet_items = re.findall(r"[-*•]\s*([^\n]+)", content)
+        bullet_items = BULLET_ITEM_RE.findall(content)
         if len(bullet_items) >= num_items:
             return bullet_items[:num_items]
 
         # Split by sentences
-        sentences = re.split(r"[.!?]+", content)
+        sentences = SENTENCE_SPLIT_RE.split(content)
         clean_sentences = [s.strip() for s in sentences if s.strip()]
 
         if len(clean_sentences) >= num_items:
@@ -973,7 +1067,7 @@ content_item6: "{agenda_items[5]}"
                 missing.append("Content lacks clear comparison elements")
 
         # Check for visual elements that could enhance the slide
-        if not re.search(r"\d+%|\$[\d,]+", content):
+        if not METRIC_RE.search(content):
             if layout in ["Four Columns", "Title and Content"]:
                 missing.append("Consider adding metrics or data points for impact")
 
@@ -1051,28 +1145,6 @@ content_item6: "{agenda_items[5]}"
             "Title Slide": {"min_elements": 1, "max_elements": 2, "flexibility": "high"},
         }.get(layout, {"min_elements": 1, "max_elements": "unlimited", "flexibility": "high"})
 
-    def _build_layout_templates(self) -> Dict[str, Dict]:
-        """Build templates for different layouts."""
-        return {
-            "Four Columns": {
-                "required_fields": ["title", "columns"],
-                "optimal_content_length": "20-40 words per column",
-            },
-            "Comparison": {
-                "required_fields": ["title", "left", "right"],
-                "optimal_content_length": "30-60 words per side",
-            },
-        }
-
-    def _build_formatting_rules(self) -> Dict[str, List[str]]:
-        """Build formatting rules for different content types."""
-        return {
-            "numbers": ["**{number}**"],
-            "percentages": ["**{percentage}**"],
-            "currency": ["**{amount}**"],
-            "emphasis": ["**{word}**"],
-        }
-
 
 # Helper function for easy import
 def optimize_content_for_layout(content: str, chosen_layout: str, slide_context: Optional[Dict] = None) -> Dict[str, Any]:
@@ -1089,3 +1161,31 @@ def optimize_content_for_layout(content: str, chosen_layout: str, slide_context:
     """
     engine = ContentOptimizationEngine()
     return engine.optimize_content_for_layout(content, chosen_layout, slide_context)
+
+
+# Per-process engine used by optimize_deck workers
+_worker_engine: Optional[ContentOptimizationEngine] = None
+
+
+def _optimize_slide(job: Tuple[str, str, Optional[Dict]]) -> Dict[str, Any]:
+    """Optimize one (content, layout, context) job in a worker process"""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = ContentOptimizationEngine()
+    return _worker_engine.optimize_content_for_layout(*job)
+
+
+def optimize_deck(slides: Sequence[Tuple[str, str]], slide_context: Optional[Dict] = None, workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Convenience function for optimizing a whole deck of (content, layout) pairs.
+
+    Args:
+        slides: (content, layout) pairs in deck order
+        slide_context: Optional context shared by all slides
+        workers: Process pool size (default: automatic, see ContentOptimizationEngine.optimize_deck)
+
+    Returns:
+        Dictionary with per-slide results, YAML blocks and deck-level gap analysis
+    """
+    engine = ContentOptimizationEngine()
+    return engine.optimize_deck(slides, slide_context, workers)
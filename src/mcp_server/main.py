@@ -5,22 +5,99 @@ import sys
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from typing import List
 
 from dotenv import load_dotenv
 from mcp.server.fastmcp import Context, FastMCP
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+from deckbuilder.content.json_stream import SlideStream  # noqa: E402
 from deckbuilder.core.engine import get_deckbuilder_client  # noqa: E402
+from deckbuilder.core.engine_pool import DEFAULT_MAX_ENGINES, EnginePool  # noqa: E402
+from deckbuilder.templates.manager import TemplateManager  # noqa: E402
 from deckbuilder.templates.metadata import TemplateMetadataLoader  # noqa: E402
+from deckbuilder.utils.progress import STAGE_COMPLETE, ProgressEvent  # noqa: E402
+from mcp_server.build_cache import BuildCache  # noqa: E402
+from mcp_server.metrics import MetricsRegistry  # noqa: E402
 
 # Content-first tools moved to content_first_tools.py to keep core server focused
 
 load_dotenv()
 
+# Opt-in build result cache (DECK_BUILD_CACHE=1), configured once .env is loaded
+build_cache = BuildCache.from_env()
+
+# Opt-in operational metrics (DECK_METRICS=1 / DECK_METRICS_PORT)
+metrics = MetricsRegistry.from_env()
+
 # Initialize client lazily to ensure environment variables are available
 deck = None
 
+# Builds run in worker threads on pooled engines, so concurrent tool calls build in
+# parallel (up to DECK_ENGINE_POOL_SIZE) and progress reaches the client meanwhile.
+_engine_pool = None
+
+
+def get_engine_pool() -> EnginePool:
+    """Lazy initialization of the build engine pool."""
+    global _engine_pool
+    if _engine_pool is None:
+        from deckbuilder.utils.path import create_mcp_path_manager
+
+        _engine_pool = EnginePool(create_mcp_path_manager(), max_engines=int(os.getenv("DECK_ENGINE_POOL_SIZE", DEFAULT_MAX_ENGINES)))
+    return _engine_pool
+
+
+def _cache_stats() -> dict:
+    """Statistics of the process-wide caches, keyed by cache name."""
+    from deckbuilder.content.processor import frontmatter_cache
+    from deckbuilder.core.deck_schema import schema_cache_stats
+    from deckbuilder.image.image_handler import image_cache_stats
+    from deckbuilder.templates.manager import template_file_cache
+    from deckbuilder.templates.metadata import template_metadata_store
+    from deckbuilder.templates.pattern_loader import pattern_cache_stats
+
+    return {
+        "build_cache": build_cache.stats(),
+        "template_metadata_cache": template_metadata_store.stats(),
+        "frontmatter_cache": {"hits": frontmatter_cache.hits, "misses": frontmatter_cache.misses},
+        "template_file_cache": template_file_cache.stats(),
+        "pattern_cache": pattern_cache_stats.stats(),
+        "schema_cache": schema_cache_stats.stats(),
+        "image_cache": image_cache_stats.stats(),
+    }
+
+
+def _collect_metrics():
+    """Cache hit ratios and engine pool utilisation, read when metrics are scraped."""
+    caches = {name[: -len("_cache")]: stats for name, stats in _cache_stats().items()}
+    ratios = []
+    for name, stats in caches.items():
+        lookups = stats["hits"] + stats["misses"]
+        ratios.append(({"cache": name}, stats["hits"] / lookups if lookups else 0.0))
+
+    collected = [
+        ("deckbuilder_cache_hits_total", "counter", "Cache hits by cache", [({"cache": name}, stats["hits"]) for name, stats in caches.items()]),
+        ("deckbuilder_cache_misses_total", "counter", "Cache misses by cache", [({"cache": name}, stats["misses"]) for name, stats in caches.items()]),
+        ("deckbuilder_cache_hit_ratio", "gauge", "Cache hit ratio by cache", ratios),
+    ]
+    if _engine_pool is not None:
+        pool = _engine_pool.stats()
+        collected.extend(
+            [
+                ("deckbuilder_engine_pool_engines", "gauge", "Engines created by the build pool", [({}, pool["engines"])]),
+                ("deckbuilder_engine_pool_in_use", "gauge", "Engines currently building", [({}, pool["in_use"])]),
+                ("deckbuilder_engine_pool_waiting", "gauge", "Builds waiting for a free engine", [({}, pool["waiting"])]),
+                ("deckbuilder_engine_pool_utilization", "gauge", "Fraction of the pool's engines in use", [({}, pool["in_use"] / pool["max_engines"])]),
+                ("deckbuilder_engine_pool_waits_total", "counter", "Builds that had to wait for an engine", [({}, pool["waits"])]),
+            ]
+        )
+    return collected
+
+
+metrics.add_collector(_collect_metrics)
+
 
 def get_deck_client():
     """Lazy initialization of deckbuilder client."""
@@ -69,12 +146,87 @@ mcp = FastMCP(
 )
 
 
+def _cached_build(source: str, content: str, fileName: str, templateName: str, build) -> str:
+    """
+    Run a build through the build cache.
+
+    Args:
+        source: Kind of input ("markdown" or "json")
+        content: Input content exactly as received, or a file digest for streamed inputs
+        fileName: Output file name
+        templateName: Template name
+        build: Callable performing the build and returning the tool's success message
+
+    Returns:
+        The build's message, or the cached message on a hit
+    """
+    if not build_cache.enabled:
+        return build()
+
+    # Resolved like the pooled engines that run the build, without creating one
+    path_manager = get_engine_pool().path_manager
+    template_path = TemplateManager(path_manager).get_template_path(templateName)
+    output_folder = str(path_manager.get_output_folder())
+    key = build_cache.make_key(source, content, fileName, template_path, output_folder)
+
+    entry = build_cache.get(key)
+    if entry:
+        return f"{entry.message} (served from build cache)"
+
+    message = build()
+    marker = "Successfully created presentation: "
+    if marker in message:
+        output_name = message.split(marker)[1].strip()
+        build_cache.put(key, os.path.join(output_folder, output_name), message)
+    return message
+
+
+def _progress_reporter(ctx: Context):
+    """
+    Create a build progress callback that forwards events to the MCP client.
+
+    Slide events become progress notifications (only sent when the client
+    supplied a progress token); completion is also logged with stage timings
+    and recorded in the metrics registry. Must be called on the event loop;
+    the callback may be called from any thread.
+
+    Returns:
+        Progress callback, or None when there is no request context and metrics are disabled
+    """
+    if ctx is None and not metrics.enabled:
+        return None
+    loop = asyncio.get_running_loop()
+
+    def report(event: ProgressEvent) -> None:
+        if event.stage == STAGE_COMPLETE:
+            metrics.record_build(event.total, event.timings)
+        if ctx is None:
+            return
+        try:
+            if event.total or event.current:
+                # Streamed builds do not know their total until they complete
+                asyncio.run_coroutine_threadsafe(ctx.report_progress(event.current, event.total or None, event.message), loop)
+            if event.stage == STAGE_COMPLETE:
+                timings = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in event.timings.items())
+                asyncio.run_coroutine_threadsafe(ctx.info(f"{event.message} ({timings})"), loop)
+        except Exception:  # nosec B110 - progress is best effort and must never fail a build
+            pass
+
+    return report
+
+
+async def _run_build(build):
+    """Run a blocking build in a worker thread."""
+    return await asyncio.to_thread(build)
+
+
 # Note: create_presentation() JSON tool removed - forces efficient file-based workflows
 # The core Deckbuilder.create_presentation() engine method remains intact
 # Use create_presentation_from_file() for token-efficient LLM workflows (15 tokens vs 2000+)
 
 
 @mcp.tool()
+@metrics.timed_tool
 async def create_presentation_from_file(
     ctx: Context,
     file_path: str,
@@ -111,7 +263,9 @@ async def create_presentation_from_file(
         - Direct file system access
         - Supports both JSON and markdown formats
         - Automatic file type detection
+        - Per-slide progress notifications when the client sends a progress token
     """
+    progress = _progress_reporter(ctx)
     try:
         # Check if file exists
         if not os.path.exists(file_path):
@@ -121,35 +275,39 @@ async def create_presentation_from_file(
         file_extension = os.path.splitext(file_path)[1].lower()
 
         if file_extension == ".json":
-            # Read JSON file
-            with open(file_path, "r", encoding="utf-8") as f:
-                json_data = json.load(f)
+            # Slides are streamed from the file one at a time, so large inputs are never loaded whole
 
-            # Convert JSON data to canonical format if needed
-            if "slides" not in json_data:
-                canonical_data = {"slides": [json_data] if isinstance(json_data, dict) else json_data}
-            else:
-                canonical_data = json_data
+            def build_json():
+                with get_engine_pool().session() as engine:
+                    result = engine.create_presentation_from_slides(SlideStream(file_path, allow_bare_slide=True), fileName, templateName, progress=progress)
 
-            # Create presentation using the new API
-            result = get_deck_client().create_presentation(canonical_data, fileName, templateName)
+                return f"Successfully created presentation from JSON file: {file_path}. {result}"
+
+            def cached_build_json():
+                # Hashing reads the whole file, so it runs in the worker thread with the build
+                content = build_cache.file_digest(file_path) if build_cache.enabled else ""
+                return _cached_build("json", content, fileName, templateName, build_json)
 
-            return f"Successfully created presentation from JSON file: {file_path}. {result}"
+            return await _run_build(cached_build_json)
 
         elif file_extension == ".md":
             # Read markdown file
             with open(file_path, "r", encoding="utf-8") as f:
                 markdown_content = f.read()
 
-            # Convert markdown to canonical JSON format
-            from deckbuilder.content.frontmatter_to_json_converter import markdown_to_canonical_json
+            def build_markdown():
+                # Convert markdown to canonical JSON format
+                from deckbuilder.content.frontmatter_to_json_converter import markdown_to_canonical_json
 
-            canonical_data = markdown_to_canonical_json(markdown_content)
+                canonical_data = markdown_to_canonical_json(markdown_content)
 
-            # Create presentation using the new API
-            result = get_deck_client().create_presentation(canonical_data, fileName, templateName)
+                # Create presentation using the new API
+                with get_engine_pool().session() as engine:
+                    result = engine.create_presentation(canonical_data, fileName, templateName, progress=progress)
 
-            return f"Successfully created presentation from markdown file: " f"{file_path} with {len(canonical_data['slides'])} slides. {result}"
+                return f"Successfully created presentation from markdown file: " f"{file_path} with {len(canonical_data['slides'])} slides. {result}"
+
+            return await _run_build(lambda: _cached_build("markdown", markdown_content, fileName, templateName, build_markdown))
 
         else:
             return f"Error: Unsupported file type '{file_extension}'. Supported types: .json, .md"
@@ -161,6 +319,7 @@ async def create_presentation_from_file(
 
 
 @mcp.tool()
+@metrics.timed_tool
 async def create_presentation_from_markdown(
     ctx: Context,
     markdown_content: str,
@@ -242,21 +401,28 @@ async def create_presentation_from_markdown(
         - border_style: Border style (thin_gray, thick_gray, no_borders, etc.)
         - custom_colors: Custom color overrides (header_bg, header_text, alt_row, border_color)
     """
+    progress = _progress_reporter(ctx)
     try:
-        # Convert markdown to canonical JSON format
-        from deckbuilder.content.frontmatter_to_json_converter import markdown_to_canonical_json
 
-        canonical_data = markdown_to_canonical_json(markdown_content)
+        def build_markdown():
+            # Convert markdown to canonical JSON format
+            from deckbuilder.content.frontmatter_to_json_converter import markdown_to_canonical_json
+
+            canonical_data = markdown_to_canonical_json(markdown_content)
+
+            # Create presentation using the new API
+            with get_engine_pool().session() as engine:
+                result = engine.create_presentation(canonical_data, fileName, templateName, progress=progress)
 
-        # Create presentation using the new API
-        result = get_deck_client().create_presentation(canonical_data, fileName, templateName)
+            return f"Successfully created presentation with {len(canonical_data['slides'])} slides " f"from markdown. {result}"
 
-        return f"Successfully created presentation with {len(canonical_data['slides'])} slides " f"from markdown. {result}"
+        return await _run_build(lambda: _cached_build("markdown", markdown_content, fileName, templateName, build_markdown))
     except Exception as e:
         return f"Error creating presentation from markdown: {str(e)}"
 
 
 @mcp.tool()
+@metrics.timed_tool
 async def list_available_templates(ctx: Context) -> str:
     """List all available presentation templates with metadata for intelligent selection
 
@@ -350,6 +516,7 @@ async def list_available_templates(ctx: Context) -> str:
 
 
 @mcp.tool()
+@metrics.timed_tool
 async def get_template_layouts(ctx: Context, template_name: str) -> str:
     """Get detailed layout information for a specific template
 
@@ -406,6 +573,12 @@ async def get_template_layouts(ctx: Context, template_name: str) -> str:
         # Load template metadata
         metadata = loader.load_template_metadata(template_name)
 
+        # Shared template analysis tells which pattern layouts this template can actually fill
+        from deckbuilder.templates.template_analysis import load_template_analysis
+
+        analysis = load_template_analysis(loader.template_folder / f"{template_name}.pptx", loader.template_folder)
+        compatibility = analysis["pattern_compatibility"]["layouts"]
+
         # Initialize pattern loader for structured frontmatter patterns
         from deckbuilder.templates.pattern_loader import PatternLoader
 
@@ -445,6 +618,7 @@ async def get_template_layouts(ctx: Context, template_name: str) -> str:
                 "optional_placeholders": optional_fields,
                 "best_for": layout_meta.best_for,
                 "example": example,
+                "template_compatible": compatibility.get(layout_name, {}).get("compatible", False),
             }
 
         result = {
@@ -504,6 +678,7 @@ def _parse_example_from_pattern(example_markdown: str, placeholders: list) -> di
 
 
 @mcp.tool()
+@metrics.timed_tool
 async def recommend_template_for_content(ctx: Context, content_description: str) -> str:
     """Analyze content description and recommend optimal templates with reasoning
 
@@ -811,7 +986,128 @@ async def recommend_template_for_content(ctx: Context, content_description: str)
         return json.dumps(error_result, indent=2)
 
 
+# Shared across calls so layout scoring matrices are compiled once per server process
+_layout_intelligence = None
+
+
+def get_layout_intelligence():
+    """Lazy initialization of the shared layout intelligence engine."""
+    global _layout_intelligence
+    if _layout_intelligence is None:
+        from deckbuilder.templates.layout_intelligence import LayoutIntelligence
+
+        _layout_intelligence = LayoutIntelligence()
+    return _layout_intelligence
+
+
+@mcp.tool()
+@metrics.timed_tool
+async def recommend_layouts_for_slides(ctx: Context, slides: List[str], max_recommendations: int = 3) -> str:
+    """Recommend layouts for every slide of a draft outline in one call
+
+    Scores all slides against all layouts in a single batch, so a whole outline
+    can be planned without one tool call per slide.
+
+    Token efficiency: outline in → ranked layouts per slide
+
+    Args:
+        ctx: MCP context
+        slides: Markdown content of each slide, in deck order
+        max_recommendations: Maximum layouts to return per slide (default: 3)
+
+    Returns:
+        JSON string in the format:
+        {
+            "slide_count": 2,
+            "fallback_layouts": ["Title and Content", "Title Slide"],
+            "slides": [
+                {
+                    "slide": 1,
+                    "recommendations": [
+                        {"layout": "Comparison", "confidence": 0.7, "reasoning": ["..."], "optimization_hints": ["..."]}
+                    ]
+                }
+            ]
+        }
+
+        Slides with no confident match have an empty recommendations list; use
+        one of the fallback layouts for them.
+
+    Use cases:
+        - Content-first planning of a full outline
+        - Picking layouts for many slides before writing frontmatter
+    """
+    try:
+        intelligence = get_layout_intelligence()
+        batch = intelligence.recommend_layouts_batch(slides, max_recommendations)
+
+        result = {
+            "slide_count": len(slides),
+            "fallback_layouts": intelligence.intelligence_data.get("recommendation_engine", {}).get("fallback_layouts", []),
+            "slides": [
+                {
+                    "slide": number,
+                    "recommendations": [
+                        {
+                            "layout": recommendation.layout_name,
+                            "confidence": round(recommendation.confidence, 3),
+                            "reasoning": recommendation.reasoning,
+                            "optimization_hints": recommendation.optimization_hints,
+                        }
+                        for recommendation in recommendations
+                    ],
+                }
+                for number, recommendations in enumerate(batch, 1)
+            ],
+        }
+        return json.dumps(result, indent=2)
+
+    except Exception as e:
+        error_result = {
+            "error": f"Failed to recommend layouts: {str(e)}",
+            "slide_count": len(slides),
+            "suggestion": "Pass a list of slide markdown strings",
+        }
+        return json.dumps(error_result, indent=2)
+
+
+@mcp.tool()
+@metrics.timed_tool
+async def get_server_diagnostics(ctx: Context) -> str:
+    """Report cache, engine pool and metrics statistics for this MCP server process
+
+    Token efficiency: no input → compact JSON counters
+
+    Args:
+        ctx: MCP context
+
+    Returns:
+        JSON string in the format:
+        {
+            "build_cache": {"enabled": true, "entries": 3, "bytes": 120000, "hits": 5, "misses": 3, "evictions": 0, "hit_rate": 0.625, ...},
+            "template_metadata_cache": {"entries": 2, "hits": 10, "misses": 2, "invalidations": 0, "hit_rate": 0.83},
+            "frontmatter_cache": {"hits": 40, "misses": 12},
+            "template_file_cache": {"entries": 1, "bytes": 430000, "hits": 7, "misses": 1},
+            "pattern_cache": {"hits": 30, "misses": 2, "hit_rate": 0.94},
+            "image_cache": {"hits": 12, "misses": 3, "hit_rate": 0.8},
+            "engine_pool": {"max_engines": 4, "engines": 2, "idle": 2, "in_use": 0, "waiting": 0, "checkouts": 8, "waits": 0},
+            "metrics": {"enabled": true, "tools": {"create_presentation_from_file": {"calls": 8, "mean_seconds": 0.4, "errors": 0}}, "builds_per_second": 0.01, ...}
+        }
+
+    Use cases:
+        - Checking whether retried builds are served from the build cache
+        - Diagnosing slow builds
+        - Checking whether concurrent builds are waiting for a free engine
+        - Tool latency and error counts when metrics are enabled (DECK_METRICS=1)
+    """
+    result = _cache_stats()
+    result["engine_pool"] = _engine_pool.stats() if _engine_pool else None
+    result["metrics"] = metrics.snapshot()
+    return json.dumps(result, indent=2)
+
+
 @mcp.tool()
+@metrics.timed_tool
 async def validate_presentation_file(ctx: Context, file_path: str, template_name: str = "default") -> str:
     """Validate markdown presentation file structure before generation
 
@@ -1036,6 +1332,10 @@ async def validate_presentation_file(ctx: Context, file_path: str, template_name
 
 
 async def async_main():
+    metrics_port = os.getenv("DECK_METRICS_PORT")
+    if metrics_port:
+        metrics.start_http_server(int(metrics_port))
+
     transport = os.getenv("TRANSPORT", "stdio")
     if transport == "sse":
         # Run the MCP server with sse transport
@@ -0,0 +1,278 @@
+"""
+Operational Metrics for Deck Builder MCP
+
+A small in-process registry of counters, gauges and histograms rendered in
+the Prometheus text exposition format. When enabled (DECK_METRICS=1 or a
+DECK_METRICS_PORT is set) the server records per-tool latency, outcomes and
+in-flight calls, builds and slides generated with their stage timings, and
+at scrape time collects cache hit ratios and engine pool utilisation.
+
+When disabled, instrumented tools call straight through after one attribute
+check and nothing is recorded.
+
+Environment variables:
+    DECK_METRICS: "1"/"true" to enable collection (default: disabled)
+    DECK_METRICS_PORT: Serve /metrics on 127.0.0.1:<port> (implies DECK_METRICS)
+"""
+
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Seconds; covers quick lookups through multi-minute builds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[Tuple[str, str], ...]
+# (name, type, help, [(labels, value)]) produced by a collector at scrape time
+CollectedMetric = Tuple[str, str, str, List[Tuple[Dict[str, Any], float]]]
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Return (le, cumulative count) pairs including +Inf."""
+        total = 0
+        result = []
+        for bound, count in zip(list(self.buckets) + [float("inf")], self.counts):
+            total += count
+            result.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return result
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    escaped = [key + '="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"' for key, value in labels]
+    return "{" + ",".join(escaped) + "}" if escaped else ""
+
+
+def is_error_result(result: Any) -> bool:
+    """Whether a tool's return value reports an error ("Error ..." text or a JSON "error" key first)."""
+    return isinstance(result, str) and (result.startswith("Error") or result[:32].lstrip("{ \n").startswith('"error"'))
+
+
+class MetricsRegistry:
+    """
+    In-process metrics registry with Prometheus text rendering.
+
+    Args:
+        enabled: Whether instrumentation records anything
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._meta: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._gauges: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._collectors: List[Callable[[], List[CollectedMetric]]] = []
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @classmethod
+    def from_env(cls) -> "MetricsRegistry":
+        """Create a registry enabled by DECK_METRICS or DECK_METRICS_PORT."""
+        enabled = os.getenv("DECK_METRICS", "").strip().lower() in ("1", "true", "yes", "on") or bool(os.getenv("DECK_METRICS_PORT"))
+        return cls(enabled=enabled)
+
+    def _describe(self, name: str, kind: str, help_text: str) -> None:
+        """Record type and help for a metric the first time it is used (caller holds the lock)."""
+        if name not in self._meta:
+            self._meta[name] = (kind, help_text)
+
+    def inc(self, name: str, amount: float = 1, help_text: str = "", **labels) -> None:
+        """Increment a counter."""
+        key = _labels(labels)
+        with self._lock:
+            self._describe(name, "counter", help_text)
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def gauge_add(self, name: str, amount: float, help_text: str = "", **labels) -> None:
+        """Add to (or subtract from) a gauge."""
+        key = _labels(labels)
+        with self._lock:
+            self._describe(name, "gauge", help_text)
+            series = self._gauges.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, help_text: str = "", buckets: Tuple[float, ...] = DEFAULT_BUCKETS, **labels) -> None:
+        """Add an observation to a histogram."""
+        key = _labels(labels)
+        with self._lock:
+            self._describe(name, "histogram", help_text)
+            series = self._histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram(buckets)
+            series[key].observe(value)
+
+    def add_collector(self, collector: Callable[[], List[CollectedMetric]]) -> None:
+        """Register a function returning metrics read at scrape time (e.g. cache statistics)."""
+        self._collectors.append(collector)
+
+    def timed_tool(self, fn: Callable) -> Callable:
+        """
+        Decorate an async MCP tool to record latency, outcome and in-flight calls.
+
+        Place it below @mcp.tool() so the registered function is the wrapper.
+        """
+        tool = fn.__name__
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return await fn(*args, **kwargs)
+
+            self.gauge_add("deckbuilder_mcp_tool_in_progress", 1, "MCP tool calls currently running", tool=tool)
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await fn(*args, **kwargs)
+                outcome = "error" if is_error_result(result) else "success"
+                return result
+            finally:
+                self.observe("deckbuilder_mcp_tool_duration_seconds", time.perf_counter() - start, "MCP tool call latency", tool=tool)
+                self.inc("deckbuilder_mcp_tool_calls_total", 1, "MCP tool calls by outcome", tool=tool, outcome=outcome)
+                self.gauge_add("deckbuilder_mcp_tool_in_progress", -1, tool=tool)
+
+        return wrapper
+
+    def record_build(self, slides: int, timings: Dict[str, float]) -> None:
+        """Record a completed presentation build with its stage timings."""
+        if not self.enabled:
+            return
+        self.inc("deckbuilder_builds_total", 1, "Presentations built")
+        self.inc("deckbuilder_slides_total", slides, "Slides generated")
+        for stage, seconds in timings.items():
+            self.observe("deckbuilder_build_stage_seconds", seconds, "Build time per stage", stage=stage)
+
+    def _collect(self) -> List[CollectedMetric]:
+        collected = []
+        for collector in self._collectors:
+            try:
+                collected.extend(collector())
+            except Exception:  # nosec B112 - a failing collector must not break the scrape
+                continue
+        return collected
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            if help_text:
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            for name, series in sorted(self._counters.items()) + sorted(self._gauges.items()):
+                header(name, *self._meta[name])
+                lines.extend(f"{name}{_format_labels(key)} {value:g}" for key, value in sorted(series.items()))
+            for name, series in sorted(self._histograms.items()):
+                header(name, *self._meta[name])
+                for key, histogram in sorted(series.items()):
+                    for bound, count in histogram.cumulative():
+                        lines.append(f"{name}_bucket{_format_labels(key + (('le', bound),))} {count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {histogram.sum:g}")
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+
+        header("deckbuilder_uptime_seconds", "gauge", "Seconds since the metrics registry started")
+        lines.append(f"deckbuilder_uptime_seconds {time.time() - self.started:g}")
+        for name, kind, help_text, samples in self._collect():
+            header(name, kind, help_text)
+            lines.extend(f"{name}{_format_labels(_labels(labels))} {value:g}" for labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Summarise metrics as JSON-friendly data for the diagnostics tool.
+
+        Returns:
+            Per-tool call counts and latency, build/slide totals and rates per second since start
+        """
+        uptime = max(time.time() - self.started, 1e-9)
+        with self._lock:
+            tools: Dict[str, Dict[str, Any]] = {}
+            for key, histogram in self._histograms.get("deckbuilder_mcp_tool_duration_seconds", {}).items():
+                tool = dict(key)["tool"]
+                tools[tool] = {"calls": histogram.count, "mean_seconds": histogram.sum / histogram.count if histogram.count else 0.0, "errors": 0}
+            for key, value in self._counters.get("deckbuilder_mcp_tool_calls_total", {}).items():
+                labels = dict(key)
+                if labels["outcome"] == "error" and labels["tool"] in tools:
+                    tools[labels["tool"]]["errors"] = int(value)
+            builds = sum(self._counters.get("deckbuilder_builds_total", {}).values())
+            slides = sum(self._counters.get("deckbuilder_slides_total", {}).values())
+
+        return {
+            "enabled": self.enabled,
+            "uptime_seconds": uptime,
+            "tools": tools,
+            "builds": int(builds),
+            "slides": int(slides),
+            "builds_per_second": builds / uptime,
+            "slides_per_second": slides / uptime,
+        }
+
+    def start_http_server(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Serve GET /metrics on a local port from a daemon thread.
+
+        Args:
+            port: Port to listen on (0 picks a free port)
+            host: Interface to bind (default: loopback only)
+
+        Returns:
+            The running server (its server_address holds the bound port)
+        """
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Keep scrapes out of the MCP server's stderr
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=self._server.serve_forever, name="deckbuilder-metrics", daemon=True).start()
+        return self._server
+
+    def stop_http_server(self) -> None:
+        """Stop the /metrics server if running."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -2,12 +2,11 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Dict, Optional
-
-from pptx import Presentation
+from typing import Dict
 
 # Add the parent directory to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from deckbuilder.templates.template_analysis import load_template_analysis  # noqa: E402
 from deckbuilder.utils.path import path_manager  # noqa: E402
 
 
@@ -42,14 +41,15 @@ class TemplateAnalyzer:
             raise FileNotFoundError(f"Template file not found: {template_path}")
 
         try:
-            prs = Presentation(template_path)
+            # Shared analysis is read from the template's sidecar unless the template changed
+            analysis = load_template_analysis(template_path)
 
             # Extract basic template info
             base_name = os.path.splitext(template_name)[0]
             template_info = {"name": base_name.replace("_", " ").title(), "version": "1.0"}
 
             # Extract raw layout data
-            layouts = self._extract_layouts(prs)
+            layouts = self._extract_layouts(analysis)
 
             # Validate template and generate warnings
             validation_results = self._validate_template(layouts)
@@ -74,65 +74,26 @@ class TemplateAnalyzer:
         except Exception as e:
             raise RuntimeError(f"Error analyzing template: {str(e)}")
 
-    def _extract_layouts(self, presentation: Presentation) -> Dict:
-        """Extract raw layout data from all slide layouts."""
+    def _extract_layouts(self, analysis: Dict) -> Dict:
+        """Build the raw layout mapping (placeholder idx -> name) from a shared template analysis."""
         layouts = {}
 
-        for idx, layout in enumerate(presentation.slide_layouts):
-            layout_info = self._extract_single_layout(layout, idx)
-            if layout_info:
-                # Use actual PowerPoint layout name
-                layout_name = f"layout_{idx}"  # fallback
-                try:
-                    if hasattr(layout, "name") and layout.name:
-                        layout_name = layout.name
-                except Exception:  # nosec B110
-                    # Layout name unavailable, keep fallback name
-                    pass
-
-                layouts[layout_name] = layout_info
-
-        return layouts
-
-    def _extract_single_layout(self, layout, index: int) -> Optional[Dict]:
-        """
-        Extract raw placeholder data from a single slide layout.
-
-        Args:
-            layout: PowerPoint slide layout object
-            index: Layout index in the template
-
-        Returns:
-            Dictionary with raw layout information
-        """
-        try:
+        for layout_name, layout_info in analysis["layouts"].items():
             placeholders = {}
-
-            # Extract each placeholder's index and available properties
-            for shape in layout.placeholders:
-                placeholder_idx = shape.placeholder_format.idx
-
-                # Try to get more information about the placeholder
-                placeholder_info = f"placeholder_{placeholder_idx}"
-
-                # Check if placeholder has a name or type information
-                try:
-                    if hasattr(shape, "name") and shape.name:
-                        placeholder_info = shape.name
-                    elif hasattr(shape.placeholder_format, "type"):
-                        placeholder_type = shape.placeholder_format.type
-                        placeholder_info = f"type_{placeholder_type}"
-                except Exception:  # nosec B110
-                    # Shape properties unavailable, keep default name
-                    pass
-
+            for placeholder in layout_info["placeholders"]:
+                placeholder_idx = placeholder["idx"]
+                # Prefer the shape name, falling back to the placeholder type
+                if placeholder["name"]:
+                    placeholder_info = placeholder["name"]
+                elif placeholder["type"]:
+                    placeholder_info = f"type_{placeholder['type']}"
+                else:
+                    placeholder_info = f"placeholder_{placeholder_idx}"
                 placeholders[str(placeholder_idx)] = placeholder_info
 
-            return {"index": index, "placeholders": placeholders}
+            layouts[layout_name] = {"index": layout_info["index"], "placeholders": placeholders}
 
-        except Exception as e:
-            print(f"Warning: Could not analyze layout {index}: {str(e)}")
-            return None
+        return layouts
 
     def _generate_aliases_template(self) -> Dict:
         """Generate basic aliases template for user configuration."""
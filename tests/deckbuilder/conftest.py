@@ -9,6 +9,7 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+from deckbuilder.utils.path import PathManager
 
 # Import deckbuilder components
 try:
@@ -26,6 +27,9 @@ except ImportError:
     LayoutIntelligence = None
     StructuredFrontmatterRegistry = None
 
+# Templates shipped with deckbuilder
+TEMPLATE_FOLDER = Path(__file__).parent.parent.parent / "src" / "deckbuilder" / "assets" / "templates"
+
 
 @pytest.fixture
 def deckbuilder_temp_dir():
@@ -35,6 +39,28 @@ def deckbuilder_temp_dir():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.fixture
+def template_folder():
+    """Folder of the templates shipped with deckbuilder."""
+    return TEMPLATE_FOLDER
+
+
+@pytest.fixture
+def make_path_manager(template_folder):
+    """Factory for library PathManagers using the shipped templates and writing to a given folder."""
+
+    def make(output_folder):
+        return PathManager(context="library", template_folder=str(template_folder), output_folder=str(output_folder))
+
+    return make
+
+
+@pytest.fixture
+def path_manager(make_path_manager, tmp_path):
+    """Library PathManager using the shipped templates and writing to tmp_path."""
+    return make_path_manager(tmp_path)
+
+
 @pytest.fixture
 def mock_deckbuilder_env(deckbuilder_temp_dir):
     """Mock environment variables for deckbuilder."""
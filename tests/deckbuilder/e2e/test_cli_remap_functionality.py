@@ -104,7 +104,26 @@ class TestCLIRemapFunctionality:
         )
 
         assert result.returncode == 2
-        assert "Invalid value for 'INPUT_FILE': File 'nonexistent.pptx' does not exist." in result.stderr
+        assert "Invalid value for 'INPUT_FILE': Path 'nonexistent.pptx' does not exist." in result.stderr
+
+    def test_remap_directory_without_recursive_error(self):
+        """Test that a directory is only remapped with --recursive."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = subprocess.run(
+                [
+                    "python",
+                    str(Path(__file__).parent.parent.parent.parent / "src" / "deckbuilder" / "cli.py"),
+                    "remap",
+                    temp_dir,
+                    "--language",
+                    "en-US",
+                ],
+                capture_output=True,
+                text=True,
+            )
+
+        assert result.returncode == 1
+        assert f"{temp_dir} is a directory. Use --recursive" in result.stderr
 
     def test_remap_invalid_file_format_error(self):
         """Test error handling for non-PowerPoint files."""
@@ -0,0 +1,102 @@
+"""
+Unit tests for the asyncio AsyncDeckbuilder facade.
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+from PIL import Image
+from pptx import Presentation
+from deckbuilder.core.async_engine import AsyncDeckbuilder
+
+
+@pytest.fixture
+def photo(tmp_path):
+    path = tmp_path / "photo.png"
+    Image.new("RGB", (1200, 800), "red").save(path)
+    return str(path)
+
+
+def text_deck(index: int) -> dict:
+    return {"slides": [{"layout": "Title Slide", "placeholders": {"title_top": f"Deck {index}"}}] * (index % 3 + 1)}
+
+
+class TestImagePreparation:
+    def test_jobs_use_placeholder_size_and_build_context(self, path_manager, photo):
+        deck = AsyncDeckbuilder(path_manager)
+        data = {
+            "slides": [
+                {"layout": "Title Slide", "placeholders": {"title_top": "No images"}},
+                {"layout": "Picture with Caption", "placeholders": {"title": "Photo", "image": photo}},
+                {"layout": "Title and Content", "placeholders": {"title": "Background"}, "background_image": photo},
+            ]
+        }
+
+        jobs = deck.collect_image_jobs(data)
+        deck.close()
+
+        assert [(value, context["slide_index"], context["field_name"]) for value, _, context in jobs] == [(photo, 1, "image"), (photo, 2, "background_image")]
+        assert jobs[0][1] == (648, 511)
+        assert jobs[1][1] == (1280, 720)
+
+    async def test_build_reuses_prepared_images(self, path_manager, photo):
+        data = {
+            "slides": [
+                {"layout": "Picture with Caption", "placeholders": {"title": "Photo", "image": photo}},
+                {"layout": "Picture with Caption", "placeholders": {"title": "Missing", "image": "missing.png"}},
+            ]
+        }
+
+        async with AsyncDeckbuilder(path_manager) as deck:
+            stats = await deck.prepare_images(data)
+            prepared = sorted(os.listdir(deck.image_handler.cache_dir))
+            await deck.create_presentation(data, fileName="images")
+
+            # Every image the build placed was already in the cache
+            assert sorted(os.listdir(deck.image_handler.cache_dir)) == prepared
+
+        assert stats["requested"] == 2
+        assert stats["failed"] == 0
+
+
+class TestAsyncBuilds:
+    async def test_concurrent_builds_share_one_loop(self, path_manager, tmp_path):
+        async with AsyncDeckbuilder(path_manager, max_builds=2) as deck:
+            results = await asyncio.gather(*(deck.create_presentation(text_deck(index), fileName=f"deck_{index}") for index in range(6)))
+
+        for index, result in enumerate(results):
+            assert f"with {index % 3 + 1} slides" in result
+            output = next(tmp_path.glob(f"deck_{index}.*.g.pptx"))
+            assert len(Presentation(str(output)).slides) == index % 3 + 1
+        assert deck.pool.stats()["engines"] <= 2
+
+    async def test_from_files(self, path_manager, tmp_path):
+        json_file = tmp_path / "deck.json"
+        json_file.write_text(json.dumps(text_deck(1)), encoding="utf-8")
+        markdown_file = tmp_path / "deck.md"
+        markdown_file.write_text("---\nlayout: Title Slide\ntitle_top: From markdown\n---\n", encoding="utf-8")
+
+        async with AsyncDeckbuilder(path_manager) as deck:
+            from_json, from_markdown, unsupported = await asyncio.gather(
+                deck.create_presentation_from_file(str(json_file), fileName="from_json"),
+                deck.create_presentation_from_file(str(markdown_file), fileName="from_md"),
+                deck.create_presentation_from_file(str(tmp_path / "deck.txt")),
+            )
+
+        assert from_json.success and from_json.slide_count == 2
+        assert from_markdown.success and from_markdown.slide_count == 1
+        assert not unsupported.success
+
+    async def test_invalid_data_is_reported(self, path_manager, tmp_path):
+        json_file = tmp_path / "empty.json"
+        json_file.write_text(json.dumps({"slides": []}), encoding="utf-8")
+
+        async with AsyncDeckbuilder(path_manager) as deck:
+            result = await deck.create_presentation_from_file(str(json_file))
+            with pytest.raises(ValueError):
+                await deck.create_presentation({"slides": []})
+
+        assert not result.success
+        assert result.error_details["error_type"] == "validation"
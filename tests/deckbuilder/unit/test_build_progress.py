@@ -0,0 +1,51 @@
+"""
+Unit tests for build progress reporting.
+"""
+
+import pytest
+from deckbuilder.core.engine import Deckbuilder
+from deckbuilder.utils.progress import STAGE_COMPLETE, STAGE_SAVE, STAGE_SLIDE, STAGE_START, BuildProgress, ProgressEvent
+
+DECK = {
+    "slides": [
+        {"layout": "Title Slide", "placeholders": {"title": "Quarterly Review", "subtitle": "Q3"}},
+        {"layout": "Title and Content", "placeholders": {"title": "Highlights"}, "content": [{"type": "bullets", "items": [{"level": 1, "text": "Revenue up"}]}]},
+        {"layout": "Section Header", "placeholders": {"title": "Next Steps"}},
+    ]
+}
+
+
+@pytest.fixture
+def engine(path_manager):
+    Deckbuilder.reset()
+    yield Deckbuilder(path_manager_instance=path_manager)
+    Deckbuilder.reset()
+
+
+class TestBuildProgress:
+    def test_slide_created_message(self):
+        events = []
+        tracker = BuildProgress(events.append, 4)
+
+        tracker.slide_created(2, "Title Slide")
+
+        assert events == [ProgressEvent(STAGE_SLIDE, 2, 4, "Slide 2/4: Title Slide")]
+
+
+class TestEngineProgress:
+    def test_events_per_slide_and_timings(self, engine):
+        events = []
+
+        result = engine.create_presentation(DECK, "progress_test", progress=events.append)
+
+        assert "Successfully created presentation with 3 slides" in result
+        assert [event.stage for event in events] == [STAGE_START, STAGE_SLIDE, STAGE_SLIDE, STAGE_SLIDE, STAGE_SAVE, STAGE_COMPLETE]
+        slide_events = [event for event in events if event.stage == STAGE_SLIDE]
+        assert [(event.current, event.total) for event in slide_events] == [(1, 3), (2, 3), (3, 3)]
+        assert slide_events[0].message == "Slide 1/3: Title Slide"
+        assert set(events[-1].timings) >= {"slide_generation", "save"}
+
+    def test_no_callback_builds_normally(self, engine):
+        result = engine.create_presentation(DECK, "no_progress_test")
+
+        assert "Successfully created presentation with 3 slides" in result
@@ -0,0 +1,109 @@
+"""
+Unit tests for compiled deck schema validation (deck_schema).
+"""
+
+import json
+
+import pytest
+from deckbuilder.core.deck_schema import DeckCheck, DeckSchema, clear_schema_cache, compiled_schema, schema_cache_stats
+from deckbuilder.core.engine import create_engine
+
+PATTERNS = {
+    "Title Only": {"yaml_pattern": {"layout": "Title Only", "title_top": "str"}, "validation": {"required_fields": ["title_top"]}},
+    "Big Number": {"yaml_pattern": {"layout": "Big Number", "title_top": "str", "number": "int"}, "validation": {"required_fields": []}},
+}
+
+
+@pytest.fixture
+def engine(path_manager):
+    return create_engine(path_manager)
+
+
+class TestDeckSchema:
+    def test_collects_every_problem_in_one_pass(self):
+        slides = [
+            {"layout": "Title Only", "placeholders": {"title_top": "Fine"}},
+            "not a slide",
+            {"placeholders": {}},
+            {"layout": "Missing Layout"},
+            {"layout": "Title Only", "placeholders": {"title": "Typo"}},
+            {"layout": "Big Number", "placeholders": {"number": "many"}, "content": "text"},
+        ]
+
+        check = DeckSchema(PATTERNS).check_deck(slides, DeckCheck())
+
+        assert check.slides == 6
+        assert check.errors == [
+            "Slide 2 must be a dictionary.",
+            "Slide 3 must have a 'layout' field.",
+            "Slide 4: No pattern found for layout 'Missing Layout'. Available layouts: Big Number, Title Only",
+            "Slide 6 'content' must be an array.",
+            "Slide 6 (Big Number): field 'number' must be an integer, got str",
+        ]
+        assert check.warnings == [
+            "Slide 5 (Title Only): 'Title Only' requires field 'title_top'",
+            "Slide 5 (Title Only): 'Title Only' has no field 'title' (it will be ignored); fields: title_top",
+        ]
+        with pytest.raises(ValueError, match=r"^5 errors in slides:\n  - Slide 2 must be a dictionary"):
+            check.raise_for_errors()
+
+    def test_fields_without_placeholders_and_strict_mode(self, monkeypatch):
+        slide = {"layout": "Title Only", "title": "Top-level fields are read too", "speaker_notes": "x"}
+
+        assert DeckSchema(PATTERNS).check_deck([slide], DeckCheck()).warnings == ["Slide 1 (Title Only): 'Title Only' requires field 'title_top'"]
+
+        monkeypatch.setenv("DECK_SCHEMA_STRICT", "1")
+        check = DeckSchema(PATTERNS).check_deck([slide])
+        assert check.errors == ["Slide 1 (Title Only): 'Title Only' requires field 'title_top'"] and not check.warnings
+
+    def test_compiled_schema_is_cached_per_pattern_set(self, tmp_path):
+        clear_schema_cache()
+        before = schema_cache_stats.stats()
+
+        first = compiled_schema(tmp_path)
+        assert compiled_schema(tmp_path) is first
+        assert "Title and Content" in first.layouts
+
+        patterns = tmp_path / "patterns"
+        patterns.mkdir()
+        pattern = {
+            "description": "A user layout added to the template folder",
+            "yaml_pattern": {"layout": "Custom Layout", "title_top": "str"},
+            "validation": {"required_fields": ["title_top"]},
+            "example": "---\nlayout: Custom Layout\ntitle_top: Hello\n---",
+        }
+        (patterns / "custom.json").write_text(json.dumps(pattern), encoding="utf-8")
+
+        assert "Custom Layout" in compiled_schema(tmp_path).layouts
+        after = schema_cache_stats.stats()
+        assert (after["hits"] - before["hits"], after["misses"] - before["misses"]) == (1, 2)
+
+
+class TestEngineSchemaCheck:
+    def test_all_errors_raised_before_any_slide_is_built(self, engine, template_folder, tmp_path):
+        engine.presentation_builder.add_slide = None  # any build attempt would fail
+        slides = [{"layout": "Title Slide", "placeholders": {"title_top": "Hi"}}, {"layout": "Nope"}, {"layout": "Title Only", "content": "x"}]
+
+        with pytest.raises(ValueError) as error:
+            engine.create_presentation({"slides": slides}, fileName="broken")
+
+        assert str(error.value).splitlines()[1:] == [
+            "  - Slide 2: No pattern found for layout 'Nope'. Available layouts: " + ", ".join(sorted(compiled_schema(template_folder).layouts)),
+            "  - Slide 3 'content' must be an array.",
+        ]
+        assert not list(tmp_path.glob("broken.*"))
+
+    def test_warnings_are_reported_and_kept(self, engine, capsys):
+        engine.create_presentation({"slides": [{"layout": "Title Only", "placeholders": {"title_top": "Hi", "subtitle": "Dropped"}}]}, fileName="warned")
+
+        assert engine.last_schema_check["warnings"] == ["Slide 1 (Title Only): 'Title Only' has no field 'subtitle' (it will be ignored); fields: title_top"]
+        assert "1 slide field issues found" in capsys.readouterr().err
+
+    def test_json_file_errors_are_collected_before_streaming(self, engine, tmp_path):
+        path = tmp_path / "deck.json"
+        path.write_text(json.dumps({"slides": [{"layout": "Title Only"}, {"layout": "Nope"}, {"layout": "Also Nope"}]}), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="^2 errors in slides"):
+            engine.create_presentation_from_json_file(str(path), fileName="streamed")
+
+        assert not list(tmp_path.glob("streamed.*"))
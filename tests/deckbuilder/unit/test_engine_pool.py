@@ -0,0 +1,122 @@
+"""
+Unit tests for the engine pool and concurrent builds.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pptx import Presentation
+from deckbuilder.core.engine import Deckbuilder, create_engine
+from deckbuilder.core.engine_pool import EnginePool
+
+BUILDS = 12
+
+
+def deck_for(index: int) -> dict:
+    """A small deck whose slide count and titles identify the build."""
+    slides = [{"layout": "Title Slide", "placeholders": {"title_top": f"Deck {index}", "subtitle": "Concurrency"}}]
+    for n in range(index % 3 + 1):
+        slides.append({"layout": "Title and Content", "placeholders": {"title": f"Deck {index} slide {n}"}, "content": [{"type": "bullets", "items": [{"level": 1, "text": f"Item {n}"}]}]})
+    return {"slides": slides}
+
+
+class TestCreateEngine:
+    def test_engines_are_independent_of_singleton(self, path_manager):
+        first = create_engine(path_manager)
+        second = create_engine(path_manager)
+
+        assert first is not second
+        assert first is not Deckbuilder(path_manager_instance=path_manager)
+        assert first.presentation_builder is not second.presentation_builder
+        Deckbuilder.reset()
+
+
+class TestEnginePool:
+    def test_engines_are_reused(self, path_manager):
+        pool = EnginePool(path_manager, max_engines=2)
+
+        with pool.session() as first:
+            pass
+        with pool.session() as second:
+            pass
+
+        assert first is second
+        assert pool.stats()["engines"] == 1
+        assert pool.stats()["checkouts"] == 2
+
+    def test_concurrent_sessions_get_distinct_engines(self, path_manager):
+        pool = EnginePool(path_manager, max_engines=2)
+
+        with pool.session() as first, pool.session() as second:
+            assert first is not second
+            assert pool.stats()["in_use"] == 2
+
+        assert pool.stats()["idle"] == 2
+
+    def test_timeout_when_exhausted(self, path_manager):
+        pool = EnginePool(path_manager, max_engines=1)
+
+        with pool.session():
+            with pytest.raises(TimeoutError):
+                with pool.session(timeout=0.01):
+                    pass
+
+        assert pool.stats()["waits"] == 1
+
+    def test_engine_returned_after_failed_build(self, path_manager):
+        pool = EnginePool(path_manager, max_engines=1)
+
+        with pytest.raises(ValueError):
+            pool.create_presentation({"slides": []}, fileName="empty")
+
+        assert pool.stats()["in_use"] == 0
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            EnginePool(max_engines=0)
+
+
+class TestConcurrentBuilds:
+    def test_parallel_builds_are_isolated(self, path_manager, tmp_path):
+        pool = EnginePool(path_manager, max_engines=4)
+        start = threading.Barrier(4)
+
+        def build(index):
+            if index < 4:
+                start.wait(timeout=10)
+            return pool.create_presentation(deck_for(index), fileName=f"deck_{index}")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(build, range(BUILDS)))
+
+        for index, result in enumerate(results):
+            expected_slides = len(deck_for(index)["slides"])
+            assert f"with {expected_slides} slides" in result
+            output = next(tmp_path.glob(f"deck_{index}.*.g.pptx"))
+            prs = Presentation(str(output))
+            assert len(prs.slides) == expected_slides
+            assert prs.slides[0].shapes[0].text_frame.text == f"Deck {index}"
+
+        stats = pool.stats()
+        assert stats["engines"] <= 4
+        assert stats["checkouts"] == BUILDS
+        assert stats["in_use"] == 0
+
+    def test_parallel_builds_with_one_name_keep_every_output(self, path_manager, tmp_path):
+        pool = EnginePool(path_manager, max_engines=4)
+        start = threading.Barrier(4)
+
+        def build(index):
+            start.wait(timeout=10)
+            return pool.create_presentation(deck_for(index), fileName="Sample_Presentation")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(build, range(4)))
+
+        names = [result.rsplit(" ", 1)[1] for result in results]
+        assert len(set(names)) == 4
+        for index, name in enumerate(names):
+            prs = Presentation(str(tmp_path / name))
+            assert len(prs.slides) == len(deck_for(index)["slides"])
+            assert prs.slides[0].shapes[0].text_frame.text == f"Deck {index}"
@@ -0,0 +1,59 @@
+"""
+Unit tests for PlaceKitten fallback cache warming.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from deckbuilder.image.fallback_warmer import FallbackWarmer
+from deckbuilder.image.image_handler import ImageHandler
+from deckbuilder.image.placekitten_integration import PlaceKittenIntegration
+
+TEMPLATE_PATH = Path(__file__).parent.parent.parent.parent / "src" / "deckbuilder" / "assets" / "templates" / "default.pptx"
+
+
+@pytest.fixture
+def placekitten(tmp_path):
+    integration = PlaceKittenIntegration(ImageHandler(str(tmp_path / "image_cache")))
+    if not integration.is_available():
+        pytest.skip("PlaceKitten library not available")
+    return integration
+
+
+class TestFallbackWarmer:
+    def test_collect_dimensions_includes_pictures_and_slide(self, placekitten):
+        dimensions = FallbackWarmer(placekitten).collect_dimensions(str(TEMPLATE_PATH))
+
+        # Full slide size for backgrounds (13.333in x 7.5in at 96 DPI)
+        assert (1280, 720) in dimensions
+        # "Picture with Caption" image placeholder
+        assert (648, 511) in dimensions
+        assert dimensions == sorted(set(dimensions))
+
+    def test_cache_key_is_independent_of_context_details(self, placekitten):
+        context = {"layout": "Picture with Caption", "slide_index": 3, "field_name": "image"}
+        image_id = placekitten._select_image_id(context)
+
+        assert placekitten._generate_fallback_cache_key((200, 100), context) == placekitten._build_cache_key((200, 100), image_id)
+
+    def test_variety_ids_cover_selector_range(self, placekitten):
+        image_ids = placekitten.get_variety_image_ids()
+        for slide_index in range(1, 20):
+            assert placekitten._select_image_id({"slide_index": slide_index, "layout": "Picture with Caption"}) in image_ids
+
+    def test_warm_cache_makes_builds_hit_cache(self, placekitten):
+        stats = placekitten.warm_cache([(64, 36)], max_workers=2)
+
+        assert stats["failed"] == 0
+        assert stats["rendered"] == len(placekitten.get_variety_image_ids())
+
+        # Second warm-up finds everything cached
+        again = placekitten.warm_cache([(64, 36)])
+        assert again["rendered"] == 0
+        assert again["cached"] == stats["rendered"]
+
+        context = {"layout": "Picture with Caption", "slide_index": 2, "field_name": "image"}
+        assert placekitten.get_fallback_info((64, 36), context)["cached"] is True
+        # No partially written temp files left behind
+        assert not list(placekitten.image_handler.cache_dir.glob(".*.jpg"))
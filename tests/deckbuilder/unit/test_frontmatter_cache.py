@@ -0,0 +1,74 @@
+"""
+Unit tests for memoized frontmatter parsing and the build profile.
+"""
+
+import pytest
+import yaml
+
+from deckbuilder.content.processor import YAML_SAFE_LOADER, ContentProcessor, FrontmatterCache, frontmatter_cache
+from deckbuilder.utils.build_profile import BuildProfile
+
+
+class TestFrontmatterCache:
+    def test_uses_c_loader_when_available(self):
+        if yaml.__with_libyaml__:
+            assert YAML_SAFE_LOADER is yaml.CSafeLoader
+        else:
+            assert YAML_SAFE_LOADER is yaml.SafeLoader
+
+    def test_hits_return_independent_copies(self):
+        cache = FrontmatterCache()
+        first, first_hit = cache.load("layout: Title Slide\nitems: [a, b]")
+        first["items"].append("mutated")
+
+        second, second_hit = cache.load("layout: Title Slide\nitems: [a, b]")
+
+        assert (first_hit, second_hit) == (False, True)
+        assert second == {"layout": "Title Slide", "items": ["a", "b"]}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_cache_is_bounded(self):
+        cache = FrontmatterCache(maxsize=2)
+        for text in ("a: 1", "b: 2", "a: 1", "c: 3"):
+            cache.load(text)
+
+        # "b" was least recently used when "c" arrived
+        assert cache.load("a: 1")[1] is True
+        assert cache.load("b: 2")[1] is False
+
+    def test_invalid_yaml_is_not_cached(self):
+        cache = FrontmatterCache()
+        for _ in range(2):
+            with pytest.raises(yaml.YAMLError):
+                cache.load("key: [unclosed")
+        assert cache.hits == 0
+
+
+class TestContentProcessorProfile:
+    def test_repeated_frontmatter_is_parsed_once(self):
+        frontmatter_cache.clear()
+        slide = "---\nlayout: Title and Content\ntitle: Repeated\n---\n- point\n"
+        processor = ContentProcessor()
+
+        slides = processor.parse_markdown_with_frontmatter(slide * 3)
+        slides[0]["title"] = "Changed"
+
+        assert [s["title"] for s in slides[1:]] == ["Repeated", "Repeated"]
+        assert processor.profile.counters == {"frontmatter_cache_misses": 1, "frontmatter_cache_hits": 2}
+        assert processor.profile.timings["frontmatter_parse"] >= 0
+
+
+class TestBuildProfile:
+    def test_stage_and_merge_accumulate(self):
+        profile = BuildProfile()
+        with profile.stage("save"):
+            pass
+        other = BuildProfile()
+        other.add_time("save", 0.5)
+        other.count("slides", 3)
+
+        profile.merge(other)
+
+        assert profile.timings["save"] >= 0.5
+        assert profile.to_dict()["counters"] == {"slides": 3}
+        assert profile.format_lines()[-1] == "slides: 3"
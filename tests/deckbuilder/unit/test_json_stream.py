@@ -0,0 +1,126 @@
+"""
+Unit tests for streaming canonical JSON slides (json_stream) and streamed builds.
+"""
+
+import json
+
+import pytest
+from pptx import Presentation
+from deckbuilder.content.json_stream import SlideStream, SlideStreamError
+from deckbuilder.core.engine import create_engine
+from deckbuilder.utils.progress import STAGE_COMPLETE, STAGE_SLIDE
+
+DECK = {
+    "title": "Quarterly",
+    "slides": [
+        {"layout": "Title Slide", "placeholders": {"title": "Q3 été \\u review", "subtitle": "2026"}},
+        {"layout": "Title and Content", "placeholders": {"title": "Numbers"}, "content": [{"type": "paragraph", "text": "x" * 300}], "score": 12345.5e3},
+        {"layout": "Title Only", "placeholders": {"title": "End"}},
+    ],
+    "footer": {"text": "Confidential", "n": [1, 2, 3]},
+}
+
+
+def write(tmp_path, text, name="deck.json"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestSlideStream:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1024 * 1024])
+    def test_matches_json_load_for_any_chunk_size(self, tmp_path, chunk_size):
+        path = write(tmp_path, json.dumps(DECK, indent=2))
+
+        stream = SlideStream(path, chunk_size=chunk_size)
+
+        assert list(stream) == DECK["slides"]
+        assert stream.metadata == {"title": "Quarterly", "footer": DECK["footer"]}
+
+    def test_numbers_cut_by_any_chunk_boundary(self, tmp_path):
+        text = '{"meta": 663182, "slides": [{"layout": "X", "p": null}], "after": 12.5, "big": -1.25e+3, "end": 7}'
+        path = write(tmp_path, text)
+
+        for chunk_size in range(1, len(text) + 2):
+            stream = SlideStream(path, chunk_size=chunk_size)
+            assert list(stream) == [{"layout": "X", "p": None}], chunk_size
+            assert stream.metadata == {"meta": 663182, "after": 12.5, "big": -1250.0, "end": 7}, chunk_size
+
+    def test_bare_array_and_bare_slide(self, tmp_path):
+        array = write(tmp_path, json.dumps(DECK["slides"]), "array.json")
+        single = write(tmp_path, json.dumps(DECK["slides"][0]), "single.json")
+
+        assert list(SlideStream(array, chunk_size=5)) == DECK["slides"]
+        assert list(SlideStream(single, allow_bare_slide=True)) == [DECK["slides"][0]]
+        with pytest.raises(ValueError, match="'slides' array at root level"):
+            list(SlideStream(single))
+
+    def test_slides_must_be_array(self, tmp_path):
+        path = write(tmp_path, '{"slides": {"layout": "Title Slide"}}')
+
+        with pytest.raises(ValueError, match="'slides' must be an array"):
+            list(SlideStream(path))
+
+    def test_syntax_error_names_slide_and_line(self, tmp_path):
+        lines = json.dumps(DECK, indent=2).splitlines()
+        broken = next(i for i, line in enumerate(lines) if '"Numbers"' in line)
+        lines[broken] = lines[broken].replace('"Numbers"', "Numbers")
+        path = write(tmp_path, "\n".join(lines))
+
+        with pytest.raises(SlideStreamError) as error:
+            list(SlideStream(path, chunk_size=16))
+
+        assert error.value.slide_index == 1
+        assert error.value.lineno == broken + 1
+        assert str(error.value).startswith("Slide 2: Expecting value")
+
+    def test_truncated_file_and_trailing_data(self, tmp_path):
+        truncated = write(tmp_path, json.dumps(DECK)[:-40], "truncated.json")
+        trailing = write(tmp_path, json.dumps(DECK) + " {}", "trailing.json")
+
+        with pytest.raises(json.JSONDecodeError):
+            list(SlideStream(truncated, chunk_size=32))
+        with pytest.raises(json.JSONDecodeError, match="Extra data"):
+            list(SlideStream(trailing))
+
+    def test_slides_are_read_lazily(self, tmp_path):
+        path = write(tmp_path, '{"slides": [{"layout": "Title Slide"}, {"layout": oops}]}')
+
+        slides = iter(SlideStream(path, chunk_size=8))
+
+        assert next(slides) == {"layout": "Title Slide"}
+        with pytest.raises(SlideStreamError, match="Slide 2"):
+            next(slides)
+
+
+class TestStreamedBuild:
+    @pytest.fixture
+    def engine(self, path_manager):
+        return create_engine(path_manager)
+
+    def test_builds_same_slides_as_create_presentation(self, engine, tmp_path):
+        path = write(tmp_path, json.dumps(DECK))
+        events = []
+
+        result = engine.create_presentation_from_json_file(str(path), fileName="streamed", progress=events.append)
+
+        prs = Presentation(next(tmp_path.glob("streamed.*.g.pptx")))
+        assert "3 slides" in result
+        assert [slide.slide_layout.name for slide in prs.slides] == ["Title Slide", "Title and Content", "Title Only"]
+        assert [event.message for event in events if event.stage == STAGE_SLIDE][0] == "Slide 1: Title Slide"
+        assert events[-1].stage == STAGE_COMPLETE and events[-1].total == 3
+
+    def test_invalid_slide_is_reported_by_index_and_nothing_is_saved(self, engine, tmp_path):
+        deck = {"slides": [{"layout": "Title Slide"}, {"placeholders": {}}]}
+        path = write(tmp_path, json.dumps(deck))
+
+        with pytest.raises(ValueError, match="Slide 2 must have a 'layout' field"):
+            engine.create_presentation_from_json_file(str(path), fileName="bad")
+
+        assert not list(tmp_path.glob("bad.*.pptx"))
+
+    def test_empty_slides(self, engine, tmp_path):
+        path = write(tmp_path, '{"slides": []}')
+
+        with pytest.raises(ValueError, match="At least one slide"):
+            engine.create_presentation_from_json_file(str(path))
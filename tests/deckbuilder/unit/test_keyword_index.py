@@ -0,0 +1,59 @@
+"""
+Unit tests for the shared compiled keyword index used by the content heuristics.
+"""
+
+from deckbuilder.templates.layout_intelligence import LayoutIntelligence
+from deckbuilder.templates.recommendation_engine import DESCRIPTION_KEYWORDS
+from deckbuilder.utils.keyword_index import KeywordIndex
+
+
+class TestKeywordIndex:
+    def test_substring_mode_matches_inside_words(self):
+        index = KeywordIndex({"comparison": ["vs", "versus"], "image": ["photo"]})
+
+        hits = index.scan("notes for devs with photographs")
+
+        assert hits.keywords == {"vs", "photo"}
+        assert hits.has("comparison") and hits.has("image")
+
+    def test_whole_word_mode_matches_word_boundaries(self):
+        index = KeywordIndex({"success": ["win", "win-win"], "compare": ["vs"]}, whole_words=True)
+
+        assert index.find("winning over devs") == frozenset()
+        assert index.find("a win-win, vs. last year") == {"win", "win-win", "vs"}
+
+    def test_first_follows_given_group_order(self):
+        index = KeywordIndex({"a": ["alpha"], "b": ["beta"], "c": ["gamma"]})
+        hits = index.scan("gamma then beta")
+
+        assert hits.first() == "b"
+        assert hits.first(["c", "b"]) == "c"
+        assert hits.first(["a"], default="none") == "none"
+
+    def test_shared_keywords_counted_per_group(self):
+        index = KeywordIndex({"executive": ["board", "executive"], "decision": ["board", "vote", "approve"]})
+        hits = index.scan("board approval")
+
+        assert hits.matched("decision") == ["board"]
+        assert (hits.count("executive"), hits.count("decision")) == (1, 1)
+
+    def test_repeated_scans_reuse_result(self):
+        index = KeywordIndex({"g": ["x"]})
+        text = "x marks the spot"
+
+        assert index.find(text) is index.find(text)
+
+
+class TestIndexedHeuristics:
+    def test_layout_intelligence_builds_intent_index_from_json(self):
+        intelligence = LayoutIntelligence()
+        intents = intelligence.intelligence_data["content_patterns"]["intent_recognition"]
+
+        assert list(intelligence.intent_keywords.groups) == list(intents)
+        assert intelligence._detect_content_type("notes for devs") == "comparison_content"
+
+    def test_description_vocabulary_preserves_branch_order(self):
+        hits = DESCRIPTION_KEYWORDS.scan("board review of training plan")
+
+        assert hits.first(["executive_presentation", "training"]) == "executive_presentation"
+        assert hits.has("decision_focused")
@@ -0,0 +1,57 @@
+"""
+Unit tests for batch layout recommendation with matrix scoring.
+"""
+
+import copy
+
+import pytest
+
+from deckbuilder.templates.layout_intelligence import LayoutIntelligence
+
+SLIDES = [
+    "# Our Platform vs Competition\n\n## Performance\nFast\n\n## Security\nStrong\n\n## Usability\nEasy\n\n## Cost\nLow",
+    "## Step 1\nPlan\n## Step 2\nBuild\n## Step 3\nShip",
+    "Revenue grew 25% with 1.5 million users, see the photo and image below",
+    "- first point\n- second point\n1. numbered",
+    "| a | b | c |\n| 1 | 2 | 3 |",
+    "",
+]
+
+
+@pytest.fixture
+def permissive_intelligence():
+    """Engine that returns every layout so full rankings can be compared."""
+    intelligence = LayoutIntelligence()
+    intelligence.intelligence_data = copy.deepcopy(intelligence.intelligence_data)
+    intelligence.intelligence_data["recommendation_engine"]["minimum_confidence"] = 0.0
+    return intelligence
+
+
+class TestRecommendLayoutsBatch:
+    def test_matches_single_slide_recommendations(self, permissive_intelligence):
+        batch = permissive_intelligence.recommend_layouts_batch(SLIDES, max_recommendations=5)
+
+        assert len(batch) == len(SLIDES)
+        for content, recommendations in zip(SLIDES, batch):
+            expected = permissive_intelligence.recommend_layouts(content, max_recommendations=5)
+            assert [r.layout_name for r in recommendations] == [r.layout_name for r in expected]
+            assert [r.confidence for r in recommendations] == pytest.approx([r.confidence for r in expected])
+            assert [r.reasoning for r in recommendations] == [r.reasoning for r in expected]
+
+    def test_minimum_confidence_and_limit_apply(self):
+        intelligence = LayoutIntelligence()
+        minimum = intelligence.intelligence_data["recommendation_engine"]["minimum_confidence"]
+
+        for recommendations in intelligence.recommend_layouts_batch(SLIDES, max_recommendations=2):
+            assert len(recommendations) <= 2
+            assert all(r.confidence >= minimum for r in recommendations)
+
+    def test_empty_batch(self):
+        assert LayoutIntelligence().recommend_layouts_batch([]) == []
+
+    def test_intelligence_file_parsed_once(self):
+        first = LayoutIntelligence()
+        second = LayoutIntelligence()
+
+        assert first.intelligence_data is second.intelligence_data
+        assert first._get_batch_scorer() is first._get_batch_scorer()
@@ -0,0 +1,122 @@
+"""
+Unit tests for mail-merge slide generation (repeat slide specs).
+"""
+
+import pytest
+from pptx import Presentation
+from deckbuilder.core.engine import create_engine
+from deckbuilder.core.mail_merge import check_fields, iter_records, substitute
+
+REGIONS = "region,revenue,owner\nNorth,125000,Ana\nSouth,98000,Ben\nEast,15000,Cy\n"
+
+
+@pytest.fixture
+def regions_csv(tmp_path):
+    path = tmp_path / "regions.csv"
+    path.write_text(REGIONS, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def build(path_manager, tmp_path):
+    def build(slides, name="merge"):
+        create_engine(path_manager).create_presentation({"slides": slides}, fileName=name)
+        return Presentation(next(tmp_path.glob(f"{name}.*.g.pptx")))
+
+    return build
+
+
+def texts(slide):
+    return [shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]
+
+
+def test_substitute():
+    assert substitute("{region}: {revenue}", {"region": "North", "revenue": 12}) == "North: 12"
+    assert substitute("{{literal}} { region } {missing}", {"region": "North", "missing": None}) == "{literal} North "
+
+
+class TestIterRecords:
+    def test_list_csv_tsv_and_jsonl(self, regions_csv, tmp_path):
+        tsv = tmp_path / "regions.tsv"
+        tsv.write_text("region\trevenue\nNorth\t1\n", encoding="utf-8")
+        jsonl = tmp_path / "regions.jsonl"
+        jsonl.write_text('{"region": "North", "revenue": 1}\n\n{"region": "South"}\n', encoding="utf-8")
+
+        assert list(iter_records([{"region": "North"}])) == [{"region": "North"}]
+        assert list(iter_records(regions_csv))[1] == {"region": "South", "revenue": "98000", "owner": "Ben"}
+        assert list(iter_records({"path": str(tsv)})) == [{"region": "North", "revenue": "1"}]
+        assert list(iter_records(str(jsonl))) == [{"region": "North", "revenue": 1}, {"region": "South"}]
+
+    def test_errors(self, tmp_path):
+        bad_line = tmp_path / "bad.jsonl"
+        bad_line.write_text('{"region": "North"}\n[1, 2]\n', encoding="utf-8")
+
+        with pytest.raises(ValueError, match="line 2"):
+            list(iter_records(str(bad_line)))
+        with pytest.raises(ValueError, match="cannot read"):
+            list(iter_records(str(tmp_path / "missing.csv")))
+        with pytest.raises(ValueError, match="unknown records format"):
+            list(iter_records({"path": str(bad_line), "format": "xml"}))
+        with pytest.raises(ValueError, match="record 2"):
+            list(iter_records([{"region": "North"}, "South"]))
+
+
+def test_check_fields_rejects_unknown_tokens():
+    spec = {"layout": "Title Only", "placeholders": {"title_top": "{region} {regoin}"}, "records": []}
+
+    with pytest.raises(ValueError, match="regoin"):
+        check_fields(spec, [{"region": "North"}])
+    check_fields({"placeholders": {"title_top": "{region} {owner}"}}, [{"region": "North"}, {"owner": "Ana"}])
+
+
+def test_build_one_slide_per_record(regions_csv, build):
+    prs = build(
+        [
+            {"layout": "Title Slide", "placeholders": {"title_top": "Regional Review"}},
+            {
+                "repeat": {
+                    "layout": "Title and Content",
+                    "placeholders": {"title_top": "{region} results", "content": "Revenue: **{revenue}** {{est.}}"},
+                    "speaker_notes": "Owner: {owner}",
+                    "records": regions_csv,
+                }
+            },
+            {"layout": "Title Only", "placeholders": {"title_top": "Questions"}},
+        ],
+    )
+
+    slides = list(prs.slides)
+    assert len(slides) == 5
+    assert [texts(slide) for slide in slides[1:4]] == [
+        ["North results", "Revenue: 125000 {est.}"],
+        ["South results", "Revenue: 98000 {est.}"],
+        ["East results", "Revenue: 15000 {est.}"],
+    ]
+    assert [slide.notes_slide.notes_text_frame.text for slide in slides[1:4]] == ["Owner: Ana", "Owner: Ben", "Owner: Cy"]
+    assert texts(slides[4]) == ["Questions"]
+    # Formatting of the built slide is kept on every stamped copy
+    assert all(slide.shapes[1].text_frame.paragraphs[0].runs[1].font.bold for slide in slides[1:4])
+    assert len({slide.slide_id for slide in slides}) == 5
+
+
+def test_stamped_slides_share_images(build, tmp_path):
+    from PIL import Image
+
+    image_path = tmp_path / "photo.png"
+    Image.new("RGB", (400, 300), "red").save(image_path)
+    prs = build(
+        [{"repeat": {"layout": "Picture with Caption", "placeholders": {"title_top": "{n}", "image": str(image_path)}, "records": [{"n": 1}, {"n": 2}]}}],
+    )
+
+    image_parts = [rel.target_part for slide in prs.slides for rel in slide.part.rels.values() if rel.reltype.endswith("/image")]
+    assert len(image_parts) == 2
+    assert image_parts[0] is image_parts[1]
+
+
+def test_invalid_repeat_specs(build):
+    with pytest.raises(ValueError, match="'repeat' must be an object"):
+        build([{"repeat": {"layout": "Title Only"}}])
+    with pytest.raises(ValueError, match="no records"):
+        build([{"repeat": {"layout": "Title Only", "records": []}}])
+    with pytest.raises(ValueError, match="unknown record field"):
+        build([{"repeat": {"layout": "Title Only", "placeholders": {"title_top": "{nmae}"}, "records": [{"name": "x"}]}}])
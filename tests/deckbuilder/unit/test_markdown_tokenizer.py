@@ -0,0 +1,67 @@
+"""
+Unit tests for the single-pass markdown line tokenizer used by ContentProcessor.
+"""
+
+from deckbuilder.content.processor import (
+    TOKEN_BULLET,
+    TOKEN_HEADING,
+    TOKEN_PARAGRAPH,
+    ContentProcessor,
+    tokenize_markdown_lines,
+)
+
+
+class TestTokenizeMarkdownLines:
+    def test_heading_levels_from_hash_count(self):
+        tokens = tokenize_markdown_lines(["# One", "### Three", "###### Six", "####### Seven", "#NoSpace"])
+
+        assert tokens == [
+            (TOKEN_HEADING, "One", 1),
+            (TOKEN_HEADING, "Three", 3),
+            (TOKEN_HEADING, "Six", 6),
+            (TOKEN_PARAGRAPH, "####### Seven", 0),
+            (TOKEN_PARAGRAPH, "#NoSpace", 0),
+        ]
+
+    def test_bullet_depth_is_not_capped(self):
+        tokens = tokenize_markdown_lines(["- top", " - still top", "  * second", "    - third", "        - fifth", "-dash"])
+
+        assert tokens == [
+            (TOKEN_BULLET, "top", 1),
+            (TOKEN_BULLET, "still top", 1),
+            (TOKEN_BULLET, "second", 2),
+            (TOKEN_BULLET, "third", 3),
+            (TOKEN_BULLET, "fifth", 5),
+            (TOKEN_PARAGRAPH, "-dash", 0),
+        ]
+
+    def test_blank_lines_are_skipped(self):
+        assert tokenize_markdown_lines(["", "   ", "text"]) == [(TOKEN_PARAGRAPH, "text", 0)]
+
+
+class TestParseRichContent:
+    def test_blocks_match_expected_structure(self):
+        content = "## Heading\nFirst line\nsecond line\n\n- one\n  - nested\n    - deeper\nClosing *text*"
+
+        assert ContentProcessor()._parse_rich_content(content) == [
+            {"type": "heading", "text": "Heading", "level": 2},
+            {"type": "paragraph", "text": "First line second line"},
+            {
+                "type": "bullets",
+                "items": [
+                    {"text": "one", "level": 1},
+                    {"text": "nested", "level": 2},
+                    {"text": "deeper", "level": 3},
+                ],
+            },
+            {"type": "paragraph", "text": "Closing *text*"},
+        ]
+
+    def test_slide_content_keeps_h1_when_frontmatter_has_title(self):
+        slide = ContentProcessor()._parse_slide_content("# Markdown Title\nBody", {"title": "Frontmatter"})
+
+        assert slide["title"] == "Frontmatter"
+        assert slide["rich_content"] == [
+            {"type": "heading", "text": "Markdown Title", "level": 1},
+            {"type": "paragraph", "text": "Body"},
+        ]
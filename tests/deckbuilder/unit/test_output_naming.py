@@ -0,0 +1,133 @@
+"""
+Unit tests for deterministic output naming and skip-if-unchanged builds (output_naming).
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from deckbuilder.core.engine import create_engine
+from deckbuilder.core.engine_pool import EnginePool
+from deckbuilder.core.output_naming import InputDigest, OutputNaming, count_slides
+
+SLIDES = [
+    {"layout": "Title Slide", "placeholders": {"title_top": "Quarterly Review", "subtitle": "2026"}},
+    {"layout": "Title and Content", "placeholders": {"title_top": "Highlights", "content": "- Revenue up"}},
+]
+
+
+@pytest.fixture
+def deterministic(monkeypatch):
+    monkeypatch.setenv("DECK_DETERMINISTIC_OUTPUT", "1")
+
+
+@pytest.fixture
+def engine(path_manager):
+    return create_engine(path_manager)
+
+
+def outputs(tmp_path):
+    return sorted(path.name for path in tmp_path.glob("*.g.pptx"))
+
+
+class TestInputDigest:
+    def digest(self, slides, template=None, patterns="p", language=None):
+        hasher = InputDigest()
+        for slide in slides:
+            hasher.add_slide(slide)
+        return hasher.hexdigest(template, patterns, language, None)
+
+    def test_key_order_does_not_matter_but_content_does(self):
+        reordered = [{"placeholders": {"subtitle": "2026", "title_top": "Quarterly Review"}, "layout": "Title Slide"}, SLIDES[1]]
+
+        assert self.digest(SLIDES) == self.digest(reordered)
+        assert len(self.digest(SLIDES)) == 16
+        assert self.digest(SLIDES) != self.digest(SLIDES[:1])
+        assert self.digest(SLIDES) != self.digest(SLIDES, patterns="q")
+        assert self.digest(SLIDES) != self.digest(SLIDES, language="en-AU")
+
+    def test_referenced_files_are_hashed_by_content(self, tmp_path):
+        records = tmp_path / "regions.csv"
+        records.write_text("region\nNorth\n", encoding="utf-8")
+        slides = [{"repeat": {"layout": "Title Only", "placeholders": {"title_top": "{region}"}, "records": str(records)}}]
+
+        before = self.digest(slides)
+        records.write_text("region\nSouth\n", encoding="utf-8")
+
+        assert self.digest(slides) != before
+
+
+class TestOutputNaming:
+    def test_prune_keeps_most_recent_hashed_outputs_only(self, tmp_path):
+        names = [f"deck.{digit * 16}.g.pptx" for digit in "0123"] + ["deck.2026-10-18_1200.g.pptx", "other.aaaaaaaaaaaaaaaa.g.pptx"]
+        for age, name in enumerate(names):
+            (tmp_path / name).write_bytes(b"")
+            os.utime(tmp_path / name, ns=(0, (100 - age) * 10**9))
+
+        removed = OutputNaming(deterministic=True, keep=2).prune(tmp_path, "deck")
+
+        assert sorted(path.name for path in removed) == ["deck.2222222222222222.g.pptx", "deck.3333333333333333.g.pptx"]
+        assert outputs(tmp_path) == ["deck.0000000000000000.g.pptx", "deck.1111111111111111.g.pptx", "deck.2026-10-18_1200.g.pptx", "other.aaaaaaaaaaaaaaaa.g.pptx"]
+
+    def test_from_env(self, monkeypatch):
+        assert not OutputNaming.from_env().deterministic
+        monkeypatch.setenv("DECK_DETERMINISTIC_OUTPUT", "true")
+        monkeypatch.setenv("DECK_OUTPUT_KEEP", "5")
+        naming = OutputNaming.from_env()
+        assert (naming.deterministic, naming.keep) == (True, 5)
+
+
+class TestDeterministicBuilds:
+    def test_unchanged_deck_is_not_rebuilt(self, deterministic, engine, tmp_path):
+
+        first = engine.create_presentation({"slides": SLIDES}, fileName="deck")
+        built = outputs(tmp_path)
+        engine.presentation_builder.add_slide = None  # any rebuild would fail
+        second = engine.create_presentation({"slides": SLIDES}, fileName="deck")
+
+        assert len(built) == 1 and built == outputs(tmp_path)
+        assert first.endswith(built[0]) and second.endswith(built[0])
+        assert "2 slides (unchanged, build skipped)" in second
+        assert engine.last_output_reused
+        assert count_slides(tmp_path / built[0]) == 2
+
+    def test_changes_rebuild_and_old_outputs_are_pruned(self, deterministic, engine, tmp_path, monkeypatch):
+        monkeypatch.setenv("DECK_OUTPUT_KEEP", "2")
+
+        names = []
+        for subtitle in ("2024", "2025", "2026"):
+            slides = [{"layout": "Title Slide", "placeholders": {"title_top": "Review", "subtitle": subtitle}}]
+            names.append(engine.create_presentation({"slides": slides}, fileName="deck").rsplit(" ", 1)[1])
+            assert not engine.last_output_reused
+
+        assert len(set(names)) == 3
+        assert outputs(tmp_path) == sorted(names[1:])
+
+    def test_json_file_and_in_memory_builds_share_outputs(self, deterministic, engine, tmp_path):
+        path = tmp_path / "deck.json"
+        path.write_text(json.dumps({"slides": SLIDES}, indent=4), encoding="utf-8")
+
+        built = engine.create_presentation_from_json_file(str(path), fileName="deck")
+        reused = engine.create_presentation({"slides": SLIDES}, fileName="deck")
+
+        assert engine.last_output_reused
+        assert built.rsplit(" ", 1)[1] == reused.rsplit(" ", 1)[1]
+
+    def test_concurrent_builds_of_one_deck(self, path_manager, tmp_path, deterministic):
+        pool = EnginePool(path_manager, max_engines=4)
+        start = threading.Barrier(4)
+
+        def build(index):
+            if index < 4:
+                start.wait(timeout=10)
+            return pool.create_presentation({"slides": SLIDES}, fileName="deck")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(build, range(12)))
+
+        built = outputs(tmp_path)
+        assert len(built) == 1 and all(result.endswith(built[0]) for result in results)
+        assert count_slides(tmp_path / built[0]) == 2
+        assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,89 @@
+"""
+Unit tests for in-memory post-generation validation (post_validation).
+"""
+
+import pytest
+from pptx import Presentation
+from deckbuilder.core.engine import create_engine
+from deckbuilder.core.post_validation import PostGenerationValidator
+
+SLIDES = [
+    {"layout": "Title Slide", "placeholders": {"title_top": "Quarterly **Review**", "subtitle": "Results for [Q3](https://example.com)"}},
+    {"layout": "Title and Content", "placeholders": {"title_top": "Highlights", "content": "- Revenue up\n- Costs down", "style": "default_style"}},
+]
+
+
+@pytest.fixture
+def engine(path_manager):
+    return create_engine(path_manager)
+
+
+def template_slide(template_folder, layout_name):
+    prs = Presentation(str(template_folder / "default.pptx"))
+    layout = next(layout for layout in prs.slide_layouts if layout.name == layout_name)
+    return prs.slides.add_slide(layout)
+
+
+class TestCheckSlide:
+    def test_layout_and_missing_content(self, template_folder):
+        slide = template_slide(template_folder, "Title Only")
+        slide.shapes.title.text = "Quarterly Review"
+        validator = PostGenerationValidator()
+
+        ok = validator.check_slide(3, slide, {"layout": "Title Slide", "placeholders": {"title_top": "Quarterly Review", "subtitle": "Next steps", "image": "chart.png"}})
+
+        assert not ok
+        assert validator.issues == [
+            "Slide 3 (Title Slide): layout is 'Title Only', expected 'Title Slide'",
+            "Slide 3 (Title Slide): 'subtitle' content is missing (expected: 'Next steps')",
+            "Slide 3 (Title Slide): 'image' has no picture",
+        ]
+
+    def test_sampling_and_count(self, template_folder):
+        slide = template_slide(template_folder, "Title Only")
+        validator = PostGenerationValidator(sample_every=3)
+
+        for number in range(1, 8):
+            validator.check_slide(number, slide, {"layout": "Title Only"})
+        validator.check_count(6, 7)
+
+        assert (validator.checked, validator.skipped) == (3, 4)
+        assert validator.issues == ["Slide count mismatch: expected 7, got 6"]
+
+    def test_disabled(self):
+        validator = PostGenerationValidator(enabled=False)
+
+        assert not validator.check_slide(1, None, {"layout": "Title Slide"})
+        assert validator.summary()["checked"] == 0
+
+
+class TestEngineValidation:
+    def test_build_validates_every_slide_in_memory(self, engine):
+
+        engine.create_presentation({"slides": SLIDES}, fileName="valid")
+
+        assert engine.last_validation["checked"] == 2
+        assert engine.last_validation["issues"] == []
+        assert engine.last_build_profile.counters["validated_slides"] == 2
+        assert "post_validation" in engine.last_build_profile.timings
+
+    def test_dropped_content_is_reported_without_failing_the_build(self, engine, capsys):
+        slides = SLIDES + [{"layout": "Title Only", "placeholders": {"title_top": "End", "content": "Never placed"}}]
+
+        result = engine.create_presentation({"slides": slides}, fileName="dropped")
+
+        assert "3 slides" in result
+        assert engine.last_validation["issues"] == ["Slide 3 (Title Only): 'content' content is missing (expected: 'Never placed')"]
+        assert "1 validation issues found" in capsys.readouterr().err
+
+    def test_environment_sampling_and_disable(self, engine, monkeypatch):
+        slides = SLIDES * 3
+
+        monkeypatch.setenv("DECK_VALIDATION_SAMPLE", "4")
+        engine.create_presentation({"slides": slides}, fileName="sampled")
+        assert (engine.last_validation["checked"], engine.last_validation["skipped"]) == (2, 4)
+
+        monkeypatch.setenv("DECK_VALIDATION", "off")
+        engine.create_presentation({"slides": slides}, fileName="unvalidated")
+        assert engine.last_validation["checked"] == 0
+        assert "validated_slides" not in engine.last_build_profile.counters
@@ -0,0 +1,134 @@
+"""
+Unit tests for the structural PPTX diff (pptx_diff).
+"""
+
+import re
+import shutil
+import zipfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from deckbuilder.cli.main import main
+from deckbuilder.core.engine import create_engine
+from deckbuilder.utils.pptx_diff import A_NS, P_NS, R_NS, REL_NS, canonical_lines, deck_key, diff_directories, diff_packages, relationship_map
+from lxml import etree
+
+SLIDES = [
+    {"layout": "Title Slide", "placeholders": {"title": "Quarterly Review", "subtitle": "2026"}},
+    {"layout": "Title and Content", "placeholders": {"title": "Highlights", "content": ["Revenue up", "Costs down"]}},
+]
+
+
+@pytest.fixture
+def build(make_path_manager):
+    def build(folder, name, slides):
+        folder.mkdir(parents=True, exist_ok=True)
+        create_engine(make_path_manager(folder)).create_presentation({"slides": slides}, fileName=name)
+        return next(folder.glob(f"{name}.*.g.pptx"))
+
+    return build
+
+
+def rewrite(path, target, edit):
+    """Copy a package to target, passing each part's text through edit(name, text)."""
+    with zipfile.ZipFile(path) as source, zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as copy:
+        for info in source.infolist():
+            data = source.read(info)
+            if info.filename.endswith((".xml", ".rels")):
+                data = edit(info.filename, data.decode("utf-8")).encode("utf-8")
+            copy.writestr(info, data)
+    return target
+
+
+@pytest.fixture
+def golden(build, tmp_path):
+    return build(tmp_path / "golden", "deck", SLIDES)
+
+
+def test_rebuild_with_new_timestamps_and_rids_is_identical(tmp_path, golden):
+    def edit(name, text):
+        if name == "docProps/core.xml":
+            text = re.sub(r"<dcterms:modified([^>]*)>[^<]*<", r"<dcterms:modified\1>2030-01-01T00:00:00Z<", text)
+        if name.startswith("ppt/slides/"):
+            text = text.replace('"rId1"', '"rId7"')
+        return text
+
+    actual = rewrite(golden, tmp_path / "actual.pptx", edit)
+
+    assert diff_packages(golden, actual).identical
+
+
+def test_reports_per_slide_shape_changes(build, tmp_path, golden):
+    changed = [dict(SLIDES[0]), {"layout": "Title and Content", "placeholders": {"title": "Highlights", "content": ["Revenue up", "Costs flat"]}}, SLIDES[0]]
+    actual = build(tmp_path / "actual", "deck", changed)
+
+    result = diff_packages(golden, actual)
+
+    assert not result.identical
+    assert result.added_slides == [3]
+    assert [slide.number for slide in result.slides] == [2]
+    assert list(result.slides[0].changed_shapes.values()) == [["text"]]
+    assert "+ slide 3" in result.format_lines()
+
+
+def test_geometry_change(tmp_path, golden):
+    xfrm = '<p:spPr><a:xfrm><a:off x="1" y="2"/><a:ext cx="3" cy="4"/></a:xfrm></p:spPr>'
+
+    def edit(name, text):
+        return text.replace("<p:spPr/>", xfrm, 1) if name == "ppt/slides/slide1.xml" else text
+
+    actual = rewrite(golden, tmp_path / "moved.pptx", edit)
+
+    slides = diff_packages(golden, actual).slides
+    assert [slide.number for slide in slides] == [1]
+    assert list(slides[0].changed_shapes.values()) == [["geometry"]]
+
+
+def test_canonical_form_ignores_attribute_order_and_relationship_ids():
+    def canonical(slide, rels):
+        slide_root, rels_root = etree.fromstring(slide), etree.fromstring(rels)
+        rid_map = relationship_map(slide_root, rels_root)
+        return canonical_lines(slide_root, rid_map), canonical_lines(rels_root, rid_map)
+
+    ns = f'xmlns:p="{P_NS}" xmlns:a="{A_NS}" xmlns:r="{R_NS}"'
+    slide = "<p:sld " + ns + '><a:blip r:embed="{image}"/><p:link b="1" a="2" r:id="{link}"/></p:sld>'
+    rel = '<Relationship Id="{}" Type="{}" Target="{}"/>'
+    rels = '<Relationships xmlns="' + REL_NS + '">{}</Relationships>'
+
+    expected = canonical(
+        slide.format(image="rId2", link="rId3"),
+        rels.format(rel.format("rId1", "layout", "l.xml") + rel.format("rId2", "image", "i.png") + rel.format("rId3", "link", "x")),
+    )
+    actual = canonical(
+        slide.format(image="rId3", link="rId1").replace('b="1" a="2"', 'a="2" b="1"'),
+        rels.format(rel.format("rId3", "image", "i.png") + rel.format("rId1", "link", "x") + rel.format("rId2", "layout", "l.xml")),
+    )
+
+    assert expected == actual
+    assert expected[0][1] == '  <a:blip r:embed="rId1">'
+
+
+def test_directories_match_generated_names(build, tmp_path, golden):
+    actual_dir = tmp_path / "actual"
+    build(actual_dir, "deck", SLIDES)
+    build(actual_dir, "extra", SLIDES[:1])
+
+    result = diff_directories(golden.parent, actual_dir, workers=2)
+
+    assert deck_key(Path("sub/deck.2026-10-18_2240.g.pptx")) == "sub/deck.g.pptx"
+    assert deck_key(Path("deck.2026-10-18_2240-2.g.pptx")) == "deck.g.pptx"
+    assert deck_key(Path("deck.3f9c2a7d1e0b4c58.g.pptx")) == "deck.g.pptx"
+    assert result.diffs["deck.g.pptx"].identical
+    assert result.unexpected == ["extra.g.pptx"] and not result.identical
+
+
+def test_cli_diff_exit_codes(build, tmp_path, golden):
+    same = shutil.copy(golden, tmp_path / "same.pptx")
+    different = build(tmp_path / "different", "deck", SLIDES[:1])
+    runner = CliRunner()
+
+    assert runner.invoke(main, ["diff", str(golden), str(same)]).exit_code == 0
+    result = runner.invoke(main, ["diff", str(golden), str(different)])
+    assert result.exit_code == 1
+    assert "- slide 2" in result.output
@@ -0,0 +1,66 @@
+"""
+Unit tests for the compiled table style palette and color memo.
+"""
+
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from deckbuilder.core.table_builder import TableBuilder
+from deckbuilder.core.table_palette import CellStyle, TablePalette, color_cache_stats, resolve_color
+from deckbuilder.templates.table_styles import TABLE_HEADER_STYLES, TABLE_ROW_STYLES
+
+
+def blank_slide():
+    prs = Presentation()
+    return prs.slides.add_slide(prs.slide_layouts[6])
+
+
+class TestResolveColor:
+    def test_names_are_normalised_and_memoised(self):
+        assert resolve_color("Navy") == RGBColor(0, 0, 128)
+        before = color_cache_stats()["hits"]
+
+        assert resolve_color("  NAVY ") == RGBColor(0, 0, 128)
+        assert color_cache_stats()["hits"] == before + 1
+
+    def test_transparent_unknown_and_non_strings(self):
+        assert resolve_color("transparent") is None
+        assert resolve_color("not-a-color") is None
+        assert resolve_color(None) is None
+        assert resolve_color(["red"]) is None
+
+
+class TestTablePalette:
+    def test_default_styles_keep_table_colors(self):
+        palette = TablePalette()
+
+        assert palette.header_style("dark_blue_white_text", {}, 12) == CellStyle(fill=RGBColor(46, 89, 132), text_color=RGBColor(255, 255, 255), bold=True, size=12)
+        assert palette.row_styles("alternating_light_gray", {}, 10) == (CellStyle(fill=RGBColor(255, 255, 255), size=10), CellStyle(fill=RGBColor(240, 240, 240), size=10))
+        assert palette.header_style("light_blue_dark_text", {}, 12) == CellStyle()
+
+    def test_named_styles(self):
+        palette = TablePalette(header_styles=TABLE_HEADER_STYLES, row_styles=TABLE_ROW_STYLES)
+
+        assert palette.header_style("light_blue_dark_text", {}, 12) == CellStyle(fill=RGBColor(217, 237, 255), text_color=RGBColor(51, 51, 51), bold=True, size=12)
+        assert palette.row_styles("alternating_light_blue", {}, 10) == (CellStyle(fill=RGBColor(255, 255, 255), size=10), CellStyle(fill=RGBColor(240, 248, 255), size=10))
+        # Rows without fill colors and unknown styles are left unstyled
+        assert palette.row_styles("no_fill", {}, 10) == (CellStyle(), CellStyle())
+        assert palette.header_style("unknown", {}, 12) == CellStyle()
+
+    def test_custom_colors_override_named_style(self):
+        palette = TablePalette()
+
+        header = palette.header_style("dark_blue_white_text", {"header_bg": "black", "header_text": "bogus"}, 14)
+
+        assert header.fill == RGBColor(0, 0, 0)
+        assert header.text_color == RGBColor(255, 255, 255)
+
+    def test_tables_of_a_builder_share_compiled_styles(self):
+        builder = TableBuilder()
+        table = {"data": [["Name", "Status"], ["Alpha", "green"], ["Beta", "red"], ["Gamma", "green"]]}
+
+        builder.add_table_to_slide(blank_slide(), table)
+        compiled = builder.palette.stats()
+        builder.add_table_to_slide(blank_slide(), table)
+
+        assert builder.palette.stats() == compiled
+        assert compiled == {"header_styles": 1, "row_styles": 1, "cell_fragments": 5, "run_fragments": 4}
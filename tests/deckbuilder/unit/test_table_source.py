@@ -0,0 +1,92 @@
+"""
+Unit tests for tables loaded from CSV/TSV files (table_source).
+"""
+
+import pytest
+from pptx import Presentation
+from deckbuilder.content.frontmatter_to_json_converter import markdown_to_canonical_json
+from deckbuilder.content.table_source import format_number, iter_table_rows, load_table_source
+from deckbuilder.core.engine import create_engine
+
+SALES = "Region,Units,Revenue,Margin\nNorth,1200,125000.5,0.25\nSouth,980,98000,0.2\nEast,15,n/a,0.3\nWest,7,7000,\n"
+
+
+@pytest.fixture
+def sales_csv(tmp_path):
+    path = tmp_path / "sales.csv"
+    path.write_text(SALES, encoding="utf-8")
+    return str(path)
+
+
+class TestIterTableRows:
+    def test_all_rows(self, sales_csv):
+        rows = list(iter_table_rows({"path": sales_csv}))
+
+        assert rows[0] == ["Region", "Units", "Revenue", "Margin"]
+        assert rows[1] == ["North", "1200", "125000.5", "0.25"]
+        assert len(rows) == 5
+
+    def test_columns_by_name_and_index_with_row_range(self, sales_csv):
+        rows = list(iter_table_rows({"path": sales_csv, "columns": ["Revenue", 0], "rows": [1, 3]}))
+
+        assert rows == [["Revenue", "Region"], ["98000", "South"], ["n/a", "East"]]
+
+    def test_number_formats(self, sales_csv):
+        per_column = list(iter_table_rows({"path": sales_csv, "number_format": {"Revenue": ",.0f", "Margin": ".0%"}, "rows": [0, 1]}))
+        everywhere = list(iter_table_rows({"path": sales_csv, "number_format": ",", "rows": [0, 1]}))
+
+        assert per_column[1] == ["North", "1200", "125,000", "25%"]
+        assert everywhere[1] == ["North", "1,200", "125,000.5", "0.25"]
+
+    def test_tsv_without_header(self, tmp_path):
+        path = tmp_path / "data.tsv"
+        path.write_text("a\t1\nb\t2\n", encoding="utf-8")
+
+        assert list(iter_table_rows({"path": str(path), "header": False, "columns": ["1"]})) == [["1"], ["2"]]
+
+    def test_errors(self, sales_csv, tmp_path):
+        with pytest.raises(ValueError, match="unknown column"):
+            list(iter_table_rows({"path": sales_csv, "columns": ["Profit"]}))
+        with pytest.raises(ValueError, match="cannot read"):
+            list(iter_table_rows({"path": str(tmp_path / "missing.csv")}))
+        with pytest.raises(ValueError, match="row range"):
+            list(iter_table_rows({"path": sales_csv, "rows": [3, 1]}))
+        with pytest.raises(ValueError, match="path"):
+            load_table_source({"columns": ["Region"]})
+
+
+def test_format_number_leaves_text():
+    assert format_number("n/a", ",.2f") == "n/a"
+    assert format_number(" 42 ", "05d") == "00042"
+    assert format_number("4.5", "d") == "4.5"
+
+
+def test_styling_options_pass_through(sales_csv):
+    table = load_table_source({"path": sales_csv, "columns": ["Region"], "header_style": "light_blue_dark_text", "cell_color_mode": "disabled"})
+
+    assert table == {"header_style": "light_blue_dark_text", "cell_color_mode": "disabled", "data": [["Region"], ["North"], ["South"], ["East"], ["West"]]}
+
+
+def test_build_with_table_source(sales_csv, path_manager, tmp_path):
+    engine = create_engine(path_manager)
+    slide = {
+        "layout": "Title Only",
+        "placeholders": {"title": "Sales"},
+        "table_source": {"path": sales_csv, "columns": ["Region", "Revenue"], "number_format": {"Revenue": ",.0f"}},
+    }
+
+    engine.create_presentation({"slides": [slide]}, fileName="sales")
+
+    prs = Presentation(str(next(tmp_path.glob("sales.*.g.pptx"))))
+    table = next(shape.table for shape in prs.slides[0].shapes if shape.has_table)
+    assert [[cell.text for cell in row.cells] for row in table.rows][:3] == [["Region", "Revenue"], ["North", "125,000"], ["South", "98,000"]]
+
+    with pytest.raises(ValueError, match="table_source"):
+        engine.create_presentation({"slides": [{"layout": "Title Only", "table_source": "sales.csv"}]})
+
+
+def test_markdown_frontmatter_keeps_table_source_on_slide(sales_csv):
+    data = markdown_to_canonical_json(f"---\nlayout: Title Only\ntitle: Sales\ntable_source:\n  path: {sales_csv}\n  rows: [0, 2]\n---\n")
+
+    assert data["slides"][0]["table_source"] == {"path": sales_csv, "rows": [0, 2]}
+    assert "table_source" not in data["slides"][0]["placeholders"]
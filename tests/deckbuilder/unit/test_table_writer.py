@@ -0,0 +1,120 @@
+"""
+Unit tests for the direct-XML table writer.
+
+The writer must produce the same table XML as creating the table through
+python-pptx and styling it cell by cell, which is how TableBuilder rendered
+tables before.
+"""
+
+import pytest
+from lxml import etree
+from pptx import Presentation
+from pptx.util import Cm
+from deckbuilder.content.formatter import ContentFormatter
+from deckbuilder.core.table_builder import TableBuilder
+from deckbuilder.core.table_writer import CellStyle, TableXmlWriter
+
+
+def formatted(text, **format_flags):
+    return {"text": text, "formatted": [{"text": part, "format": format_flags} for part in text.split(" ")]}
+
+
+STATUS_TABLE = [
+    ["Project", "Status", "red"],
+    ["Alpha", "green", "Done\nShipped"],
+    ["Beta", "TRANSPARENT", "line\vbreak"],
+    ["Gamma", "", "  Blue  "],
+]
+
+TABLES = {
+    "defaults": {"data": STATUS_TABLE},
+    "custom_colors": {
+        "data": STATUS_TABLE,
+        "custom_colors": {"header_bg": "navy", "header_text": "yellow", "primary_row": "lightgray", "alt_row": "transparent"},
+        "header_font_size": 30,
+        "data_font_size": 9,
+    },
+    "unstyled": {"data": STATUS_TABLE, "header_style": "unknown", "row_style": "unknown"},
+    "colors_disabled": {"data": STATUS_TABLE, "cell_color_mode": "disabled"},
+    "dimensions": {"data": STATUS_TABLE, "column_widths": [3, 4, 5], "row_height": 1.2, "table_height": 8},
+    "formatted": {"data": [[formatted("Bold header", bold=True), "Plain"], [formatted("mixed text", italic=True, underline=True), formatted("red")]]},
+    "single_cell": {"rows": [["only"]]},
+}
+
+
+def legacy_add_table(builder, slide, table_data):
+    """TableBuilder.add_table_to_slide before the XML writer: create, fill, then style cell by cell."""
+    data = table_data.get("data", table_data.get("rows", []))
+    header_font_size = table_data.get("header_font_size", 12)
+    data_font_size = table_data.get("data_font_size", 10)
+    dimensions = builder._parse_dimensions(table_data, len(data[0]), len(data))
+    width = dimensions["table_width"] or Cm(20)
+    height = dimensions["table_height"] or builder._calculate_smart_table_height(data, header_font_size, data_font_size)
+
+    table = slide.shapes.add_table(len(data), len(data[0]), Cm(2.5), Cm(5), width, height).table
+    for row_idx, row_data in enumerate(data):
+        for col_idx, cell_data in enumerate(row_data):
+            cell = table.cell(row_idx, col_idx)
+            if isinstance(cell_data, dict) and "formatted" in cell_data and builder.content_formatter:
+                builder.content_formatter.apply_formatted_segments_to_cell(cell, cell_data["formatted"])
+            elif isinstance(cell_data, dict) and "formatted" in cell_data:
+                cell.text = cell_data.get("text", str(cell_data))
+            else:
+                cell.text = str(cell_data)
+
+    if dimensions["column_widths"]:
+        builder._apply_column_widths(table, dimensions["column_widths"])
+    if dimensions["row_height"]:
+        builder._apply_row_heights(table, dimensions["row_height"])
+
+    builder._apply_table_styling(
+        table,
+        table_data.get("header_style", "dark_blue_white_text"),
+        table_data.get("row_style", "alternating_light_gray"),
+        table_data.get("border_style", "thin_gray"),
+        table_data.get("custom_colors", {}),
+        table_data,
+        header_font_size,
+        data_font_size,
+    )
+    if table_data.get("cell_color_mode", "auto") in ["auto", "enabled"]:
+        builder._apply_per_cell_colors(table, data, table_data.get("cell_color_mode", "auto"))
+
+
+def blank_slide():
+    prs = Presentation()
+    return prs.slides.add_slide(prs.slide_layouts[6])
+
+
+def canonical(slide):
+    return etree.tostring(slide.shapes[0]._element, method="c14n")
+
+
+@pytest.mark.parametrize("content_formatter", [None, ContentFormatter(language_code="en-AU", font_name="Arial")], ids=["plain", "language_font"])
+@pytest.mark.parametrize("name", sorted(TABLES))
+def test_xml_matches_per_cell_styling(name, content_formatter):
+    builder = TableBuilder(content_formatter)
+    expected, actual = blank_slide(), blank_slide()
+
+    legacy_add_table(builder, expected, TABLES[name])
+    builder.add_table_to_slide(actual, TABLES[name])
+
+    assert canonical(actual) == canonical(expected)
+
+
+def test_ragged_rows_are_padded_and_truncated():
+    slide = blank_slide()
+    TableBuilder().add_table_to_slide(slide, {"data": [["A", "B"], ["only"], ["x", "y", "extra"]]})
+
+    table = slide.shapes[0].table
+    assert [[cell.text for cell in row.cells] for row in table.rows] == [["A", "B"], ["only", ""], ["x", "y"]]
+    assert table.cell(1, 1).fill.fore_color.rgb == table.cell(1, 0).fill.fore_color.rgb
+
+
+def test_fragments_are_shared_per_style_class():
+    writer = TableXmlWriter(header=CellStyle(bold=True, size=12), primary_row=CellStyle(size=10), alt_row=CellStyle(size=10))
+    writer.build_table([["H"] * 3] + [["d"] * 3] * 20, 3, Cm(10), Cm(10))
+
+    # Primary and alternate rows differ only by fill, so their runs share one fragment
+    assert writer.palette.stats()["run_fragments"] == 2
+    assert writer.palette.stats()["cell_fragments"] == 1
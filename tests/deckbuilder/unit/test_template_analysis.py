@@ -0,0 +1,83 @@
+"""
+Unit tests for the shared template analysis sidecar cache.
+"""
+
+import json
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from pptx import Presentation
+
+from deckbuilder.templates import template_analysis
+from deckbuilder.templates.template_analysis import TemplateAnalysisCache, get_layout_names, get_sidecar_path
+
+TEMPLATE_PATH = Path(__file__).parent.parent.parent.parent / "src" / "deckbuilder" / "assets" / "templates" / "default.pptx"
+
+
+@pytest.fixture
+def template_copy(tmp_path):
+    path = tmp_path / "default.pptx"
+    shutil.copy2(TEMPLATE_PATH, path)
+    return path
+
+
+class TestTemplateAnalysisCache:
+    def test_analysis_describes_layouts_and_placeholders(self, template_copy):
+        analysis = TemplateAnalysisCache().load(template_copy)
+
+        layout_names = get_layout_names(analysis)
+        assert layout_names[:2] == ["Title Slide", "Title and Content"]
+        assert analysis["layout_count"] == len(Presentation(str(template_copy)).slide_layouts)
+
+        image = next(p for p in analysis["layouts"]["Picture with Caption"]["placeholders"] if p["name"] == "image")
+        assert image["type"] == "PICTURE"
+        assert image["idx"] == 1
+        assert image["width"] > 0 and image["height"] > 0
+
+        compatibility = analysis["pattern_compatibility"]
+        assert compatibility["layouts"]["Four Columns"] == {"has_pattern": True, "compatible": True, "missing_fields": []}
+        assert "timeline" in compatibility["patterns_without_layout"]
+
+    def test_sidecar_is_reused_across_instances(self, template_copy):
+        first = TemplateAnalysisCache().load(template_copy)
+        sidecar = get_sidecar_path(template_copy)
+        assert json.loads(sidecar.read_text())["content_hash"] == first["content_hash"]
+
+        with patch.object(template_analysis, "compute_layout_analysis") as compute:
+            second = TemplateAnalysisCache().load(template_copy)
+        compute.assert_not_called()
+        assert second["layouts"] == first["layouts"]
+
+    def test_template_change_invalidates_sidecar(self, template_copy):
+        cache = TemplateAnalysisCache()
+        before = cache.load(template_copy)
+
+        prs = Presentation(str(template_copy))
+        prs.slide_layouts[0].name = "Renamed Title Slide"
+        prs.save(str(template_copy))
+
+        after = cache.load(template_copy)
+        assert after["content_hash"] != before["content_hash"]
+        assert "Renamed Title Slide" in after["layouts"]
+        assert json.loads(get_sidecar_path(template_copy).read_text())["content_hash"] == after["content_hash"]
+
+    def test_user_pattern_refreshes_compatibility_only(self, template_copy):
+        cache = TemplateAnalysisCache()
+        cache.load(template_copy)
+
+        patterns_dir = template_copy.parent / "patterns"
+        patterns_dir.mkdir()
+        pattern = {
+            "description": "Title only with a field the layout lacks",
+            "yaml_pattern": {"layout": "Title Only", "title_top": "str", "missing_field": "str"},
+            "validation": {"required_fields": ["title_top"]},
+            "example": "---\nlayout: Title Only\ntitle_top: Example\n---",
+        }
+        (patterns_dir / "title_only.json").write_text(json.dumps(pattern))
+
+        with patch.object(template_analysis, "compute_layout_analysis") as compute:
+            analysis = cache.load(template_copy)
+        compute.assert_not_called()
+        assert analysis["pattern_compatibility"]["layouts"]["Title Only"]["missing_fields"] == ["missing_field"]
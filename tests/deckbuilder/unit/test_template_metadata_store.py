@@ -0,0 +1,79 @@
+"""
+Unit tests for the process-wide template metadata store.
+"""
+
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from deckbuilder.templates.metadata import TemplateMetadataLoader, template_metadata_store
+
+TEMPLATE_PATH = Path(__file__).parent.parent.parent.parent / "src" / "deckbuilder" / "assets" / "templates" / "default.pptx"
+
+
+@pytest.fixture
+def template_folder(tmp_path):
+    shutil.copy2(TEMPLATE_PATH, tmp_path / "default.pptx")
+    # Sidecars and lock files are not templates
+    (tmp_path / ".default.analysis.json").write_text("{}")
+    (tmp_path / "~$default.pptx").write_bytes(b"lock")
+    template_metadata_store.invalidate()
+    template_metadata_store.reset_stats()
+    return tmp_path
+
+
+class TestTemplateMetadataStore:
+    def test_metadata_is_shared_across_loaders(self, template_folder):
+        first = TemplateMetadataLoader(template_folder).load_template_metadata("default")
+
+        with patch.object(TemplateMetadataLoader, "create_template_metadata_from_patterns") as build:
+            second = TemplateMetadataLoader(template_folder).load_template_metadata("default")
+        build.assert_not_called()
+
+        assert second is first
+        stats = TemplateMetadataLoader(template_folder).get_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_template_discovery_lists_pptx_files_only(self, template_folder):
+        assert TemplateMetadataLoader(template_folder).get_template_names() == ["default"]
+
+    def test_template_change_invalidates_entry(self, template_folder):
+        loader = TemplateMetadataLoader(template_folder)
+        first = loader.load_template_metadata("default")
+
+        template_file = template_folder / "default.pptx"
+        stat = template_file.stat()
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert loader.load_template_metadata("default") is not first
+        assert loader.get_cache_stats()["invalidations"] == 1
+
+    def test_user_pattern_change_is_picked_up(self, template_folder):
+        loader = TemplateMetadataLoader(template_folder)
+        assert "Cache Test" not in loader.load_template_metadata("default").layouts
+
+        patterns_dir = template_folder / "patterns"
+        patterns_dir.mkdir()
+        pattern = {
+            "description": "User pattern for store invalidation",
+            "yaml_pattern": {"layout": "Cache Test", "title_top": "str"},
+            "validation": {"required_fields": ["title_top"]},
+            "example": "---\nlayout: Cache Test\ntitle_top: Example\n---",
+        }
+        (patterns_dir / "cache_test.json").write_text(json.dumps(pattern))
+
+        assert "Cache Test" in loader.load_template_metadata("default").layouts
+
+    def test_concurrent_readers_get_same_metadata(self, template_folder):
+        expected = TemplateMetadataLoader(template_folder).load_template_metadata("default")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: TemplateMetadataLoader(template_folder).load_template_metadata("default"), range(32)))
+
+        assert all(result is expected for result in results)
+        assert template_metadata_store.stats()["hits"] == 32
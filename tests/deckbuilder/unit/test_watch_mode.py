@@ -0,0 +1,175 @@
+"""
+Unit tests for watch mode: slide reuse between builds (slide_reuse) and the polling file watcher.
+"""
+
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from deckbuilder.cli.main import DeckbuilderCLI
+from deckbuilder.core.engine import create_engine
+from deckbuilder.core.slide_reuse import SlideReuseCache
+from deckbuilder.utils.file_watcher import FileWatcher
+from deckbuilder.utils.pptx_diff import diff_packages
+
+IMAGE = Path(__file__).parent.parent.parent.parent / "src" / "placekitten" / "images" / "ACuteKitten-1.png"
+
+
+@pytest.fixture
+def deckbuilder(path_manager):
+    engine = create_engine(path_manager)
+    engine.slide_reuse = SlideReuseCache()
+    return engine
+
+
+def deck(image):
+    slides = [{"layout": "Title and Content", "placeholders": {"title_top": f"Point {i}", "content": "- See [docs](https://example.com)\n- **Bold**"}, "speaker_notes": f"Note {i}"} for i in range(3)]
+    slides.append({"layout": "Picture with Caption", "placeholders": {"title_top": "Kitten", "image": str(image), "text_caption": "Caption"}})
+    return {"slides": slides}
+
+
+def output_path(result):
+    return result.rsplit(" ", 1)[1]
+
+
+class TestSlideReuse:
+    def test_unchanged_slides_are_restored_identically(self, deckbuilder, tmp_path):
+        data = deck(IMAGE)
+
+        built = deckbuilder.create_presentation(data, fileName="built")
+        assert (deckbuilder.slide_reuse.built, deckbuilder.slide_reuse.reused) == (4, 0)
+
+        deckbuilder.presentation_builder.add_slide = None  # any slide build would fail
+        reused = deckbuilder.create_presentation(data, fileName="reused")
+
+        assert (deckbuilder.slide_reuse.built, deckbuilder.slide_reuse.reused) == (0, 4)
+        assert deckbuilder.last_build_profile.counters["reused_slides"] == 4
+        assert str(IMAGE) in deckbuilder.slide_reuse.files
+        diff = diff_packages(tmp_path / output_path(built), tmp_path / output_path(reused))
+        assert diff.identical, diff.format_lines()
+
+    def test_edited_slides_and_files_are_rebuilt(self, deckbuilder, tmp_path):
+        image = tmp_path / "kitten.png"
+        shutil.copy(IMAGE, image)
+        data = deck(image)
+        deckbuilder.create_presentation(data, fileName="deck")
+
+        data["slides"][1]["placeholders"]["title_top"] = "Edited"
+        deckbuilder.create_presentation(data, fileName="deck")
+        assert (deckbuilder.slide_reuse.built, deckbuilder.slide_reuse.reused) == (1, 3)
+
+        shutil.copy(IMAGE.with_name("ACuteKitten-2.png"), image)
+        deckbuilder.create_presentation(data, fileName="deck")
+        assert (deckbuilder.slide_reuse.built, deckbuilder.slide_reuse.reused) == (1, 3)
+
+    def test_incremental_rebuild_matches_full_build_with_fallback_images(self, deckbuilder, path_manager, tmp_path):
+        slides = [{"layout": "Picture with Caption", "placeholders": {"title_top": f"Missing {i}", "image": "missing.png", "text_caption": "Fallback"}} for i in range(5)]
+        deckbuilder.create_presentation({"slides": slides}, fileName="first")
+
+        slides[4]["placeholders"]["title_top"] = "Edited"
+        incremental = deckbuilder.create_presentation({"slides": slides}, fileName="incremental")
+        assert (deckbuilder.slide_reuse.built, deckbuilder.slide_reuse.reused) == (1, 4)
+        full = create_engine(path_manager).create_presentation({"slides": slides}, fileName="full")
+
+        diff = diff_packages(tmp_path / output_path(full), tmp_path / output_path(incremental))
+        assert diff.identical, diff.format_lines()
+
+    def test_inserted_slide_rebuilds_slides_with_fallback_images_after_it(self, deckbuilder, path_manager, tmp_path):
+        slides = [{"layout": "Picture with Caption", "placeholders": {"title_top": f"Missing {i}", "image": "missing.png", "text_caption": "Fallback"}} for i in range(4)]
+        slides.append({"layout": "Title Only", "placeholders": {"title_top": "Text only"}})
+        deckbuilder.create_presentation({"slides": slides}, fileName="first")
+
+        slides.insert(0, {"layout": "Title Slide", "placeholders": {"title_top": "Inserted"}})
+        incremental = deckbuilder.create_presentation({"slides": slides}, fileName="incremental")
+        # Pictures moved and are rebuilt; the text slide is restored at its new position
+        assert (deckbuilder.slide_reuse.built, deckbuilder.slide_reuse.reused) == (5, 1)
+        full = create_engine(path_manager).create_presentation({"slides": slides}, fileName="full")
+
+        diff = diff_packages(tmp_path / output_path(full), tmp_path / output_path(incremental))
+        assert diff.identical, diff.format_lines()
+
+    def test_context_change_drops_every_snapshot(self, deckbuilder):
+        data = deck(IMAGE)
+        deckbuilder.create_presentation(data, fileName="deck")
+
+        deckbuilder.create_presentation(data, fileName="deck", language_code="en-AU")
+
+        assert (deckbuilder.slide_reuse.built, deckbuilder.slide_reuse.reused) == (4, 0)
+
+
+class TestFileWatcher:
+    def test_changes_in_files_and_folders(self, tmp_path):
+        deck_file = tmp_path / "deck.md"
+        deck_file.write_text("one", encoding="utf-8")
+        patterns = tmp_path / "patterns"
+        patterns.mkdir()
+        watcher = FileWatcher([deck_file, patterns, tmp_path / "missing.png"])
+
+        assert watcher.changes() == set()
+        deck_file.write_text("two!", encoding="utf-8")
+        (patterns / "custom.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "missing.png").write_bytes(b"png")
+
+        assert watcher.changes() == {str(deck_file), str(patterns / "custom.json"), str(tmp_path / "missing.png")}
+        assert watcher.changes() == set()
+
+    def test_wait_debounces_bursts_of_writes(self, tmp_path):
+        deck_file = tmp_path / "deck.md"
+        deck_file.write_text("", encoding="utf-8")
+        watcher = FileWatcher([deck_file], interval=0.01, debounce=0.05)
+        writes = iter(range(1, 4))
+        polls = []
+
+        def sleep(seconds):
+            polls.append(seconds)
+            write = next(writes, None)
+            if write is not None:
+                deck_file.write_text("x" * write, encoding="utf-8")
+            time.sleep(seconds)
+
+        assert watcher.wait(sleep=sleep) == {str(deck_file)}
+        # The burst spans three polls and is reported once, after it has gone quiet
+        assert len(polls) > 3
+        assert watcher.wait(timeout=0.05) == set()
+
+    def test_watch_keeps_state_of_files_already_watched(self, tmp_path):
+        deck_file, image = tmp_path / "deck.md", tmp_path / "image.png"
+        deck_file.write_text("one", encoding="utf-8")
+        image.write_bytes(b"png")
+        watcher = FileWatcher([deck_file])
+
+        deck_file.write_text("edited while building", encoding="utf-8")
+        watcher.watch([deck_file, image])
+
+        assert watcher.changes() == {str(deck_file)}
+
+
+class TestWatchCommand:
+    def test_rebuilds_on_change(self, template_folder, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        deck_file = tmp_path / "deck.md"
+        deck_file.write_text(
+            "---\nlayout: Title Slide\ntitle_top: Watched\nsubtitle: First\n---\n\n---\nlayout: Title Only\ntitle_top: Second slide\n---\n",
+            encoding="utf-8",
+        )
+
+        def edit():
+            time.sleep(0.5)
+            deck_file.write_text(deck_file.read_text(encoding="utf-8").replace("First", "Edited"), encoding="utf-8")
+            # Make sure the edit is seen even on file systems with coarse timestamps
+            os.utime(deck_file, ns=(0, time.time_ns() + 10**9))
+
+        editor = threading.Thread(target=edit)
+        editor.start()
+        runs = DeckbuilderCLI(template_folder=str(template_folder)).watch_presentation(str(deck_file), interval=0.05, debounce=0.1, max_runs=2)
+        editor.join()
+
+        output = capsys.readouterr().out
+        assert runs == 2
+        assert "(2 slides built, 0 reused) in " in output
+        assert "📝 Changed: deck.md" in output
+        assert "(1 slides built, 1 reused) in " in output
+        assert len(list(tmp_path.glob("deck.*.g.pptx"))) == 1
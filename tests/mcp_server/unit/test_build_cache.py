@@ -0,0 +1,128 @@
+"""
+Unit tests for the MCP build result cache.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))  # noqa: E402
+
+import pytest  # noqa: E402
+from mcp_server.build_cache import BuildCache  # noqa: E402
+
+TEMPLATE_PATH = str(Path(__file__).parent.parent.parent.parent / "src" / "deckbuilder" / "assets" / "templates" / "default.pptx")
+
+
+def write_output(folder: Path, name: str, data: bytes) -> str:
+    path = folder / name
+    path.write_bytes(data)
+    return str(path)
+
+
+class TestBuildCacheKey:
+    def test_key_depends_on_every_input(self, tmp_path):
+        cache = BuildCache(enabled=True)
+        base = cache.make_key("markdown", "# Slides", "Deck", TEMPLATE_PATH, str(tmp_path))
+
+        assert base == cache.make_key("markdown", "# Slides", "Deck", TEMPLATE_PATH, str(tmp_path))
+        assert base != cache.make_key("markdown", "# Other", "Deck", TEMPLATE_PATH, str(tmp_path))
+        assert base != cache.make_key("json", "# Slides", "Deck", TEMPLATE_PATH, str(tmp_path))
+        assert base != cache.make_key("markdown", "# Slides", "Other", TEMPLATE_PATH, str(tmp_path))
+        assert base != cache.make_key("markdown", "# Slides", "Deck", None, str(tmp_path))
+        assert base != cache.make_key("markdown", "# Slides", "Deck", TEMPLATE_PATH, str(tmp_path), font_name="Arial")
+        assert base != cache.make_key("markdown", "# Slides", "Deck", TEMPLATE_PATH, str(tmp_path), language_code="en-AU")
+
+    def test_template_edit_changes_key(self, tmp_path):
+        template = tmp_path / "custom.pptx"
+        template.write_bytes(b"v1")
+        cache = BuildCache(enabled=True)
+        before = cache.make_key("markdown", "x", "Deck", str(template), str(tmp_path))
+
+        template.write_bytes(b"v2 edited")
+
+        assert cache.make_key("markdown", "x", "Deck", str(template), str(tmp_path)) != before
+
+
+class TestBuildCache:
+    def test_disabled_cache_never_stores(self, tmp_path):
+        cache = BuildCache(enabled=False)
+        path = write_output(tmp_path, "a.pptx", b"data")
+
+        assert cache.put("k", path, "ok") is False
+        assert cache.get("k") is None
+        assert cache.stats()["misses"] == 0
+
+    def test_hit_and_miss_counts(self, tmp_path):
+        cache = BuildCache(enabled=True)
+        path = write_output(tmp_path, "a.pptx", b"data")
+        cache.put("k", path, "built")
+
+        assert cache.get("missing") is None
+        assert cache.get("k").message == "built"
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"], stats["bytes"]) == (1, 1, 1, 4)
+
+    def test_hit_restores_deleted_output(self, tmp_path):
+        cache = BuildCache(enabled=True)
+        path = write_output(tmp_path, "a.pptx", b"original")
+        cache.put("k", path, "built")
+
+        Path(path).unlink()
+
+        assert cache.get("k").output_path == path
+        assert Path(path).read_bytes() == b"original"
+
+    def test_entry_bound_evicts_least_recently_used(self, tmp_path):
+        cache = BuildCache(max_entries=2, enabled=True)
+        for name in ("a", "b"):
+            cache.put(name, write_output(tmp_path, f"{name}.pptx", b"x"), name)
+        cache.get("a")
+
+        cache.put("c", write_output(tmp_path, "c.pptx", b"x"), "c")
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_byte_bound(self, tmp_path):
+        cache = BuildCache(max_bytes=10, enabled=True)
+
+        assert cache.put("big", write_output(tmp_path, "big.pptx", b"x" * 11), "big") is False
+        cache.put("a", write_output(tmp_path, "a.pptx", b"x" * 6), "a")
+        cache.put("b", write_output(tmp_path, "b.pptx", b"x" * 6), "b")
+
+        assert cache.stats()["entries"] == 1
+        assert cache.stats()["bytes"] == 6
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("DECK_BUILD_CACHE", "true")
+        monkeypatch.setenv("DECK_BUILD_CACHE_MAX_ENTRIES", "5")
+        monkeypatch.setenv("DECK_BUILD_CACHE_MAX_MB", "1")
+
+        cache = BuildCache.from_env()
+
+        assert (cache.enabled, cache.max_entries, cache.max_bytes) == (True, 5, 1024 * 1024)
+
+
+class TestCachedBuildTool:
+    def test_retry_is_served_from_cache(self, tmp_path, monkeypatch):
+        main = pytest.importorskip("mcp_server.main")
+        path_manager = SimpleNamespace(get_output_folder=lambda: tmp_path, get_template_folder=lambda: Path(TEMPLATE_PATH).parent, get_template_name=lambda: "default")
+        monkeypatch.setattr(main, "get_engine_pool", lambda: SimpleNamespace(path_manager=path_manager))
+        monkeypatch.setattr(main, "get_deck_client", lambda: pytest.fail("the build cache must not create the Deckbuilder singleton"))
+        monkeypatch.setattr(main, "build_cache", BuildCache(enabled=True))
+
+        builds = []
+
+        def build():
+            builds.append(1)
+            write_output(tmp_path, "Deck.g.pptx", b"pptx")
+            return "Successfully created presentation with 1 slides. Successfully created presentation: Deck.g.pptx"
+
+        first = main._cached_build("markdown", "# Slide", "Deck", "default", build)
+        second = main._cached_build("markdown", "# Slide", "Deck", "default", build)
+
+        assert len(builds) == 1
+        assert second == f"{first} (served from build cache)"
+        assert main.build_cache.stats()["hits"] == 1
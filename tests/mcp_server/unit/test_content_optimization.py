@@ -143,3 +143,28 @@ This is the first point. This is the second point."""
 
         assert "yaml_structure" in result["optimized_content"]
         assert result["gap_analysis"]["content_fit"] == "excellent"
+
+    def test_optimize_deck_matches_single_slide_calls(self, engine):
+        """Test that optimize_deck returns the same per-slide results in deck order."""
+        slides = [
+            ("Col 1: A\nCol 2: B\nCol 3: C\nCol 4: D", "Four Columns"),
+            ("Traditional approach costs $50K vs our solution at $30K", "Comparison"),
+            ("Short note", "Unknown Layout"),
+        ]
+        result = engine.optimize_deck(slides, workers=1)
+
+        assert result["slide_count"] == 3
+        for number, (content, layout) in enumerate(slides, 1):
+            expected = engine.optimize_content_for_layout(content, layout)
+            assert result["slides"][number - 1]["optimized_content"] == expected["optimized_content"]
+            assert result["yaml_blocks"][number - 1] == expected["optimized_content"]["yaml_structure"]
+
+        gaps = result["gap_analysis"]
+        assert sum(gaps["content_fit_counts"].values()) == 3
+        assert 0 < gaps["average_layout_utilization"] <= 1.0
+
+    def test_optimize_deck_process_pool(self, engine):
+        """Test that worker processes produce the same results as in-process optimization."""
+        slides = [(f"Point {i}. Another point with 25% growth.", "Title and Content") for i in range(4)]
+
+        assert engine.optimize_deck(slides, workers=2) == engine.optimize_deck(slides, workers=1)
@@ -0,0 +1,122 @@
+"""
+Unit tests for the MCP metrics registry.
+"""
+
+import asyncio
+import sys
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))  # noqa: E402
+
+from mcp_server.metrics import MetricsRegistry, is_error_result  # noqa: E402
+
+
+def sample_lines(text: str, name: str):
+    return [line for line in text.splitlines() if line.startswith(name)]
+
+
+class TestMetricsRegistry:
+    def test_counter_and_gauge_rendering(self):
+        registry = MetricsRegistry(enabled=True)
+        registry.inc("jobs_total", 2, "Jobs run", kind="a")
+        registry.inc("jobs_total", 1, kind="a")
+        registry.gauge_add("queue_depth", 3, "Queued jobs")
+
+        text = registry.render()
+
+        assert "# HELP jobs_total Jobs run" in text
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{kind="a"} 3' in text
+        assert "queue_depth 3" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry(enabled=True)
+        for value in (0.003, 0.2, 0.2, 500):
+            registry.observe("latency_seconds", value, "Latency", buckets=(0.01, 0.5))
+
+        lines = sample_lines(registry.render(), "latency_seconds")
+
+        assert lines == [
+            'latency_seconds_bucket{le="0.01"} 1',
+            'latency_seconds_bucket{le="0.5"} 3',
+            'latency_seconds_bucket{le="+Inf"} 4',
+            "latency_seconds_sum 500.403",
+            "latency_seconds_count 4",
+        ]
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry(enabled=True)
+        registry.inc("events_total", label='say "hi"\n')
+
+        assert 'events_total{label="say \\"hi\\"\\n"} 1' in registry.render()
+
+    def test_collectors_and_failing_collector(self):
+        registry = MetricsRegistry(enabled=True)
+        registry.add_collector(lambda: [("cache_hit_ratio", "gauge", "Hit ratio", [({"cache": "x"}, 0.5)])])
+        registry.add_collector(lambda: 1 / 0)
+
+        assert 'cache_hit_ratio{cache="x"} 0.5' in registry.render()
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.delenv("DECK_METRICS", raising=False)
+        monkeypatch.delenv("DECK_METRICS_PORT", raising=False)
+        assert MetricsRegistry.from_env().enabled is False
+
+        monkeypatch.setenv("DECK_METRICS_PORT", "9464")
+        assert MetricsRegistry.from_env().enabled is True
+
+
+class TestToolInstrumentation:
+    def test_disabled_registry_records_nothing(self):
+        registry = MetricsRegistry(enabled=False)
+
+        @registry.timed_tool
+        async def tool(ctx, value: int) -> str:
+            return str(value)
+
+        assert asyncio.run(tool(None, 3)) == "3"
+        assert registry.snapshot()["tools"] == {}
+        assert tool.__name__ == "tool"
+
+    def test_latency_outcomes_and_builds(self):
+        registry = MetricsRegistry(enabled=True)
+
+        @registry.timed_tool
+        async def build(ctx, fail: bool = False) -> str:
+            return "Error: failed" if fail else "ok"
+
+        asyncio.run(build(None))
+        asyncio.run(build(None, fail=True))
+        registry.record_build(5, {"slide_generation": 0.2, "save": 0.05})
+
+        snapshot = registry.snapshot()
+        assert snapshot["tools"]["build"]["calls"] == 2
+        assert snapshot["tools"]["build"]["errors"] == 1
+        assert (snapshot["builds"], snapshot["slides"]) == (1, 5)
+        text = registry.render()
+        assert 'deckbuilder_mcp_tool_in_progress{tool="build"} 0' in text
+        assert 'deckbuilder_build_stage_seconds_count{stage="save"} 1' in text
+
+    def test_error_result_detection(self):
+        assert is_error_result("Error creating presentation: boom")
+        assert is_error_result('{\n  "error": "Template not found"\n}')
+        assert not is_error_result('{\n  "template_name": "default"\n}')
+        assert not is_error_result({"error": "not a string"})
+
+
+class TestMetricsEndpoint:
+    def test_serves_metrics_on_local_port(self):
+        registry = MetricsRegistry(enabled=True)
+        registry.inc("requests_total")
+        server = registry.start_http_server(0)
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:  # nosec B310 - local test server
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+        finally:
+            registry.stop_http_server()
+
+        assert "requests_total 1" in body
+        assert content_type.startswith("text/plain; version=0.0.4")
@@ -0,0 +1,87 @@
+"""
+Unit tests for directory-scale remapping with a skip-unchanged manifest.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from pptx import Presentation
+
+from deckbuilder.content.batch_remap import MANIFEST_FILENAME, BatchRemapper
+
+TEMPLATE_PATH = Path(__file__).parent.parent / "src" / "deckbuilder" / "assets" / "templates" / "default.pptx"
+
+
+@pytest.fixture
+def deck_folder(tmp_path):
+    """Folder tree with two decks plus files that must be ignored."""
+    for relative in ("a/first.pptx", "b/c/second.pptx"):
+        prs = Presentation(str(TEMPLATE_PATH))
+        slide = prs.slides.add_slide(prs.slide_layouts[0])
+        slide.shapes.title.text = f"Deck {relative}"
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        prs.save(str(path))
+
+    # Backups and Office lock files are never remapped
+    (tmp_path / "a" / "first.bak.pptx").write_bytes(b"backup")
+    (tmp_path / "a" / "~$first.pptx").write_bytes(b"lock")
+    return tmp_path
+
+
+class TestBatchRemapper:
+    def test_find_presentations_skips_backups_and_locks(self, deck_folder):
+        found = [p.relative_to(deck_folder).as_posix() for p in BatchRemapper.find_presentations(deck_folder)]
+        assert found == ["a/first.pptx", "b/c/second.pptx"]
+
+    def test_atomic_remap_writes_manifest_without_backups(self, deck_folder):
+        summary = BatchRemapper(font_name="Arial", workers=2, atomic=True).remap_directory(str(deck_folder))
+
+        assert summary["processed"] == 2
+        assert summary["failed"] == 0
+        assert not (deck_folder / "b" / "c" / "second.bak.pptx").exists()
+        assert not list(deck_folder.rglob(".*.tmp.pptx"))
+
+        manifest = json.loads((deck_folder / MANIFEST_FILENAME).read_text())
+        assert set(manifest["files"]) == {"a/first.pptx", "b/c/second.pptx"}
+        assert manifest["files"]["a/first.pptx"]["font"] == "Arial"
+
+        title_run = Presentation(str(deck_folder / "a" / "first.pptx")).slides[0].shapes.title.text_frame.paragraphs[0].runs[0]
+        assert title_run.font.name == "Arial"
+
+    def test_unchanged_files_are_skipped(self, deck_folder):
+        BatchRemapper(font_name="Arial", workers=1, atomic=True).remap_directory(str(deck_folder))
+
+        summary = BatchRemapper(font_name="Arial", workers=1, atomic=True).remap_directory(str(deck_folder))
+        assert summary["skipped"] == 2
+        assert summary["processed"] == 0
+
+    def test_changed_settings_or_mapping_trigger_reprocessing(self, deck_folder):
+        BatchRemapper(language_code="en-AU", workers=1, atomic=True).remap_directory(str(deck_folder))
+
+        # Different font
+        summary = BatchRemapper(language_code="en-AU", font_name="Calibri", workers=1, atomic=True).remap_directory(str(deck_folder))
+        assert summary["processed"] == 2
+
+        # Language mapping file edited
+        with patch.object(BatchRemapper, "mapping_hash", return_value="changed"):
+            summary = BatchRemapper(language_code="en-AU", font_name="Calibri", workers=1, atomic=True).remap_directory(str(deck_folder))
+        assert summary["processed"] == 2
+
+    def test_edited_file_is_reprocessed(self, deck_folder):
+        BatchRemapper(font_name="Arial", workers=1, atomic=True).remap_directory(str(deck_folder))
+
+        prs = Presentation(str(deck_folder / "a" / "first.pptx"))
+        prs.slides[0].shapes.title.text = "Edited"
+        prs.save(str(deck_folder / "a" / "first.pptx"))
+
+        summary = BatchRemapper(font_name="Arial", workers=1, atomic=True).remap_directory(str(deck_folder))
+        assert summary["processed"] == 1
+        assert summary["skipped"] == 1
+
+    def test_mapping_hash_uses_packaged_mapping_file(self):
+        assert BatchRemapper(language_code="en-AU").mapping_hash()
+        assert BatchRemapper(language_code="xx-XX").mapping_hash() == ""
+        assert BatchRemapper(font_name="Arial").mapping_hash() == ""
@@ -0,0 +1,104 @@
+"""
+Unit tests for the bulk XML remap engine.
+
+Verifies that XmlRemapEngine produces the same run formatting, text and
+statistics as the python-pptx proxy walk in FormattingSupport.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+from deckbuilder.content.formatting_support import FormattingSupport
+from deckbuilder.content.remap_engine import RUN_XPATH, XmlRemapEngine
+
+TEMPLATE_PATH = Path(__file__).parent.parent / "src" / "deckbuilder" / "assets" / "templates" / "default.pptx"
+
+TEST_MAPPING = {
+    "spelling_patterns": {"color": "colour", "optimize": "optimise"},
+    "conditional_mappings": {"program": {"to": "programme", "except_contexts": ["computer"]}},
+    "vocabulary": {"cell phone": "mobile phone"},
+}
+
+
+@pytest.fixture
+def sample_deck(tmp_path):
+    """Deck with text frames, a table and a grouped text box."""
+    prs = Presentation(str(TEMPLATE_PATH))
+    layout = prs.slide_layouts[0]
+
+    slide = prs.slides.add_slide(layout)
+    slide.shapes.title.text = "Optimize the Color program"
+
+    table = slide.shapes.add_table(2, 2, Inches(1), Inches(3), Inches(4), Inches(1)).table
+    table.cell(0, 0).text = "cell phone plans"
+    table.cell(1, 1).text = "A computer program"
+
+    group = slide.shapes.add_group_shape()
+    group.shapes.add_textbox(Inches(1), Inches(5), Inches(2), Inches(1)).text_frame.text = "COLOR grouped"
+
+    path = tmp_path / "sample.pptx"
+    prs.save(str(path))
+    return path
+
+
+def _run_snapshot(path):
+    """Collect (text, lang, latin typeface) for every run in every part."""
+    prs = Presentation(str(path))
+    snapshot = []
+    for part in prs.part.package.iter_parts():
+        if not hasattr(part, "_element"):
+            continue
+        try:
+            runs = RUN_XPATH(part._element)
+        except Exception:
+            continue
+        for run in runs:
+            rPr = run.rPr
+            latin = rPr.latin if rPr is not None else None
+            snapshot.append((str(part.partname), run.text, rPr.get("lang") if rPr is not None else None, latin.get("typeface") if latin is not None else None))
+    return sorted(snapshot)
+
+
+class TestXmlRemapEngine:
+    @pytest.mark.parametrize("language, font", [("en-AU", None), (None, "Arial"), ("en-GB", "Calibri")])
+    def test_matches_proxy_engine(self, sample_deck, tmp_path, language, font):
+        formatter = FormattingSupport()
+        with patch.object(FormattingSupport, "load_language_mapping", return_value=TEST_MAPPING):
+            proxy = formatter.update_presentation(str(sample_deck), language, font, str(tmp_path / "proxy.pptx"), create_backup=False, engine="proxy")
+            xml = formatter.update_presentation(str(sample_deck), language, font, str(tmp_path / "xml.pptx"), create_backup=False, engine="xml")
+
+        assert proxy["success"] and xml["success"]
+        assert xml["stats"] == proxy["stats"]
+        assert _run_snapshot(tmp_path / "xml.pptx") == _run_snapshot(tmp_path / "proxy.pptx")
+
+    def test_text_replacement_is_batched_per_unique_text(self, sample_deck):
+        formatter = FormattingSupport()
+        prs = Presentation(str(sample_deck))
+
+        with (
+            patch.object(FormattingSupport, "load_language_mapping", return_value=TEST_MAPPING),
+            patch.object(FormattingSupport, "apply_text_replacements", wraps=formatter.apply_text_replacements) as replace,
+        ):
+            stats = XmlRemapEngine(formatter).remap_parts(prs, "en-AU")
+
+        # Only texts containing a mapped word reach the replacement passes
+        replaced_inputs = {call.args[0] for call in replace.call_args_list}
+        assert replaced_inputs == {"Optimize the Color program", "cell phone plans", "A computer program", "COLOR grouped"}
+        assert stats["total_text_replaced"] == 3
+
+        texts = [run.text for run in RUN_XPATH(prs.slides[0].part._element)]
+        assert "Optimise the Colour programme" in texts
+        assert "A computer program" in texts
+        assert "COLOUR grouped" in texts
+
+    def test_unknown_language_applies_no_lang(self, sample_deck):
+        prs = Presentation(str(sample_deck))
+        stats = XmlRemapEngine().remap_parts(prs, None, "Arial")
+
+        assert stats["total_language_applied"] == 0
+        assert stats["total_font_applied"] == stats["total_runs_processed"] > 0
+        assert stats["theme_fonts_updated"] == 1